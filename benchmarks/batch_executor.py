@@ -0,0 +1,90 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the time taken to call ResourceControllerV2.get_resource_instance()
+for many ids, one after the other and with BatchExecutor.
+
+The `--count` calls are made against a local stand-in for the service that
+answers after `--latency` milliseconds, with each of the `--workers` values.
+
+    python benchmarks/batch_executor.py [--count N] [--latency MS] [--workers N [N ...]]
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+import requests
+
+from ibm_platform_services.batch import BatchExecutor
+from ibm_platform_services.resource_controller_v2 import ResourceControllerV2
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        time.sleep(self.server.latency)
+        body = json.dumps({'id': self.path.rsplit('/', 1)[-1], 'name': 'instance', 'state': 'active'}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--count', type=int, default=500, help='the number of calls')
+    parser.add_argument('--latency', type=float, default=20, help='the latency of the stand-in, in milliseconds')
+    parser.add_argument('--workers', type=int, nargs='+', default=[4, 16, 64], help='the worker counts to measure')
+    options = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.latency = options.latency / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    service = ResourceControllerV2(authenticator=BearerTokenAuthenticator('token'))
+    service.set_service_url('http://127.0.0.1:{0}'.format(server.server_address[1]))
+    service.get_http_client().mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=max(options.workers)))
+    ids = ['instance-{0}'.format(i) for i in range(options.count)]
+
+    print('{0:<14} {1:>8} {2:>10} {3:>10}'.format('mode', 'calls', 'time', 'calls/s'))
+    start = time.perf_counter()
+    for instance_id in ids:
+        service.get_resource_instance(instance_id)
+    elapsed = time.perf_counter() - start
+    print('{0:<14} {1:>8} {2:>9.2f}s {3:>10.1f}'.format('sequential', options.count, elapsed, options.count / elapsed))
+    for workers in options.workers:
+        with BatchExecutor(max_workers=workers) as executor:
+            start = time.perf_counter()
+            failed = sum(1 for result in executor.map(service.get_resource_instance, ids) if result.error is not None)
+            elapsed = time.perf_counter() - start
+        assert not failed
+        mode = 'batch x{0}'.format(workers)
+        print('{0:<14} {1:>8} {2:>9.2f}s {3:>10.1f}'.format(mode, options.count, elapsed, options.count / elapsed))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the memory held by regular and compact model objects.
+
+For each model, --count objects are decoded from the same json representation
+(so the property values are shared and only the objects themselves, including
+nested model objects and parsed date-times, are counted) and the memory they
+hold is measured with tracemalloc:
+
+- `from_dict`: regular objects returned by the generated from_dict() method
+- `decoder`: regular objects returned by deserialization.from_dict()
+- `compact`: compact objects returned by compact.from_dict()
+
+The `saved` column compares the compact objects with the from_dict() ones.
+From Python 3.11, objects with up to 30 attributes keep them inline until their
+`__dict__` is first accessed (for example by the generated __eq__() method), so
+regular objects of the smaller models are already close to compact there.
+
+    python benchmarks/compact_models.py [--count N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from ibm_platform_services import compact, deserialization
+from ibm_platform_services.iam_identity_v1 import ApiKey
+from ibm_platform_services.resource_controller_v2 import ResourceInstance, ResourceKey
+from ibm_platform_services.usage_reports_v4 import InstanceUsage
+
+CRN = 'crn:v1:bluemix:public:cloud-object-storage:global:a/account:8d7af921-b136-4078-9666-081bd8470d94::'
+TIMESTAMP = '2022-01-01T12:00:00.000Z'
+
+MODELS = {
+    ResourceInstance: {
+        'id': CRN,
+        'guid': '8d7af921-b136-4078-9666-081bd8470d94',
+        'crn': CRN,
+        'url': '/v2/resource_instances/8d7af921-b136-4078-9666-081bd8470d94',
+        'name': 'my-instance',
+        'account_id': 'account',
+        'resource_group_id': 'group',
+        'resource_group_crn': 'crn:v1:bluemix:public:resource-controller::a/account::resource-group:group',
+        'resource_id': 'dff97f5c-bc5e-4455-b470-411c3edbe49c',
+        'resource_plan_id': '2fdf0c08-2d32-4f46-84b5-32e0c92fffd8',
+        'target_crn': 'crn:v1:bluemix:public:globalcatalog::::deployment:2fdf0c08',
+        'state': 'active',
+        'type': 'service_instance',
+        'region_id': 'global',
+        'created_at': TIMESTAMP,
+        'created_by': 'IBMid-1234',
+        'updated_at': TIMESTAMP,
+        'updated_by': 'IBMid-1234',
+        'locked': False,
+        'allow_cleanup': False,
+        'last_operation': {
+            'type': 'create',
+            'state': 'succeeded',
+            'async': False,
+            'description': 'Completed create instance operation',
+            'cancelable': False,
+            'poll': False,
+        },
+    },
+    ResourceKey: {
+        'id': CRN + 'resource-key:key',
+        'guid': 'key',
+        'crn': CRN + 'resource-key:key',
+        'url': '/v2/resource_keys/key',
+        'name': 'my-key',
+        'account_id': 'account',
+        'resource_group_id': 'group',
+        'source_crn': CRN,
+        'state': 'active',
+        'iam_compatible': True,
+        'created_at': TIMESTAMP,
+        'updated_at': TIMESTAMP,
+        'credentials': {'apikey': 'key', 'iam_apikey_name': 'my-key'},
+    },
+    InstanceUsage: {
+        'account_id': 'account',
+        'resource_instance_id': CRN,
+        'resource_instance_name': 'my-instance',
+        'resource_id': 'cloud-object-storage',
+        'resource_group_id': 'group',
+        'pricing_country': 'USA',
+        'currency_code': 'USD',
+        'billable': True,
+        'plan_id': 'plan',
+        'region': 'us-south',
+        'month': '2022-01',
+        'usage': [
+            {
+                'metric': 'STORAGE',
+                'unit': 'GIGABYTE_MONTHS',
+                'quantity': 10,
+                'cost': 1.5,
+                'rated_cost': 1.5,
+                'discounts': [],
+            }
+        ],
+    },
+    ApiKey: {
+        'id': 'ApiKey-1234',
+        'entity_tag': '1-abc',
+        'crn': 'crn:v1:bluemix:public:iam-identity::a/account::apikey:ApiKey-1234',
+        'locked': False,
+        'created_at': TIMESTAMP,
+        'created_by': 'IBMid-1234',
+        'modified_at': TIMESTAMP,
+        'name': 'my-api-key',
+        'iam_id': 'IBMid-1234',
+        'account_id': 'account',
+        'apikey': '',
+    },
+}
+
+
+def measure(decode, model_json, count):
+    """
+    Return the number of bytes held per object by `count` decoded objects.
+    """
+    gc.collect()
+    tracemalloc.start()
+    models = [decode(model_json) for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del models
+    return size / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--count', type=int, default=20000, help='the number of objects decoded per model')
+    options = parser.parse_args()
+
+    print('{0:<18} {1:>10} {2:>10} {3:>10} {4:>10}'.format('model', 'from_dict', 'decoder', 'compact', 'saved'))
+    for model_class, model_json in MODELS.items():
+        assert compact.from_dict(model_class, model_json) == model_class.from_dict(model_json)
+        generated = measure(model_class.from_dict, model_json, options.count)
+        decoded = measure(deserialization.get_decoder(model_class), model_json, options.count)
+        compacted = measure(deserialization.get_decoder(compact.compact_class(model_class)), model_json, options.count)
+        print(
+            '{0:<18} {1:>8.0f} B {2:>8.0f} B {3:>8.0f} B {4:>9.0%}'.format(
+                model_class.__name__, generated, decoded, compacted, 1 - compacted / generated
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
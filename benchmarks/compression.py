@@ -0,0 +1,214 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the bytes transferred and the time taken by large
+UsageMeteringV4.report_resource_usage(), GlobalCatalogV1.upload_artifact()
+and UsageReportsV4.get_resource_usage_account() calls, with and without gzip
+compression.
+
+The calls are made `--repeat` times against a local stand-in for the
+services, which compresses its responses when asked to, with payloads of
+`--count` usage records, catalog entries or instance usage records shaped
+like the ones recorded from the services.
+
+    python benchmarks/compression.py [--count N] [--repeat N] [--level N]
+"""
+
+import argparse
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import io
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+
+from ibm_platform_services import compression
+from ibm_platform_services.global_catalog_v1 import GlobalCatalogV1
+from ibm_platform_services.usage_metering_v4 import MeasureAndQuantity, ResourceInstanceUsage, UsageMeteringV4
+from ibm_platform_services.usage_reports_v4 import UsageReportsV4
+
+CRN = 'crn:v1:bluemix:public:cloud-object-storage:global:a/account:{0:08x}-b136-4078-9666-081bd8470d94::'
+
+
+def resource_usage(count):
+    return [
+        ResourceInstanceUsage(
+            resource_instance_id=CRN.format(i),
+            plan_id='744bfc56-d12c-4866-88d5-dac9139e0e5d',
+            region='us-south',
+            start=1485907200000 + i,
+            end=1485910800000 + i,
+            measured_usage=[
+                MeasureAndQuantity(measure='STORAGE', quantity=i * 17),
+                MeasureAndQuantity(measure='BANDWIDTH', quantity=i * 3),
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def catalog_artifact(count):
+    entries = [
+        {
+            'name': 'entry-{0}'.format(i),
+            'kind': 'service',
+            'overview_ui': {'en': {'display_name': 'Entry {0}'.format(i), 'description': 'A catalog entry.'}},
+            'tags': ['ibm_created', 'storage', 'us-south'],
+            'metadata': {'pricing': {'type': 'paid', 'origin': 'pricing_catalog'}, 'rc_compatible': True},
+        }
+        for i in range(count)
+    ]
+    return json.dumps(entries).encode('utf-8')
+
+
+def instances_usage(count):
+    resources = [
+        {
+            'account_id': 'account',
+            'resource_instance_id': CRN.format(i),
+            'resource_id': 'cloud-object-storage',
+            'pricing_country': 'USA',
+            'currency_code': 'USD',
+            'billable': True,
+            'plan_id': '744bfc56-d12c-4866-88d5-dac9139e0e5d',
+            'region': 'us-south',
+            'month': '2022-01',
+            'usage': [
+                {
+                    'metric': 'STORAGE',
+                    'unit': 'GIGABYTE_MONTHS',
+                    'quantity': i * 1.5,
+                    'rateable_quantity': i * 1.5,
+                    'cost': i * 0.02,
+                    'rated_cost': i * 0.02,
+                    'price': [],
+                }
+            ],
+        }
+        for i in range(count)
+    ]
+    return json.dumps({'limit': count, 'count': count, 'resources': resources}).encode('utf-8')
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = self.server.report
+        headers = {'Content-Type': 'application/json'}
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel=6)
+            headers['Content-Encoding'] = 'gzip'
+        self.respond(body, headers)
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.receive()
+        self.respond(b'{"resources": []}', {'Content-Type': 'application/json'}, status=202)
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        self.receive()
+        self.respond(b'', {})
+
+    def receive(self):
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            size = -1
+            while size:
+                size = int(self.rfile.readline().strip(), 16)
+                self.server.received += size
+                self.rfile.read(size + 2)
+        else:
+            length = int(self.headers['Content-Length'])
+            self.server.received += length
+            self.rfile.read(length)
+
+    def respond(self, body, headers, status=200):
+        self.server.sent += len(body)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--count', type=int, default=1000, help='the number of records in each payload')
+    parser.add_argument('--repeat', type=int, default=20, help='the number of calls of each operation')
+    parser.add_argument('--level', type=int, default=6, help='the compression level')
+    options = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.report = instances_usage(options.count)
+    server.received = server.sent = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+    usage = resource_usage(options.count)
+    artifact = catalog_artifact(options.count)
+
+    calls = {
+        'report_resource_usage': (UsageMeteringV4, lambda s: s.report_resource_usage('cloud-object-storage', usage)),
+        'upload_artifact': (
+            GlobalCatalogV1,
+            lambda s: s.upload_artifact(
+                'entry', 'entries.json', artifact=io.BytesIO(artifact), content_type='application/json'
+            ),
+        ),
+        'get_resource_usage_account': (UsageReportsV4, lambda s: s.get_resource_usage_account('account', '2022-01')),
+    }
+    print(
+        '{0:<28} {1:<10} {2:>12} {3:>12} {4:>8} {5:>10}'.format(
+            'operation', 'mode', 'body', 'wire', 'ratio', 'per call'
+        )
+    )
+    for operation, (service_class, call) in calls.items():
+        for mode in ('identity', 'gzip'):
+            if mode == 'gzip':
+                gzip_compression = compression.GzipCompression(level=options.level)
+            else:
+                gzip_compression = compression.GzipCompression(threshold=float('inf'), decompress=False)
+            service = service_class(authenticator=BearerTokenAuthenticator('token'))
+            service.set_service_url(url)
+            compression.set_compression(service, gzip_compression)
+            call(service)
+            server.received = server.sent = 0
+            request_bytes = gzip_compression.request_bytes[operation]
+            start = time.perf_counter()
+            for _ in range(options.repeat):
+                call(service)
+            elapsed = time.perf_counter() - start
+            if operation.startswith('get_'):
+                body, wire = len(server.report) * options.repeat, server.sent
+            else:
+                wire = server.received
+                body = gzip_compression.request_bytes[operation] - request_bytes or wire
+            print(
+                '{0:<28} {1:<10} {2:>12,} {3:>12,} {4:>7.1%} {5:>8.2f}ms'.format(
+                    operation, mode, body, wire, wire / body, elapsed / options.repeat * 1000
+                )
+            )
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Count the connections opened by a mix of service clients with and without a ConnectionPoolRegistry.
+
+A local keep-alive HTTP server stands in for the platform endpoints; every client
+points at it, and a pool of worker threads issues requests through randomly chosen
+clients. The server sleeps for --handshake-ms whenever a connection is opened to
+stand in for the TCP and TLS handshake cost of a real endpoint.
+
+    python benchmarks/connection_pool.py [--clients N] [--requests N] [--threads N] [--handshake-ms N]
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import random
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_platform_services.connection_pool import ConnectionPoolRegistry
+from ibm_platform_services.global_search_v2 import GlobalSearchV2
+from ibm_platform_services.global_tagging_v1 import GlobalTaggingV1
+from ibm_platform_services.resource_controller_v2 import ResourceControllerV2
+from ibm_platform_services.resource_manager_v2 import ResourceManagerV2
+
+OPERATIONS = [
+    (ResourceControllerV2, lambda client: client.list_resource_instances()),
+    (ResourceManagerV2, lambda client: client.list_resource_groups()),
+    (GlobalTaggingV1, lambda client: client.list_tags()),
+    (GlobalSearchV2, lambda client: client.get_supported_types()),
+]
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+        time.sleep(self.server.handshake_delay)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = b'{}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def run(url, registry, args):
+    clients = []
+    for i in range(args.clients):
+        service_class, operation = OPERATIONS[i % len(OPERATIONS)]
+        client = service_class(authenticator=NoAuthAuthenticator())
+        client.set_service_url(url)
+        if registry is not None:
+            registry.attach(client)
+        clients.append((client, operation))
+
+    rnd = random.Random(42)
+    calls = [rnd.choice(clients) for _ in range(args.requests)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        list(executor.map(lambda call: call[1](call[0]), calls))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--clients', type=int, default=20)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--handshake-ms', type=float, default=20.0)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.lock = threading.Lock()
+    server.handshake_delay = args.handshake_ms / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+
+    for label, registry in [
+        ('private pools', None),
+        ('shared registry', ConnectionPoolRegistry(pool_maxsize=args.threads, pool_block=True)),
+    ]:
+        server.connections = 0
+        elapsed = run(url, registry, args)
+        print(
+            '{0:<16} {1:5d} connections for {2} requests from {3} clients, {4:6.2f} s'.format(
+                label, server.connections, args.requests, args.clients, elapsed
+            )
+        )
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the memory used by CaseManagementV1.download_file() calls whose result
+is read whole with downloads.download() to a file, for several file sizes.
+
+A local HTTP server stands in for the Case Management service and serves
+attachments of each of the `--sizes` in MiB. Each download runs in a forked
+process, whose growth in peak resident set size is reported, and the bytes are
+checksummed with sha256 in both modes.
+
+    python benchmarks/download_memory.py [--sizes N,N,...] [--chunk-size N]
+"""
+
+import argparse
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import multiprocessing
+import os
+import resource
+import tempfile
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_platform_services import downloads
+from ibm_platform_services.case_management_v1 import CaseManagementV1
+
+MIB = 1024 * 1024
+
+# The bytes repeated to make up every attachment.
+BLOCK = os.urandom(MIB)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        size = int(self.path.rsplit('/', 1)[-1]) * MIB
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(size))
+        self.send_header('ETag', '"{0}"'.format(size))
+        self.end_headers()
+        for _ in range(size // MIB):
+            self.wfile.write(BLOCK)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def run(url, mode, size, chunk_size, results):
+    service = CaseManagementV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(url)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    with tempfile.TemporaryFile() as file:
+        if mode == 'whole':
+            content = service.download_file('CS0000001', str(size)).get_result().content
+            digest = hashlib.sha256(content).hexdigest()
+            file.write(content)
+        else:
+            download = downloads.download(
+                service.download_file,
+                'CS0000001',
+                str(size),
+                destination=file,
+                chunk_size=chunk_size,
+                checksum='sha256',
+            )
+            digest = download.hexdigest()
+    elapsed = time.perf_counter() - start
+    growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    results.put((growth * 1024, elapsed, digest))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--sizes', default='16,64,128', help='the sizes of the attachments, in MiB')
+    parser.add_argument('--chunk-size', type=int, default=downloads.DEFAULT_CHUNK_SIZE, help='the chunk size in bytes')
+    options = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+    context = multiprocessing.get_context('fork')
+
+    print('{0:>8} {1:<10} {2:>14} {3:>10} {4:>10}'.format('MiB', 'mode', 'peak RSS +', 'time', 'MiB/s'))
+    for size in (int(size) for size in options.sizes.split(',')):
+        digests = set()
+        for mode in ('whole', 'streamed'):
+            results = context.Queue()
+            process = context.Process(target=run, args=(url, mode, size, options.chunk_size, results))
+            process.start()
+            growth, elapsed, digest = results.get()
+            process.join()
+            digests.add(digest)
+            print(
+                '{0:>8} {1:<10} {2:>12.1f}MiB {3:>9.2f}s {4:>10.0f}'.format(
+                    size, mode, growth / MIB, elapsed, size / elapsed
+                )
+            )
+        assert len(digests) == 1
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
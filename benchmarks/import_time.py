@@ -0,0 +1,77 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the cold-start cost of importing a single service class with importing every service.
+
+Each measurement runs in a fresh interpreter so that nothing is cached in sys.modules.
+
+    python benchmarks/import_time.py [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SINGLE_SERVICE = 'from ibm_platform_services import ResourceControllerV2'
+ALL_SERVICES = 'import ibm_platform_services as p\nfor name in p._LAZY_ATTRIBUTES:\n    getattr(p, name)'
+BASELINE = 'import ibm_cloud_sdk_core'
+
+TIMER = '''
+import time
+start = time.perf_counter()
+{0}
+print(time.perf_counter() - start)
+'''
+
+
+def measure(statement, runs):
+    """
+    Return the timings (in seconds) of `statement` executed in `runs` fresh interpreters.
+    """
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', TIMER.format(statement)], check=True, capture_output=True, text=True
+        ).stdout
+        timings.append(float(output))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=10, help='number of fresh interpreters per scenario')
+    args = parser.parse_args()
+
+    results = {}
+    for label, statement in [
+        ('ibm_cloud_sdk_core only', BASELINE),
+        ('single service', SINGLE_SERVICE),
+        ('all services', ALL_SERVICES),
+    ]:
+        results[label] = statistics.median(measure(statement, args.runs))
+        print('{0:<24} {1:8.1f} ms (median of {2})'.format(label, results[label] * 1000, args.runs))
+
+    print(
+        'single-service import is {0:.1f}x faster than a full import'.format(
+            results['all services'] / results['single service']
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()
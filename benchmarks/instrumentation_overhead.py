@@ -0,0 +1,118 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the overhead per call of the instrumentation hooks on
+ResourceControllerV2.get_resource_instance() and GlobalTaggingV1.attach_tag().
+
+The clients' requests session answers every request with a canned response
+without touching the network, so the time measured is the time spent in the
+SDK and in requests. Each operation is called with the hooks removed
+(`none`), with the default instrumentation, which does nothing (`no-op`), and
+with an instrumentation that collects the metrics of every call (`active`).
+
+    python benchmarks/instrumentation_overhead.py [--count N] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+import requests
+
+from ibm_platform_services import instrumentation
+from ibm_platform_services.global_tagging_v1 import GlobalTaggingV1
+from ibm_platform_services.resource_controller_v2 import ResourceControllerV2
+
+INSTANCE_ID = 'crn:v1:bluemix:public:cloud-object-storage:global:a/account:8d7af921-b136-4078-9666-081bd8470d94::'
+
+
+class CannedAdapter(requests.adapters.BaseAdapter):
+    """
+    A transport adapter that answers every request with the same JSON body.
+    """
+
+    def __init__(self, body):
+        super().__init__()
+        self.body = body
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'application/json'
+        response._content = self.body  # pylint: disable=protected-access
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+class CollectingInstrumentation(instrumentation.Instrumentation):
+    def __init__(self):
+        self.metrics = []
+
+    def end_operation(self, metrics):
+        self.metrics.append(metrics)
+
+
+def client(service_class, body, mode):
+    service = service_class(authenticator=BearerTokenAuthenticator('token'))
+    service.get_http_client().mount('https://', CannedAdapter(body))
+    if mode == 'none':
+        del service.send
+        hooks = service.get_http_client().hooks['response']
+        hooks[:] = [hook for hook in hooks if not isinstance(hook, instrumentation._ResponseObserver)]
+    elif mode == 'active':
+        instrumentation.set_instrumentation(service, CollectingInstrumentation())
+    return service
+
+
+OPERATIONS = {
+    'get_resource_instance': (
+        ResourceControllerV2,
+        b'{"id": "instance", "name": "instance", "state": "active"}',
+        lambda service: service.get_resource_instance(INSTANCE_ID),
+    ),
+    'attach_tag': (
+        GlobalTaggingV1,
+        b'{"results": [{"resource_id": "crn", "is_error": false}]}',
+        lambda service: service.attach_tag(resources=[{'resource_id': INSTANCE_ID}], tag_names=['env:prod']),
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--count', type=int, default=5000, help='the number of calls per run')
+    parser.add_argument('--repeat', type=int, default=5, help='the number of runs; the fastest is reported')
+    options = parser.parse_args()
+
+    modes = ('none', 'no-op', 'active')
+    print('{0:<24} {1:>10} {2:>10} {3:>10}'.format('operation', *modes))
+    for name, (service_class, body, call) in OPERATIONS.items():
+        timings = []
+        for mode in modes:
+            service = client(service_class, body, mode)
+            call(service)
+            runs = timeit.repeat(lambda: call(service), number=options.count, repeat=options.repeat)
+            timings.append(min(runs) / options.count)
+        print('{0:<24} {1:>8.1f}us {2:>8.1f}us {3:>8.1f}us'.format(name, *(t * 1e6 for t in timings)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the JSON codecs on large ResourceInstancesList, InstancesUsage and
+EntrySearchResult payloads.
+
+For each payload and codec the benchmark reports the time to encode the
+payload to bytes (`dumps`) and to decode a response body holding it (`loads`).
+The `requests` row decodes the body with requests.Response.json(), which is
+how responses were decoded before the codec was pluggable. OrjsonCodec is
+skipped if orjson is not installed.
+
+    python benchmarks/json_codec.py [--count N] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+import requests
+
+from ibm_platform_services import json_codec
+
+CRN = 'crn:v1:bluemix:public:cloud-object-storage:global:a/account:{0:08x}-b136-4078-9666-081bd8470d94::'
+TIMESTAMP = '2022-01-01T12:00:00.000Z'
+
+
+def resource_instances_list(count):
+    resources = []
+    for i in range(count):
+        resources.append(
+            {
+                'id': CRN.format(i),
+                'guid': '{0:08x}-b136-4078-9666-081bd8470d94'.format(i),
+                'crn': CRN.format(i),
+                'url': '/v2/resource_instances/{0:08x}-b136-4078-9666-081bd8470d94'.format(i),
+                'name': 'instance-{0}'.format(i),
+                'account_id': 'account',
+                'resource_group_id': 'group',
+                'resource_id': 'dff97f5c-bc5e-4455-b470-411c3edbe49c',
+                'resource_plan_id': '2fdf0c08-2d32-4f46-84b5-32e0c92fffd8',
+                'target_crn': 'crn:v1:bluemix:public:globalcatalog::::deployment:2fdf0c08',
+                'parameters': {'location': 'us-south', 'size': i},
+                'state': 'active',
+                'type': 'service_instance',
+                'created_at': TIMESTAMP,
+                'updated_at': TIMESTAMP,
+                'locked': False,
+                'last_operation': {'type': 'create', 'state': 'succeeded', 'async': False},
+            }
+        )
+    return {'rows_count': count, 'next_url': None, 'resources': resources}
+
+
+def instances_usage(count):
+    resources = []
+    for i in range(count):
+        resources.append(
+            {
+                'account_id': 'account',
+                'resource_instance_id': CRN.format(i),
+                'resource_id': 'cloud-object-storage',
+                'pricing_country': 'USA',
+                'currency_code': 'USD',
+                'billable': True,
+                'plan_id': 'plan',
+                'region': 'us-south',
+                'month': '2022-01',
+                'usage': [
+                    {
+                        'metric': metric,
+                        'unit': 'GIGABYTE_MONTHS',
+                        'quantity': i * 1.5,
+                        'rateable_quantity': i * 1.5,
+                        'cost': i * 0.021,
+                        'rated_cost': i * 0.021,
+                        'price': [],
+                        'discounts': [],
+                    }
+                    for metric in ('STORAGE', 'CLASS_A_CALLS', 'CLASS_B_CALLS')
+                ],
+            }
+        )
+    return {
+        'limit': count,
+        'count': count,
+        'first': {'href': '/v4/accounts/account/resource_instances/usage'},
+        'resources': resources,
+    }
+
+
+def entry_search_result(count):
+    resources = []
+    for i in range(count):
+        resources.append(
+            {
+                'id': 'entry-{0}'.format(i),
+                'name': 'entry-{0}'.format(i),
+                'kind': 'service',
+                'overview_ui': {
+                    'en': {
+                        'display_name': 'Entry {0}'.format(i),
+                        'description': 'A catalog entry ' * 4,
+                        'long_description': '',
+                    }
+                },
+                'images': {'image': 'https://example.com/image.svg'},
+                'disabled': False,
+                'tags': ['storage', 'ibm_created', 'rc_compatible'],
+                'provider': {'email': 'support@example.com', 'name': 'IBM'},
+                'metadata': {'rc_compatible': True, 'service': {'iam_compatible': True, 'bindable': True}},
+                'created': TIMESTAMP,
+                'updated': TIMESTAMP,
+            }
+        )
+    return {'offset': 0, 'limit': count, 'count': count, 'resource_count': count, 'resources': resources}
+
+
+PAYLOADS = {
+    'ResourceInstancesList': resource_instances_list,
+    'InstancesUsage': instances_usage,
+    'EntrySearchResult': entry_search_result,
+}
+
+
+def measure(function, repeat):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def requests_loads(body):
+    response = requests.Response()
+    response.headers['content-type'] = 'application/json'
+    response.encoding = 'utf-8'
+    response._content = body  # pylint: disable=protected-access
+    return response.json()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--count', type=int, default=2000, help='the number of resources per payload')
+    parser.add_argument('--repeat', type=int, default=5, help='the number of runs; the fastest is reported')
+    options = parser.parse_args()
+
+    codecs = {'requests': None, 'JSONCodec': json_codec.JSONCodec()}
+    try:
+        codecs['OrjsonCodec'] = json_codec.OrjsonCodec()
+    except ImportError:
+        pass
+
+    print('{0:<22} {1:>8} {2:<12} {3:>10} {4:>10}'.format('payload', 'size', 'codec', 'dumps', 'loads'))
+    for name, build in PAYLOADS.items():
+        payload = build(options.count)
+        body = json_codec.DEFAULT_CODEC.dumps(payload)
+        size = '{0:.1f}MB'.format(len(body) / 1e6)
+        for codec_name, codec in codecs.items():
+            if codec is None:
+                dumps = None
+                loads = measure(lambda: requests_loads(body), options.repeat)
+            else:
+                assert codec.loads(codec.dumps(payload)) == payload
+                dumps = measure(lambda: codec.dumps(payload), options.repeat)
+                loads = measure(lambda: codec.loads(body), options.repeat)
+            print(
+                '{0:<22} {1:>8} {2:<12} {3:>10} {4:>8.1f}ms'.format(
+                    name, size, codec_name, '-' if dumps is None else '{0:.1f}ms'.format(dumps * 1000), loads * 1000
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
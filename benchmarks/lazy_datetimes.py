@@ -0,0 +1,104 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the cost of the date-time properties when decoding a large listing of
+ResourceInstance objects.
+
+Each resource instance holds five date-times. The listing is decoded with
+ResourceInstance.from_dict() and with the compiled decoder, and:
+
+- `eager`: every date-time is parsed with string_to_datetime() while decoding,
+  as from_dict() did before the date-times were parsed lazily
+- `unread`: no date-time is read, so none is parsed
+- `one read`: the created_at property of every object is read
+- `all read`: every date-time property of every object is read
+
+    python benchmarks/lazy_datetimes.py [--count N] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+from ibm_cloud_sdk_core.utils import string_to_datetime
+
+from ibm_platform_services import deserialization
+from ibm_platform_services.resource_controller_v2 import ResourceInstance
+
+DATETIMES = ('created_at', 'updated_at', 'deleted_at', 'scheduled_reclaim_at', 'restored_at')
+
+RESOURCE_INSTANCE = {
+    'id': 'crn:v1:bluemix:public:cloud-object-storage:global:a/account::instance',
+    'guid': '8d7af921-b136-4078-9666-081bd8470d94',
+    'name': 'my-instance',
+    'account_id': 'account',
+    'resource_group_id': 'group',
+    'state': 'active',
+    'created_at': '2022-01-01T12:00:00.000Z',
+    'updated_at': '2022-01-02T12:00:00.000Z',
+    'deleted_at': '2022-01-03T12:00:00.000Z',
+    'scheduled_reclaim_at': '2022-01-04T12:00:00.000Z',
+    'restored_at': '2022-01-05T12:00:00.000Z',
+}
+
+
+def eager(decode, dicts):
+    models = []
+    for model_json in dicts:
+        model = decode(model_json)
+        for name in DATETIMES:
+            # Replace the lazy date-time with the parsed one, as the eager from_dict() did.
+            model.__dict__[name] = string_to_datetime(model_json[name])
+        models.append(model)
+    return models
+
+
+def read(decode, dicts, names):
+    models = [decode(model_json) for model_json in dicts]
+    for model in models:
+        for name in names:
+            getattr(model, name)
+    return models
+
+
+def measure(function, repeat):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--count', type=int, default=10000, help='the number of resource instances per run')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of runs; the fastest is reported')
+    options = parser.parse_args()
+
+    dicts = [dict(RESOURCE_INSTANCE) for _ in range(options.count)]
+    print('{0:<10} {1:>12} {2:>12}'.format('', 'from_dict', 'compiled'))
+    cases = (
+        ('eager', lambda decode: eager(decode, dicts)),
+        ('unread', lambda decode: read(decode, dicts, ())),
+        ('one read', lambda decode: read(decode, dicts, ('created_at',))),
+        ('all read', lambda decode: read(decode, dicts, DATETIMES)),
+    )
+    for name, run in cases:
+        timings = [
+            measure(lambda: run(decode), options.repeat)
+            for decode in (ResourceInstance.from_dict, deserialization.get_decoder(ResourceInstance))
+        ]
+        print('{0:<10} {1:>10.1f}ms {2:>10.1f}ms'.format(name, *(timing * 1000 for timing in timings)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the requests and request bytes sent to report usage records with
+MeteringBatcher alone and with a MeteringAggregator in front of it.
+
+`--count` usage events of `--instances` resource instances, spread over
+`--hours` hourly windows, are reported to a local stand-in for the service
+that accepts every record. Each event measures two additive counters, and one
+in `--gauge-every` events also measures a gauge, which is not additive.
+
+    python benchmarks/metering_aggregation.py [--count N] [--instances N] [--hours N] [--gauge-every N]
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+
+from ibm_platform_services.metering import MeteringAggregator, MeteringBatcher
+from ibm_platform_services.usage_metering_v4 import MeasureAndQuantity, ResourceInstanceUsage, UsageMeteringV4
+
+CRN = 'crn:v1:bluemix:public:cloud-object-storage:us-south:a/account:{0:08x}-b136-4078-9666-081bd8470d94::'
+
+HOUR = 3600 * 1000
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        length = int(self.headers['Content-Length'])
+        records = json.loads(self.rfile.read(length))
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.records += len(records)
+            self.server.bytes += length
+        body = json.dumps({'resources': [{'status': 201, 'location': ''} for _ in records]}).encode('utf-8')
+        self.send_response(202)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def events(options):
+    for i in range(options.count):
+        start = 1485907200000 + (i * options.hours * HOUR) // options.count
+        measures = [
+            MeasureAndQuantity(measure='STORAGE', quantity=i % 7),
+            MeasureAndQuantity(measure='API_CALLS', quantity=1),
+        ]
+        if i % options.gauge_every == 0:
+            measures.append(MeasureAndQuantity(measure='INSTANCES', quantity=1))
+        yield ResourceInstanceUsage(
+            resource_instance_id=CRN.format(i % options.instances),
+            plan_id='744bfc56-d12c-4866-88d5-dac9139e0e5d',
+            region='us-south',
+            start=start,
+            end=start + 1000,
+            measured_usage=measures,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--count', type=int, default=200000, help='the number of usage events')
+    parser.add_argument('--instances', type=int, default=50, help='the number of resource instances')
+    parser.add_argument('--hours', type=int, default=4, help='the number of hourly windows')
+    parser.add_argument('--gauge-every', type=int, default=1000, help='the share of events that measure a gauge')
+    options = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    service = UsageMeteringV4(authenticator=BearerTokenAuthenticator('token'))
+    service.set_service_url('http://127.0.0.1:{0}'.format(server.server_address[1]))
+
+    print(
+        '{0:<11} {1:>8} {2:>9} {3:>9} {4:>12} {5:>10}'.format(
+            'mode', 'events', 'records', 'requests', 'KiB sent', 'time'
+        )
+    )
+    for mode in ('batched', 'aggregated'):
+        server.requests = server.records = server.bytes = 0
+        start = time.perf_counter()
+        with MeteringBatcher(service, max_batch_size=100, max_age=0.5) as batcher:
+            if mode == 'batched':
+                for event in events(options):
+                    batcher.submit('cloud-object-storage', event)
+            else:
+                with MeteringAggregator(batcher.submit, additive={'STORAGE', 'API_CALLS'}) as aggregator:
+                    for event in events(options):
+                        aggregator.add('cloud-object-storage', event)
+            batcher.flush()
+        elapsed = time.perf_counter() - start
+        assert server.records == batcher.accepted
+        print(
+            '{0:<11} {1:>8} {2:>9} {3:>9} {4:>12.0f} {5:>9.2f}s'.format(
+                mode, options.count, server.records, server.requests, server.bytes / 1024, elapsed
+            )
+        )
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the throughput of usage records reported with one
+UsageMeteringV4.report_resource_usage() call per record, and with
+MeteringBatcher.
+
+`--count` records for `--resources` resource ids are reported from `--threads`
+threads against a local stand-in for the service that answers after
+`--latency` milliseconds, accepting every record.
+
+    python benchmarks/metering_batcher.py [--count N] [--threads N] [--resources N] [--latency MS] [--batch-size N]
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+import requests
+
+from ibm_platform_services.metering import MeteringBatcher
+from ibm_platform_services.usage_metering_v4 import MeasureAndQuantity, ResourceInstanceUsage, UsageMeteringV4
+
+CRN = 'crn:v1:bluemix:public:{0}:us-south:a/account:{1:08x}-b136-4078-9666-081bd8470d94::'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        records = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        time.sleep(self.server.latency)
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.records += len(records)
+        body = json.dumps({'resources': [{'status': 201, 'location': ''} for _ in records]}).encode('utf-8')
+        self.send_response(202)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def usage(resource_id, i):
+    return ResourceInstanceUsage(
+        resource_instance_id=CRN.format(resource_id, i),
+        plan_id='744bfc56-d12c-4866-88d5-dac9139e0e5d',
+        region='us-south',
+        start=1485907200000 + i,
+        end=1485910800000 + i,
+        measured_usage=[MeasureAndQuantity(measure='STORAGE', quantity=i)],
+    )
+
+
+def run_threads(count, threads, report):
+    def work(first):
+        for i in range(first, count, threads):
+            report(i)
+
+    workers = [threading.Thread(target=work, args=(first,)) for first in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--count', type=int, default=5000, help='the number of records')
+    parser.add_argument('--threads', type=int, default=8, help='the number of reporting threads')
+    parser.add_argument('--resources', type=int, default=4, help='the number of resource ids')
+    parser.add_argument('--latency', type=float, default=10, help='the latency of the stand-in, in milliseconds')
+    parser.add_argument('--batch-size', type=int, default=100, help='the maximum number of records in a batch')
+    options = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.latency = options.latency / 1000
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    service = UsageMeteringV4(authenticator=BearerTokenAuthenticator('token'))
+    service.set_service_url('http://127.0.0.1:{0}'.format(server.server_address[1]))
+    service.get_http_client().mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=options.threads))
+    resource_ids = ['resource-{0}'.format(r) for r in range(options.resources)]
+    records = [
+        (resource_ids[i % options.resources], usage(resource_ids[i % options.resources], i))
+        for i in range(options.count)
+    ]
+
+    print('{0:<12} {1:>8} {2:>9} {3:>10} {4:>12}'.format('mode', 'records', 'requests', 'time', 'records/s'))
+    for mode in ('per record', 'batched'):
+        server.requests = server.records = 0
+        start = time.perf_counter()
+        if mode == 'per record':
+            run_threads(
+                options.count, options.threads, lambda i: service.report_resource_usage(records[i][0], [records[i][1]])
+            )
+        else:
+            with MeteringBatcher(service, max_batch_size=options.batch_size, max_age=0.5) as batcher:
+                run_threads(options.count, options.threads, lambda i: batcher.submit(*records[i]))
+                batcher.flush()
+            assert batcher.accepted == options.count
+        elapsed = time.perf_counter() - start
+        assert server.records == options.count
+        print(
+            '{0:<12} {1:>8} {2:>9} {3:>9.2f}s {4:>12.0f}'.format(
+                mode, options.count, server.requests, elapsed, options.count / elapsed
+            )
+        )
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the sustained rate at which usage records are appended to a
+MeteringSpool, with the fsync calls of concurrent appends shared, with one
+fsync call per record, and without fsync.
+
+`--count` records are appended from `--threads` threads to a spool in a
+temporary directory under `--directory`, and acknowledged in groups of
+`--batch-size` as a MeteringBatcher would once they are accepted, so that
+segments of `--segment-size` MiB are removed as the spool goes; the number of
+segments removed is reported.
+
+    python benchmarks/metering_spool.py [--count N] [--threads N] [--batch-size N] [--segment-size N] [--directory DIR]
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+
+from ibm_platform_services.metering import MeteringSpool
+from ibm_platform_services.usage_metering_v4 import MeasureAndQuantity, ResourceInstanceUsage
+
+CRN = 'crn:v1:bluemix:public:cloud-object-storage:us-south:a/account:{0:08x}-b136-4078-9666-081bd8470d94::'
+
+MODES = {
+    'group commit': {'fsync': True, 'group_commit': True},
+    'fsync each': {'fsync': True, 'group_commit': False},
+    'no fsync': {'fsync': False},
+}
+
+
+def usage(i):
+    return ResourceInstanceUsage(
+        resource_instance_id=CRN.format(i),
+        plan_id='744bfc56-d12c-4866-88d5-dac9139e0e5d',
+        region='us-south',
+        start=1485907200000 + i,
+        end=1485910800000 + i,
+        measured_usage=[MeasureAndQuantity(measure='STORAGE', quantity=i)],
+    ).to_dict()
+
+
+def run(spool, records, threads, batch_size):
+    def work(first):
+        record_ids = []
+        for i in range(first, len(records), threads):
+            record_ids.append(spool.append('cloud-object-storage', records[i]))
+            if len(record_ids) == batch_size:
+                spool.acknowledge(record_ids)
+                record_ids = []
+        spool.acknowledge(record_ids)
+
+    workers = [threading.Thread(target=work, args=(first,)) for first in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--count', type=int, default=20000, help='the number of records')
+    parser.add_argument('--threads', type=int, default=8, help='the number of appending threads')
+    parser.add_argument('--batch-size', type=int, default=100, help='the number of records acknowledged together')
+    parser.add_argument('--segment-size', type=int, default=1, help='the size of the segments, in MiB')
+    parser.add_argument('--directory', default=None, help='the directory of the temporary spools')
+    options = parser.parse_args()
+
+    records = [usage(i) for i in range(options.count)]
+    print(
+        '{0:<14} {1:>8} {2:>8} {3:>9} {4:>10} {5:>12}'.format(
+            'mode', 'records', 'fsyncs', 'removed', 'time', 'records/s'
+        )
+    )
+    for mode, settings in MODES.items():
+        with tempfile.TemporaryDirectory(dir=options.directory) as directory:
+            spool = MeteringSpool(directory, segment_size=options.segment_size * 1024 * 1024, **settings)
+            start = time.perf_counter()
+            run(spool, records, options.threads, options.batch_size)
+            elapsed = time.perf_counter() - start
+            spool.close()
+            assert spool.appended == options.count
+            print(
+                '{0:<14} {1:>8} {2:>8} {3:>9} {4:>9.2f}s {5:>12.0f}'.format(
+                    mode, options.count, spool.syncs, spool.compacted, elapsed, options.count / elapsed
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
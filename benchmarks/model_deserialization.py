@@ -0,0 +1,132 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the generated from_dict() methods with the compiled decoders of the
+deserialization module for ResourceInstance, CatalogEntry and Offering.
+
+Two json representations are decoded for each model: a sparse one, holding the
+properties a typical listing returns, and a full one, holding every property of
+the model and of its nested models, three levels deep (two items per nested list).
+
+    python benchmarks/model_deserialization.py [--count N] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+from ibm_platform_services import deserialization
+from ibm_platform_services.catalog_management_v1 import Offering
+from ibm_platform_services.common import LazyDatetimeAttribute
+from ibm_platform_services.global_catalog_v1 import CatalogEntry
+from ibm_platform_services.resource_controller_v2 import ResourceInstance
+
+SPARSE = {
+    ResourceInstance: {
+        'id': 'crn:v1:bluemix:public:cloud-object-storage:global:a/account::instance',
+        'guid': '8d7af921-b136-4078-9666-081bd8470d94',
+        'crn': 'crn:v1:bluemix:public:cloud-object-storage:global:a/account::instance',
+        'url': '/v2/resource_instances/8d7af921-b136-4078-9666-081bd8470d94',
+        'name': 'my-instance',
+        'account_id': 'account',
+        'resource_group_id': 'group',
+        'resource_id': 'dff97f5c-bc5e-4455-b470-411c3edbe49c',
+        'resource_plan_id': '2fdf0c08-2d32-4f46-84b5-32e0c92fffd8',
+        'target_crn': 'crn:v1:bluemix:public:globalcatalog::::deployment:2fdf0c08',
+        'state': 'active',
+        'type': 'service_instance',
+        'created_at': '2022-01-01T12:00:00.000Z',
+        'updated_at': '2022-01-01T12:00:00.000Z',
+        'locked': False,
+    },
+    CatalogEntry: {
+        'id': 'cloud-object-storage',
+        'name': 'cloud-object-storage',
+        'kind': 'service',
+        'overview_ui': {'en': {'display_name': 'Object Storage', 'description': 'Storage', 'long_description': ''}},
+        'images': {'image': 'https://example.com/image.svg'},
+        'disabled': False,
+        'tags': ['storage', 'ibm_created'],
+        'provider': {'email': 'support@example.com', 'name': 'IBM'},
+        'created': '2022-01-01T12:00:00.000Z',
+        'updated': '2022-01-01T12:00:00.000Z',
+    },
+    Offering: {
+        'id': 'offering',
+        'name': 'my-offering',
+        'label': 'My Offering',
+        'catalog_id': 'catalog',
+        'tags': ['terraform'],
+        'created': '2022-01-01T12:00:00.000Z',
+        'updated': '2022-01-01T12:00:00.000Z',
+        'kinds': [{'id': 'kind', 'format_kind': 'terraform', 'target_kind': 'terraform', 'versions': [{'id': 'v1'}]}],
+    },
+}
+
+
+def full_json(model_class, depth=0):
+    """
+    Return a json representation of a model with every property set.
+    """
+    spec = deserialization.get_model_spec(model_class)
+    if spec is None or depth > 2:
+        return None
+    result = {}
+    for field in spec.fields:
+        if field.kind == deserialization.CONVERTED or isinstance(
+            getattr(model_class, field.arg, None), LazyDatetimeAttribute
+        ):
+            value = '2022-01-01T12:00:00.000Z'
+        elif field.kind == deserialization.VALUE:
+            value = 'testString'
+        else:
+            value = full_json(field.target, depth + 1)
+            if value is not None and field.kind == deserialization.MODEL_LIST:
+                value = [value, value]
+            elif value is not None and field.kind == deserialization.MODEL_DICT:
+                value = {'en': value}
+        if value is not None:
+            result[field.key] = value
+    return result
+
+
+def measure(function, repeat):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--count', type=int, default=2000, help='the number of objects decoded per run')
+    parser.add_argument('--repeat', type=int, default=5, help='the number of runs; the fastest is reported')
+    options = parser.parse_args()
+
+    print('{0:<18} {1:<7} {2:>12} {3:>12} {4:>8}'.format('model', 'json', 'from_dict', 'compiled', 'speedup'))
+    for model_class in (ResourceInstance, CatalogEntry, Offering):
+        for name, model_json in (('sparse', SPARSE[model_class]), ('full', full_json(model_class))):
+            dicts = [model_json] * options.count
+            decode = deserialization.get_decoder(model_class)
+            assert decode(model_json) == model_class.from_dict(model_json)
+            generated = measure(lambda: [model_class.from_dict(d) for d in dicts], options.repeat)
+            compiled = measure(lambda: [decode(d) for d in dicts], options.repeat)
+            print(
+                '{0:<18} {1:<7} {2:>10.1f}ms {3:>10.1f}ms {4:>7.2f}x'.format(
+                    model_class.__name__, name, generated * 1000, compiled * 1000, generated / compiled
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
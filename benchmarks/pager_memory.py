@@ -0,0 +1,115 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the peak memory of ResourceInstancesPager.get_all() with iterating over the pager.
+
+A local HTTP server stands in for the Resource Controller and serves --items
+resource instances in pages of --limit items. Peak memory is measured with
+tracemalloc while every instance is visited once.
+
+    python benchmarks/pager_memory.py [--items N] [--limit N]
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+import tracemalloc
+from urllib.parse import parse_qs, urlsplit
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_platform_services.resource_controller_v2 import ResourceControllerV2, ResourceInstancesPager
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        query = parse_qs(urlsplit(self.path).query)
+        limit = int(query.get('limit', ['100'])[0])
+        start = int(query.get('start', ['0'])[0])
+        end = min(start + limit, self.server.items)
+        resources = [
+            {
+                'id': 'crn:v1:bluemix:public:service:global:a/account::instance-{0}'.format(i),
+                'guid': 'instance-{0}'.format(i),
+                'name': 'instance {0}'.format(i),
+                'state': 'active',
+                'resource_group_id': 'group',
+                'created_at': '2022-01-01T12:00:00.000Z',
+                'updated_at': '2022-01-01T12:00:00.000Z',
+            }
+            for i in range(start, end)
+        ]
+        result = {'rows_count': len(resources), 'resources': resources, 'next_url': None}
+        if end < self.server.items:
+            result['next_url'] = '/v2/resource_instances?limit={0}&start={1}'.format(limit, end)
+        body = json.dumps(result).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def visit_all(pager):
+    count = 0
+    for _ in pager.get_all():
+        count += 1
+    return count
+
+
+def visit_each(pager):
+    count = 0
+    for _ in pager:
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=1000000)
+    parser.add_argument('--limit', type=int, default=1000)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.items = args.items
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = ResourceControllerV2(authenticator=NoAuthAuthenticator())
+    client.set_service_url('http://127.0.0.1:{0}'.format(server.server_address[1]))
+
+    for label, visit in [('get_all()', visit_all), ('iteration', visit_each)]:
+        pager = ResourceInstancesPager(client=client, limit=args.limit)
+        tracemalloc.start()
+        start = time.perf_counter()
+        count = visit(pager)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print('{0:<10} {1:8d} items  peak {2:9.1f} MiB  {3:6.1f} s'.format(label, count, peak / 2**20, elapsed))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the time of a paged walk with and without PrefetchingPager.
+
+A local HTTP server stands in for the Resource Controller and answers each page
+after --latency-ms; the caller spends --processing-ms on every page. Without
+prefetching the walk takes about pages * (latency + processing); with
+prefetching it approaches pages * max(latency, processing).
+
+    python benchmarks/pager_prefetch.py [--pages N] [--latency-ms N] [--processing-ms N] [--depth N]
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_platform_services.pagination import PrefetchingPager
+from ibm_platform_services.resource_controller_v2 import ResourceControllerV2, ResourceInstancesPager
+
+PAGE_SIZE = 10
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        time.sleep(self.server.latency)
+        query = parse_qs(urlsplit(self.path).query)
+        page = int(query.get('start', ['0'])[0])
+        resources = [{'guid': 'instance-{0}-{1}'.format(page, i)} for i in range(PAGE_SIZE)]
+        result = {'rows_count': len(resources), 'resources': resources, 'next_url': None}
+        if page + 1 < self.server.pages:
+            result['next_url'] = '/v2/resource_instances?start={0}'.format(page + 1)
+        body = json.dumps(result).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def walk(pager, processing):
+    pages = 0
+    while pager.has_next():
+        pager.get_next()
+        time.sleep(processing)
+        pages += 1
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pages', type=int, default=500)
+    parser.add_argument('--latency-ms', type=float, default=10.0)
+    parser.add_argument('--processing-ms', type=float, default=10.0)
+    parser.add_argument('--depth', type=int, default=1)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.pages = args.pages
+    server.latency = args.latency_ms / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = ResourceControllerV2(authenticator=NoAuthAuthenticator())
+    client.set_service_url('http://127.0.0.1:{0}'.format(server.server_address[1]))
+
+    print(
+        'expected: sequential ~{0:.1f} s, prefetch ~{1:.1f} s'.format(
+            args.pages * (args.latency_ms + args.processing_ms) / 1000,
+            args.pages * max(args.latency_ms, args.processing_ms) / 1000,
+        )
+    )
+    for label, make_pager in [
+        ('sequential', lambda: ResourceInstancesPager(client=client)),
+        ('prefetch', lambda: PrefetchingPager(ResourceInstancesPager(client=client), depth=args.depth)),
+    ]:
+        start = time.perf_counter()
+        pages = walk(make_pager(), args.processing_ms / 1000)
+        print('{0:<10} {1:5d} pages  {2:6.2f} s'.format(label, pages, time.perf_counter() - start))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare a sequential offset walk of GlobalCatalogV1.list_catalog_entries with ParallelOffsetPager.
+
+A local HTTP server stands in for the Global Catalog and answers each page after
+--latency-ms.
+
+    python benchmarks/parallel_offset_pager.py [--items N] [--limit N] [--latency-ms N] [--workers N]
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_platform_services.connection_pool import ConnectionPoolRegistry
+from ibm_platform_services.global_catalog_v1 import GlobalCatalogV1
+from ibm_platform_services.pagination import ParallelOffsetPager
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        time.sleep(self.server.latency)
+        query = parse_qs(urlsplit(self.path).query)
+        offset = int(query.get('_offset', ['0'])[0])
+        limit = int(query.get('_limit', ['50'])[0])
+        resources = [
+            {'id': 'entry-{0}'.format(i), 'name': 'entry {0}'.format(i), 'kind': 'service'}
+            for i in range(offset, min(offset + limit, self.server.items))
+        ]
+        result = {
+            'offset': offset,
+            'limit': limit,
+            'count': self.server.items,
+            'resource_count': len(resources),
+            'resources': resources,
+        }
+        body = json.dumps(result).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def sequential(client, limit):
+    results = []
+    offset = 0
+    while True:
+        result = client.list_catalog_entries(offset=offset, limit=limit).get_result()
+        results.extend(result['resources'])
+        offset += limit
+        if offset >= result['count']:
+            return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=20000)
+    parser.add_argument('--limit', type=int, default=100)
+    parser.add_argument('--latency-ms', type=float, default=20.0)
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.items = args.items
+    server.latency = args.latency_ms / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = GlobalCatalogV1(authenticator=NoAuthAuthenticator())
+    client.set_service_url('http://127.0.0.1:{0}'.format(server.server_address[1]))
+    ConnectionPoolRegistry(pool_maxsize=args.workers).attach(client)
+
+    for label, walk in [
+        ('sequential', lambda: sequential(client, args.limit)),
+        (
+            'parallel',
+            lambda: ParallelOffsetPager(
+                client=client, operation='list_catalog_entries', limit=args.limit, max_workers=args.workers
+            ).get_all(),
+        ),
+    ]:
+        start = time.perf_counter()
+        count = len(walk())
+        print('{0:<10} {1:7d} items  {2:6.2f} s'.format(label, count, time.perf_counter() - start))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
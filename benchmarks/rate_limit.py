@@ -0,0 +1,126 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the throughput and the 429 responses of a bulk job of
+GlobalTaggingV1.attach_tag() calls against a service that enforces a quota,
+without a rate limiter, with an adaptive one, and with a configured limit.
+
+Each of `--threads` threads makes its share of `--count` calls against a
+local stand-in for the service that accepts `--quota` requests per second, in
+windows of a quarter of a second. Without a limiter the throttled calls are
+retried after the delay of their Retry-After header, as a job without one
+would have to.
+
+    python benchmarks/rate_limit.py [--threads N] [--count N] [--quota N]
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+import requests
+
+from ibm_platform_services import rate_limit
+from ibm_platform_services.global_tagging_v1 import GlobalTaggingV1
+
+WINDOW = 0.25
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers['Content-Length']))
+        with self.server.lock:
+            now = time.monotonic()
+            if now - self.server.window_start >= WINDOW:
+                self.server.window_start = now
+                self.server.window_count = 0
+            self.server.window_count += 1
+            allowed = self.server.window_count <= self.server.window_requests
+            retry_after = self.server.window_start + WINDOW - now
+            if not allowed:
+                self.server.rejected += 1
+        if allowed:
+            status, body = 200, b'{"results": []}'
+        else:
+            status, body = 429, b'{"message": "Too many requests"}'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if not allowed:
+            self.send_header('Retry-After', '{0:.3f}'.format(retry_after))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--threads', type=int, default=16, help='the number of calling threads')
+    parser.add_argument('--count', type=int, default=400, help='the number of calls')
+    parser.add_argument('--quota', type=int, default=100, help='the requests per second accepted by the stand-in')
+    options = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.window_requests = max(1, int(options.quota * WINDOW))
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print('{0:<12} {1:>8} {2:>8} {3:>10} {4:>10}'.format('mode', 'calls', '429s', 'time', 'calls/s'))
+    for mode in ('plain', 'adaptive', 'configured'):
+        service = GlobalTaggingV1(authenticator=BearerTokenAuthenticator('token'))
+        service.set_service_url('http://127.0.0.1:{0}'.format(server.server_address[1]))
+        service.get_http_client().mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=options.threads))
+        if mode == 'adaptive':
+            rate_limit.set_rate_limiter(service, rate_limit.RateLimiter(max_retries=100))
+        elif mode == 'configured':
+            rate_limit.set_rate_limiter(service, rate_limit.RateLimiter(rate=0.9 * options.quota, max_retries=100))
+        time.sleep(WINDOW)
+        server.window_start = time.monotonic()
+        server.window_count = server.rejected = 0
+
+        def call(i, service=service):
+            while True:
+                try:
+                    return service.attach_tag(resources=[{'resource_id': 'crn-{0}'.format(i)}], tag_names=['env:prod'])
+                except ApiException as error:
+                    if error.code != 429:
+                        raise
+                    time.sleep(rate_limit.get_retry_after(error.http_response.headers) or WINDOW)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(options.threads) as executor:
+            list(executor.map(call, range(options.count)))
+        elapsed = time.perf_counter() - start
+        print(
+            '{0:<12} {1:>8} {2:>8} {3:>9.2f}s {4:>10.1f}'.format(
+                mode, options.count, server.rejected, elapsed, options.count / elapsed
+            )
+        )
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
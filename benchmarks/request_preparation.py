@@ -0,0 +1,134 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the client-side overhead per call of
+IamAccessGroupsV2.is_member_of_access_group() and
+ResourceControllerV2.get_resource_instance(), with the network stubbed out.
+
+The clients' send() method returns the prepared request without sending it,
+so the time measured is the time spent validating the arguments, building the
+headers and the URL and authenticating the request. `generic` prepares the
+requests as the operations did before they used a RequestTemplate, with
+get_sdk_headers(), encode_path_vars() and prepare_request().
+
+Each operation is called with the same ids on every call (`repeated`), and
+with a different id on every call (`distinct`), as the encoded path variables
+of the most recent calls are cached.
+
+    python benchmarks/request_preparation.py [--count N] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+
+from ibm_platform_services.common import get_sdk_headers
+from ibm_platform_services.iam_access_groups_v2 import IamAccessGroupsV2
+from ibm_platform_services.resource_controller_v2 import ResourceControllerV2
+
+INSTANCE_ID = 'crn:v1:bluemix:public:cloud-object-storage:global:a/account:8d7af921-b136-4078-9666-081bd8470d94::'
+
+
+def generic_is_member_of_access_group(service, access_group_id, iam_id, *, transaction_id=None, **kwargs):
+    if not access_group_id:
+        raise ValueError('access_group_id must be provided')
+    if not iam_id:
+        raise ValueError('iam_id must be provided')
+    headers = {'Transaction-Id': transaction_id}
+    sdk_headers = get_sdk_headers(
+        service_name=service.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='is_member_of_access_group'
+    )
+    headers.update(sdk_headers)
+    if 'headers' in kwargs:
+        headers.update(kwargs.get('headers'))
+        del kwargs['headers']
+    path_param_keys = ['access_group_id', 'iam_id']
+    path_param_values = service.encode_path_vars(access_group_id, iam_id)
+    path_param_dict = dict(zip(path_param_keys, path_param_values))
+    url = '/v2/groups/{access_group_id}/members/{iam_id}'.format(**path_param_dict)
+    request = service.prepare_request(method='HEAD', url=url, headers=headers)
+    return service.send(request, **kwargs)
+
+
+def generic_get_resource_instance(service, id, **kwargs):  # pylint: disable=redefined-builtin
+    if not id:
+        raise ValueError('id must be provided')
+    headers = {}
+    sdk_headers = get_sdk_headers(
+        service_name=service.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_resource_instance'
+    )
+    headers.update(sdk_headers)
+    if 'headers' in kwargs:
+        headers.update(kwargs.get('headers'))
+        del kwargs['headers']
+    headers['Accept'] = 'application/json'
+    path_param_keys = ['id']
+    path_param_values = service.encode_path_vars(id)
+    path_param_dict = dict(zip(path_param_keys, path_param_values))
+    url = '/v2/resource_instances/{id}'.format(**path_param_dict)
+    request = service.prepare_request(method='GET', url=url, headers=headers)
+    return service.send(request, **kwargs)
+
+
+def stub(service):
+    service.send = lambda request, **kwargs: request
+    return service
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--count', type=int, default=50000, help='the number of calls per run')
+    parser.add_argument('--repeat', type=int, default=5, help='the number of runs; the fastest is reported')
+    options = parser.parse_args()
+
+    access_groups = stub(IamAccessGroupsV2(authenticator=BearerTokenAuthenticator('token')))
+    resource_controller = stub(ResourceControllerV2(authenticator=BearerTokenAuthenticator('token')))
+    distinct_ids = [INSTANCE_ID.replace('8d7af921', '{0:08x}'.format(i)) for i in range(options.count)]
+    operations = (
+        (
+            'is_member_of_access_group',
+            lambda ids: generic_is_member_of_access_group(access_groups, 'AccessGroupId-1234', next(ids)),
+            lambda ids: access_groups.is_member_of_access_group('AccessGroupId-1234', next(ids)),
+        ),
+        (
+            'get_resource_instance',
+            lambda ids: generic_get_resource_instance(resource_controller, next(ids)),
+            lambda ids: resource_controller.get_resource_instance(next(ids)),
+        ),
+    )
+
+    print('{0:<27} {1:<9} {2:>10} {3:>10} {4:>8}'.format('operation', 'ids', 'generic', 'template', 'speedup'))
+    for name, generic, template in operations:
+        for ids_name, ids in (('repeated', [INSTANCE_ID] * options.count), ('distinct', distinct_ids)):
+            assert generic(iter(ids)) == template(iter(ids))
+            timings = []
+            for call in (generic, template):
+                runs = []
+                for _ in range(options.repeat):
+                    iterator = iter(ids)
+                    runs.append(timeit.timeit(lambda: call(iterator), number=options.count))
+                timings.append(min(runs) / options.count)
+            print(
+                '{0:<27} {1:<9} {2:>8.2f}us {3:>8.2f}us {4:>7.2f}x'.format(
+                    name, ids_name, timings[0] * 1e6, timings[1] * 1e6, timings[0] / timings[1]
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure IamPolicyManagementV1.get_role() calls against a local stand-in for
+the service, without a response cache (`uncached`), with a cache whose
+results stay fresh (`cached`), and with a cache whose results expire on
+every call and are revalidated with their ETag (`revalidated`).
+
+The stand-in answers after `--latency` milliseconds, as a remote service
+would, and answers 304 Not Modified to requests whose If-None-Match header
+matches the ETag of the role.
+
+    python benchmarks/response_cache.py [--count N] [--roles N] [--latency MS]
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+
+from ibm_platform_services import response_cache
+from ibm_platform_services.iam_policy_management_v1 import IamPolicyManagementV1
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        time.sleep(self.server.latency)
+        role_id = self.path.rsplit('/', 1)[-1]
+        etag = '"{0}"'.format(role_id)
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = json.dumps(
+            {
+                'id': role_id,
+                'display_name': 'Role ' + role_id,
+                'description': 'A custom role',
+                'actions': ['iam.policy.read', 'iam.policy.update'] * 10,
+                'crn': 'crn:v1:bluemix:public:iam::::role:' + role_id,
+            }
+        ).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def client(url, cache=None):
+    service = IamPolicyManagementV1(authenticator=BearerTokenAuthenticator('token'))
+    service.set_service_url(url)
+    if cache is not None:
+        response_cache.set_cache(service, cache)
+    return service
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--count', type=int, default=2000, help='the number of calls per run')
+    parser.add_argument('--roles', type=int, default=20, help='the number of distinct roles requested')
+    parser.add_argument('--latency', type=float, default=2, help='the latency of the stand-in, in milliseconds')
+    options = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.latency = options.latency / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+
+    caches = {
+        'uncached': None,
+        'cached': response_cache.ResponseCache(),
+        'revalidated': response_cache.ResponseCache(ttls={'get_role': 0}),
+    }
+    print('{0:<12} {1:>10} {2:>12} {3:>8} {4:>8}'.format('cache', 'time', 'calls/s', 'hits', 'misses'))
+    for name, cache in caches.items():
+        service = client(url, cache)
+        start = time.perf_counter()
+        for i in range(options.count):
+            service.get_role('role-{0}'.format(i % options.roles))
+        elapsed = time.perf_counter() - start
+        hits = misses = '-'
+        if cache is not None:
+            hits, misses = sum(cache.hits.values()), sum(cache.misses.values())
+        print(
+            '{0:<12} {1:>8.2f}s {2:>12.0f} {3:>8} {4:>8}'.format(name, elapsed, options.count / elapsed, hits, misses)
+        )
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
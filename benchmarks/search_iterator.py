@@ -0,0 +1,103 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the peak memory and time of walking a large GlobalSearchV2.search result with SearchIterator.
+
+A local HTTP server stands in for Global Search: it serves --items results in
+batches of --limit, threading an opaque search cursor, and answers each call
+after --latency-ms. The caller spends --processing-ms on every batch.
+
+    python benchmarks/search_iterator.py [--items N] [--limit N] [--latency-ms N] [--processing-ms N]
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+import tracemalloc
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_platform_services.global_search_v2 import GlobalSearchV2, SearchIterator
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        time.sleep(self.server.latency)
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        start = int(body.get('search_cursor', '0'))
+        end = min(start + self.server.limit, self.server.items)
+        items = [
+            {'crn': 'crn:v1:bluemix:public:service:global:a/account::instance-{0}'.format(i), 'name': 'name'}
+            for i in range(start, end)
+        ]
+        body = json.dumps({'search_cursor': str(end), 'limit': self.server.limit, 'items': items}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=50000)
+    parser.add_argument('--limit', type=int, default=1000)
+    parser.add_argument('--latency-ms', type=float, default=20.0)
+    parser.add_argument('--processing-ms', type=float, default=20.0)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.items = args.items
+    server.limit = args.limit
+    server.latency = args.latency_ms / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = GlobalSearchV2(authenticator=NoAuthAuthenticator())
+    client.set_service_url('http://127.0.0.1:{0}'.format(server.server_address[1]))
+
+    def process_all(results):
+        count = 0
+        for count, _ in enumerate(results, 1):
+            if count % args.limit == 0:
+                time.sleep(args.processing_ms / 1000)
+        return count
+
+    for label, walk in [
+        ('get_all()', lambda: process_all(SearchIterator(client=client, fields=['name']).get_all())),
+        ('iteration', lambda: process_all(SearchIterator(client=client, fields=['name']))),
+        ('prefetch', lambda: process_all(SearchIterator(client=client, fields=['name'], prefetch=True))),
+    ]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        count = walk()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print('{0:<10} {1:8d} items  peak {2:8.1f} MiB  {3:6.2f} s'.format(label, count, peak / 2**20, elapsed))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the requests sent when many threads call
+GlobalCatalogV1.get_catalog_entry() for a few hot entries at the same time,
+with and without coalescing of identical concurrent requests.
+
+Each of `--threads` threads makes `--count` calls for entries picked among
+`--entries`, against a local stand-in for the service that answers after
+`--latency` milliseconds.
+
+    python benchmarks/single_flight.py [--threads N] [--count N] [--entries N] [--latency MS]
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+import requests
+
+from ibm_platform_services import single_flight
+from ibm_platform_services.global_catalog_v1 import GlobalCatalogV1
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        with self.server.lock:
+            self.server.requests += 1
+        time.sleep(self.server.latency)
+        body = json.dumps({'id': self.path.rsplit('/', 1)[-1], 'kind': 'service', 'tags': ['a'] * 20}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--threads', type=int, default=64, help='the number of calling threads')
+    parser.add_argument('--count', type=int, default=20, help='the number of calls per thread')
+    parser.add_argument('--entries', type=int, default=4, help='the number of distinct entries requested')
+    parser.add_argument('--latency', type=float, default=20, help='the latency of the stand-in, in milliseconds')
+    options = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.latency = options.latency / 1000
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print('{0:<12} {1:>8} {2:>10} {3:>10}'.format('mode', 'calls', 'requests', 'time'))
+    for mode in ('plain', 'coalesced'):
+        service = GlobalCatalogV1(authenticator=BearerTokenAuthenticator('token'))
+        service.set_service_url('http://127.0.0.1:{0}'.format(server.server_address[1]))
+        service.get_http_client().mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=options.threads))
+        if mode == 'coalesced':
+            single_flight.set_single_flight(service, single_flight.SingleFlight())
+        server.requests = 0
+
+        def worker(offset, service=service):
+            for i in range(options.count):
+                service.get_catalog_entry('entry-{0}'.format((offset + i) % options.entries))
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(options.threads) as executor:
+            list(executor.map(worker, range(options.threads)))
+        elapsed = time.perf_counter() - start
+        print(
+            '{0:<12} {1:>8} {2:>10} {3:>9.2f}s'.format(mode, options.threads * options.count, server.requests, elapsed)
+        )
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
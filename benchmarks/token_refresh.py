@@ -0,0 +1,116 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the latency of ResourceControllerV2.get_resource_instance() calls
+authenticated with short-lived IAM tokens, with and without the background
+token refresher.
+
+Each mode calls a local stand-in for the service and the token service for
+`--duration` seconds. The tokens live for `--ttl` seconds, and the token
+service answers after `--token-latency` milliseconds.
+
+    python benchmarks/token_refresh.py [--duration S] [--ttl S] [--token-latency MS]
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+import jwt
+
+from ibm_platform_services import token_refresh
+from ibm_platform_services.resource_controller_v2 import ResourceControllerV2
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers['Content-Length']))
+        time.sleep(self.server.token_latency)
+        now = int(time.time())
+        access_token = jwt.encode({'iat': now, 'exp': now + self.server.ttl}, 'x' * 32, algorithm='HS256')
+        self.respond({'access_token': access_token, 'token_type': 'Bearer', 'expires_in': self.server.ttl})
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.respond({'id': self.path.rsplit('/', 1)[-1], 'state': 'active'})
+
+    def respond(self, result):
+        body = json.dumps(result).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--duration', type=float, default=10, help='the duration of each mode, in seconds')
+    parser.add_argument('--ttl', type=int, default=3, help='the lifetime of the tokens, in seconds')
+    parser.add_argument('--token-latency', type=float, default=300, help='the token service latency, in milliseconds')
+    options = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.ttl = options.ttl
+    server.token_latency = options.token_latency / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+
+    print('{0:<12} {1:>8} {2:>8} {3:>10} {4:>10} {5:>10}'.format('mode', 'calls', 'blocked', 'p50', 'p99', 'max'))
+    for mode in ('plain', 'refreshed'):
+        service = ResourceControllerV2(authenticator=IAMAuthenticator(mode, url=url))
+        service.set_service_url(url)
+        refresher = None
+        if mode == 'refreshed':
+            refresher = token_refresh.TokenRefresher()
+            token_refresh.set_token_refresher(service, refresher)
+        # The first token is not measured.
+        service.get_resource_instance('instance')
+
+        latencies = []
+        deadline = time.perf_counter() + options.duration
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            service.get_resource_instance('instance')
+            latencies.append(time.perf_counter() - start)
+        if refresher is not None:
+            refresher.close()
+        latencies.sort()
+        blocked = sum(1 for latency in latencies if latency >= server.token_latency)
+        print(
+            '{0:<12} {1:>8} {2:>8} {3:>8.2f}ms {4:>8.2f}ms {5:>8.2f}ms'.format(
+                mode,
+                len(latencies),
+                blocked,
+                latencies[len(latencies) // 2] * 1000,
+                latencies[int(len(latencies) * 0.99)] * 1000,
+                latencies[-1] * 1000,
+            )
+        )
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the memory used by CaseManagementV1.upload_file() and
+GlobalCatalogV1.upload_artifact() calls with and without streaming uploads,
+for several file sizes.
+
+A local HTTP server stands in for the services and discards the bodies it
+receives. A file of each of the `--sizes` in MiB is uploaded from a forked
+process, whose growth in peak resident set size is reported; the plain calls
+are passed the open file, and the streamed ones an UploadStream of it. The
+HTTP client reads the multipart body of a plain upload_file() call whole, so
+files larger than `--plain-limit` MiB are only uploaded with streaming.
+
+    python benchmarks/upload_memory.py [--sizes N,N,...] [--plain-limit N] [--chunk-size N]
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import multiprocessing
+import os
+import resource
+import tempfile
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_platform_services import uploads
+from ibm_platform_services.case_management_v1 import CaseManagementV1, FileWithMetadata
+from ibm_platform_services.global_catalog_v1 import GlobalCatalogV1
+
+MIB = 1024 * 1024
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        received = 0
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            size = -1
+            while size:
+                size = int(self.rfile.readline().strip(), 16)
+                self.discard(size + 2)
+                received += size
+        else:
+            received = int(self.headers['Content-Length'])
+            self.discard(received)
+        self.server.received = received
+        body = b'{"id": "attachment"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def discard(self, length):
+        while length:
+            length -= len(self.rfile.read(min(length, MIB)))
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def run(url, operation, mode, path, chunk_size, results):
+    if operation == 'upload_file':
+        service = CaseManagementV1(authenticator=NoAuthAuthenticator())
+    else:
+        service = GlobalCatalogV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(url)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    with open(path, 'rb') as file:
+        if mode == 'plain':
+            body = file
+        else:
+            uploads.set_streaming_uploads(service, chunk_size)
+            body = uploads.UploadStream(file, chunk_size=chunk_size)
+        if operation == 'upload_file':
+            service.upload_file('CS0000001', [FileWithMetadata(body, filename='bundle.bin')])
+        else:
+            service.upload_artifact('entry', 'artifact.bin', artifact=body)
+    elapsed = time.perf_counter() - start
+    growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    results.put((growth * 1024, elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--sizes', default='64,256,2048', help='the sizes of the files, in MiB')
+    parser.add_argument('--plain-limit', type=int, default=256, help='the largest size uploaded plain, in MiB')
+    parser.add_argument('--chunk-size', type=int, default=uploads.DEFAULT_CHUNK_SIZE, help='the chunk size in bytes')
+    options = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+    context = multiprocessing.get_context('fork')
+    block = os.urandom(MIB)
+
+    print(
+        '{0:<15} {1:>8} {2:<10} {3:>14} {4:>10} {5:>10}'.format(
+            'operation', 'MiB', 'mode', 'peak RSS +', 'time', 'MiB/s'
+        )
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for size in (int(size) for size in options.sizes.split(',')):
+            path = os.path.join(directory, '{0}.bin'.format(size))
+            with open(path, 'wb') as file:
+                for _ in range(size):
+                    file.write(block)
+            for operation in ('upload_file', 'upload_artifact'):
+                for mode in ('plain', 'streamed'):
+                    if mode == 'plain' and size > options.plain_limit:
+                        continue
+                    results = context.Queue()
+                    process = context.Process(
+                        target=run, args=(url, operation, mode, path, options.chunk_size, results)
+                    )
+                    process.start()
+                    growth, elapsed = results.get()
+                    process.join()
+                    assert server.received >= size * MIB
+                    print(
+                        '{0:<15} {1:>8} {2:<10} {3:>12.1f}MiB {4:>9.2f}s {5:>10.0f}'.format(
+                            operation, size, mode, growth / MIB, elapsed, size / elapsed
+                        )
+                    )
+            os.remove(path)
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
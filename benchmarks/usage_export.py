@@ -0,0 +1,189 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the time and memory taken to flatten the metrics of a
+UsageReportsV4.get_resource_usage_account() report into rows of dicts built
+from InstanceUsage and Metric objects, and to export them as columns with
+usage_export.export_usage() and export_usage_csv().
+
+A local HTTP server stands in for the Usage Reports service and serves a
+report of `--rows` metric rows, `--metrics` per instance, in pages of
+`--page-size` instances. Each mode runs in a forked process, whose growth in
+peak resident set size is reported, with the time taken and the part of it
+spent on the rows rather than on the requests and the decoding of their JSON,
+which all modes share.
+
+    python benchmarks/usage_export.py [--rows N] [--metrics N] [--page-size N]
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import multiprocessing
+import resource
+import tempfile
+import threading
+import time
+import urllib
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_platform_services import usage_export
+from ibm_platform_services.usage_reports_v4 import InstancesUsage, UsageReportsV4
+
+CRN = 'crn:v1:bluemix:public:cloud-object-storage:global:a/account:{0:08x}-b136-4078-9666-081bd8470d94::'
+
+MIB = 1024 * 1024
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        page = int(query.get('_start', ['0'])[0])
+        result = {'limit': self.server.page_size, 'count': self.server.page_size}
+        if page + 1 < self.server.pages:
+            result['next'] = {'offset': str(page + 1)}
+        body = (json.dumps(result)[:-1] + ', "resources": ' + self.server.resources + '}').encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def resources(count, metrics):
+    return [
+        {
+            'account_id': 'account',
+            'resource_instance_id': CRN.format(i),
+            'resource_id': 'cloud-object-storage',
+            'pricing_country': 'USA',
+            'currency_code': 'USD',
+            'billable': True,
+            'plan_id': '744bfc56-d12c-4866-88d5-dac9139e0e5d',
+            'month': '2022-06',
+            'usage': [
+                {
+                    'metric': 'METRIC_{0}'.format(m),
+                    'unit': 'GIGABYTE_MONTHS',
+                    'quantity': i + m / 10,
+                    'rateable_quantity': i + m / 10,
+                    'cost': i * 0.02,
+                    'rated_cost': i * 0.025,
+                    'price': [{'price': 0.02, 'quantityTier': 1}],
+                    'discounts': [],
+                }
+                for m in range(metrics)
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def flatten(operation):
+    # The object-based flattening the export replaces.
+    rows = []
+    start = None
+    while True:
+        usage = InstancesUsage.from_dict(operation('account', '2022-06', start=start).get_result())
+        for instance in usage.resources:
+            for metric in instance.usage:
+                rows.append(
+                    {
+                        'resource_instance_id': instance.resource_instance_id,
+                        'plan_id': instance.plan_id,
+                        'metric': metric.metric,
+                        'quantity': metric.quantity,
+                        'cost': metric.cost,
+                        'rated_cost': metric.rated_cost,
+                        'currency_code': instance.currency_code,
+                    }
+                )
+        if usage.next is None or not usage.next.offset:
+            return rows
+        start = usage.next.offset
+
+
+def run(url, mode, results):
+    service = UsageReportsV4(authenticator=NoAuthAuthenticator())
+    service.set_service_url(url)
+    fetching = [0.0]
+
+    def operation(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return service.get_resource_usage_account(*args, **kwargs)
+        finally:
+            fetching[0] += time.perf_counter() - start
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == 'objects':
+        rows = len(flatten(operation))
+    elif mode == 'columns':
+        rows = len(usage_export.export_usage(operation, 'account', '2022-06'))
+    else:
+        with tempfile.TemporaryFile('w+', newline='') as file:
+            rows = usage_export.export_usage_csv(operation, 'account', '2022-06', destination=file)
+    elapsed = time.perf_counter() - start
+    growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    results.put((rows, growth * 1024, elapsed, elapsed - fetching[0]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--rows', type=int, default=1000000, help='the number of metric rows of the report')
+    parser.add_argument('--metrics', type=int, default=4, help='the number of metrics of each instance')
+    parser.add_argument('--page-size', type=int, default=1000, help='the number of instances in each page')
+    options = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.page_size = options.page_size
+    server.resources = json.dumps(resources(options.page_size, options.metrics))
+    server.pages = max(1, options.rows // (options.page_size * options.metrics))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+    context = multiprocessing.get_context('fork')
+
+    print(
+        '{0:<9} {1:>9} {2:>14} {3:>10} {4:>10} {5:>14}'.format(
+            'mode', 'rows', 'peak RSS +', 'time', 'rows time', 'rows/s (rows)'
+        )
+    )
+    for mode in ('objects', 'columns', 'csv'):
+        results = context.Queue()
+        process = context.Process(target=run, args=(url, mode, results))
+        process.start()
+        rows, growth, elapsed, converting = results.get()
+        process.join()
+        assert rows == server.pages * options.page_size * options.metrics
+        print(
+            '{0:<9} {1:>9} {2:>12.1f}MiB {3:>9.2f}s {4:>9.2f}s {5:>14.0f}'.format(
+                mode, rows, growth / MIB, elapsed, converting, rows / converting
+            )
+        )
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,429 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides asyncio variants of the service clients and pagers.
+
+Every service class has an `Async` counterpart (for example
+AsyncResourceControllerV2 for ResourceControllerV2) whose operations take the
+same arguments as the synchronous ones and return awaitables that resolve to a
+DetailedResponse:
+
+    async with AsyncResourceControllerV2.new_instance() as client:
+        response = await client.get_resource_instance(id=instance_id)
+
+Likewise every pager has an `Async` counterpart that supports `async for`:
+
+    pager = AsyncResourceInstancesPager(client=client, limit=100)
+    async for instance in pager:
+        ...
+
+Requests are sent with aiohttp, which is installed with the `async` extra:
+
+    pip install "ibm-platform-services[async]"
+
+Token refreshes by the authenticator's token manager are run on the default
+executor so that they never block the event loop.
+"""
+
+import asyncio
+import importlib
+import time
+from typing import AsyncIterator, List
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators import Authenticator
+from ibm_cloud_sdk_core.token_managers.token_manager import TokenManager
+
+from . import instrumentation, json_codec
+from .pagination import record_page_call, replay_page_call
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+# Maps the synchronous service and pager classes to the modules that define them.
+_SERVICE_CLASSES = {
+    'CaseManagementV1': 'case_management_v1',
+    'CatalogManagementV1': 'catalog_management_v1',
+    'ContextBasedRestrictionsV1': 'context_based_restrictions_v1',
+    'EnterpriseBillingUnitsV1': 'enterprise_billing_units_v1',
+    'EnterpriseManagementV1': 'enterprise_management_v1',
+    'EnterpriseUsageReportsV1': 'enterprise_usage_reports_v1',
+    'GlobalCatalogV1': 'global_catalog_v1',
+    'GlobalSearchV2': 'global_search_v2',
+    'GlobalTaggingV1': 'global_tagging_v1',
+    'IamAccessGroupsV2': 'iam_access_groups_v2',
+    'IamIdentityV1': 'iam_identity_v1',
+    'IamPolicyManagementV1': 'iam_policy_management_v1',
+    'IbmCloudShellV1': 'ibm_cloud_shell_v1',
+    'OpenServiceBrokerV1': 'open_service_broker_v1',
+    'ResourceControllerV2': 'resource_controller_v2',
+    'ResourceManagerV2': 'resource_manager_v2',
+    'UsageMeteringV4': 'usage_metering_v4',
+    'UsageReportsV4': 'usage_reports_v4',
+    'UserManagementV1': 'user_management_v1',
+}
+
+_PAGER_CLASSES = {
+    'GetCasesPager': 'case_management_v1',
+    'EnterprisesPager': 'enterprise_management_v1',
+    'AccountsPager': 'enterprise_management_v1',
+    'AccountGroupsPager': 'enterprise_management_v1',
+    'GetResourceUsageReportPager': 'enterprise_usage_reports_v1',
+    'AccessGroupsPager': 'iam_access_groups_v2',
+    'AccessGroupMembersPager': 'iam_access_groups_v2',
+    'ResourceInstancesPager': 'resource_controller_v2',
+    'ResourceAliasesForInstancePager': 'resource_controller_v2',
+    'ResourceKeysForInstancePager': 'resource_controller_v2',
+    'ResourceKeysPager': 'resource_controller_v2',
+    'ResourceBindingsPager': 'resource_controller_v2',
+    'ResourceAliasesPager': 'resource_controller_v2',
+    'ResourceBindingsForAliasPager': 'resource_controller_v2',
+    'UsersPager': 'user_management_v1',
+}
+
+__all__ = ['AsyncServiceMixin', 'AsyncPager'] + [
+    'Async' + name for name in list(_SERVICE_CLASSES) + list(_PAGER_CLASSES)
+]
+
+
+##############################################################################
+# Service
+##############################################################################
+
+
+class _DeferredAuthenticator(Authenticator):
+    """
+    Wraps the authenticator of an async client so that prepare_request() does not
+    authenticate; the async client authenticates the request just before sending it.
+    """
+
+    def __init__(self, authenticator: Authenticator) -> None:
+        self.authenticator = authenticator
+
+    def authenticate(self, req: dict) -> None:
+        pass
+
+    def validate(self) -> None:
+        self.authenticator.validate()
+
+    def authentication_type(self) -> str:
+        return self.authenticator.authentication_type()
+
+    def __getattr__(self, name):
+        return getattr(self.authenticator, name)
+
+
+class AsyncServiceMixin:
+    """
+    Turns a service class into an asyncio client: its `send()` method returns an
+    awaitable, so every generated operation returns an awaitable as well.
+
+    The client opens an aiohttp session on first use; close it with `close()` or
+    use the client as an async context manager. The retry settings of the
+    synchronous clients (`enable_retries()`) do not apply to asyncio clients.
+
+    :attr int connection_limit: The maximum number of simultaneous connections.
+    :attr int connection_limit_per_host: The maximum number of simultaneous
+          connections to one host (0 means no limit).
+    :attr bool is_async: Marks the asyncio clients, whose send() returns an
+          awaitable; the send middleware of the opt-in modules checks it.
+    """
+
+    connection_limit = 100
+    connection_limit_per_host = 0
+    is_async = True
+
+    # The calls are measured by send() and _send() rather than by instrumentation.install().
+    _measures_calls = True
+
+    def __init__(self, *args, **kwargs) -> None:
+        if aiohttp is None:
+            raise ImportError(
+                'The asyncio clients require the aiohttp package; install it with '
+                '"pip install ibm-platform-services[async]"'
+            )
+        super().__init__(*args, **kwargs)
+        # The authenticator is validated by BaseService before it is wrapped.
+        self.authenticator = _DeferredAuthenticator(self.authenticator)
+        self._session = None
+        self._token_lock = None
+
+    def get_authenticator(self) -> Authenticator:
+        return self.authenticator.authenticator
+
+    def send(self, request: dict, **kwargs):
+        """
+        Send a request prepared with prepare_request().
+
+        :return: An awaitable that resolves to a DetailedResponse, or raises an ApiException.
+               If the `stream` keyword argument is true, the result of a successful
+               response is the aiohttp.ClientResponse, which the caller must release.
+        """
+        metrics = None
+        if type(instrumentation.get_instrumentation(self)) is not instrumentation.Instrumentation:
+            # Taken now, as the operation was recorded in the context of the caller.
+            metrics = instrumentation.take_operation(request)
+        else:
+            instrumentation.discard_operation()
+        return self._send(request, metrics, **kwargs)
+
+    async def close(self) -> None:
+        """
+        Close the aiohttp session used by the client.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit, limit_per_host=self.connection_limit_per_host)
+            self._session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.CookieJar(unsafe=True))
+        return self._session
+
+    async def _authenticate(self, request: dict) -> None:
+        authenticator = self.get_authenticator()
+        token_manager = getattr(authenticator, 'token_manager', None)
+        if isinstance(token_manager, TokenManager):
+            # Fetch or refresh the token off the event loop; authenticate() then finds it ready.
+            if token_manager._is_token_expired() or token_manager.refresh_time < token_manager._get_current_time():
+                if self._token_lock is None:
+                    self._token_lock = asyncio.Lock()
+                async with self._token_lock:
+                    await asyncio.get_running_loop().run_in_executor(None, token_manager.get_token)
+        authenticator.authenticate(request)
+
+    async def _send(self, request: dict, metrics: instrumentation.OperationMetrics, **kwargs) -> DetailedResponse:
+        if metrics is None:
+            return await self._send_request(request, None, **kwargs)
+        measured = instrumentation.get_instrumentation(self)
+        measured.start_operation(metrics, request)
+        try:
+            return await self._send_request(request, metrics, **kwargs)
+        except Exception as error:
+            metrics.error = error
+            raise
+        finally:
+            measured.end_operation(metrics)
+
+    async def _send_request(
+        self, request: dict, metrics: instrumentation.OperationMetrics, **kwargs
+    ) -> DetailedResponse:
+        kwargs = dict({'timeout': 60}, **kwargs)
+        kwargs = dict(kwargs, **self.http_config)
+        stream_response = kwargs.get('stream') or False
+
+        await self._authenticate(request)
+
+        options = {'timeout': _client_timeout(kwargs.get('timeout'))}
+        if self.disable_ssl_verification or kwargs.get('verify') is False:
+            options['ssl'] = False
+        if kwargs.get('proxies'):
+            options['proxy'] = kwargs['proxies'].get(request['url'].split(':', 1)[0])
+
+        data = request.get('data')
+        if request.get('files'):
+            data = _build_form_data(request['files'], data)
+
+        session = self._get_session()
+        start = time.perf_counter()
+        response = await session.request(
+            request['method'],
+            request['url'],
+            headers=dict(request['headers']),
+            params=request.get('params') or None,
+            data=data,
+            **options,
+        )
+        if metrics is not None:
+            metrics.status_code = response.status
+            metrics.request_bytes = instrumentation.body_size(data)
+        if stream_response and 200 <= response.status <= 299:
+            if metrics is not None:
+                metrics.network_time = time.perf_counter() - start
+            return DetailedResponse(
+                response=response, headers=CaseInsensitiveDict(response.headers), status_code=response.status
+            )
+        try:
+            content = await response.read()
+        finally:
+            response.release()
+        decode_start = time.perf_counter()
+        if metrics is not None:
+            metrics.network_time = decode_start - start
+            metrics.response_bytes = len(content)
+
+        if 200 <= response.status <= 299:
+            if response.status == 204 or request['method'] == 'HEAD':
+                result = None
+            elif not content:
+                result = None
+            else:
+                try:
+                    result = json_codec.get_codec(self).loads(content)
+                except ValueError:
+                    result = _to_requests_response(response, content)
+                if metrics is not None:
+                    metrics.deserialization_time = time.perf_counter() - decode_start
+            return DetailedResponse(
+                response=result, headers=CaseInsensitiveDict(response.headers), status_code=response.status
+            )
+
+        raise ApiException(response.status, http_response=_to_requests_response(response, content))
+
+
+def _client_timeout(timeout) -> 'aiohttp.ClientTimeout':
+    if isinstance(timeout, tuple):
+        return aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+    return aiohttp.ClientTimeout(total=timeout)
+
+
+def _build_form_data(files: list, data) -> 'aiohttp.FormData':
+    form = aiohttp.FormData()
+    if isinstance(data, dict):
+        for name, value in data.items():
+            form.add_field(name, value)
+    for part_name, file_tuple in files:
+        if not isinstance(file_tuple, tuple):
+            form.add_field(part_name, file_tuple)
+            continue
+        filename, value = file_tuple[0], file_tuple[1]
+        content_type = file_tuple[2] if len(file_tuple) > 2 else None
+        form.add_field(part_name, value, filename=filename, content_type=content_type)
+    return form
+
+
+def _to_requests_response(response: 'aiohttp.ClientResponse', content: bytes) -> requests.Response:
+    """
+    Present a response received by aiohttp as a requests.Response, which is what
+    DetailedResponse and ApiException hold for the synchronous clients.
+    """
+    result = requests.Response()
+    result.status_code = response.status
+    result.reason = response.reason
+    result.headers = CaseInsensitiveDict(response.headers)
+    result.url = str(response.url)
+    result.encoding = response.charset
+    result._content = content  # pylint: disable=protected-access
+    return result
+
+
+##############################################################################
+# Pagers
+##############################################################################
+
+
+class AsyncPager:
+    """
+    The asyncio counterpart of a generated pager. It accepts the same arguments as
+    the pager it wraps (with an asyncio client) and supports `async for`.
+    """
+
+    _pager_class = None
+
+    def __init__(self, *, client: AsyncServiceMixin, **kwargs) -> None:
+        self._client = client
+        self._pager = self._pager_class(client=client, **kwargs)  # pylint: disable=not-callable
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._pager.has_next()
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+        call = record_page_call(self._pager)
+        with instrumentation.page_scope(call.page):
+            response = await call.invoke(self._client)
+        return replay_page_call(self._pager, response)
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        while self.has_next():
+            for item in await self.get_next() or []:
+                yield item
+
+
+##############################################################################
+# Lazily created classes
+##############################################################################
+
+
+def _make_async_class(name: str):
+    if name in _SERVICE_CLASSES:
+        module = importlib.import_module('.' + _SERVICE_CLASSES[name], __package__)
+        service_class = getattr(module, name)
+        return type(
+            'Async' + name,
+            (AsyncServiceMixin, service_class),
+            {
+                '__doc__': 'The asyncio variant of {0}.'.format(name),
+                '__module__': __name__,
+            },
+        )
+    module = importlib.import_module('.' + _PAGER_CLASSES[name], __package__)
+    return type(
+        'Async' + name,
+        (AsyncPager,),
+        {
+            '__doc__': 'The asyncio variant of {0}.'.format(name),
+            '__module__': __name__,
+            '_pager_class': getattr(module, name),
+        },
+    )
+
+
+def __getattr__(name):
+    """
+    Create the asyncio variant of a service or pager class on first access.
+    """
+    if name.startswith('Async') and (name[5:] in _SERVICE_CLASSES or name[5:] in _PAGER_CLASSES):
+        value = _make_async_class(name[5:])
+        globals()[name] = value
+        return value
+    raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,320 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides BatchExecutor, which calls a service operation for
+many argument sets with bounded concurrency:
+
+    from ibm_platform_services.batch import BatchExecutor
+
+    with BatchExecutor(max_workers=16) as executor:
+        for result in executor.map(resource_controller_service.get_resource_instance, instance_ids):
+            if result.error is None:
+                print(result.response.get_result()['name'])
+
+The results are returned in the order of the arguments, or as they complete,
+and a failed call is returned with its exception instead of raising it. The
+argument sets are taken from their iterable only as results are consumed, so
+a generator of millions of ids is never read far ahead of the caller.
+
+Transient errors (connection errors, timeouts, and 429, 500, 502, 503 and 504
+responses) are retried with exponential backoff, as long as the operation is
+idempotent (a GET, HEAD, OPTIONS, PUT or DELETE request) or the error is a 429
+response, which the service sends before doing anything; the other operations,
+such as a POST request that creates a resource, may have taken effect before
+they failed, and are only retried if `map()` is called with
+`retry_unsafe=True`. A 429 response holds all the calls to its host for the
+delay of its Retry-After header, and the calls to a host can be limited
+further with `max_per_host` and `host_limits`, since one executor may run the
+batches of several clients at once.
+"""
+
+import collections
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import itertools
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+from urllib.parse import urlsplit
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+import requests
+
+from .rate_limit import get_retry_after
+
+# The status codes of the responses whose calls are retried.
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+# The HTTP methods of the operations that can be retried after any transient error.
+IDEMPOTENT_METHODS = frozenset(['DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE'])
+
+
+class BatchResult:
+    """
+    The outcome of one call of a batch.
+
+    :attr int index: The position of the argument set in the arguments of the batch.
+    :attr arguments: The argument set.
+    :attr DetailedResponse response: The response of the call, or None if it failed.
+    :attr Exception error: The exception raised by the last attempt of the call, or
+          None if it succeeded.
+    :attr int attempts: The number of times the operation was called.
+    """
+
+    __slots__ = ('index', 'arguments', 'response', 'error', 'attempts')
+
+    def __init__(
+        self,
+        index: int,
+        arguments: Any,
+        *,
+        response: DetailedResponse = None,
+        error: Exception = None,
+        attempts: int = 1,
+    ) -> None:
+        self.index = index
+        self.arguments = arguments
+        self.response = response
+        self.error = error
+        self.attempts = attempts
+
+    def get_result(self):
+        """
+        Return the result of the response, or raise the exception of the call.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.response.get_result()
+
+    def __repr__(self) -> str:
+        outcome = 'error={0!r}'.format(self.error) if self.error is not None else 'ok'
+        return 'BatchResult(index={0}, {1}, attempts={2})'.format(self.index, outcome, self.attempts)
+
+
+class _Host:
+    """
+    The calls in progress to a host, and until when they are held after a 429 response.
+    """
+
+    def __init__(self, limit: Optional[int]) -> None:
+        self._slots = threading.BoundedSemaphore(limit) if limit else None
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            if self._slots is not None:
+                self._slots.acquire()  # pylint: disable=consider-using-with
+            # A 429 response may have arrived while waiting for the slot.
+            if self._resume_at <= time.monotonic():
+                return
+            self.release()
+
+    def release(self) -> None:
+        if self._slots is not None:
+            self._slots.release()
+
+    def hold(self, delay: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+
+class BatchExecutor:
+    """
+    Calls service operations for many argument sets on a bounded pool of worker threads.
+
+    The executor may run several batches at once, for example from several
+    threads; `max_workers` bounds the calls in progress across all of them.
+    Close the executor, or use it as a context manager, to stop its threads.
+
+    :param int max_workers: (optional) The maximum number of calls in progress.
+    :param int max_per_host: (optional) The maximum number of calls in progress to
+           each host; by default only `max_workers` applies.
+    :param dict host_limits: (optional) Per-host overrides of `max_per_host`, keyed
+           by host name or `host:port`.
+    :param int max_pending: (optional) The maximum number of argument sets of a
+           batch taken from its iterable ahead of the results consumed; by default
+           twice `max_workers`.
+    :param int max_retries: (optional) The number of times a call that failed with
+           a transient error is retried.
+    :param float retry_interval: (optional) The delay in seconds before the first
+           retry; it doubles with each retry.
+    :param float max_retry_interval: (optional) The maximum delay in seconds before a retry.
+
+    :attr int retries: The number of calls retried.
+    :attr int throttled: The number of 429 responses received.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 8,
+        max_per_host: int = None,
+        host_limits: Dict[str, int] = None,
+        max_pending: int = None,
+        max_retries: int = 4,
+        retry_interval: float = 0.5,
+        max_retry_interval: float = 30.0,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        if max_pending is not None and max_pending < 1:
+            raise ValueError('max_pending must be at least 1')
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self.host_limits = dict(host_limits or {})
+        self.max_pending = max_pending or 2 * max_workers
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.retries = 0
+        self.throttled = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='BatchExecutor')
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def map(
+        self,
+        method: Callable[..., DetailedResponse],
+        arguments: Iterable,
+        *,
+        ordered: bool = True,
+        retry_unsafe: bool = False,
+    ) -> Iterator[BatchResult]:
+        """
+        Call an operation once for each argument set, and return the results as they are consumed.
+
+        Each argument set is a dict of keyword arguments, a tuple of positional
+        arguments, or the single positional argument of the operation.
+
+        :param method: The operation, usually a method of a service client, for
+               example `iam_identity_service.get_api_key`.
+        :param arguments: The argument sets; an iterable that may be a generator.
+        :param bool ordered: (optional) If true, the results are returned in the
+               order of the argument sets; otherwise as the calls complete.
+        :param bool retry_unsafe: (optional) If true, the calls of an operation that
+               is not idempotent, such as a POST request, are retried after any
+               transient error rather than only after a 429 response.
+        :return: An iterator of the results of the calls.
+        :rtype: Iterator[BatchResult]
+        """
+        host = self._get_host(method)
+        calls = ((index, arguments) for index, arguments in enumerate(arguments))
+        return self._results(method, host, calls, ordered, retry_unsafe)
+
+    def close(self) -> None:
+        """
+        Stop the worker threads once the calls in progress complete.
+        """
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'BatchExecutor':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get_host(self, method: Callable) -> _Host:
+        service_url = getattr(getattr(method, '__self__', None), 'service_url', None)
+        netloc = urlsplit(service_url).netloc.lower() if service_url else ''
+        with self._lock:
+            host = self._hosts.get(netloc)
+            if host is None:
+                limit = self.host_limits.get(netloc, self.host_limits.get(netloc.split(':')[0], self.max_per_host))
+                host = self._hosts[netloc] = _Host(limit)
+            return host
+
+    def _results(
+        self, method, host: _Host, calls: Iterator, ordered: bool, retry_unsafe: bool
+    ) -> Iterator[BatchResult]:
+        pending = collections.deque() if ordered else set()
+        add = pending.append if ordered else pending.add
+        for index, arguments in itertools.islice(calls, self.max_pending):
+            add(self._executor.submit(self._call, method, host, index, arguments, retry_unsafe))
+        try:
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    add = pending.add
+                for future in done:
+                    for index, arguments in itertools.islice(calls, 1):
+                        add(self._executor.submit(self._call, method, host, index, arguments, retry_unsafe))
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _call(self, method, host: _Host, index: int, arguments, retry_unsafe: bool) -> BatchResult:
+        if isinstance(arguments, dict):
+            args, kwargs = (), arguments
+        elif isinstance(arguments, tuple):
+            args, kwargs = arguments, {}
+        else:
+            args, kwargs = (arguments,), {}
+        attempt = 0
+        while True:
+            attempt += 1
+            host.acquire()
+            try:
+                response = method(*args, **kwargs)
+            except Exception as error:  # pylint: disable=broad-except
+                delay = self._get_retry_delay(error, attempt, retry_unsafe)
+                if delay is None:
+                    return BatchResult(index, arguments, error=error, attempts=attempt)
+                if isinstance(error, ApiException) and error.code == 429:
+                    host.hold(delay)
+            else:
+                return BatchResult(index, arguments, response=response, attempts=attempt)
+            finally:
+                host.release()
+            with self._lock:
+                self.retries += 1
+            time.sleep(delay)
+
+    def _get_retry_delay(self, error: Exception, attempt: int, retry_unsafe: bool) -> Optional[float]:
+        # Returns the delay before retrying a failed call, or None if it is not retried.
+        throttled = isinstance(error, ApiException) and error.code == 429
+        if isinstance(error, ApiException):
+            if error.code not in RETRY_STATUS_CODES:
+                return None
+            if throttled:
+                with self._lock:
+                    self.throttled += 1
+        elif not isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return None
+        if attempt > self.max_retries:
+            return None
+        if not (throttled or retry_unsafe or _request_method(error) in IDEMPOTENT_METHODS):
+            return None
+        retry_after = get_retry_after(getattr(getattr(error, 'http_response', None), 'headers', None))
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_interval)
+        # Exponential backoff with jitter, so that the calls that failed together are not retried together.
+        delay = min(self.max_retry_interval, self.retry_interval * 2 ** (attempt - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _request_method(error: Exception) -> Optional[str]:
+    # Returns the HTTP method of the request of a failed call, if the exception holds it.
+    request = getattr(getattr(error, 'http_response', None), 'request', None) or getattr(error, 'request', None)
+    method = getattr(request, 'method', None)
+    return method.upper() if isinstance(method, str) else None
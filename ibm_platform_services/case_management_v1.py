@@ -25,7 +25,7 @@ API Version: 1.0.0
 """
 
 from enum import Enum
-from typing import BinaryIO, Dict, List
+from typing import BinaryIO, Dict, Iterator, List
 import json
 import sys
 
@@ -34,6 +34,7 @@ from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_list, convert_model
 
+from . import instrumentation, json_codec
 from .common import get_sdk_headers
 
 ##############################################################################
@@ -73,6 +74,8 @@ class CaseManagementV1(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # default
@@ -212,7 +215,7 @@ class CaseManagementV1(BaseService):
             'sla_credit_request': sla_credit_request,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -289,7 +292,7 @@ class CaseManagementV1(BaseService):
         )
         headers.update(sdk_headers)
 
-        data = json.dumps(status_payload)
+        data = json_codec.encode(self, status_payload)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -331,7 +334,7 @@ class CaseManagementV1(BaseService):
 
         data = {'comment': comment}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -376,7 +379,7 @@ class CaseManagementV1(BaseService):
 
         data = {'watchlist': watchlist}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -419,7 +422,7 @@ class CaseManagementV1(BaseService):
 
         data = {'watchlist': watchlist}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -468,7 +471,7 @@ class CaseManagementV1(BaseService):
 
         data = {'crn': crn, 'type': type, 'id': id, 'note': note}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2381,14 +2384,15 @@ class GetCasesPager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.get_cases(
-            limit=self._limit,
-            search=self._search,
-            sort=self._sort,
-            status=self._status,
-            fields=self._fields,
-            offset=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.get_cases(
+                limit=self._limit,
+                search=self._search,
+                sort=self._sort,
+                status=self._status,
+                fields=self._fields,
+                offset=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next')
@@ -2400,6 +2404,18 @@ class GetCasesPager:
 
         return result.get('cases')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of Case.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
@@ -33,9 +33,10 @@ import json
 from ibm_cloud_sdk_core import BaseService, DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
-from ibm_cloud_sdk_core.utils import convert_list, convert_model, datetime_to_string, string_to_datetime
+from ibm_cloud_sdk_core.utils import convert_list, convert_model, datetime_to_string
 
-from .common import get_sdk_headers
+from . import instrumentation, json_codec
+from .common import LazyDatetimeAttribute, get_sdk_headers, lazy_datetime
 
 ##############################################################################
 # Service
@@ -74,6 +75,8 @@ class CatalogManagementV1(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # Account
@@ -134,7 +137,7 @@ class CatalogManagementV1(BaseService):
 
         data = {'id': id, 'hide_IBM_cloud_catalog': hide_ibm_cloud_catalog, 'account_filters': account_filters}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -313,7 +316,7 @@ class CatalogManagementV1(BaseService):
             'kind': kind,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -441,7 +444,7 @@ class CatalogManagementV1(BaseService):
             'kind': kind,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -821,7 +824,7 @@ class CatalogManagementV1(BaseService):
             'media': media,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -901,7 +904,7 @@ class CatalogManagementV1(BaseService):
 
         data = {'tags': tags, 'target_kinds': target_kinds, 'content': content}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -984,7 +987,7 @@ class CatalogManagementV1(BaseService):
 
         data = {'tags': tags, 'target_kinds': target_kinds, 'content': content}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1053,7 +1056,7 @@ class CatalogManagementV1(BaseService):
 
         data = {'tags': tags, 'target_kinds': target_kinds, 'content': content}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1290,7 +1293,7 @@ class CatalogManagementV1(BaseService):
             'media': media,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1343,7 +1346,7 @@ class CatalogManagementV1(BaseService):
         )
         headers.update(sdk_headers)
 
-        data = json.dumps(updates)
+        data = json_codec.encode(self, updates)
         headers['content-type'] = 'application/json-patch+json'
 
         if 'headers' in kwargs:
@@ -1570,7 +1573,7 @@ class CatalogManagementV1(BaseService):
 
         data = {'description': description, 'days_until_deprecate': days_until_deprecate}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1905,7 +1908,7 @@ class CatalogManagementV1(BaseService):
 
         data = {'description': description, 'days_until_deprecate': days_until_deprecate}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2086,7 +2089,7 @@ class CatalogManagementV1(BaseService):
 
         data = {'tags': tags, 'target_kinds': target_kinds, 'content': content}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2344,7 +2347,7 @@ class CatalogManagementV1(BaseService):
             'version_locator_id': version_locator_id,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2446,7 +2449,7 @@ class CatalogManagementV1(BaseService):
             'version_locator_id': version_locator_id,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2583,7 +2586,7 @@ class CatalogManagementV1(BaseService):
             'vcenter_datastore': vcenter_datastore,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2680,7 +2683,7 @@ class CatalogManagementV1(BaseService):
             'vcenter_datastore': vcenter_datastore,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2828,7 +2831,7 @@ class CatalogManagementV1(BaseService):
             'vcenter_datastore': vcenter_datastore,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -3114,7 +3117,7 @@ class CatalogManagementV1(BaseService):
             'data': data,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -3270,7 +3273,7 @@ class CatalogManagementV1(BaseService):
             'data': data,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -3697,7 +3700,7 @@ class CatalogManagementV1(BaseService):
         )
         headers.update(sdk_headers)
 
-        data = json.dumps(accounts)
+        data = json_codec.encode(self, accounts)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -3741,7 +3744,7 @@ class CatalogManagementV1(BaseService):
         )
         headers.update(sdk_headers)
 
-        data = json.dumps(accounts)
+        data = json_codec.encode(self, accounts)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -3861,7 +3864,7 @@ class CatalogManagementV1(BaseService):
             'last_operation': last_operation,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -4011,7 +4014,7 @@ class CatalogManagementV1(BaseService):
             'last_operation': last_operation,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -4630,6 +4633,9 @@ class AuditRecord:
     :attr str message: (optional) A message which describes the change.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    created = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -4671,7 +4677,7 @@ class AuditRecord:
         if 'id' in _dict:
             args['id'] = _dict.get('id')
         if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
+            args['created'] = lazy_datetime(_dict.get('created'))
         if 'change_type' in _dict:
             args['change_type'] = _dict.get('change_type')
         if 'target_type' in _dict:
@@ -4756,6 +4762,10 @@ class Catalog:
           vpe.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    created = LazyDatetimeAttribute()
+    updated = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -4849,9 +4859,9 @@ class Catalog:
         if 'disabled' in _dict:
             args['disabled'] = _dict.get('disabled')
         if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
+            args['created'] = lazy_datetime(_dict.get('created'))
         if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
+            args['updated'] = lazy_datetime(_dict.get('updated'))
         if 'resource_group_id' in _dict:
             args['resource_group_id'] = _dict.get('resource_group_id')
         if 'owning_account' in _dict:
@@ -4957,6 +4967,10 @@ class CatalogObject:
     :attr dict data: (optional) Map of data values for this object.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    created = LazyDatetimeAttribute()
+    updated = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -5053,9 +5067,9 @@ class CatalogObject:
         if 'tags' in _dict:
             args['tags'] = _dict.get('tags')
         if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
+            args['created'] = lazy_datetime(_dict.get('created'))
         if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
+            args['updated'] = lazy_datetime(_dict.get('updated'))
         if 'short_description' in _dict:
             args['short_description'] = _dict.get('short_description')
         if 'short_description_i18n' in _dict:
@@ -5574,6 +5588,10 @@ class Deployment:
     :attr datetime updated: (optional) the date'time this catalog was last updated.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    created = LazyDatetimeAttribute()
+    updated = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -5633,9 +5651,9 @@ class Deployment:
         if 'tags' in _dict:
             args['tags'] = _dict.get('tags')
         if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
+            args['created'] = lazy_datetime(_dict.get('created'))
         if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
+            args['updated'] = lazy_datetime(_dict.get('updated'))
         return cls(**args)
 
     @classmethod
@@ -6498,6 +6516,10 @@ class Kind:
     :attr List[Plan] plans: (optional) list of plans.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    created = LazyDatetimeAttribute()
+    updated = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -6564,9 +6586,9 @@ class Kind:
         if 'additional_features' in _dict:
             args['additional_features'] = [Feature.from_dict(x) for x in _dict.get('additional_features')]
         if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
+            args['created'] = lazy_datetime(_dict.get('created'))
         if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
+            args['updated'] = lazy_datetime(_dict.get('updated'))
         if 'versions' in _dict:
             args['versions'] = [Version.from_dict(x) for x in _dict.get('versions')]
         if 'plans' in _dict:
@@ -6934,6 +6956,9 @@ class ObjectAccess:
     :attr datetime create: (optional) date and time create.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    create = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -6971,7 +6996,7 @@ class ObjectAccess:
         if 'target_id' in _dict:
             args['target_id'] = _dict.get('target_id')
         if 'create' in _dict:
-            args['create'] = string_to_datetime(_dict.get('create'))
+            args['create'] = lazy_datetime(_dict.get('create'))
         return cls(**args)
 
     @classmethod
@@ -7491,6 +7516,10 @@ class Offering:
           offering.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    created = LazyDatetimeAttribute()
+    updated = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -7655,9 +7684,9 @@ class Offering:
         if 'rating' in _dict:
             args['rating'] = Rating.from_dict(_dict.get('rating'))
         if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
+            args['created'] = lazy_datetime(_dict.get('created'))
         if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
+            args['updated'] = lazy_datetime(_dict.get('updated'))
         if 'short_description' in _dict:
             args['short_description'] = _dict.get('short_description')
         if 'long_description' in _dict:
@@ -8393,6 +8422,10 @@ class Plan:
     :attr List[Deployment] deployments: (optional) list of deployments.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    created = LazyDatetimeAttribute()
+    updated = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -8461,9 +8494,9 @@ class Plan:
         if 'additional_features' in _dict:
             args['additional_features'] = [Feature.from_dict(x) for x in _dict.get('additional_features')]
         if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
+            args['created'] = lazy_datetime(_dict.get('created'))
         if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
+            args['updated'] = lazy_datetime(_dict.get('updated'))
         if 'deployments' in _dict:
             args['deployments'] = [Deployment.from_dict(x) for x in _dict.get('deployments')]
         return cls(**args)
@@ -9010,6 +9043,10 @@ class State:
           ibm-published, public-published.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    current_entered = LazyDatetimeAttribute()
+    pending_requested = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -9046,11 +9083,11 @@ class State:
         if 'current' in _dict:
             args['current'] = _dict.get('current')
         if 'current_entered' in _dict:
-            args['current_entered'] = string_to_datetime(_dict.get('current_entered'))
+            args['current_entered'] = lazy_datetime(_dict.get('current_entered'))
         if 'pending' in _dict:
             args['pending'] = _dict.get('pending')
         if 'pending_requested' in _dict:
-            args['pending_requested'] = string_to_datetime(_dict.get('pending_requested'))
+            args['pending_requested'] = lazy_datetime(_dict.get('pending_requested'))
         if 'previous' in _dict:
             args['previous'] = _dict.get('previous')
         return cls(**args)
@@ -9174,6 +9211,9 @@ class SyndicationAuthorization:
     :attr datetime last_run: (optional) Date and time last updated.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    last_run = LazyDatetimeAttribute()
+
     def __init__(self, *, token: str = None, last_run: datetime = None) -> None:
         """
         Initialize a SyndicationAuthorization object.
@@ -9191,7 +9231,7 @@ class SyndicationAuthorization:
         if 'token' in _dict:
             args['token'] = _dict.get('token')
         if 'last_run' in _dict:
-            args['last_run'] = string_to_datetime(_dict.get('last_run'))
+            args['last_run'] = lazy_datetime(_dict.get('last_run'))
         return cls(**args)
 
     @classmethod
@@ -9344,6 +9384,9 @@ class SyndicationHistory:
     :attr datetime last_run: (optional) Date and time last syndicated.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    last_run = LazyDatetimeAttribute()
+
     def __init__(
         self, *, namespaces: List[str] = None, clusters: List['SyndicationCluster'] = None, last_run: datetime = None
     ) -> None:
@@ -9368,7 +9411,7 @@ class SyndicationHistory:
         if 'clusters' in _dict:
             args['clusters'] = [SyndicationCluster.from_dict(x) for x in _dict.get('clusters')]
         if 'last_run' in _dict:
-            args['last_run'] = string_to_datetime(_dict.get('last_run'))
+            args['last_run'] = lazy_datetime(_dict.get('last_run'))
         return cls(**args)
 
     @classmethod
@@ -9506,6 +9549,10 @@ class Validation:
           region, namespace, etc).  Values will vary by Content type.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    validated = LazyDatetimeAttribute()
+    requested = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -9540,9 +9587,9 @@ class Validation:
         """Initialize a Validation object from a json dictionary."""
         args = {}
         if 'validated' in _dict:
-            args['validated'] = string_to_datetime(_dict.get('validated'))
+            args['validated'] = lazy_datetime(_dict.get('validated'))
         if 'requested' in _dict:
-            args['requested'] = string_to_datetime(_dict.get('requested'))
+            args['requested'] = lazy_datetime(_dict.get('requested'))
         if 'state' in _dict:
             args['state'] = _dict.get('state')
         if 'last_operation' in _dict:
@@ -9636,6 +9683,10 @@ class Version:
           version.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    created = LazyDatetimeAttribute()
+    updated = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -9766,9 +9817,9 @@ class Version:
         if 'sha' in _dict:
             args['sha'] = _dict.get('sha')
         if 'created' in _dict:
-            args['created'] = string_to_datetime(_dict.get('created'))
+            args['created'] = lazy_datetime(_dict.get('created'))
         if 'updated' in _dict:
-            args['updated'] = string_to_datetime(_dict.get('updated'))
+            args['updated'] = lazy_datetime(_dict.get('updated'))
         if 'offering_id' in _dict:
             args['offering_id'] = _dict.get('offering_id')
         if 'catalog_id' in _dict:
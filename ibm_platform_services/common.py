@@ -18,16 +18,33 @@
 This module provides common methods for use across all service modules.
 """
 
+import datetime
+import hashlib
+import io
+import json
+import os
 import platform
+import re
+import time
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from requests.structures import CaseInsensitiveDict
+from requests.utils import quote
+from ibm_cloud_sdk_core.utils import cleanup_values, remove_null_values, string_to_datetime, strip_extra_slashes
+
+from . import instrumentation
 from .version import __version__
 
 HEADER_NAME_USER_AGENT = 'User-Agent'
 SDK_NAME = 'platform-services-python-sdk'
 
 
+@lru_cache(maxsize=None)
 def get_system_info():
     """
-    Get information about the system to be inserted into the User-Agent header
+    Get information about the system to be inserted into the User-Agent header.
+    The platform lookups are performed on first use and cached afterwards.
     """
     format_msg = '(lang=python; os.name={0}; os.version={1}; python.version={2})'
     return format_msg.format(
@@ -35,22 +52,359 @@ def get_system_info():
     )  # Python version
 
 
+@lru_cache(maxsize=None)
 def get_user_agent():
     """
     Get the value to be sent in the User-Agent header
     """
-    return USER_AGENT
+    return '{0}/{1} {2}'.format(SDK_NAME, __version__, get_system_info())
 
 
-USER_AGENT = '{0}/{1} {2}'.format(SDK_NAME, __version__, get_system_info())
+def __getattr__(name):
+    # USER_AGENT is computed on first access rather than at import time.
+    if name == 'USER_AGENT':
+        return get_user_agent()
+    raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
 
 
 def get_sdk_headers(service_name, service_version, operation_id):
-    # pylint: disable=unused-argument
-
     """
-    Get the request headers to be sent in requests by the SDK
+    Get the request headers to be sent in requests by the SDK. The User-Agent
+    header also identifies the operation, which prepare_request() records for
+    its instrumentation once the request is built.
     """
     headers = {}
-    headers[HEADER_NAME_USER_AGENT] = get_user_agent()
+    headers[HEADER_NAME_USER_AGENT] = instrumentation.OperationUserAgent(
+        get_user_agent(), service_name, service_version, operation_id
+    )
     return headers
+
+
+# The attributes of the authenticators and their token managers that hold the
+# state of their tokens rather than their configuration.
+_TOKEN_STATE_ATTRIBUTES = frozenset(
+    [
+        'access_token',
+        'expire_time',
+        'lock',
+        'refresh_time',
+        'refresh_token',
+        'request_time',
+        'token_info',
+        'token_manager',
+    ]
+)
+
+
+def auth_scope(authenticator) -> str:
+    """
+    Return a digest that identifies the credentials of an authenticator, so
+    that what is fetched with one set of credentials is never shared with
+    clients that use another. Every attribute of the authenticator and of its
+    token manager is part of the scope, other than the state of their tokens,
+    so authenticators have the same scope only if they are configured alike.
+    """
+    parts = []
+    for source in (authenticator, getattr(authenticator, 'token_manager', None)):
+        if source is None:
+            continue
+        # Values that are not JSON, such as custom objects, are identified by their repr(),
+        # which includes their id() unless the class defines it.
+        parts.append(type(source).__qualname__)
+        parts.append(json.dumps(auth_configuration(source), sort_keys=True, default=repr))
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+def auth_configuration(source) -> dict:
+    """
+    Return the attributes of an authenticator or token manager that configure
+    it, that is all of them other than the state of its token.
+    """
+    return {k: v for k, v in getattr(source, '__dict__', {}).items() if k not in _TOKEN_STATE_ATTRIBUTES}
+
+
+def stream_size(stream) -> Optional[int]:
+    """
+    Return the number of bytes left in a file object, if it can be known without reading it.
+    """
+    try:
+        return os.fstat(stream.fileno()).st_size - stream.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+    try:
+        position = stream.tell()
+        size = stream.seek(0, io.SEEK_END) - position
+        stream.seek(position)
+        return size
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+# The request headers that do not select the result of an operation.
+_UNKEYED_HEADERS = frozenset(
+    ['authorization', 'traceparent', 'tracestate', 'transaction-id', 'user-agent', 'x-correlation-id', 'x-request-id']
+)
+
+
+def request_key(operation_id: str, request: dict, authenticator) -> tuple:
+    """
+    Return a key that identifies the result of a prepared request without a
+    body: the operation, URL, query parameters, the request headers that
+    select the result, and the scope of the credentials that authenticate it.
+    """
+    headers = request.get('headers') or {}
+    return (
+        operation_id,
+        request['url'],
+        tuple(sorted((request.get('params') or {}).items())),
+        tuple(sorted((k.lower(), v) for k, v in headers.items() if k.lower() not in _UNKEYED_HEADERS)),
+        auth_scope(authenticator),
+    )
+
+
+# The characters that quote(value, safe='') does not escape, and the escaped form of the other ASCII characters.
+_PATH_UNSAFE = re.compile(r'[^A-Za-z0-9_.~-]')
+_PATH_ESCAPES = {chr(code): '%{0:02X}'.format(code) for code in range(128) if _PATH_UNSAFE.match(chr(code))}
+
+
+@lru_cache(maxsize=1024)
+def encode_path_var(value: str) -> str:
+    """
+    Encode a path variable to be substituted into a URL path, like
+    `BaseService.encode_path_vars()` does. The most recently encoded values
+    are cached, as an operation is often called repeatedly for the same ids.
+    """
+    if not isinstance(value, str) or not value.isascii():
+        return quote(value, safe='')
+    # Replacing each distinct unsafe character is faster than quote(), which maps every character.
+    unsafe = set(_PATH_UNSAFE.findall(value))
+    if '%' in unsafe:
+        value = value.replace('%', '%25')
+        unsafe.discard('%')
+    for character in unsafe:
+        value = value.replace(character, _PATH_ESCAPES[character])
+    return value
+
+
+class RequestTemplate:
+    """
+    The parts of the requests of an operation that do not change from call to
+    call, prepared once: the SDK headers, the Accept header, the URL template
+    and the names of its path parameters.
+
+    prepare() builds the same request dict as the generated methods do with
+    get_sdk_headers(), encode_path_vars() and BaseService.prepare_request(),
+    for operations that send neither a body nor files.
+
+    :param str method: The HTTP method of the operation.
+    :param str path: The path of the operation, for example
+           `/v2/resource_instances/{id}`.
+    :param str service_name: The service name passed to get_sdk_headers().
+    :param str service_version: The service version passed to get_sdk_headers().
+    :param str operation_id: The operation id passed to get_sdk_headers().
+    :param str accept: (optional) The value of the Accept header.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        *,
+        service_name: str,
+        service_version: str,
+        operation_id: str,
+        accept: str = None,
+    ) -> None:
+        self.method = method
+        self.path = path
+        self.service_name = service_name
+        self.service_version = service_version
+        self.operation_id = operation_id
+        self.accept = accept
+        self.path_param_names = tuple(re.findall(r'{(\w+)}', path))
+        # A format string with positional fields, filled in with the encoded path variables.
+        self._path_format = re.sub(r'{\w+}', '{}', path)
+        self._sdk_headers = None
+
+    def prepare(
+        self,
+        service,
+        path_values: Iterable[str] = (),
+        *,
+        headers: dict = None,
+        params: dict = None,
+        custom_headers: dict = None,
+    ) -> dict:
+        """
+        Build the request dict of a call of the operation, and record the
+        operation for its instrumentation once the request is built.
+
+        :param BaseService service: The service client that sends the request.
+        :param path_values: The values of the path parameters, in the order of
+               `path_param_names`.
+        :param dict headers: (optional) The header parameters of the operation.
+        :param dict params: (optional) The query parameters of the operation.
+        :param dict custom_headers: (optional) The headers passed by the caller
+               in the `headers` keyword argument.
+        :return: The request dict, authenticated, to be passed to `service.send()`.
+        """
+        start = time.perf_counter()
+        if self._sdk_headers is None:
+            # Computed on first use, as the User-Agent header is.
+            self._sdk_headers = {HEADER_NAME_USER_AGENT: get_user_agent()}
+        if not service.service_url:
+            raise ValueError('The service_url is required')
+        request_headers = dict(headers) if headers else {}
+        request_headers.update(self._sdk_headers)
+        if custom_headers:
+            request_headers.update(custom_headers)
+        if self.accept is not None:
+            request_headers['Accept'] = self.accept
+        request_headers = CaseInsensitiveDict(cleanup_values(remove_null_values(request_headers)))
+        if service.default_headers is not None:
+            request_headers.update(service.default_headers)
+        if 'user-agent' not in request_headers:
+            request_headers.update(service.user_agent_header)
+        path = self._path_format.format(*[encode_path_var(value) for value in path_values])
+        request = {
+            'method': self.method,
+            'url': strip_extra_slashes(service.service_url + path),
+            'headers': request_headers,
+            'params': cleanup_values(remove_null_values(params)),
+            'data': None,
+        }
+        service.authenticator.authenticate(request)
+        request['files'] = []
+        instrumentation.begin_operation(self.service_name, self.service_version, self.operation_id, start)
+        return request
+
+
+_ISO_8601 = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(?:[Zz]|([+-])(\d{2}):?(\d{2}))?$'
+)
+_timezones = {}
+
+
+def parse_datetime(string: str) -> datetime.datetime:
+    """
+    De-serialize a date-time string like `string_to_datetime()` does, parsing
+    the `YYYY-MM-DDTHH:MM:SS[.ffffff][Z|+HH:MM]` form directly and other strings
+    with `string_to_datetime()`. A string without an offset denotes UTC.
+    """
+    match = _ISO_8601.match(string) if isinstance(string, str) else None
+    if match is None:
+        return string_to_datetime(string)
+    year, month, day, hour, minute, second, fraction, sign, offset_hours, offset_minutes = match.groups()
+    tzinfo = datetime.timezone.utc
+    if sign is not None:
+        offset = (sign, offset_hours, offset_minutes)
+        tzinfo = _timezones.get(offset)
+        if tzinfo is None:
+            delta = datetime.timedelta(hours=int(offset_hours), minutes=int(offset_minutes))
+            try:
+                tzinfo = datetime.timezone(-delta if sign == '-' else delta)
+            except ValueError:
+                return string_to_datetime(string)
+            _timezones[offset] = tzinfo
+    try:
+        return datetime.datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int(fraction[:6].ljust(6, '0')) if fraction else 0,
+            tzinfo,
+        )
+    except ValueError:
+        # For example a day or hour out of range; string_to_datetime() reports it.
+        return string_to_datetime(string)
+
+
+class LazyDatetime:
+    """
+    A date-time kept in its string form until it is first needed, as stored by
+    LazyDatetimeAttribute. It compares equal to the datetime it denotes.
+
+    :attr str string: The string form of the date-time.
+    """
+
+    __slots__ = ('string', '_datetime')
+
+    def __init__(self, string: str) -> None:
+        self.string = string
+        self._datetime = None
+
+    def get(self) -> datetime.datetime:
+        """
+        Return the date-time, parsing it on the first call.
+        """
+        if self._datetime is None:
+            self._datetime = parse_datetime(self.string)
+        return self._datetime
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyDatetime):
+            return self.string == other.string or self.get() == other.get()
+        if isinstance(other, datetime.datetime):
+            return self.get() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.get())
+
+    def __repr__(self) -> str:
+        return 'LazyDatetime({0!r})'.format(self.string)
+
+
+def lazy_datetime(value):
+    """
+    Return a LazyDatetime for a date-time string read by from_dict(), or the
+    value itself if it is not a string.
+    """
+    return LazyDatetime(value) if isinstance(value, str) else value
+
+
+class LazyDatetimeAttribute:
+    """
+    A model attribute holding a date-time. A LazyDatetime assigned to the
+    attribute (as from_dict() does with lazy_datetime()) is parsed on first
+    access and replaced with the resulting datetime, so that listings whose
+    date-times are never read do not pay for parsing them; a string that is not
+    a valid date-time then raises a ValueError on that access. Other values,
+    including strings assigned by the caller, are stored as is.
+    """
+
+    def __init__(self) -> None:
+        self.name = None
+
+    def __set_name__(self, owner, name) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self._load(instance)
+        if type(value) is LazyDatetime:  # pylint: disable=unidiomatic-typecheck
+            value = value.get()
+            self._store(instance, value)
+        return value
+
+    def __set__(self, instance, value) -> None:
+        self._store(instance, value)
+
+    def __delete__(self, instance) -> None:
+        try:
+            del instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def _load(self, instance):
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def _store(self, instance, value) -> None:
+        instance.__dict__[self.name] = value
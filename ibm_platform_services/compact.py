@@ -0,0 +1,200 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides compact variants of the model classes, for applications
+that keep large numbers of model objects (for example a full inventory of
+resource instances) in memory.
+
+A compact model class is a subclass of the generated model class that stores
+the model's properties in `__slots__` instead of a per-object `__dict__`, so
+isinstance() checks, to_dict(), from_dict(), __str__() and the property
+accessors work unchanged, and a compact object compares equal to a regular
+object holding the same values. Additional properties of the models that allow
+them are still kept in the object's `__dict__`. Unlike regular objects,
+compact objects do not expose their properties through `vars()` or `__dict__`,
+and attributes that are neither properties nor additional properties are
+ignored when compact objects are compared.
+
+Compact objects are created by the from_dict() and from_dict_list() functions
+below, which decode nested models as compact objects too, or by the usual
+constructor and from_dict() method of a compact class:
+
+    from ibm_platform_services import compact
+    from ibm_platform_services.resource_controller_v2 import ResourceInstance
+
+    instances = compact.from_dict_list(ResourceInstance, result['resources'])
+
+The compact classes of the models in LIST_ITEM_MODELS are also available by
+name, for example `compact.CompactResourceInstance`. As a compact class derives
+from the generated class, its objects still hold the `__dict__` and weak
+reference pointers of the generated objects, so a model with a single property,
+such as global_tagging_v1.Tag, takes as much memory in either form and is not
+listed.
+"""
+
+import importlib
+import threading
+from typing import Dict, List, Type, TypeVar
+
+from . import deserialization
+from .common import LazyDatetimeAttribute
+
+ModelType = TypeVar('ModelType')
+
+# The models returned in bulk by the listing operations, keyed by service module.
+LIST_ITEM_MODELS = {
+    'resource_controller_v2': ('ResourceInstance', 'ResourceKey', 'ResourceBinding', 'ResourceAlias', 'Reclamation'),
+    'usage_reports_v4': ('InstanceUsage',),
+    'iam_identity_v1': ('ApiKey', 'ServiceId', 'TrustedProfile', 'ProfileClaimRule', 'ProfileLink'),
+}
+
+_compact_classes = {}
+_lock = threading.Lock()
+
+
+class CompactModel:
+    """
+    The base class of the compact model classes.
+    """
+
+    __slots__ = ()
+
+    # The generated model class that the compact class derives from, and the names of its attributes.
+    _model_class = None
+    _attributes = ()
+
+    def __eq__(self, other) -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self._model_class):
+            return False
+        return _get_state(self) == _get_state(other)
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (_restore, (self._model_class, _get_state(self)))
+
+    @staticmethod
+    def _nested_model_class(model_class: type) -> type:
+        # Nested models are decoded as compact objects too; see deserialization._compile_spec().
+        if deserialization.get_model_spec(model_class) is None:
+            return model_class
+        return compact_class(model_class)
+
+
+def compact_class(model_class: Type[ModelType]) -> Type[ModelType]:
+    """
+    Return the compact variant of a model class, creating it on first use.
+
+    :param type model_class: A generated model class, for example `ResourceInstance`.
+    :return: A subclass of the model class that stores its properties in `__slots__`.
+    """
+    compact = _compact_classes.get(model_class)
+    if compact is None:
+        with _lock:
+            compact = _compact_classes.get(model_class)
+            if compact is None:
+                spec = deserialization.get_model_spec(model_class)
+                if spec is None or issubclass(model_class, CompactModel):
+                    raise ValueError('{0} does not have a compact variant'.format(model_class.__name__))
+                name = 'Compact' + model_class.__name__
+                attributes = tuple(attribute for attribute, _ in spec.attributes)
+                # The slots of lazily parsed date-times are accessed through a LazyDatetimeAttribute.
+                lazy = [a for a in attributes if isinstance(getattr(model_class, a, None), LazyDatetimeAttribute)]
+                namespace = {
+                    '__slots__': tuple('_' + a if a in lazy else a for a in attributes),
+                    '__module__': __name__,
+                    '__qualname__': name,
+                    '__doc__': model_class.__doc__,
+                    '_model_class': model_class,
+                    '_attributes': attributes,
+                }
+                compact = type(name, (CompactModel, model_class), namespace)
+                for attribute in lazy:
+                    setattr(compact, attribute, _LazyDatetimeSlot(attribute, vars(compact)['_' + attribute]))
+                _compact_classes[model_class] = compact
+    return compact
+
+
+def from_dict(model_class: Type[ModelType], _dict: Dict) -> ModelType:
+    """
+    Initialize a compact model object, and compact nested model objects, from a
+    json dictionary.
+
+    :param type model_class: A generated model class, for example `ResourceInstance`.
+    :param dict _dict: The json representation of the model.
+    :return: An instance of the compact variant of the model class.
+    """
+    return deserialization.from_dict(compact_class(model_class), _dict)
+
+
+def from_dict_list(model_class: Type[ModelType], dicts: List[Dict]) -> List[ModelType]:
+    """
+    Initialize a list of compact model objects from a list of json dictionaries.
+    """
+    return deserialization.from_dict_list(compact_class(model_class), dicts)
+
+
+def _get_state(model) -> dict:
+    if not isinstance(model, CompactModel):
+        return vars(model)
+    state = {}
+    for name in model._attributes:
+        try:
+            state[name] = getattr(model, name)
+        except AttributeError:
+            pass
+    if hasattr(model, '_properties'):
+        # The additional properties.
+        state.update(vars(model))
+    return state
+
+
+class _LazyDatetimeSlot(LazyDatetimeAttribute):
+    """
+    A LazyDatetimeAttribute that keeps its value in a slot of a compact model.
+    """
+
+    def __init__(self, name: str, slot) -> None:
+        super().__init__()
+        self.name = name
+        self._slot = slot
+
+    def __delete__(self, instance) -> None:
+        self._slot.__delete__(instance)
+
+    def _load(self, instance):
+        return self._slot.__get__(instance)
+
+    def _store(self, instance, value) -> None:
+        self._slot.__set__(instance, value)
+
+
+def _restore(model_class: type, state: dict):
+    model = object.__new__(compact_class(model_class))
+    for name, value in state.items():
+        setattr(model, name, value)
+    return model
+
+
+def __getattr__(name):
+    if name.startswith('Compact'):
+        for module_name, class_names in LIST_ITEM_MODELS.items():
+            if name[len('Compact') :] in class_names:
+                module = importlib.import_module('.' + module_name, __package__)
+                return compact_class(getattr(module, name[len('Compact') :]))
+    raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
@@ -0,0 +1,255 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides opt-in gzip compression of large request bodies, and
+explicit negotiation of compressed responses, with byte counts:
+
+    from ibm_platform_services import compression
+
+    gzip = compression.GzipCompression(threshold=4096)
+    compression.set_compression(usage_metering_service, gzip)
+    ...
+    print(gzip.request_wire_bytes['report_resource_usage'], gzip.request_bytes['report_resource_usage'])
+
+Request bodies of at least `threshold` bytes are compressed. A body read from
+a file is compressed as it is sent, in chunks, so it is never held in memory;
+the request is then sent with chunked transfer encoding. Bodies that already
+have a Content-Encoding, for example because `set_enable_gzip_compression()`
+compressed them, are left as they are.
+
+Responses are requested with `Accept-Encoding: gzip`, or `identity` when
+`decompress` is false, and a compressed response is decompressed as it is
+read, also when it is streamed. The byte counts of a streamed response are
+recorded once it has been read to its end.
+
+The asyncio clients compress their requests and negotiate the encoding of
+their responses, but do not record the byte counts of their responses.
+"""
+
+import threading
+import zlib
+from collections import Counter
+from typing import Iterable, Iterator, Optional
+
+import requests
+from ibm_cloud_sdk_core import BaseService
+
+from . import instrumentation
+from .common import stream_size
+from .middleware import SendMiddleware, install_middleware
+
+# The size of the chunks in which a file body is read and compressed.
+CHUNK_SIZE = 64 * 1024
+
+
+class GzipCompression:
+    """
+    The compression settings of a group of service clients, and the byte counts of their calls.
+
+    :param int threshold: (optional) The minimum size in bytes of a request body to compress.
+    :param int level: (optional) The compression level, from 1 (fastest) to 9 (smallest).
+    :param bool decompress: (optional) If false, responses are requested without compression.
+    :param operations: (optional) The ids of the operations whose requests are
+           compressed; by default the requests of all operations are.
+
+    :attr Counter requests_compressed: The number of request bodies compressed, by operation id.
+    :attr Counter request_bytes: The size of the request bodies before compression, by operation id.
+    :attr Counter request_wire_bytes: The size of the request bodies sent, by operation id.
+    :attr Counter response_bytes: The size of the response bodies after decompression, by operation id.
+    :attr Counter response_wire_bytes: The size of the response bodies received, by operation id.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: int = 1024,
+        level: int = 6,
+        decompress: bool = True,
+        operations: Iterable[str] = None,
+    ) -> None:
+        if not 1 <= level <= 9:
+            raise ValueError('level must be between 1 and 9')
+        self.threshold = threshold
+        self.level = level
+        self.decompress = decompress
+        self.operations = None if operations is None else frozenset(operations)
+        self.requests_compressed = Counter()
+        self.request_bytes = Counter()
+        self.request_wire_bytes = Counter()
+        self.response_bytes = Counter()
+        self.response_wire_bytes = Counter()
+        self._lock = threading.Lock()
+
+    def compresses(self, operation_id: Optional[str]) -> bool:
+        """
+        Return true if the requests of an operation are compressed.
+        """
+        return self.operations is None or operation_id in self.operations
+
+    def compress(self, data):
+        """
+        Return a request body compressed with gzip: bytes for bytes, or an
+        iterator of compressed chunks for a file object.
+        """
+        if isinstance(data, (bytes, bytearray)):
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+            return compressor.compress(data) + compressor.flush()
+        return self._compress_stream(data, None, counted=False)
+
+    def _count(self, operation_id: Optional[str], **counts) -> None:
+        key = operation_id or ''
+        with self._lock:
+            for name, value in counts.items():
+                getattr(self, name)[key] += value
+
+    def _compress_stream(self, stream, operation_id: Optional[str], counted: bool = True) -> Iterator[bytes]:
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        read = wire = 0
+        for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            read += len(chunk)
+            compressed = compressor.compress(chunk)
+            if compressed:
+                wire += len(compressed)
+                yield compressed
+        compressed = compressor.flush()
+        wire += len(compressed)
+        yield compressed
+        if counted:
+            self._count(operation_id, requests_compressed=1, request_bytes=read, request_wire_bytes=wire)
+
+
+def set_compression(service: BaseService, compression: Optional[GzipCompression]) -> BaseService:
+    """
+    Compress the large request bodies of a service client, and negotiate the encoding of its responses.
+
+    :param BaseService service: The service client.
+    :param GzipCompression compression: The compression settings, or None to stop compressing.
+    :return: The service client passed in.
+    """
+    service.compression = compression
+    if compression is not None:
+        install_middleware(service, _CompressingSend)
+    return service
+
+
+def get_compression(service: BaseService) -> Optional[GzipCompression]:
+    """
+    Return the compression settings of a service client, or None.
+    """
+    return getattr(service, 'compression', None)
+
+
+class _CompressingSend(SendMiddleware):
+    """
+    Replaces the send() method of a service client, compressing its large
+    request bodies and counting the bytes of its responses.
+    """
+
+    def __call__(self, request: dict, **kwargs):
+        service = self.service
+        compression = getattr(service, 'compression', None)
+        if compression is None:
+            return self.send_next(service, request, **kwargs)
+        operation_id = instrumentation.current_operation_id()
+        # The prepared request may be sent again, so it is left as it is.
+        request = dict(request, headers=request['headers'].copy())
+        request['headers']['Accept-Encoding'] = 'gzip' if compression.decompress else 'identity'
+        is_async = getattr(service, 'is_async', False)
+        data = request.get('data')
+        if (
+            data is not None
+            and not request.get('files')
+            and 'content-encoding' not in request['headers']
+            and compression.compresses(operation_id)
+        ):
+            # The asyncio clients send file bodies as they are.
+            self._compress(compression, operation_id, request, data, streams=not is_async)
+        if is_async:
+            return self.send_next(service, request, **kwargs)
+
+        # The response hooks of a request replace those of the session, such as
+        # the decoders of json_codec and instrumentation, which are kept first.
+        hooks = dict(kwargs.get('hooks') or {})
+        response_hooks = hooks.get('response') or []
+        if callable(response_hooks):
+            response_hooks = [response_hooks]
+        session_hooks = [hook for hook in service.get_http_client().hooks['response'] if hook not in response_hooks]
+        hooks['response'] = session_hooks + list(response_hooks) + [_ResponseCounter(compression, operation_id)]
+        kwargs['hooks'] = hooks
+        return self.send_next(service, request, **kwargs)
+
+    @staticmethod
+    def _compress(
+        compression: GzipCompression, operation_id: Optional[str], request: dict, data, streams: bool
+    ) -> None:
+        # Replaces the body of the request with its compressed form, if it is large enough.
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if isinstance(data, (bytes, bytearray)):
+            if len(data) < compression.threshold:
+                return
+            body = compression.compress(data)
+            compression._count(  # pylint: disable=protected-access
+                operation_id, requests_compressed=1, request_bytes=len(data), request_wire_bytes=len(body)
+            )
+        elif streams and hasattr(data, 'read'):
+            size = stream_size(data)
+            if size is not None and size < compression.threshold:
+                return
+            body = compression._compress_stream(data, operation_id)  # pylint: disable=protected-access
+        else:
+            return
+        request['data'] = body
+        request['headers']['Content-Encoding'] = 'gzip'
+        request['headers'].pop('Content-Length', None)
+
+
+class _ResponseCounter:
+    """
+    A response hook that counts the bytes of a response body as it is read.
+    """
+
+    __slots__ = ('compression', 'operation_id')
+
+    def __init__(self, compression: GzipCompression, operation_id: Optional[str]) -> None:
+        self.compression = compression
+        self.operation_id = operation_id
+
+    def __call__(self, response: requests.Response, **kwargs) -> requests.Response:
+        # Response.content, text, json() and iter_lines() all read the body with iter_content().
+        iter_content = vars(response).get('iter_content')
+        compression, operation_id = self.compression, self.operation_id
+
+        def counting_iter_content(*args, **kwargs):
+            chunks = (
+                iter_content(*args, **kwargs)
+                if iter_content
+                else requests.Response.iter_content(response, *args, **kwargs)
+            )
+            size = 0
+            for chunk in chunks:
+                size += len(chunk)
+                yield chunk
+            tell = getattr(response.raw, 'tell', None)
+            compression._count(  # pylint: disable=protected-access
+                operation_id, response_bytes=size, response_wire_bytes=tell() if tell else size
+            )
+
+        response.iter_content = counting_iter_content
+        return response
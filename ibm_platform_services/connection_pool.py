@@ -0,0 +1,169 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides a registry of keep-alive connection pools that can be
+shared by several service clients.
+
+By default each service client owns a private `requests.Session` and therefore
+a private pool of connections, so a process holding many clients opens (and
+TLS-handshakes) one connection per client even when the clients talk to the
+same host. Clients attached to a ConnectionPoolRegistry keep their own session
+(cookies, retry settings, SSL verification flag) but borrow their connections
+from one pool per host.
+"""
+
+import ssl
+import threading
+from typing import Dict, Type, TypeVar
+from urllib.parse import urlsplit
+
+from ibm_cloud_sdk_core import BaseService
+from ibm_cloud_sdk_core.utils import SSLHTTPAdapter
+from urllib3 import PoolManager
+from urllib3.util.ssl_ import create_urllib3_context
+
+ServiceType = TypeVar('ServiceType', bound=BaseService)
+
+
+class ConnectionPoolRegistry:
+    """
+    A registry of connection pools, one per host, shared by the service clients attached to it.
+
+    :param int pool_maxsize: (optional) The maximum number of connections kept alive
+           for each host.
+    :param bool pool_block: (optional) If true, requests wait for a free connection once
+           a host has `pool_maxsize` connections in use instead of opening (and then
+           discarding) additional ones, which makes `pool_maxsize` a hard cap.
+    :param int num_pools: (optional) The number of distinct pools kept per host (for
+           example, clients that disable SSL verification use a separate pool).
+    :param dict host_limits: (optional) Per-host overrides of `pool_maxsize`, keyed by
+           host name or `host:port`.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        num_pools: int = 10,
+        host_limits: Dict[str, int] = None,
+    ) -> None:
+        if pool_maxsize < 1:
+            raise ValueError('pool_maxsize must be at least 1')
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.num_pools = num_pools
+        self.host_limits = dict(host_limits or {})
+        self._pool_managers = {}
+        self._lock = threading.Lock()
+
+    def new_instance(self, service_class: Type[ServiceType], service_name: str = None) -> ServiceType:
+        """
+        Return a new client of the specified service class, constructed with its
+        `new_instance()` method and attached to this registry.
+
+        :param type service_class: The service class, for example `ResourceControllerV2`.
+        :param str service_name: (optional) The name used to look up the external
+               configuration; defaults to the service class' DEFAULT_SERVICE_NAME.
+        :return: The new service client.
+        """
+        if service_name is None:
+            service_name = service_class.DEFAULT_SERVICE_NAME
+        return self.attach(service_class.new_instance(service_name=service_name))
+
+    def attach(self, service: ServiceType) -> ServiceType:
+        """
+        Route the requests sent by a service client through the pool shared for its host.
+
+        The shared pool is mounted for the host of the client's current service URL and
+        uses the retry configuration the client has at the time of the call, so attach
+        the client again after changing its service URL or calling `enable_retries()`.
+
+        :param BaseService service: The service client to attach.
+        :return: The service client passed in.
+        """
+        if not service.service_url:
+            raise ValueError('The service_url is required')
+        prefix = self._get_prefix(service.service_url)
+        kwargs = {}
+        if service.retry_config is not None:
+            kwargs['max_retries'] = service.retry_config
+        adapter = _SharedPoolAdapter(self.get_pool_manager(service.service_url), **kwargs)
+        service.http_adapter = adapter
+        service.get_http_client().mount(prefix, adapter)
+        return service
+
+    def get_pool_manager(self, url: str) -> PoolManager:
+        """
+        Return the pool manager that holds the connections to the host of a URL,
+        creating it on first use.
+
+        :param str url: A URL of the host.
+        :return: The pool manager shared for the host.
+        """
+        key = self._get_prefix(url)
+        with self._lock:
+            pool_manager = self._pool_managers.get(key)
+            if pool_manager is None:
+                netloc = urlsplit(url).netloc.lower()
+                maxsize = self.host_limits.get(netloc, self.host_limits.get(netloc.split(':')[0], self.pool_maxsize))
+                # Mirror the TLS settings of the SSLHTTPAdapter used by BaseService.
+                ssl_context = create_urllib3_context()
+                ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+                pool_manager = PoolManager(
+                    num_pools=self.num_pools, maxsize=maxsize, block=self.pool_block, ssl_context=ssl_context
+                )
+                self._pool_managers[key] = pool_manager
+            return pool_manager
+
+    def close(self) -> None:
+        """
+        Close all the pooled connections. Pools are re-created on demand if the
+        attached clients keep sending requests.
+        """
+        with self._lock:
+            for pool_manager in self._pool_managers.values():
+                pool_manager.clear()
+
+    @staticmethod
+    def _get_prefix(url: str) -> str:
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.netloc:
+            raise ValueError('Invalid service URL: {0}'.format(url))
+        return '{0}://{1}/'.format(parts.scheme, parts.netloc).lower()
+
+
+class _SharedPoolAdapter(SSLHTTPAdapter):
+    """
+    A transport adapter that borrows its connections from a pool manager owned by a ConnectionPoolRegistry.
+    """
+
+    def __init__(self, pool_manager: PoolManager, **kwargs) -> None:
+        self._shared_pool_manager = pool_manager
+        super().__init__(**kwargs)
+
+    # pylint: disable=arguments-differ
+    def init_poolmanager(self, connections, maxsize, block, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = self._shared_pool_manager
+
+    def close(self) -> None:
+        # The shared pool outlives the sessions of individual clients.
+        for proxy in self.proxy_manager.values():
+            proxy.clear()
@@ -36,6 +36,7 @@ from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
 
+from . import instrumentation, json_codec
 from .common import get_sdk_headers
 
 ##############################################################################
@@ -75,6 +76,8 @@ class ContextBasedRestrictionsV1(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # Zones
@@ -139,7 +142,7 @@ class ContextBasedRestrictionsV1(BaseService):
             'excluded': excluded,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -327,7 +330,7 @@ class ContextBasedRestrictionsV1(BaseService):
             'excluded': excluded,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -507,7 +510,7 @@ class ContextBasedRestrictionsV1(BaseService):
             'enforcement_mode': enforcement_mode,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -734,7 +737,7 @@ class ContextBasedRestrictionsV1(BaseService):
             'enforcement_mode': enforcement_mode,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -0,0 +1,286 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides an optional, faster alternative to the generated
+`from_dict()` methods of the model classes.
+
+A generated `from_dict()` method tests and reads every property of the model
+separately and then calls the constructor with keyword arguments, which makes
+it the main CPU cost of loading large listings. The first time a model class is
+decoded here, its table of FieldSpec entries (JSON key, nested model type,
+conversion function, required-property error) is read from model_specs.py, and
+a decoder function specialized for that table is compiled. The tables are
+generated from the service modules by scripts/generate_model_specs.py, so the
+decoders do not need the source of the model classes; a table that no longer
+matches the constructor of its class is not used. The decoder performs one
+dictionary lookup per property, decodes nested models with their own compiled
+decoders and fills in the new object directly, producing objects equal to the
+ones returned by `from_dict()`, including the ValueError raised for a missing
+required property. Date-time properties in the usual ISO 8601 form are parsed
+by common.parse_datetime(), which returns the same points in time as
+`string_to_datetime()` (although not always the same tzinfo object for UTC) in
+a fraction of the time.
+
+Models without a table, such as those whose `from_dict()` method does
+something else (for example the base classes that select a subclass through a
+discriminator), are decoded with their own `from_dict()` method.
+
+Example:
+    from ibm_platform_services import deserialization
+    from ibm_platform_services.resource_controller_v2 import ResourceInstance
+
+    instances = deserialization.from_dict_list(ResourceInstance, result['resources'])
+"""
+
+import inspect
+import sys
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional, Type, TypeVar
+
+from ibm_cloud_sdk_core.utils import string_to_datetime
+
+from .common import parse_datetime
+from .model_specs import MODEL_SPECS
+
+ModelType = TypeVar('ModelType')
+
+# The kinds of FieldSpec.
+VALUE = 'value'
+MODEL = 'model'
+MODEL_LIST = 'model_list'
+MODEL_DICT = 'model_dict'
+CONVERTED = 'converted'
+
+
+class FieldSpec(NamedTuple):
+    """
+    How one property of a model is read from its JSON representation.
+
+    :attr str key: The JSON property name.
+    :attr str arg: The constructor argument (and attribute) name.
+    :attr str kind: `value` (copied as is), `model`, `model_list` or `model_dict`
+          (a nested model, a list of them or a dict of them), or `converted`
+          (passed through a function such as string_to_datetime).
+    :attr target: The nested model class for the model kinds, the function for
+          the `converted` kind, None otherwise.
+    :attr str required_message: The message of the ValueError raised when a
+          required property is missing, None for optional properties.
+    """
+
+    key: str
+    arg: str
+    kind: str
+    target: object = None
+    required_message: Optional[str] = None
+
+
+class ModelSpec(NamedTuple):
+    """
+    The field spec table of a model class.
+
+    :attr list fields: The properties read by from_dict(), in the order it reads them.
+    :attr list attributes: The attributes set by the constructor, in the order it
+          sets them, with the default value used when the property is absent.
+    :attr bool additional_properties: True if properties not listed in the class'
+          `_properties` are kept as additional attributes.
+    """
+
+    fields: List[FieldSpec]
+    attributes: List[tuple]
+    additional_properties: bool
+
+
+_MISSING = object()
+_decoders = {}
+_compiling = {}
+_specs = {}
+_lock = threading.RLock()
+
+
+def from_dict(model_class: Type[ModelType], _dict: Dict) -> ModelType:
+    """
+    Initialize a model object from a json dictionary; equivalent to
+    `model_class.from_dict(_dict)`.
+    """
+    return get_decoder(model_class)(_dict)
+
+
+def from_dict_list(model_class: Type[ModelType], dicts: List[Dict]) -> List[ModelType]:
+    """
+    Initialize a list of model objects from a list of json dictionaries.
+    """
+    decode = get_decoder(model_class)
+    return [decode(_dict) for _dict in dicts]
+
+
+def get_decoder(model_class: Type[ModelType]) -> Callable[[Dict], ModelType]:
+    """
+    Return the compiled decoder of a model class, compiling it on first use.
+
+    The decoder of a class that cannot be compiled is its from_dict() method.
+    """
+    decoder = _decoders.get(model_class)
+    if decoder is None:
+        with _lock:
+            decoder = _decoders.get(model_class) or _compiling.get(model_class)
+            if decoder is None:
+                decoder = _compile(model_class)
+    return decoder
+
+
+# Faster equivalents of the conversion functions used by from_dict() methods.
+_FAST_CONVERTERS = {string_to_datetime: parse_datetime}
+
+
+def get_model_spec(model_class: type) -> Optional[ModelSpec]:
+    """
+    Return the field spec table of a model class, or None if its from_dict()
+    method cannot be decoded by this module.
+    """
+    if model_class not in _specs:
+        _specs[model_class] = _load_spec(model_class)
+    return _specs[model_class]
+
+
+def _load_spec(model_class: type) -> Optional[ModelSpec]:
+    if 'from_dict' not in vars(model_class):
+        # A subclass that inherits from_dict() and __init__(), for example a compact model class.
+        for base in model_class.__mro__[1:]:
+            if '__init__' in vars(base) or 'from_dict' in vars(base):
+                break
+        if '__init__' in vars(model_class) or 'from_dict' not in vars(base):
+            return None
+        return get_model_spec(base)
+    package, _, module_name = model_class.__module__.rpartition('.')
+    table = MODEL_SPECS.get(module_name, {}).get(model_class.__qualname__) if package == __package__ else None
+    if table is None:
+        return None
+    entries, names, additional_properties = table
+    namespace = vars(sys.modules[model_class.__module__])
+    fields = []
+    for entry in entries:
+        if isinstance(entry, str):
+            fields.append(FieldSpec(entry, entry, VALUE))
+            continue
+        key, arg, kind, target, required_message = entry
+        if target is not None:
+            target = namespace.get(target)
+            if target is None:
+                return None
+        fields.append(FieldSpec(key, arg, kind, target, required_message))
+    # The table is only used while it matches the constructor of the class.
+    parameters = inspect.signature(model_class.__init__).parameters
+    attributes = []
+    for name in names:
+        parameter = parameters.get(name)
+        if parameter is None or parameter.kind not in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY):
+            return None
+        attributes.append((name, parameter.default))
+    args = {field.arg for field in fields}
+    if not args <= set(names):
+        return None
+    for name, default in attributes:
+        if default is inspect.Parameter.empty and name not in args:
+            return None
+    return ModelSpec(fields, attributes, additional_properties)
+
+
+def _compile(model_class: type) -> Callable[[Dict], object]:
+    spec = get_model_spec(model_class)
+    if spec is None:
+        _decoders[model_class] = model_class.from_dict
+        return model_class.from_dict
+
+    # Used by the nested decoders of recursive models, which are compiled first.
+    def decode_recursive(_dict):
+        return _decoders[model_class](_dict)
+
+    _compiling[model_class] = decode_recursive
+    try:
+        decoder = _compile_spec(model_class, spec)
+    finally:
+        del _compiling[model_class]
+    _decoders[model_class] = decoder
+    return decoder
+
+
+def _compile_spec(model_class: type, spec: ModelSpec) -> Callable[[Dict], object]:
+    # A model class can choose the classes of its nested models, as the compact model classes do.
+    nested_model_class = getattr(model_class, '_nested_model_class', lambda target: target)
+    # The values of the new object's attributes start as a copy of the constructor
+    # defaults; the properties stored as is (most of them) are then copied in one
+    # C-level update, and only the others are visited one by one.
+    template = {name: None if default is inspect.Parameter.empty else default for name, default in spec.attributes}
+    copied = frozenset(field.key for field in spec.fields if field.key == field.arg)
+    required = frozenset(field.key for field in spec.fields if field.required_message is not None)
+    namespace = {
+        '_MISSING': _MISSING,
+        '_new': object.__new__,
+        '_cls': model_class,
+        '_from_dict': model_class.from_dict,
+        '_template': template,
+        '_copied': copied,
+        '_required': required,
+    }
+    lines = ['def decode(_dict):', '    keys = _dict.keys()']
+    if required:
+        # from_dict() raises the ValueError for the first missing property.
+        lines += ['    if not keys >= _required:', '        return _from_dict(_dict)']
+    lines += [
+        '    attributes = _template.copy()',
+        '    if keys <= _copied:',
+        '        attributes.update(_dict)',
+        '    else:',
+        '        for k in keys & _copied:',
+        '            attributes[k] = _dict[k]',
+    ]
+    fields = [field for field in spec.fields if field.kind != VALUE or field.key != field.arg]
+    if fields:
+        lines.append('    get = _dict.get')
+    for i, field in enumerate(fields):
+        lines.append('    v = get({0!r}, _MISSING)'.format(field.key))
+        lines.append('    if v is not _MISSING:')
+        if field.kind == VALUE:
+            lines.append('        attributes[{0!r}] = v'.format(field.arg))
+            continue
+        if field.kind == CONVERTED:
+            namespace['f{0}'.format(i)] = _FAST_CONVERTERS.get(field.target, field.target)
+        else:
+            namespace['f{0}'.format(i)] = get_decoder(nested_model_class(field.target))
+        expression = {
+            MODEL: 'f{0}(v)',
+            CONVERTED: 'f{0}(v)',
+            MODEL_LIST: '[f{0}(x) for x in v]',
+            MODEL_DICT: '{{k: f{0}(x) for k, x in v.items()}}',
+        }[field.kind].format(i)
+        lines.append('        attributes[{0!r}] = {1}'.format(field.arg, expression))
+    # The attributes are then set in the constructor's order, which lets the interpreter
+    # store them as compactly as the constructor does (or in the slots of compact models).
+    lines.append('    obj = _new(_cls)')
+    lines += ['    obj.{0} = attributes[{0!r}]'.format(name) for name, _ in spec.attributes]
+    if spec.additional_properties:
+        namespace['_properties'] = model_class._properties
+        lines += [
+            '    for k, v in _dict.items():',
+            '        if k not in _properties:',
+            '            setattr(obj, k, v)',
+        ]
+    lines.append('    return obj')
+    exec(  # pylint: disable=exec-used
+        compile('\n'.join(lines), '<decoder for {0}>'.format(model_class.__qualname__), 'exec'), namespace
+    )
+    return namespace['decode']
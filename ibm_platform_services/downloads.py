@@ -0,0 +1,289 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides streaming downloads of the binary results of operations
+such as CaseManagementV1.download_file(), GlobalCatalogV1.get_artifact() and
+CatalogManagementV1.get_offering_source(), which otherwise return the whole
+body in memory.
+
+A Download iterates over the body in chunks of a fixed size, and download()
+writes it to a path or a file object:
+
+    from ibm_platform_services import downloads
+
+    result = downloads.download(
+        case_management_service.download_file, 'CS1234567', 'file-id', destination='/tmp/logs.zip', checksum='sha256'
+    )
+    print(result.size, result.hexdigest())
+
+    for chunk in downloads.Download(global_catalog_service.get_artifact, 'entry-id', 'artifact.tgz'):
+        ...
+
+The checksum is computed as the chunks are received. When the connection
+fails in the middle of the body, the download is resumed with a Range request
+from the last byte received, conditional on the entity tag of the first
+response. An interrupted download to a path is resumed from the bytes already
+written with `resume=True`.
+"""
+
+import hashlib
+import os
+import re
+from typing import BinaryIO, Callable, Iterator, Optional, Union
+
+import requests
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from urllib3.exceptions import HTTPError
+
+# The default size of the chunks in which a body is read.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# The exceptions raised when the connection fails while a body is read.
+_RESUMABLE_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError, HTTPError)
+
+
+class Download:
+    """
+    The body of the result of an operation, retrieved in chunks as it is iterated.
+
+    :param operation: The operation, a method of a service client, for example
+           `case_management_service.download_file`.
+    :param args: The positional arguments of the operation.
+    :param int chunk_size: (optional) The size of the chunks, in bytes.
+    :param str checksum: (optional) The name of a hashlib algorithm, for example
+           `sha256`, to compute the checksum of the body with.
+    :param int offset: (optional) The position of the first byte to retrieve;
+           the bytes before it are requested with a Range header.
+    :param int max_retries: (optional) The number of times the download is
+           resumed after the connection fails.
+    :param kwargs: The keyword arguments of the operation.
+
+    :attr int offset: The position of the next byte to retrieve.
+    :attr int size: The size of the whole body, once known.
+    :attr int attempts: The number of requests sent.
+    :attr DetailedResponse response: The response of the most recent request.
+    """
+
+    def __init__(
+        self,
+        operation: Callable[..., DetailedResponse],
+        *args,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        checksum: str = None,
+        offset: int = 0,
+        max_retries: int = 3,
+        **kwargs,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        self.operation = operation
+        self.args = args
+        self.kwargs = kwargs
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.offset = offset
+        self.size = None
+        self.attempts = 0
+        self.response = None
+        self._hash = hashlib.new(checksum) if checksum else None
+        self._etag = None
+        self._restart = None
+        self._body = None
+
+    def hexdigest(self) -> Optional[str]:
+        """
+        Return the checksum of the bytes retrieved so far, or None if no checksum is computed.
+        """
+        return self._hash.hexdigest() if self._hash is not None else None
+
+    def __iter__(self) -> Iterator[bytes]:
+        retries = 0
+        while True:
+            skip = self._open()
+            try:
+                for chunk in self._body.iter_content(self.chunk_size):
+                    if skip:
+                        # The server ignored the Range header: the bytes already retrieved are sent again.
+                        chunk, skip = chunk[skip:], max(0, skip - len(chunk))
+                        if not chunk:
+                            continue
+                    self.offset += len(chunk)
+                    if self._hash is not None:
+                        self._hash.update(chunk)
+                    yield chunk
+                if self.size is not None and self.offset < self.size:
+                    # urllib3 does not check that the whole body was received.
+                    raise requests.exceptions.ChunkedEncodingError(
+                        'The connection closed after {0} of {1} bytes'.format(self.offset, self.size)
+                    )
+            except _RESUMABLE_ERRORS:
+                if retries >= self.max_retries:
+                    raise
+                retries += 1
+                continue
+            finally:
+                self._body.close()
+            if self.size is None:
+                self.size = self.offset
+            return
+
+    def close(self) -> None:
+        """
+        Release the connection of the current response, if any.
+        """
+        if self._body is not None:
+            self._body.close()
+
+    def __enter__(self) -> 'Download':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _open(self) -> int:
+        # Sends the request for the bytes from the offset, and returns the number of bytes to skip.
+        kwargs = dict(self.kwargs, stream=True)
+        headers = dict(kwargs.get('headers') or {})
+        if self.offset:
+            headers['Range'] = 'bytes={0}-'.format(self.offset)
+            if self._etag:
+                headers['If-Range'] = self._etag
+        kwargs['headers'] = headers
+        self.attempts += 1
+        try:
+            self.response = self.operation(*self.args, **kwargs)
+        except ApiException as error:
+            total = _get_total_size(getattr(error.http_response, 'headers', {}))
+            if error.code == 416 and self.offset and total == self.offset:
+                # The bytes before the offset are the whole body.
+                self.size = total
+                self._body = _EMPTY
+                return 0
+            raise
+        self._body = self.response.get_result()
+        response_headers = self.response.get_headers()
+        etag = response_headers.get('ETag')
+        if self._etag is None:
+            self._etag = etag
+        if self.response.get_status_code() == 206:
+            self.size = _get_total_size(response_headers)
+            return 0
+        length = response_headers.get('Content-Length')
+        self.size = int(length) if length and 'Content-Encoding' not in response_headers else None
+        if not self.offset:
+            return 0
+        if self._restart is not None:
+            # The whole body is retrieved again, and written over the bytes already written.
+            self._restart()
+            self.offset = 0
+            if self._hash is not None:
+                self._hash = hashlib.new(self._hash.name)
+            return 0
+        if etag != self._etag:
+            self._body.close()
+            raise ApiException(412, message='The body changed while it was downloaded', http_response=self._body)
+        return self.offset
+
+
+class _Empty:
+    @staticmethod
+    def iter_content(chunk_size):  # pylint: disable=unused-argument
+        return iter(())
+
+    def close(self):
+        pass
+
+
+_EMPTY = _Empty()
+
+
+def _get_total_size(headers) -> Optional[int]:
+    # Returns the size of the whole body from the Content-Range header of a response, if known.
+    match = re.match(r'bytes (?:\d+-\d+|\*)/(\d+)', (headers or {}).get('Content-Range') or '')
+    return int(match.group(1)) if match else None
+
+
+def download(
+    operation: Callable[..., DetailedResponse],
+    *args,
+    destination: Union[str, os.PathLike, BinaryIO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checksum: str = None,
+    resume: bool = False,
+    max_retries: int = 3,
+    **kwargs,
+) -> Download:
+    """
+    Write the body of the result of an operation to a path or a file object, in chunks.
+
+    :param operation: The operation, a method of a service client, for example
+           `catalog_management_service.get_offering_source`.
+    :param args: The positional arguments of the operation.
+    :param destination: The path of the file to write, or a binary file object
+           open for writing.
+    :param int chunk_size: (optional) The size of the chunks, in bytes.
+    :param str checksum: (optional) The name of a hashlib algorithm, for example
+           `sha256`, to compute the checksum of the whole file with.
+    :param bool resume: (optional) If true and the destination is a path, the
+           bytes already in the file are kept and only the rest of the body is
+           requested; they are replaced if the server sends the whole body.
+    :param int max_retries: (optional) The number of times the download is
+           resumed after the connection fails.
+    :param kwargs: The keyword arguments of the operation.
+    :return: The completed download, with its size and checksum.
+    :rtype: Download
+    """
+    if isinstance(destination, (str, os.PathLike)):
+        offset = os.path.getsize(destination) if resume and os.path.exists(destination) else 0
+        with open(destination, 'r+b' if offset else 'wb') as file:
+            return _write(file, operation, args, kwargs, chunk_size, checksum, offset, max_retries)
+    return _write(destination, operation, args, kwargs, chunk_size, checksum, 0, max_retries)
+
+
+def _write(file: BinaryIO, operation, args, kwargs, chunk_size, checksum, offset, max_retries) -> Download:
+    download_ = Download(
+        operation, *args, chunk_size=chunk_size, checksum=checksum, offset=offset, max_retries=max_retries, **kwargs
+    )
+    if offset:
+        # The checksum covers the bytes already written.
+        if download_._hash is not None:  # pylint: disable=protected-access
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                download_._hash.update(chunk)  # pylint: disable=protected-access
+        file.seek(offset)
+    try:
+        start = file.tell()
+    except (AttributeError, OSError):
+        start = None
+    if start is not None and _seekable(file):
+
+        def restart():
+            file.seek(start - offset)
+            file.truncate()
+
+        download_._restart = restart  # pylint: disable=protected-access
+    with download_:
+        for chunk in download_:
+            file.write(chunk)
+    file.flush()
+    return download_
+
+
+def _seekable(file) -> bool:
+    try:
+        return file.seekable()
+    except (AttributeError, OSError):
+        return False
@@ -30,6 +30,7 @@ from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import datetime_to_string, string_to_datetime
 
+from . import instrumentation, json_codec
 from .common import get_sdk_headers
 
 ##############################################################################
@@ -69,6 +70,8 @@ class EnterpriseBillingUnitsV1(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # Billing Units
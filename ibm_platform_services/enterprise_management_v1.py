@@ -24,7 +24,7 @@ API Version: 1.0
 """
 
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterator, List
 import json
 
 from ibm_cloud_sdk_core import BaseService, DetailedResponse, get_query_param
@@ -32,6 +32,7 @@ from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import datetime_to_string, string_to_datetime
 
+from . import instrumentation, json_codec
 from .common import get_sdk_headers
 
 ##############################################################################
@@ -71,6 +72,8 @@ class EnterpriseManagementV1(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # Enterprise Operations
@@ -124,7 +127,7 @@ class EnterpriseManagementV1(BaseService):
             'domain': domain,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -272,7 +275,7 @@ class EnterpriseManagementV1(BaseService):
 
         data = {'name': name, 'domain': domain, 'primary_contact_iam_id': primary_contact_iam_id}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -336,7 +339,7 @@ class EnterpriseManagementV1(BaseService):
 
         data = {'parent': parent, 'billing_unit_id': billing_unit_id}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -388,7 +391,7 @@ class EnterpriseManagementV1(BaseService):
 
         data = {'parent': parent, 'name': name, 'owner_iam_id': owner_iam_id}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -532,7 +535,7 @@ class EnterpriseManagementV1(BaseService):
 
         data = {'parent': parent}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -588,7 +591,7 @@ class EnterpriseManagementV1(BaseService):
 
         data = {'parent': parent, 'name': name, 'primary_contact_iam_id': primary_contact_iam_id}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -739,7 +742,7 @@ class EnterpriseManagementV1(BaseService):
 
         data = {'name': name, 'primary_contact_iam_id': primary_contact_iam_id}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1780,13 +1783,14 @@ class EnterprisesPager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.list_enterprises(
-            enterprise_account_id=self._enterprise_account_id,
-            account_group_id=self._account_group_id,
-            account_id=self._account_id,
-            limit=self._limit,
-            next_docid=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.list_enterprises(
+                enterprise_account_id=self._enterprise_account_id,
+                account_group_id=self._account_group_id,
+                account_id=self._account_id,
+                limit=self._limit,
+                next_docid=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next_url')
@@ -1798,6 +1802,18 @@ class EnterprisesPager:
 
         return result.get('resources')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of Enterprise.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
@@ -1861,13 +1877,14 @@ class AccountsPager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.list_accounts(
-            enterprise_id=self._enterprise_id,
-            account_group_id=self._account_group_id,
-            parent=self._parent,
-            limit=self._limit,
-            next_docid=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.list_accounts(
+                enterprise_id=self._enterprise_id,
+                account_group_id=self._account_group_id,
+                parent=self._parent,
+                limit=self._limit,
+                next_docid=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next_url')
@@ -1879,6 +1896,18 @@ class AccountsPager:
 
         return result.get('resources')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of Account.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
@@ -1943,13 +1972,14 @@ class AccountGroupsPager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.list_account_groups(
-            enterprise_id=self._enterprise_id,
-            parent_account_group_id=self._parent_account_group_id,
-            parent=self._parent,
-            limit=self._limit,
-            next_docid=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.list_account_groups(
+                enterprise_id=self._enterprise_id,
+                parent_account_group_id=self._parent_account_group_id,
+                parent=self._parent,
+                limit=self._limit,
+                next_docid=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next_url')
@@ -1961,6 +1991,18 @@ class AccountGroupsPager:
 
         return result.get('resources')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of AccountGroup.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
@@ -23,13 +23,14 @@ API Version: 1.0.0-beta.1
 """
 
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, Iterator, List
 import json
 
 from ibm_cloud_sdk_core import BaseService, DetailedResponse, get_query_param
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 
+from . import instrumentation, json_codec
 from .common import get_sdk_headers
 
 ##############################################################################
@@ -69,6 +70,8 @@ class EnterpriseUsageReportsV1(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # Enterprise Usage Reports
@@ -943,16 +946,17 @@ class GetResourceUsageReportPager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.get_resource_usage_report(
-            enterprise_id=self._enterprise_id,
-            account_group_id=self._account_group_id,
-            account_id=self._account_id,
-            children=self._children,
-            month=self._month,
-            billing_unit_id=self._billing_unit_id,
-            limit=self._limit,
-            offset=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.get_resource_usage_report(
+                enterprise_id=self._enterprise_id,
+                account_group_id=self._account_group_id,
+                account_id=self._account_id,
+                children=self._children,
+                month=self._month,
+                billing_unit_id=self._billing_unit_id,
+                limit=self._limit,
+                offset=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next')
@@ -964,6 +968,18 @@ class GetResourceUsageReportPager:
 
         return result.get('reports')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of ResourceUsageReport.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
@@ -36,6 +36,7 @@ from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
 
+from . import instrumentation, json_codec
 from .common import get_sdk_headers
 
 ##############################################################################
@@ -75,6 +76,8 @@ class GlobalCatalogV1(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # Object
@@ -279,7 +282,7 @@ class GlobalCatalogV1(BaseService):
             'metadata': metadata,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -471,7 +474,7 @@ class GlobalCatalogV1(BaseService):
             'metadata': metadata,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -756,7 +759,7 @@ class GlobalCatalogV1(BaseService):
 
         data = {'extendable': extendable, 'include': include, 'exclude': exclude}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -956,6 +959,7 @@ class GlobalCatalogV1(BaseService):
 
         if 'headers' in kwargs:
             headers.update(kwargs.get('headers'))
+            del kwargs['headers']
         headers['Accept'] = '*/*'
 
         path_param_keys = ['object_id', 'artifact_id']
@@ -964,7 +968,7 @@ class GlobalCatalogV1(BaseService):
         url = '/{object_id}/artifacts/{artifact_id}'.format(**path_param_dict)
         request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
 
-        response = self.send(request)
+        response = self.send(request, **kwargs)
         return response
 
     def upload_artifact(
@@ -27,7 +27,7 @@ or by an IMS ID. The properties of a resource include tags and system properties
 properties are defined in an IBM Cloud billing account, and span across many regions.
 """
 
-from typing import Dict, List
+from typing import Dict, Iterator, List
 import json
 
 from ibm_cloud_sdk_core import BaseService, DetailedResponse
@@ -35,7 +35,9 @@ from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_list
 
+from . import instrumentation, json_codec
 from .common import get_sdk_headers
+from .pagination import PrefetchingPager
 
 ##############################################################################
 # Service
@@ -74,6 +76,8 @@ class GlobalSearchV2(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # Search
@@ -90,7 +94,7 @@ class GlobalSearchV2(BaseService):
         limit: int = None,
         timeout: int = None,
         sort: List[str] = None,
-        **kwargs
+        **kwargs,
     ) -> DetailedResponse:
         """
         Find instances of resources (v3).
@@ -145,7 +149,7 @@ class GlobalSearchV2(BaseService):
 
         data = {'query': query, 'fields': fields, 'search_cursor': search_cursor}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -390,3 +394,124 @@ class SupportedTypesList:
     def __ne__(self, other: 'SupportedTypesList') -> bool:
         """Return `true` when self and other are not equal, false otherwise."""
         return not self == other
+
+
+##############################################################################
+# Pagers
+##############################################################################
+
+
+class SearchIterator:
+    """
+    SearchIterator can be used to simplify the use of the "search" method: it threads
+    the search cursor through successive calls until an empty batch is returned.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: GlobalSearchV2,
+        query: str = None,
+        fields: List[str] = None,
+        transaction_id: str = None,
+        account_id: str = None,
+        limit: int = None,
+        timeout: int = None,
+        sort: List[str] = None,
+        prefetch: bool = False,
+    ) -> None:
+        """
+        Initialize a SearchIterator object.
+        :param str query: (optional) The Lucene-formatted query string. Default to
+               '*' if not set.
+        :param List[str] fields: (optional) The list of the fields returned by the
+               search. Defaults to all. `crn` is always returned.
+        :param str transaction_id: (optional) An aplhanumeric string that can be
+               used to trace a request across services. If not specified it will be
+               automatically generated with the prefix "gst-".
+        :param str account_id: (optional) The account ID to filter resources.
+        :param int limit: (optional) The maximum number of hits to return in each
+               batch. Defaults to 10.
+        :param int timeout: (optional) A search timeout, bounding each search
+               request to be executed within the specified time value and bail with the
+               hits accumulated up to that point when expired. Defaults to the system
+               defined timeout.
+        :param List[str] sort: (optional) Comma separated properties names used for
+               sorting.
+        :param bool prefetch: (optional) If true, iterating retrieves the next batch
+               on a worker thread while the current batch is being consumed.
+        """
+        self._has_next = True
+        self._client = client
+        self._page_context = {'next': None}
+        self._query = query
+        self._fields = fields
+        self._transaction_id = transaction_id
+        self._account_id = account_id
+        self._limit = limit
+        self._timeout = timeout
+        self._sort = sort
+        self._prefetch = prefetch
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next batch of results.
+        :return: A List[dict], where each element is a dict that represents an instance of ResultItem.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration('No more results available')
+
+        with instrumentation.pager_page(self):
+            result = self._client.search(
+                query=self._query,
+                fields=self._fields,
+                search_cursor=self._page_context.get('next'),
+                transaction_id=self._transaction_id,
+                account_id=self._account_id,
+                limit=self._limit,
+                timeout=self._timeout,
+                sort=self._sort,
+            ).get_result()
+
+        items = result.get('items')
+        self._page_context['next'] = result.get('search_cursor')
+        if not items or self._page_context['next'] is None:
+            self._has_next = False
+
+        return items or []
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next batch of results only when the current one has been consumed
+        (or while it is being consumed, if prefetch is enabled).
+        :return: An Iterator[dict], where each element is a dict that represents an instance of ResultItem.
+        :rtype: Iterator[dict]
+        """
+        batches = PrefetchingPager(self) if self._prefetch else self
+        try:
+            while batches.has_next():
+                yield from batches.get_next()
+        finally:
+            if batches is not self:
+                batches.close()
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all batches of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents an instance of ResultItem.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
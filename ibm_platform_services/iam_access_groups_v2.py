@@ -26,7 +26,7 @@ API Version: 2.0
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, Iterator, List
 import json
 
 from ibm_cloud_sdk_core import BaseService, DetailedResponse, get_query_param
@@ -34,7 +34,8 @@ from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
 
-from .common import get_sdk_headers
+from . import instrumentation, json_codec
+from .common import RequestTemplate, get_sdk_headers
 
 ##############################################################################
 # Service
@@ -47,6 +48,15 @@ class IamAccessGroupsV2(BaseService):
     DEFAULT_SERVICE_URL = 'https://iam.cloud.ibm.com'
     DEFAULT_SERVICE_NAME = 'iam_access_groups'
 
+    # The prepared requests of the operations that are called at high rates.
+    _is_member_of_access_group_request = RequestTemplate(
+        'HEAD',
+        '/v2/groups/{access_group_id}/members/{iam_id}',
+        service_name=DEFAULT_SERVICE_NAME,
+        service_version='V2',
+        operation_id='is_member_of_access_group',
+    )
+
     @classmethod
     def new_instance(
         cls,
@@ -73,6 +83,8 @@ class IamAccessGroupsV2(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # Access group operations
@@ -123,7 +135,7 @@ class IamAccessGroupsV2(BaseService):
 
         data = {'name': name, 'description': description}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -321,7 +333,7 @@ class IamAccessGroupsV2(BaseService):
 
         data = {'name': name, 'description': description}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -418,20 +430,9 @@ class IamAccessGroupsV2(BaseService):
         if not iam_id:
             raise ValueError('iam_id must be provided')
         headers = {'Transaction-Id': transaction_id}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='is_member_of_access_group'
+        request = self._is_member_of_access_group_request.prepare(
+            self, (access_group_id, iam_id), headers=headers, custom_headers=kwargs.pop('headers', None)
         )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-
-        path_param_keys = ['access_group_id', 'iam_id']
-        path_param_values = self.encode_path_vars(access_group_id, iam_id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v2/groups/{access_group_id}/members/{iam_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='HEAD', url=url, headers=headers)
 
         response = self.send(request, **kwargs)
         return response
@@ -479,7 +480,7 @@ class IamAccessGroupsV2(BaseService):
 
         data = {'members': members}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -658,7 +659,7 @@ class IamAccessGroupsV2(BaseService):
 
         data = {'members': members}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -781,7 +782,7 @@ class IamAccessGroupsV2(BaseService):
 
         data = {'type': type, 'groups': groups}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -857,7 +858,7 @@ class IamAccessGroupsV2(BaseService):
 
         data = {'expiration': expiration, 'realm_name': realm_name, 'conditions': conditions, 'name': name}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1021,7 +1022,7 @@ class IamAccessGroupsV2(BaseService):
 
         data = {'expiration': expiration, 'realm_name': realm_name, 'conditions': conditions, 'name': name}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1170,7 +1171,7 @@ class IamAccessGroupsV2(BaseService):
 
         data = {'public_access_enabled': public_access_enabled}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -2973,17 +2974,18 @@ class AccessGroupsPager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.list_access_groups(
-            account_id=self._account_id,
-            transaction_id=self._transaction_id,
-            iam_id=self._iam_id,
-            membership_type=self._membership_type,
-            limit=self._limit,
-            sort=self._sort,
-            show_federated=self._show_federated,
-            hide_public_access=self._hide_public_access,
-            offset=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.list_access_groups(
+                account_id=self._account_id,
+                transaction_id=self._transaction_id,
+                iam_id=self._iam_id,
+                membership_type=self._membership_type,
+                limit=self._limit,
+                sort=self._sort,
+                show_federated=self._show_federated,
+                hide_public_access=self._hide_public_access,
+                offset=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next')
@@ -2995,6 +2997,18 @@ class AccessGroupsPager:
 
         return result.get('groups')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of Group.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
@@ -3073,16 +3087,17 @@ class AccessGroupMembersPager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.list_access_group_members(
-            access_group_id=self._access_group_id,
-            transaction_id=self._transaction_id,
-            membership_type=self._membership_type,
-            limit=self._limit,
-            type=self._type,
-            verbose=self._verbose,
-            sort=self._sort,
-            offset=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.list_access_group_members(
+                access_group_id=self._access_group_id,
+                transaction_id=self._transaction_id,
+                membership_type=self._membership_type,
+                limit=self._limit,
+                type=self._type,
+                verbose=self._verbose,
+                sort=self._sort,
+                offset=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next')
@@ -3094,6 +3109,18 @@ class AccessGroupMembersPager:
 
         return result.get('members')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of ListGroupMembersResponseMember.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
@@ -33,6 +33,7 @@ from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
 
+from . import instrumentation, json_codec
 from .common import get_sdk_headers
 
 ##############################################################################
@@ -72,6 +73,8 @@ class IamIdentityV1(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # API key Operations
@@ -219,7 +222,7 @@ class IamIdentityV1(BaseService):
             'store_value': store_value,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -358,7 +361,7 @@ class IamIdentityV1(BaseService):
 
         data = {'name': name, 'description': description}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -611,7 +614,7 @@ class IamIdentityV1(BaseService):
             'apikey': apikey,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -725,7 +728,7 @@ class IamIdentityV1(BaseService):
 
         data = {'name': name, 'description': description, 'unique_instance_crns': unique_instance_crns}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -888,7 +891,7 @@ class IamIdentityV1(BaseService):
 
         data = {'name': name, 'account_id': account_id, 'description': description}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1046,7 +1049,7 @@ class IamIdentityV1(BaseService):
 
         data = {'name': name, 'description': description}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1164,7 +1167,7 @@ class IamIdentityV1(BaseService):
             'expiration': expiration,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1329,7 +1332,7 @@ class IamIdentityV1(BaseService):
             'expiration': expiration,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1419,7 +1422,7 @@ class IamIdentityV1(BaseService):
 
         data = {'cr_type': cr_type, 'link': link, 'name': name}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1688,7 +1691,7 @@ class IamIdentityV1(BaseService):
             'system_refresh_token_expiration_in_seconds': system_refresh_token_expiration_in_seconds,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
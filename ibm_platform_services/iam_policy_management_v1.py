@@ -32,6 +32,7 @@ from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
 
+from . import instrumentation, json_codec
 from .common import get_sdk_headers
 
 ##############################################################################
@@ -71,6 +72,8 @@ class IamPolicyManagementV1(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # Policies
@@ -269,7 +272,7 @@ class IamPolicyManagementV1(BaseService):
 
         data = {'type': type, 'subjects': subjects, 'roles': roles, 'resources': resources, 'description': description}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -374,7 +377,7 @@ class IamPolicyManagementV1(BaseService):
 
         data = {'type': type, 'subjects': subjects, 'roles': roles, 'resources': resources, 'description': description}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -488,7 +491,7 @@ class IamPolicyManagementV1(BaseService):
 
         data = {'state': state}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -647,7 +650,7 @@ class IamPolicyManagementV1(BaseService):
             'description': description,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -704,7 +707,7 @@ class IamPolicyManagementV1(BaseService):
 
         data = {'display_name': display_name, 'description': description, 'actions': actions}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -0,0 +1,421 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides hooks to observe the operations invoked on the service
+clients, for metrics and tracing.
+
+An Instrumentation is notified when each call of an operation starts and ends,
+with an OperationMetrics object that describes the call: the operation id, the
+time spent preparing the request, waiting for the response and decoding it,
+the request and response sizes, the status code, the number of retries and,
+for the calls made by a pager, the page number. The default instrumentation
+does nothing. An instrumentation can be set for the whole package or for a
+single service client:
+
+    class LoggingInstrumentation(instrumentation.Instrumentation):
+        def end_operation(self, metrics):
+            logger.info('%s: %s in %.1fms', metrics.operation_id, metrics.status_code, metrics.total_time * 1000)
+
+    instrumentation.set_default_instrumentation(LoggingInstrumentation())
+    instrumentation.set_instrumentation(tagging_service, LoggingInstrumentation())
+
+The service classes install the hooks that take the measurements when they are
+constructed; see install().
+"""
+
+import contextlib
+import contextvars
+import time
+import weakref
+from typing import Iterator, Optional
+
+import requests
+from ibm_cloud_sdk_core import BaseService, DetailedResponse
+
+from .middleware import SendMiddleware, install_middleware
+
+# The operation whose request is being prepared: (service_name, service_version, operation_id, start time).
+_operation = contextvars.ContextVar('operation', default=None)
+# The page number of the calls made by a pager.
+_page = contextvars.ContextVar('page', default=None)
+# The call being sent, when it is measured.
+_call = contextvars.ContextVar('call', default=None)
+
+
+class OperationMetrics:
+    """
+    The measurements of one call of an operation. Times are in seconds.
+
+    :attr str service_name: The name of the service, or None if the request was
+          not prepared by a generated operation.
+    :attr str service_version: The version of the service.
+    :attr str operation_id: The operation id, for example `get_resource_instance`.
+    :attr str method: The HTTP method of the request.
+    :attr str url: The URL of the request, without the query string.
+    :attr int page: The page number, for the calls made by a pager.
+    :attr float prepare_time: The time spent preparing the request, from the
+          start of the operation until the request is sent.
+    :attr float network_time: The time spent sending the request and receiving
+          the response.
+    :attr float deserialization_time: The time spent decoding the response body.
+    :attr int request_bytes: The size of the request body, or None if it was streamed.
+    :attr int response_bytes: The size of the response body, or None if it was streamed.
+    :attr int status_code: The HTTP status code, or None if no response was received.
+    :attr int retries: The number of times the request was retried.
+    :attr Exception error: The exception raised by the call, if any.
+    """
+
+    def __init__(
+        self,
+        *,
+        service_name: str = None,
+        service_version: str = None,
+        operation_id: str = None,
+        method: str = None,
+        url: str = None,
+        page: int = None,
+    ) -> None:
+        self.service_name = service_name
+        self.service_version = service_version
+        self.operation_id = operation_id
+        self.method = method
+        self.url = url
+        self.page = page
+        self.prepare_time = 0.0
+        self.network_time = 0.0
+        self.deserialization_time = 0.0
+        self.request_bytes = None
+        self.response_bytes = None
+        self.status_code = None
+        self.retries = 0
+        self.error = None
+
+    @property
+    def total_time(self) -> float:
+        """The time spent in the call, from the start of the operation."""
+        return self.prepare_time + self.network_time + self.deserialization_time
+
+    def __repr__(self) -> str:
+        return 'OperationMetrics({0})'.format(', '.join('{0}={1!r}'.format(k, v) for k, v in vars(self).items()))
+
+
+class Instrumentation:
+    """
+    The interface notified of the calls of operations. This class does nothing;
+    subclasses override the methods they need.
+    """
+
+    def start_operation(self, metrics: OperationMetrics, request: dict) -> None:
+        """
+        Called when a request is about to be sent. At this point only the
+        operation, the request and prepare_time of the metrics are known.
+
+        :param OperationMetrics metrics: The metrics of the call, completed before end_operation().
+        :param dict request: The prepared request. Its headers may be changed,
+               for example to propagate a trace context.
+        """
+
+    def end_operation(self, metrics: OperationMetrics) -> None:
+        """
+        Called when a call has completed, successfully or not.
+
+        :param OperationMetrics metrics: The metrics of the call.
+        """
+
+
+DEFAULT_INSTRUMENTATION = Instrumentation()
+
+_default_instrumentation = DEFAULT_INSTRUMENTATION
+
+
+def set_default_instrumentation(instrumentation: Optional[Instrumentation]) -> None:
+    """
+    Set the instrumentation of the service clients that do not have one of their own.
+
+    :param Instrumentation instrumentation: The instrumentation, or None to restore
+           the default one, which does nothing.
+    """
+    global _default_instrumentation  # pylint: disable=global-statement
+    _default_instrumentation = instrumentation or DEFAULT_INSTRUMENTATION
+
+
+def get_default_instrumentation() -> Instrumentation:
+    """
+    Return the instrumentation of the service clients that do not have one of their own.
+    """
+    return _default_instrumentation
+
+
+def set_instrumentation(service: BaseService, instrumentation: Optional[Instrumentation]) -> BaseService:
+    """
+    Set the instrumentation of a service client.
+
+    :param BaseService service: The service client.
+    :param Instrumentation instrumentation: The instrumentation, or None to use the
+           default instrumentation of the package.
+    :return: The service client passed in.
+    """
+    service.instrumentation = instrumentation
+    install(service)
+    return service
+
+
+def get_instrumentation(service: Optional[BaseService] = None) -> Instrumentation:
+    """
+    Return the instrumentation of a service client.
+    """
+    return getattr(service, 'instrumentation', None) or _default_instrumentation
+
+
+def install(service: BaseService) -> None:
+    """
+    Install the hooks that measure the calls sent by a service client.
+
+    The service classes call this function when they are constructed; call it
+    again after replacing a client's http client with `set_http_client()`.
+
+    :param BaseService service: The service client.
+    """
+    # The asyncio clients measure their calls themselves.
+    if not getattr(service, '_measures_calls', False):
+        install_middleware(service, _InstrumentedSend)
+    if not isinstance(vars(service).get('prepare_request'), _OperationRecorder):
+        service.prepare_request = _OperationRecorder(service)
+    hooks = service.get_http_client().hooks['response']
+    if not any(isinstance(hook, _ResponseObserver) for hook in hooks):
+        hooks.append(_ResponseObserver())
+
+
+def begin_operation(service_name: str, service_version: str, operation_id: str, start: Optional[float] = None) -> None:
+    """
+    Record the operation of a request that has been prepared, and is then sent
+    by the same thread or task. The prepare_request() method installed by
+    install() and RequestTemplate.prepare() call this function once the request
+    is built, so an operation whose request cannot be prepared is not recorded.
+
+    :param float start: (optional) The time.perf_counter() value at which the
+           operation started, by default the current one.
+    """
+    _operation.set((service_name, service_version, operation_id, time.perf_counter() if start is None else start))
+
+
+def take_operation(request: dict) -> OperationMetrics:
+    """
+    Return new metrics for a request about to be sent, for the operation
+    recorded by begin_operation(), which is cleared.
+    """
+    operation = _operation.get()
+    metrics = OperationMetrics(method=request.get('method'), url=request.get('url'), page=_page.get())
+    if operation is not None:
+        _operation.set(None)
+        metrics.service_name, metrics.service_version, metrics.operation_id, start = operation
+        metrics.prepare_time = time.perf_counter() - start
+    return metrics
+
+
+def current_operation_id() -> Optional[str]:
+    """
+    Return the id of the operation recorded by begin_operation() whose request
+    has not been sent yet, if any.
+    """
+    operation = _operation.get()
+    return None if operation is None else operation[2]
+
+
+def discard_operation() -> None:
+    """
+    Clear the operation recorded by begin_operation(), for a call answered
+    without sending its request.
+    """
+    _operation.set(None)
+
+
+def get_page() -> Optional[int]:
+    """
+    Return the page number of the calls made by a pager in the current context.
+    """
+    return _page.get()
+
+
+@contextlib.contextmanager
+def page_scope(page: Optional[int]) -> Iterator[None]:
+    """
+    Report the calls made within the context as calls for the given page number.
+    """
+    token = _page.set(page)
+    try:
+        yield
+    finally:
+        _page.reset(token)
+
+
+@contextlib.contextmanager
+def pager_page(pager) -> Iterator[None]:
+    """
+    Report the calls made within the context as calls for the next page of a
+    pager, and count the page once the context exits without an error.
+    """
+    page = getattr(pager, '_pages_retrieved', 0) + 1
+    with page_scope(page):
+        yield
+    pager._pages_retrieved = page
+
+
+def body_size(body) -> Optional[int]:
+    """
+    Return the size of a request or response body, or None if it is streamed.
+    """
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    return None
+
+
+class OperationUserAgent(str):
+    """
+    The value of the User-Agent header returned by get_sdk_headers(), which
+    also identifies the operation the headers were built for and when it
+    started, so that prepare_request() can record the operation of a request
+    once it is built. It is sent as the plain string it is equal to.
+    """
+
+    def __new__(cls, value: str, service_name: str, service_version: str, operation_id: str) -> 'OperationUserAgent':
+        user_agent = super().__new__(cls, value)
+        user_agent.operation = (service_name, service_version, operation_id, time.perf_counter())
+        return user_agent
+
+    def __reduce__(self):
+        # Copies are plain strings.
+        return (str, (str(self),))
+
+
+class _OperationRecorder:
+    """
+    Replaces the prepare_request() method of a service client, recording the
+    operation named by the OperationUserAgent among the headers of a request
+    once the request is built. Requests whose User-Agent header is set by the
+    caller are sent without an operation.
+    """
+
+    def __init__(self, service: BaseService) -> None:
+        # A weak reference, as the service holds this object.
+        self._service = weakref.ref(service)
+
+    def __call__(self, method: str, url: str, *, headers: Optional[dict] = None, **kwargs) -> dict:
+        service = self._service()
+        request = type(service).prepare_request(service, method, url, headers=headers, **kwargs)
+        for value in (headers or {}).values():
+            if isinstance(value, OperationUserAgent):
+                begin_operation(*value.operation)
+                break
+        return request
+
+
+class _InstrumentedSend(SendMiddleware):
+    """
+    Replaces the send() method of a service client, measuring the calls when
+    the client's instrumentation is not the default one.
+    """
+
+    def __call__(self, request: dict, **kwargs) -> DetailedResponse:
+        service = self.service
+        instrumentation = get_instrumentation(service)
+        if type(instrumentation) is Instrumentation:  # pylint: disable=unidiomatic-typecheck
+            _operation.set(None)
+            return self.send_next(service, request, **kwargs)
+
+        metrics = take_operation(request)
+        instrumentation.start_operation(metrics, request)
+        call = _Call(metrics)
+        token = _call.set(call)
+        start = time.perf_counter()
+        try:
+            return self.send_next(service, request, **kwargs)
+        except Exception as error:
+            metrics.error = error
+            raise
+        finally:
+            _call.reset(token)
+            end = time.perf_counter()
+            decode_start = call.decode_start or end
+            metrics.network_time = decode_start - start
+            metrics.deserialization_time = end - decode_start
+            response = call.response
+            if response is None:
+                metrics.request_bytes = body_size(request.get('data'))
+            else:
+                metrics.status_code = response.status_code
+                if not kwargs.get('stream') or metrics.error is not None:
+                    metrics.response_bytes = len(response.content or b'')
+            instrumentation.end_operation(metrics)
+
+
+class _Call:
+    """
+    The state of a call being measured, shared with the response hook.
+    """
+
+    __slots__ = ('metrics', 'response', 'decode_start')
+
+    def __init__(self, metrics: OperationMetrics) -> None:
+        self.metrics = metrics
+        self.response = None
+        self.decode_start = None
+
+
+class _ResponseObserver:
+    """
+    A response hook of the requests session of a service client, which records
+    the response of the call being measured and times the decoding of its body.
+    """
+
+    def __call__(self, response: requests.Response, **kwargs) -> requests.Response:
+        call = _call.get()
+        if call is None:
+            return response
+        call.response = response
+        call.metrics.request_bytes = body_size(response.request.body)
+        retries = getattr(response.raw, 'retries', None)
+        if retries is not None:
+            call.metrics.retries = len(retries.history)
+        # Wraps the json() method, or the decoder set by the json_codec module.
+        response.json = _TimedDecoder(call, response, vars(response).get('json'))
+        return response
+
+
+class _TimedDecoder:
+    """
+    Replaces the json() method of a response, recording when the decoding starts.
+    """
+
+    __slots__ = ('call', 'response', 'decode')
+
+    def __init__(self, call: _Call, response: requests.Response, decode) -> None:
+        self.call = call
+        # A weak reference, as the decoder is an attribute of the response.
+        self.response = weakref.ref(response)
+        self.decode = decode
+
+    def __call__(self, **kwargs):
+        if self.call.decode_start is None:
+            self.call.decode_start = time.perf_counter()
+        if self.decode is not None:
+            return self.decode(**kwargs)
+        return requests.Response.json(self.response(), **kwargs)
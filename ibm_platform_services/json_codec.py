@@ -0,0 +1,199 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides the JSON codec used to encode request bodies and decode
+response bodies.
+
+The default codec is backed by the json module of the standard library. A
+different codec can be set for the whole package or for a single service
+client:
+
+    from ibm_platform_services import json_codec
+
+    json_codec.set_default_codec(json_codec.OrjsonCodec())
+    json_codec.set_codec(tagging_service, json_codec.OrjsonCodec())
+
+A codec encodes request bodies straight to bytes, and is given the bytes
+received to decode response bodies rather than the text that requests decodes
+them to. BaseService.send() of the core still reads Response.text, which
+builds a string of the body, to find out whether it is empty, so what a codec
+saves on responses is the parsing rather than the copy. OrjsonCodec requires
+the orjson package, which is installed with the `orjson` extra:
+
+    pip install "ibm-platform-services[orjson]"
+"""
+
+import json
+import weakref
+from typing import Any, Optional
+
+import requests
+from ibm_cloud_sdk_core import BaseService
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class JSONCodec:
+    """
+    The default JSON codec, backed by the json module of the standard library.
+
+    Subclasses override dumps() and loads().
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object as a JSON document.
+
+        :param obj: The object to encode: a dict, list, str, number, bool or None.
+        :return: The UTF-8 encoded JSON document.
+        """
+        return json.dumps(obj).encode('utf-8')
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode a JSON document.
+
+        :param bytes data: The JSON document, encoded as UTF-8.
+        :return: The decoded object.
+        :raises ValueError: if the document is not valid JSON.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    A JSON codec backed by the orjson package.
+
+    Unlike the default codec, orjson encodes documents without whitespace,
+    rejects integers that do not fit in 64 bits, and encodes NaN and infinity
+    as null.
+    """
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                'OrjsonCodec requires the orjson package; install it with "pip install ibm-platform-services[orjson]"'
+            )
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+DEFAULT_CODEC = JSONCodec()
+
+_default_codec = DEFAULT_CODEC
+
+
+def set_default_codec(codec: Optional[JSONCodec]) -> None:
+    """
+    Set the codec used by the service clients that do not have a codec of their own.
+
+    :param JSONCodec codec: The codec, or None to restore the standard library codec.
+    """
+    global _default_codec  # pylint: disable=global-statement
+    _default_codec = codec or DEFAULT_CODEC
+
+
+def get_default_codec() -> JSONCodec:
+    """
+    Return the codec used by the service clients that do not have a codec of their own.
+    """
+    return _default_codec
+
+
+def set_codec(service: BaseService, codec: Optional[JSONCodec]) -> BaseService:
+    """
+    Set the codec used by a service client.
+
+    :param BaseService service: The service client.
+    :param JSONCodec codec: The codec, or None to use the default codec of the package.
+    :return: The service client passed in.
+    """
+    service.json_codec = codec
+    install(service)
+    return service
+
+
+def get_codec(service: Optional[BaseService] = None) -> JSONCodec:
+    """
+    Return the codec used by a service client.
+
+    :param BaseService service: (optional) The service client.
+    :return: The client's codec, or the default codec of the package.
+    """
+    return getattr(service, 'json_codec', None) or _default_codec
+
+
+def encode(service: BaseService, obj: Any) -> bytes:
+    """
+    Encode a request body with the codec of a service client.
+    """
+    return get_codec(service).dumps(obj)
+
+
+def install(service: BaseService) -> None:
+    """
+    Decode the JSON responses received by a service client with its codec.
+
+    The service classes call this function when they are constructed; call it
+    again after replacing a client's http client with `set_http_client()`.
+
+    :param BaseService service: The service client.
+    """
+    hooks = service.get_http_client().hooks['response']
+    if not any(isinstance(hook, _ResponseDecoder) for hook in hooks):
+        hooks.append(_ResponseDecoder(service))
+
+
+class _ResponseDecoder:
+    """
+    A response hook of the requests session of a service client, which runs before
+    BaseService.send() reads the response.
+    """
+
+    def __init__(self, service: BaseService) -> None:
+        # A weak reference, as the session that holds the hook belongs to the service.
+        self._service = weakref.ref(service)
+
+    def __call__(self, response: requests.Response, **kwargs) -> requests.Response:
+        codec = get_codec(self._service())
+        # The default codec decodes responses as requests does.
+        if type(codec) is not JSONCodec:  # pylint: disable=unidiomatic-typecheck
+            response.json = _BodyDecoder(codec, response)
+        return response
+
+
+class _BodyDecoder:
+    """
+    Replaces the json() method of a response, decoding the body with a codec.
+    """
+
+    __slots__ = ('codec', 'response')
+
+    def __init__(self, codec: JSONCodec, response: requests.Response) -> None:
+        self.codec = codec
+        # A weak reference, as the decoder is an attribute of the response.
+        self.response = weakref.ref(response)
+
+    def __call__(self, **kwargs) -> Any:
+        return self.codec.loads(self.response().content)
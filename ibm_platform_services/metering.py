@@ -0,0 +1,884 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides MeteringBatcher, which submits the usage records
+reported by many threads to UsageMeteringV4.report_resource_usage() in
+batches, on background threads:
+
+    from ibm_platform_services.metering import MeteringBatcher
+
+    with MeteringBatcher(usage_metering_service, max_batch_size=100, max_age=2.0) as batcher:
+        for event in events:
+            batcher.submit(event.resource_id, ResourceInstanceUsage(...))
+
+The records are grouped by resource id, and the records of a resource are
+sent once `max_batch_size` of them are buffered, once the oldest of them has
+waited `max_age` seconds, or when flush() is called. At most `max_pending`
+records are buffered or in flight; submit() blocks while the buffer is full.
+
+The service reports the status of each record of a batch. Accepted records
+and duplicates of records already accepted are done with; records rejected
+with a 429 or 5xx status, and the records of a batch that failed with a
+transient error, are sent again with the next batch of their resource after a
+backoff delay; the other records are reported to the `on_failure` callback.
+
+Buffered records are lost if the process stops before they are accepted. A
+MeteringSpool keeps them in an append-only log on disk until they are
+accepted or failed, and the records it still holds when it is opened again
+are submitted again by the batcher it is given to:
+
+    spool = MeteringSpool('/var/lib/metering/spool')
+    batcher = MeteringBatcher(usage_metering_service, spool=spool)
+
+The log is split into segments, and the segments whose records are all done
+with are removed. Records are identified by a digest of their content, or by
+the id they are submitted with; a record is not submitted again while the
+spool holds a record with its id that is not done with. Appends wait until
+their record is written to disk with fsync; the appends of concurrent threads
+share their fsync calls.
+
+A MeteringAggregator in front of the batcher sums the quantities of the
+measures named additive, per resource instance, plan, region, consumer and
+window, and submits one record for each when it is flushed, such as at the
+end of each window:
+
+    aggregator = MeteringAggregator(batcher.submit, additive={'STORAGE', 'API_CALLS'}, window=3600)
+    aggregator.add(event.resource_id, ResourceInstanceUsage(...))
+    aggregator.flush(before=int(time.time() * 1000))
+
+The records with other measures are submitted as they are added.
+"""
+
+import collections
+import copy
+import hashlib
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from ibm_cloud_sdk_core import ApiException
+import requests
+
+from .batch import RETRY_STATUS_CODES
+from .rate_limit import get_retry_after
+from .usage_metering_v4 import MeasureAndQuantity, ResourceInstanceUsage, ResourceUsageDetails, UsageMeteringV4
+
+logger = logging.getLogger(__name__)
+
+# The status of a record that duplicates a record already accepted.
+DUPLICATE_STATUS = 409
+
+# The file name suffix of the segments of a spool.
+SEGMENT_SUFFIX = '.log'
+
+
+class _Entry:
+    """
+    A buffered usage record.
+    """
+
+    __slots__ = ('record', 'queued_at', 'attempts', 'record_id')
+
+    def __init__(self, record, queued_at: float, record_id: str = None) -> None:
+        self.record = record
+        self.queued_at = queued_at
+        self.attempts = 0
+        # The id of the record in the spool, if any.
+        self.record_id = record_id
+
+
+class _Group:
+    """
+    The buffered usage records of one resource.
+    """
+
+    __slots__ = ('entries', 'not_before')
+
+    def __init__(self) -> None:
+        self.entries = collections.deque()
+        # The time before which the records are not sent, after a transient failure.
+        self.not_before = 0.0
+
+
+class _Total:
+    """
+    The quantities of the additive measures of one instance, plan, region and consumer in a window.
+    """
+
+    __slots__ = ('start', 'end', 'quantities')
+
+    def __init__(self, start: int, end: int) -> None:
+        self.start = start
+        self.end = end
+        self.quantities: Dict[str, Union[int, float]] = {}
+
+
+class MeteringSpool:
+    """
+    An append-only log on disk of the usage records that are not accepted or failed yet.
+
+    The spool replays the records of the log it finds in its directory when it
+    is opened, and writes to a new segment. A directory must be used by one
+    spool at a time.
+
+    :param str directory: The directory of the segments; it is created if needed.
+    :param int segment_size: (optional) The size in bytes after which a new segment is started.
+    :param bool fsync: (optional) If false, appends return once their record is
+           written to the operating system, which keeps it if the process stops
+           but not if the machine does.
+    :param bool group_commit: (optional) If false, each append calls fsync for
+           its own record, rather than sharing the calls of concurrent appends.
+
+    :attr int appended: The number of records appended.
+    :attr int duplicates: The number of records not appended because a record with their id was not done with.
+    :attr int syncs: The number of fsync calls.
+    :attr int compacted: The number of segments removed.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        segment_size: int = 16 * 1024 * 1024,
+        fsync: bool = True,
+        group_commit: bool = True,
+    ) -> None:
+        self.directory = directory
+        self.segment_size = segment_size
+        self.fsync = fsync
+        self.group_commit = group_commit
+        self.appended = 0
+        self.duplicates = 0
+        self.syncs = 0
+        self.compacted = 0
+        # The segment of each record held, by record id, and the records not done with, by segment.
+        self._segments: Dict[str, int] = {}
+        self._outstanding: Dict[int, int] = {}
+        self._segment_ids: Dict[int, List[str]] = {}
+        # The ids of the records held that are done with.
+        self._done = set()
+        self._replayed: List[Tuple[str, str, dict]] = []
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        # The number of lines written, and the number of them known to be on disk.
+        self._written = 0
+        self._synced = 0
+        os.makedirs(directory, exist_ok=True)
+        numbers = sorted(
+            int(name[: -len(SEGMENT_SUFFIX)])
+            for name in os.listdir(directory)
+            if name.endswith(SEGMENT_SUFFIX) and name[: -len(SEGMENT_SUFFIX)].isdigit()
+        )
+        replayed: Dict[str, Tuple[str, str, dict]] = {}
+        for number in numbers:
+            self._replay(number, replayed)
+        self._replayed = [record for record_id, record in replayed.items() if record_id not in self._done]
+        self._active = (numbers[-1] + 1) if numbers else 0
+        self._outstanding[self._active] = 0
+        self._segment_ids[self._active] = []
+        self._file = open(self._path(self._active), 'ab')  # pylint: disable=consider-using-with
+        self._compact()
+
+    def pending(self) -> List[Tuple[str, str, dict]]:
+        """
+        Return the records found in the log when the spool was opened that are not
+        done with yet, as `(record_id, resource_id, usage)` tuples, in the order
+        they were appended. They are returned once.
+        """
+        replayed, self._replayed = self._replayed, []
+        return replayed
+
+    def append(self, resource_id: str, usage, record_id: str = None) -> Optional[str]:
+        """
+        Write a usage record to the log, and wait until it is on disk.
+
+        :param str resource_id: The resource for which the usage is submitted.
+        :param usage: A ResourceInstanceUsage or its dict.
+        :param str record_id: (optional) The id of the record; by default a digest
+               of the resource id and the record.
+        :return: The id of the record, or None if the spool holds a record with the
+                 id that is not done with yet.
+        """
+        if not isinstance(usage, dict):
+            usage = usage.to_dict()
+        if record_id is None:
+            record_id = get_record_id(resource_id, usage)
+        line = _encode({'id': record_id, 'resource_id': resource_id, 'usage': usage})
+        with self._lock:
+            if record_id in self._segments and record_id not in self._done:
+                self.duplicates += 1
+                return None
+            self._write(line)
+            self._hold(record_id, self._active)
+            self.appended += 1
+            written = self._written
+            if not self.fsync:
+                self._file.flush()
+            elif not self.group_commit:
+                self._sync_file()
+        if self.fsync and self.group_commit:
+            self._sync(written)
+        return record_id
+
+    def acknowledge(self, record_ids: Iterable[str]) -> None:
+        """
+        Record that usage records are done with: accepted, or failed for good.
+        The acknowledgements are not waited for, as a record sent again after a
+        restart is rejected as a duplicate by the service, and those made once
+        the spool is closed are dropped.
+        """
+        with self._lock:
+            if self._file.closed:
+                return
+            record_ids = [r for r in record_ids if r in self._segments and r not in self._done]
+            if not record_ids:
+                return
+            self._write(_encode({'done': record_ids}))
+            self._release(record_ids)
+            self._file.flush()
+            self._compact()
+
+    def close(self) -> None:
+        """
+        Write the log to disk and close it.
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+                if self.fsync:
+                    os.fsync(self._file.fileno())
+                self._file.close()
+
+    def __enter__(self) -> 'MeteringSpool':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def segments(self) -> List[str]:
+        """The paths of the segments of the log."""
+        return [self._path(number) for number in sorted(self._outstanding)]
+
+    def _path(self, number: int) -> str:
+        return os.path.join(self.directory, '{0:012d}{1}'.format(number, SEGMENT_SUFFIX))
+
+    def _replay(self, number: int, replayed: Dict[str, Tuple[str, str, dict]]) -> None:
+        # Reads the records and acknowledgements of a segment written by an earlier spool.
+        self._outstanding[number] = 0
+        self._segment_ids[number] = []
+        with open(self._path(number), 'rb') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # The last line of a segment may be incomplete if the process stopped while writing it.
+                    continue
+                if 'done' in entry:
+                    self._release([r for r in entry['done'] if r in self._segments and r not in self._done])
+                elif entry['id'] not in self._segments or entry['id'] in self._done:
+                    self._hold(entry['id'], number)
+                    replayed.pop(entry['id'], None)
+                    replayed[entry['id']] = (entry['id'], entry['resource_id'], entry['usage'])
+
+    def _hold(self, record_id: str, number: int) -> None:
+        # Records that a segment holds a record; a record done with may be appended again.
+        self._done.discard(record_id)
+        self._segments[record_id] = number
+        self._outstanding[number] += 1
+        self._segment_ids[number].append(record_id)
+
+    def _release(self, record_ids: List[str]) -> None:
+        for record_id in record_ids:
+            self._done.add(record_id)
+            self._outstanding[self._segments[record_id]] -= 1
+
+    def _write(self, line: bytes) -> None:
+        # Called with the lock held; starts a new segment once the active one is full.
+        if self._file.tell() >= self.segment_size:
+            self._file.flush()
+            if self.fsync:
+                self._sync_file()
+            self._file.close()
+            self._active += 1
+            self._outstanding[self._active] = 0
+            self._segment_ids[self._active] = []
+            self._file = open(self._path(self._active), 'ab')  # pylint: disable=consider-using-with
+        self._file.write(line)
+        self._written += 1
+
+    def _sync(self, written: int) -> None:
+        # Waits until the first `written` lines are on disk. The thread that calls fsync
+        # writes the lines of every append that came before it, so the appends waiting
+        # for it meanwhile find their lines written once it is done.
+        with self._sync_lock:
+            if self._synced >= written:
+                return
+            with self._lock:
+                self._file.flush()
+                target = self._written
+                fileno = os.dup(self._file.fileno())
+            try:
+                os.fsync(fileno)
+            finally:
+                os.close(fileno)
+            self.syncs += 1
+            self._synced = max(self._synced, target)
+
+    def _sync_file(self) -> None:
+        # Called with the lock held.
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.syncs += 1
+        self._synced = self._written
+
+    def _compact(self) -> None:
+        # Called with the lock held; removes the oldest segments while all their records are done with.
+        # Later segments are kept until then, as they hold the acknowledgements of earlier ones.
+        for number in sorted(self._outstanding):
+            if number == self._active or self._outstanding[number] > 0:
+                return
+            os.remove(self._path(number))
+            for record_id in self._segment_ids.pop(number):
+                # The record may have been appended again to a later segment.
+                if self._segments.get(record_id) == number:
+                    del self._segments[record_id]
+                    self._done.discard(record_id)
+            del self._outstanding[number]
+            self.compacted += 1
+
+
+def get_record_id(resource_id: str, usage: dict) -> str:
+    """
+    Return the id of a usage record: a digest of its resource id and content.
+    """
+    return hashlib.sha256(_encode([resource_id, usage])).hexdigest()[:32]
+
+
+def _encode(value) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+class MeteringBatcher:
+    """
+    Submits usage records in batches per resource id, on background threads.
+
+    Close the batcher, or use it as a context manager, to send the buffered
+    records and stop its threads.
+
+    :param UsageMeteringV4 service: The service client.
+    :param int max_batch_size: (optional) The maximum number of records in a batch.
+    :param float max_age: (optional) The number of seconds after which a record
+           is sent even if its batch is not full.
+    :param int max_pending: (optional) The maximum number of records buffered or
+           in flight; submit() blocks while there are that many.
+    :param int max_workers: (optional) The maximum number of batches in flight.
+    :param int max_attempts: (optional) The number of times a record is sent
+           before it is reported as failed.
+    :param float retry_interval: (optional) The delay in seconds before a record
+           is sent again the first time; it doubles with each attempt.
+    :param float max_retry_interval: (optional) The maximum delay in seconds
+           before a record is sent again.
+    :param on_failure: (optional) A function called with the resource id, the
+           record and the reason, a ResourceUsageDetails or an exception, for
+           each record that failed. The exceptions it raises are logged.
+    :param MeteringSpool spool: (optional) The spool that keeps the records
+           until they are done with; the records it replays are submitted first.
+           The batcher does not close it.
+
+    :attr int submitted: The number of records submitted.
+    :attr int duplicates: The number of records not submitted because the spool held them already.
+    :attr int accepted: The number of records accepted, including duplicates.
+    :attr int failed: The number of records that failed.
+    :attr int requeued: The number of times records were requeued after a transient failure.
+    :attr int batches: The number of batches sent.
+    """
+
+    def __init__(
+        self,
+        service: UsageMeteringV4,
+        *,
+        max_batch_size: int = 100,
+        max_age: float = 1.0,
+        max_pending: int = 10000,
+        max_workers: int = 2,
+        max_attempts: int = 5,
+        retry_interval: float = 0.5,
+        max_retry_interval: float = 30.0,
+        on_failure: Callable[[str, object, Union[ResourceUsageDetails, Exception]], None] = None,
+        spool: MeteringSpool = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError('max_batch_size must be at least 1')
+        if max_pending < max_batch_size:
+            raise ValueError('max_pending must be at least max_batch_size')
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        self.service = service
+        self.max_batch_size = max_batch_size
+        self.max_age = max_age
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.on_failure = on_failure
+        self.spool = spool
+        self.submitted = 0
+        self.duplicates = 0
+        self.accepted = 0
+        self.failed = 0
+        self.requeued = 0
+        self.batches = 0
+        self._groups: Dict[str, _Group] = {}
+        # The number of records buffered or in flight.
+        self._pending = 0
+        # The number of flush() calls waiting, while which every record is sent as soon as possible.
+        self._flushing = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        if spool is not None:
+            with self._condition:
+                for record_id, resource_id, record in spool.pending():
+                    self._add(resource_id, _Entry(record, time.monotonic(), record_id))
+        self._threads = [
+            threading.Thread(target=self._run, name='MeteringBatcher-{0}'.format(i), daemon=True)
+            for i in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def pending(self) -> int:
+        """The number of records buffered or in flight."""
+        return self._pending
+
+    def submit(
+        self,
+        resource_id: str,
+        usage: Union[ResourceInstanceUsage, dict, List[Union[ResourceInstanceUsage, dict]]],
+        *,
+        timeout: float = None,
+    ) -> None:
+        """
+        Buffer usage records to be sent with the next batch of their resource.
+
+        :param str resource_id: The resource for which the usage is submitted.
+        :param usage: A ResourceInstanceUsage or its dict, or a list of them.
+        :param float timeout: (optional) The maximum number of seconds to wait for
+               room in the buffer; by default submit() waits as long as it takes.
+        :raises queue.Full: If the buffer is still full after `timeout` seconds.
+        """
+        records = usage if isinstance(usage, list) else [usage]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for record in records:
+            with self._condition:
+                while self._pending >= self.max_pending and not self._closed:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise queue.Full('The metering buffer is full')
+                    self._condition.wait(remaining)
+                if self._closed:
+                    raise ValueError('The metering batcher is closed')
+                if self.spool is None:
+                    self._add(resource_id, _Entry(record, time.monotonic()))
+                    self.submitted += 1
+                    continue
+                # The room is taken while the record is written to the spool, without holding the lock.
+                self._pending += 1
+            try:
+                record_id = self.spool.append(resource_id, record)
+            except BaseException:
+                with self._condition:
+                    self._pending -= 1
+                    self._condition.notify_all()
+                raise
+            with self._condition:
+                self._pending -= 1
+                if record_id is None:
+                    self.duplicates += 1
+                    self._condition.notify_all()
+                else:
+                    self._add(resource_id, _Entry(record, time.monotonic(), record_id))
+                    self.submitted += 1
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Send the buffered records, and wait until every record submitted is accepted or failed.
+
+        :param float timeout: (optional) The maximum number of seconds to wait.
+        :return: True if no record is buffered or in flight any more.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                while self._pending:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+                return True
+            finally:
+                self._flushing -= 1
+
+    def close(self) -> None:
+        """
+        Send the buffered records, then stop the background threads.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
+
+    def __enter__(self) -> 'MeteringBatcher':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _add(self, resource_id: str, entry: _Entry) -> None:
+        # Called with the condition held.
+        group = self._groups.get(resource_id)
+        if group is None:
+            group = self._groups[resource_id] = _Group()
+        group.entries.append(entry)
+        self._pending += 1
+        # The workers wait for the first record of a group to be due, or for a batch to be full.
+        if len(group.entries) in (1, self.max_batch_size):
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    now = time.monotonic()
+                    batch = self._take_batch(now)
+                    if batch is not None:
+                        break
+                    if self._closed and not self._pending:
+                        return
+                    self._condition.wait(self._next_due(now))
+            self._send(*batch)
+
+    def _take_batch(self, now: float):
+        # Removes the records of the resource that is due first from the buffer, if any resource is due.
+        urgent = self._flushing or self._closed
+        due = None
+        for resource_id, group in self._groups.items():
+            if group.not_before > now:
+                continue
+            oldest = group.entries[0].queued_at
+            if urgent or len(group.entries) >= self.max_batch_size or now - oldest >= self.max_age:
+                if due is None or oldest < due[1]:
+                    due = (resource_id, oldest)
+        if due is None:
+            return None
+        resource_id = due[0]
+        group = self._groups[resource_id]
+        entries = [group.entries.popleft() for _ in range(min(self.max_batch_size, len(group.entries)))]
+        if not group.entries:
+            del self._groups[resource_id]
+        return resource_id, entries
+
+    def _next_due(self, now: float) -> Optional[float]:
+        # Returns the number of seconds until a resource is due, or None if none is buffered.
+        urgent = self._flushing or self._closed
+        times = [
+            max(group.not_before, now if urgent else group.entries[0].queued_at + self.max_age)
+            for group in self._groups.values()
+        ]
+        return max(0.0, min(times) - now) if times else None
+
+    def _send(self, resource_id: str, entries: List[_Entry]) -> None:
+        with self._condition:
+            self.batches += 1
+        for entry in entries:
+            entry.attempts += 1
+        try:
+            response = self.service.report_resource_usage(resource_id, [entry.record for entry in entries])
+        except Exception as error:  # pylint: disable=broad-except
+            if _is_transient(error):
+                self._requeue(resource_id, [(entry, error) for entry in entries], get_retry_after(_headers(error)))
+            else:
+                self._fail(resource_id, [(entry, error) for entry in entries])
+            return
+        results = (response.get_result() or {}).get('resources') or []
+        accepted, retried, failed = [], [], []
+        for i, entry in enumerate(entries):
+            details = results[i] if i < len(results) else None
+            status = details.get('status') if details else None
+            if status is None:
+                # The record is sent again; the service rejects it as a duplicate if it was accepted.
+                retried.append((entry, ApiException(response.get_status_code(), message='The record has no status')))
+            elif 200 <= status < 300 or status == DUPLICATE_STATUS:
+                accepted.append(entry)
+            else:
+                reason = ResourceUsageDetails(
+                    status, details.get('location'), code=details.get('code'), message=details.get('message')
+                )
+                (retried if status in RETRY_STATUS_CODES else failed).append((entry, reason))
+        self._acknowledge(accepted)
+        with self._condition:
+            self.accepted += len(accepted)
+            self._release(len(accepted))
+        if retried:
+            self._requeue(resource_id, retried, get_retry_after(response.get_headers()))
+        if failed:
+            self._fail(resource_id, failed)
+
+    def _requeue(self, resource_id: str, entries: List[tuple], retry_after: Optional[float]) -> None:
+        # Puts the records back at the front of their group, to be sent after a backoff delay.
+        exhausted = [(entry, reason) for entry, reason in entries if entry.attempts >= self.max_attempts]
+        entries = [entry for entry, _ in entries if entry.attempts < self.max_attempts]
+        if entries:
+            attempts = max(entry.attempts for entry in entries)
+            if retry_after is None:
+                delay = min(self.max_retry_interval, self.retry_interval * 2 ** (attempts - 1))
+                retry_after = delay / 2 + random.uniform(0, delay / 2)
+            with self._condition:
+                group = self._groups.get(resource_id)
+                if group is None:
+                    group = self._groups[resource_id] = _Group()
+                group.entries.extendleft(reversed(entries))
+                group.not_before = max(group.not_before, time.monotonic() + min(retry_after, self.max_retry_interval))
+                self.requeued += len(entries)
+                self._condition.notify_all()
+        if exhausted:
+            self._fail(resource_id, exhausted)
+
+    def _fail(self, resource_id: str, entries: List[tuple]) -> None:
+        # Reports the records that failed, with their reasons.
+        self._acknowledge([entry for entry, _ in entries])
+        with self._condition:
+            self.failed += len(entries)
+            self._release(len(entries))
+        if self.on_failure is not None:
+            for entry, reason in entries:
+                # The workers outlive the errors of the callback, or flush() would wait for them forever.
+                try:
+                    self.on_failure(resource_id, entry.record, reason)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception('The on_failure callback of a MeteringBatcher failed')
+
+    def _acknowledge(self, entries: List[_Entry]) -> None:
+        # The records that cannot be acknowledged stay in the spool, and are submitted again when it is opened.
+        if self.spool is not None:
+            try:
+                self.spool.acknowledge(entry.record_id for entry in entries if entry.record_id is not None)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('A MeteringBatcher failed to acknowledge records in its spool')
+
+    def _release(self, count: int) -> None:
+        # Called with the condition held, once records are accepted or failed.
+        if count:
+            self._pending -= count
+            self._condition.notify_all()
+
+
+class MeteringAggregator:
+    """
+    Merges the additive measures of usage records before they are submitted.
+
+    The quantities of the additive measures of the records of one resource
+    instance, plan, region and consumer whose start falls in the same window
+    are summed, and submitted as one record that spans from the earliest start
+    to the latest end of the records merged. The other measures, and the
+    quantities that are not numbers, are submitted at once, in a copy of their
+    record without the additive measures; records without additive measures
+    are submitted unchanged.
+
+    :param submit: The function the records are submitted to, with their
+           resource id, such as MeteringBatcher.submit.
+    :param additive: The names of the additive measures.
+    :param float window: (optional) The length of the windows in seconds; the
+           windows start at multiples of it since the epoch.
+    :param int max_totals: (optional) The maximum number of totals held; the
+           totals are submitted when a record would need one more.
+
+    :attr int added: The number of records added.
+    :attr int passed: The number of records submitted with measures that are not additive.
+    :attr int emitted: The number of records of totals submitted.
+    """
+
+    def __init__(
+        self,
+        submit: Callable[[str, List[Union[ResourceInstanceUsage, dict]]], None],
+        *,
+        additive: Iterable[str],
+        window: float = 3600.0,
+        max_totals: int = 100000,
+    ) -> None:
+        if window <= 0:
+            raise ValueError('window must be positive')
+        if max_totals < 1:
+            raise ValueError('max_totals must be at least 1')
+        self.submit = submit
+        self.additive = frozenset(additive)
+        self.window = window
+        self.max_totals = max_totals
+        self.added = 0
+        self.passed = 0
+        self.emitted = 0
+        self._window_ms = window * 1000
+        # The totals by resource id, instance id, plan id, region, consumer id and window.
+        self._totals: Dict[tuple, _Total] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def totals(self) -> int:
+        """The number of totals held."""
+        return len(self._totals)
+
+    def add(
+        self, resource_id: str, usage: Union[ResourceInstanceUsage, dict, List[Union[ResourceInstanceUsage, dict]]]
+    ) -> None:
+        """
+        Add usage records to the totals of their windows.
+
+        :param str resource_id: The resource for which the usage is submitted.
+        :param usage: A ResourceInstanceUsage or its dict, or a list of them.
+        """
+        passed, full = [], []
+        with self._lock:
+            for record in usage if isinstance(usage, list) else [usage]:
+                self.added += 1
+                additive, others = [], []
+                for measure in _value(record, 'measured_usage') or []:
+                    quantity = _value(measure, 'quantity')
+                    if (
+                        _value(measure, 'measure') in self.additive
+                        and isinstance(quantity, (int, float))
+                        and not isinstance(quantity, bool)
+                    ):
+                        additive.append(measure)
+                    else:
+                        others.append(measure)
+                if not additive:
+                    passed.append(record)
+                    continue
+                if others:
+                    passed.append(_with_measures(record, others))
+                start, end = _value(record, 'start'), _value(record, 'end')
+                key = (
+                    resource_id,
+                    _value(record, 'resource_instance_id'),
+                    _value(record, 'plan_id'),
+                    _value(record, 'region'),
+                    _value(record, 'consumer_id'),
+                    int(start // self._window_ms),
+                )
+                total = self._totals.get(key)
+                if total is None:
+                    if len(self._totals) >= self.max_totals:
+                        full.append(self._totals)
+                        self._totals = {}
+                    total = self._totals[key] = _Total(start, end)
+                else:
+                    total.start = min(total.start, start)
+                    total.end = max(total.end, end)
+                quantities = total.quantities
+                for measure in additive:
+                    name = _value(measure, 'measure')
+                    quantities[name] = quantities.get(name, 0) + _value(measure, 'quantity')
+            self.passed += len(passed)
+        if passed:
+            self.submit(resource_id, passed)
+        for totals in full:
+            self._submit(totals)
+
+    def flush(self, before: int = None) -> int:
+        """
+        Submit the totals held.
+
+        :param int before: (optional) A time in milliseconds since the epoch; only
+               the totals of the windows that end by then are submitted.
+        :return: The number of records submitted.
+        """
+        with self._lock:
+            if before is None:
+                totals, self._totals = self._totals, {}
+            else:
+                totals = {
+                    key: total for key, total in self._totals.items() if (key[-1] + 1) * self._window_ms <= before
+                }
+                for key in totals:
+                    del self._totals[key]
+        return self._submit(totals)
+
+    def close(self) -> None:
+        """
+        Submit the totals held.
+        """
+        self.flush()
+
+    def __enter__(self) -> 'MeteringAggregator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _submit(self, totals: Dict[tuple, _Total]) -> int:
+        records: Dict[str, List[ResourceInstanceUsage]] = {}
+        for (resource_id, instance_id, plan_id, region, consumer_id, _), total in totals.items():
+            records.setdefault(resource_id, []).append(
+                ResourceInstanceUsage(
+                    resource_instance_id=instance_id,
+                    plan_id=plan_id,
+                    start=total.start,
+                    end=total.end,
+                    measured_usage=[MeasureAndQuantity(measure=m, quantity=q) for m, q in total.quantities.items()],
+                    region=region,
+                    consumer_id=consumer_id,
+                )
+            )
+        with self._lock:
+            self.emitted += len(totals)
+        for resource_id, usage in records.items():
+            self.submit(resource_id, usage)
+        return len(totals)
+
+
+def _value(model, name: str):
+    # Reads a property of a model or of its dict.
+    return model.get(name) if isinstance(model, dict) else getattr(model, name, None)
+
+
+def _with_measures(record, measures: list):
+    record = copy.copy(record)
+    if isinstance(record, dict):
+        record['measured_usage'] = measures
+    else:
+        record.measured_usage = measures
+    return record
+
+
+def _is_transient(error: Exception) -> bool:
+    if isinstance(error, ApiException):
+        return error.code in RETRY_STATUS_CODES
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def _headers(error: Exception):
+    return getattr(getattr(error, 'http_response', None), 'headers', None)
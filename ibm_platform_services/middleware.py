@@ -0,0 +1,96 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides the chain of middleware that wraps the send() method of
+a service client.
+
+Each middleware replaces the client's send() method and passes the requests
+it does not answer itself on to the send() method it replaced, so several
+middleware can be installed on the same client. The most recently installed
+middleware sees a request first.
+"""
+
+import weakref
+from typing import Optional, Type, TypeVar
+
+from ibm_cloud_sdk_core import BaseService
+
+M = TypeVar('M', bound='SendMiddleware')
+
+
+class SendMiddleware:
+    """
+    The base class of the objects installed in place of the send() method of a
+    service client.
+
+    Subclasses implement __call__(request, **kwargs) and call send_next() for
+    the requests they pass on.
+
+    :param BaseService service: The service client.
+    :param send: The send() method replaced by the middleware, or None if it is
+           the method of the service class.
+    """
+
+    def __init__(self, service: BaseService, send=None) -> None:
+        # A weak reference, as the service holds this object.
+        self._service = weakref.ref(service)
+        self._next = send
+
+    @property
+    def service(self) -> BaseService:
+        """The service client."""
+        return self._service()
+
+    def send_next(self, service: BaseService, request: dict, **kwargs):
+        """
+        Send a request with the send() method replaced by this middleware.
+        """
+        if self._next is None:
+            return type(service).send(service, request, **kwargs)
+        return self._next(request, **kwargs)
+
+    def __call__(self, request: dict, **kwargs):
+        return self.send_next(self.service, request, **kwargs)
+
+
+def find_middleware(service: BaseService, middleware_type: Type[M]) -> Optional[M]:
+    """
+    Return the middleware of the given type installed on a service client, or None.
+    """
+    send = vars(service).get('send')
+    while isinstance(send, SendMiddleware):
+        if isinstance(send, middleware_type):
+            return send
+        send = send._next  # pylint: disable=protected-access
+    return None
+
+
+def install_middleware(service: BaseService, middleware_type: Type[M], *args, **kwargs) -> M:
+    """
+    Install a middleware on a service client, unless one of the same type is
+    already installed.
+
+    :param BaseService service: The service client.
+    :param type middleware_type: The SendMiddleware subclass, constructed with
+           the service, the replaced send() method and the other arguments.
+    :return: The middleware of the given type installed on the client.
+    """
+    middleware = find_middleware(service, middleware_type)
+    if middleware is None:
+        middleware = middleware_type(service, vars(service).get('send'), *args, **kwargs)
+        service.send = middleware
+    return middleware
@@ -0,0 +1,5848 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Generated by `python scripts/generate_model_specs.py`; do not edit.
+
+"""
+The field spec tables of the model classes of the service modules, from which
+the deserialization module compiles its decoders.
+
+MODEL_SPECS maps the name of each service module to the tables of its model
+classes, by class name. A table holds the properties read by `from_dict()`,
+in the order it reads them: the JSON name of a property that is copied as is
+to the attribute of the same name, or a tuple of the JSON name, the attribute
+name, the kind of FieldSpec, the name of the nested model class or conversion
+function in the service module, and the message of the ValueError raised when
+the property is required and missing. It then holds the attributes set by the
+constructor, in the order it sets them, and whether the model keeps additional
+properties.
+"""
+
+MODEL_SPECS = {
+    'case_management_v1': {
+        'Attachment': (
+            (
+                'id',
+                'filename',
+                'size_in_bytes',
+                'created_at',
+                'url',
+            ),
+            ('id', 'filename', 'size_in_bytes', 'created_at', 'url'),
+            False,
+        ),
+        'AttachmentList': (
+            (('attachments', 'attachments', 'model_list', 'Attachment', None),),
+            ('attachments',),
+            False,
+        ),
+        'Case': (
+            (
+                'number',
+                'short_description',
+                'description',
+                'created_at',
+                ('created_by', 'created_by', 'model', 'User', None),
+                'updated_at',
+                ('updated_by', 'updated_by', 'model', 'User', None),
+                'contact_type',
+                ('contact', 'contact', 'model', 'User', None),
+                'status',
+                'severity',
+                'support_tier',
+                'resolution',
+                'close_notes',
+                ('eu', 'eu', 'model', 'CaseEu', None),
+                ('watchlist', 'watchlist', 'model_list', 'User', None),
+                ('attachments', 'attachments', 'model_list', 'Attachment', None),
+                ('offering', 'offering', 'model', 'Offering', None),
+                ('resources', 'resources', 'model_list', 'Resource', None),
+                ('comments', 'comments', 'model_list', 'Comment', None),
+            ),
+            (
+                'number',
+                'short_description',
+                'description',
+                'created_at',
+                'created_by',
+                'updated_at',
+                'updated_by',
+                'contact_type',
+                'contact',
+                'status',
+                'severity',
+                'support_tier',
+                'resolution',
+                'close_notes',
+                'eu',
+                'watchlist',
+                'attachments',
+                'offering',
+                'resources',
+                'comments',
+            ),
+            False,
+        ),
+        'CaseEu': (
+            (
+                'support',
+                'data_center',
+            ),
+            ('support', 'data_center'),
+            False,
+        ),
+        'CaseList': (
+            (
+                'total_count',
+                ('first', 'first', 'model', 'PaginationLink', None),
+                ('next', 'next', 'model', 'PaginationLink', None),
+                ('previous', 'previous', 'model', 'PaginationLink', None),
+                ('last', 'last', 'model', 'PaginationLink', None),
+                ('cases', 'cases', 'model_list', 'Case', None),
+            ),
+            ('total_count', 'first', 'next', 'previous', 'last', 'cases'),
+            False,
+        ),
+        'CasePayloadEu': (
+            (
+                'supported',
+                'data_center',
+            ),
+            ('supported', 'data_center'),
+            False,
+        ),
+        'Comment': (
+            (
+                'value',
+                'added_at',
+                ('added_by', 'added_by', 'model', 'User', None),
+            ),
+            ('value', 'added_at', 'added_by'),
+            False,
+        ),
+        'Offering': (
+            (
+                ('name', 'name', 'value', None, "Required property 'name' not present in Offering JSON"),
+                ('type', 'type', 'model', 'OfferingType', "Required property 'type' not present in Offering JSON"),
+            ),
+            ('name', 'type'),
+            False,
+        ),
+        'OfferingType': (
+            (
+                ('group', 'group', 'value', None, "Required property 'group' not present in OfferingType JSON"),
+                ('key', 'key', 'value', None, "Required property 'key' not present in OfferingType JSON"),
+                'kind',
+                'id',
+            ),
+            ('group', 'key', 'kind', 'id'),
+            False,
+        ),
+        'PaginationLink': (
+            ('href',),
+            ('href',),
+            False,
+        ),
+        'Resource': (
+            (
+                'crn',
+                'name',
+                'type',
+                'url',
+                'note',
+            ),
+            ('crn', 'name', 'type', 'url', 'note'),
+            False,
+        ),
+        'ResourcePayload': (
+            (
+                'crn',
+                'type',
+                'id',
+                'note',
+            ),
+            ('crn', 'type', 'id', 'note'),
+            False,
+        ),
+        'User': (
+            (
+                'name',
+                ('realm', 'realm', 'value', None, "Required property 'realm' not present in User JSON"),
+                ('user_id', 'user_id', 'value', None, "Required property 'user_id' not present in User JSON"),
+            ),
+            ('name', 'realm', 'user_id'),
+            False,
+        ),
+        'Watchlist': (
+            (('watchlist', 'watchlist', 'model_list', 'User', None),),
+            ('watchlist',),
+            False,
+        ),
+        'WatchlistAddResponse': (
+            (
+                ('added', 'added', 'model_list', 'User', None),
+                ('failed', 'failed', 'model_list', 'User', None),
+            ),
+            ('added', 'failed'),
+            False,
+        ),
+        'AcceptPayload': (
+            (
+                ('action', 'action', 'value', None, "Required property 'action' not present in AcceptPayload JSON"),
+                'comment',
+            ),
+            ('action', 'comment'),
+            False,
+        ),
+        'ResolvePayload': (
+            (
+                ('action', 'action', 'value', None, "Required property 'action' not present in ResolvePayload JSON"),
+                'comment',
+                (
+                    'resolution_code',
+                    'resolution_code',
+                    'value',
+                    None,
+                    "Required property 'resolution_code' not present in ResolvePayload JSON",
+                ),
+            ),
+            ('action', 'comment', 'resolution_code'),
+            False,
+        ),
+        'UnresolvePayload': (
+            (
+                ('action', 'action', 'value', None, "Required property 'action' not present in UnresolvePayload JSON"),
+                (
+                    'comment',
+                    'comment',
+                    'value',
+                    None,
+                    "Required property 'comment' not present in UnresolvePayload JSON",
+                ),
+            ),
+            ('action', 'comment'),
+            False,
+        ),
+        'FileWithMetadata': (
+            (
+                ('data', 'data', 'value', None, "Required property 'data' not present in FileWithMetadata JSON"),
+                'filename',
+                'content_type',
+            ),
+            ('data', 'filename', 'content_type'),
+            False,
+        ),
+    },
+    'catalog_management_v1': {
+        'AccessListBulkResponse': (
+            ('errors',),
+            ('errors',),
+            False,
+        ),
+        'Account': (
+            (
+                'id',
+                ('hide_IBM_cloud_catalog', 'hide_ibm_cloud_catalog', 'value', None, None),
+                ('account_filters', 'account_filters', 'model', 'Filters', None),
+            ),
+            ('id', 'hide_ibm_cloud_catalog', 'account_filters'),
+            False,
+        ),
+        'AccumulatedFilters': (
+            (
+                ('account_filters', 'account_filters', 'model_list', 'Filters', None),
+                ('catalog_filters', 'catalog_filters', 'model_list', 'AccumulatedFiltersCatalogFiltersItem', None),
+            ),
+            ('account_filters', 'catalog_filters'),
+            False,
+        ),
+        'AccumulatedFiltersCatalogFiltersItem': (
+            (
+                ('catalog', 'catalog', 'model', 'AccumulatedFiltersCatalogFiltersItemCatalog', None),
+                ('filters', 'filters', 'model', 'Filters', None),
+            ),
+            ('catalog', 'filters'),
+            False,
+        ),
+        'AccumulatedFiltersCatalogFiltersItemCatalog': (
+            (
+                'id',
+                'name',
+            ),
+            ('id', 'name'),
+            False,
+        ),
+        'ApprovalResult': (
+            (
+                'allow_request',
+                'ibm',
+                'public',
+                'changed',
+            ),
+            ('allow_request', 'ibm', 'public', 'changed'),
+            False,
+        ),
+        'AuditLog': (
+            (('list', 'list', 'model_list', 'AuditRecord', None),),
+            ('list',),
+            False,
+        ),
+        'AuditRecord': (
+            (
+                'id',
+                ('created', 'created', 'converted', 'lazy_datetime', None),
+                'change_type',
+                'target_type',
+                'target_id',
+                'who_delegate_email',
+                'message',
+            ),
+            ('id', 'created', 'change_type', 'target_type', 'target_id', 'who_delegate_email', 'message'),
+            False,
+        ),
+        'Catalog': (
+            (
+                'id',
+                ('_rev', 'rev', 'value', None, None),
+                'label',
+                'short_description',
+                'catalog_icon_url',
+                'tags',
+                'url',
+                'crn',
+                'offerings_url',
+                ('features', 'features', 'model_list', 'Feature', None),
+                'disabled',
+                ('created', 'created', 'converted', 'lazy_datetime', None),
+                ('updated', 'updated', 'converted', 'lazy_datetime', None),
+                'resource_group_id',
+                'owning_account',
+                ('catalog_filters', 'catalog_filters', 'model', 'Filters', None),
+                ('syndication_settings', 'syndication_settings', 'model', 'SyndicationResource', None),
+                'kind',
+            ),
+            (
+                'id',
+                'rev',
+                'label',
+                'short_description',
+                'catalog_icon_url',
+                'tags',
+                'url',
+                'crn',
+                'offerings_url',
+                'features',
+                'disabled',
+                'created',
+                'updated',
+                'resource_group_id',
+                'owning_account',
+                'catalog_filters',
+                'syndication_settings',
+                'kind',
+            ),
+            False,
+        ),
+        'CatalogObject': (
+            (
+                'id',
+                'name',
+                ('_rev', 'rev', 'value', None, None),
+                'crn',
+                'url',
+                'parent_id',
+                'label_i18n',
+                'label',
+                'tags',
+                ('created', 'created', 'converted', 'lazy_datetime', None),
+                ('updated', 'updated', 'converted', 'lazy_datetime', None),
+                'short_description',
+                'short_description_i18n',
+                'kind',
+                ('publish', 'publish', 'model', 'PublishObject', None),
+                ('state', 'state', 'model', 'State', None),
+                'catalog_id',
+                'catalog_name',
+                'data',
+            ),
+            (
+                'id',
+                'name',
+                'rev',
+                'crn',
+                'url',
+                'parent_id',
+                'label_i18n',
+                'label',
+                'tags',
+                'created',
+                'updated',
+                'short_description',
+                'short_description_i18n',
+                'kind',
+                'publish',
+                'state',
+                'catalog_id',
+                'catalog_name',
+                'data',
+            ),
+            False,
+        ),
+        'CatalogSearchResult': (
+            (
+                'total_count',
+                ('resources', 'resources', 'model_list', 'Catalog', None),
+            ),
+            ('total_count', 'resources'),
+            False,
+        ),
+        'CategoryFilter': (
+            (
+                'include',
+                ('filter', 'filter', 'model', 'FilterTerms', None),
+            ),
+            ('include', 'filter'),
+            False,
+        ),
+        'ClusterInfo': (
+            (
+                'resource_group_id',
+                'resource_group_name',
+                'id',
+                'name',
+                'region',
+            ),
+            ('resource_group_id', 'resource_group_name', 'id', 'name', 'region'),
+            False,
+        ),
+        'Configuration': (
+            (
+                'key',
+                'type',
+                'default_value',
+                'value_constraint',
+                'description',
+                'required',
+                'options',
+                'hidden',
+            ),
+            ('key', 'type', 'default_value', 'value_constraint', 'description', 'required', 'options', 'hidden'),
+            False,
+        ),
+        'DeployRequestBodySchematics': (
+            (
+                'name',
+                'description',
+                'tags',
+                'resource_group_id',
+            ),
+            ('name', 'description', 'tags', 'resource_group_id'),
+            False,
+        ),
+        'Deployment': (
+            (
+                'id',
+                'label',
+                'name',
+                'short_description',
+                'long_description',
+                'metadata',
+                'tags',
+                ('created', 'created', 'converted', 'lazy_datetime', None),
+                ('updated', 'updated', 'converted', 'lazy_datetime', None),
+            ),
+            ('id', 'label', 'name', 'short_description', 'long_description', 'metadata', 'tags', 'created', 'updated'),
+            False,
+        ),
+        'Feature': (
+            (
+                'title',
+                'description',
+            ),
+            ('title', 'description'),
+            False,
+        ),
+        'FilterTerms': (
+            ('filter_terms',),
+            ('filter_terms',),
+            False,
+        ),
+        'Filters': (
+            (
+                'include_all',
+                ('category_filters', 'category_filters', 'model_dict', 'CategoryFilter', None),
+                ('id_filters', 'id_filters', 'model', 'IDFilter', None),
+            ),
+            ('include_all', 'category_filters', 'id_filters'),
+            False,
+        ),
+        'IDFilter': (
+            (
+                ('include', 'include', 'model', 'FilterTerms', None),
+                ('exclude', 'exclude', 'model', 'FilterTerms', None),
+            ),
+            ('include', 'exclude'),
+            False,
+        ),
+        'Image': (
+            ('image',),
+            ('image',),
+            False,
+        ),
+        'ImageManifest': (
+            (
+                'description',
+                ('images', 'images', 'model_list', 'Image', None),
+            ),
+            ('description', 'images'),
+            False,
+        ),
+        'InstallStatus': (
+            (
+                ('metadata', 'metadata', 'model', 'InstallStatusMetadata', None),
+                ('release', 'release', 'model', 'InstallStatusRelease', None),
+                ('content_mgmt', 'content_mgmt', 'model', 'InstallStatusContentMgmt', None),
+            ),
+            ('metadata', 'release', 'content_mgmt'),
+            False,
+        ),
+        'InstallStatusContentMgmt': (
+            (
+                'pods',
+                'errors',
+            ),
+            ('pods', 'errors'),
+            False,
+        ),
+        'InstallStatusMetadata': (
+            (
+                'cluster_id',
+                'region',
+                'namespace',
+                'workspace_id',
+                'workspace_name',
+            ),
+            ('cluster_id', 'region', 'namespace', 'workspace_id', 'workspace_name'),
+            False,
+        ),
+        'InstallStatusRelease': (
+            (
+                'deployments',
+                'replicasets',
+                'statefulsets',
+                'pods',
+                'errors',
+            ),
+            ('deployments', 'replicasets', 'statefulsets', 'pods', 'errors'),
+            False,
+        ),
+        'JsonPatchOperation': (
+            (
+                ('op', 'op', 'value', None, "Required property 'op' not present in JsonPatchOperation JSON"),
+                ('path', 'path', 'value', None, "Required property 'path' not present in JsonPatchOperation JSON"),
+                ('from', 'from_', 'value', None, None),
+                'value',
+            ),
+            ('op', 'path', 'from_', 'value'),
+            False,
+        ),
+        'Kind': (
+            (
+                'id',
+                'format_kind',
+                'target_kind',
+                'metadata',
+                'install_description',
+                'tags',
+                ('additional_features', 'additional_features', 'model_list', 'Feature', None),
+                ('created', 'created', 'converted', 'lazy_datetime', None),
+                ('updated', 'updated', 'converted', 'lazy_datetime', None),
+                ('versions', 'versions', 'model_list', 'Version', None),
+                ('plans', 'plans', 'model_list', 'Plan', None),
+            ),
+            (
+                'id',
+                'format_kind',
+                'target_kind',
+                'metadata',
+                'install_description',
+                'tags',
+                'additional_features',
+                'created',
+                'updated',
+                'versions',
+                'plans',
+            ),
+            False,
+        ),
+        'License': (
+            (
+                'id',
+                'name',
+                'type',
+                'url',
+                'description',
+            ),
+            ('id', 'name', 'type', 'url', 'description'),
+            False,
+        ),
+        'MediaItem': (
+            (
+                'url',
+                'caption',
+                'type',
+                'thumbnail_url',
+            ),
+            ('url', 'caption', 'type', 'thumbnail_url'),
+            False,
+        ),
+        'NamespaceSearchResult': (
+            (
+                (
+                    'offset',
+                    'offset',
+                    'value',
+                    None,
+                    "Required property 'offset' not present in NamespaceSearchResult JSON",
+                ),
+                (
+                    'limit',
+                    'limit',
+                    'value',
+                    None,
+                    "Required property 'limit' not present in NamespaceSearchResult JSON",
+                ),
+                'total_count',
+                'resource_count',
+                'first',
+                'last',
+                'prev',
+                'next',
+                'resources',
+            ),
+            ('offset', 'limit', 'total_count', 'resource_count', 'first', 'last', 'prev', 'next', 'resources'),
+            False,
+        ),
+        'ObjectAccess': (
+            (
+                'id',
+                'account',
+                'catalog_id',
+                'target_id',
+                ('create', 'create', 'converted', 'lazy_datetime', None),
+            ),
+            ('id', 'account', 'catalog_id', 'target_id', 'create'),
+            False,
+        ),
+        'ObjectAccessListResult': (
+            (
+                (
+                    'offset',
+                    'offset',
+                    'value',
+                    None,
+                    "Required property 'offset' not present in ObjectAccessListResult JSON",
+                ),
+                (
+                    'limit',
+                    'limit',
+                    'value',
+                    None,
+                    "Required property 'limit' not present in ObjectAccessListResult JSON",
+                ),
+                'total_count',
+                'resource_count',
+                'first',
+                'last',
+                'prev',
+                'next',
+                ('resources', 'resources', 'model_list', 'ObjectAccess', None),
+            ),
+            ('offset', 'limit', 'total_count', 'resource_count', 'first', 'last', 'prev', 'next', 'resources'),
+            False,
+        ),
+        'ObjectListResult': (
+            (
+                ('offset', 'offset', 'value', None, "Required property 'offset' not present in ObjectListResult JSON"),
+                ('limit', 'limit', 'value', None, "Required property 'limit' not present in ObjectListResult JSON"),
+                'total_count',
+                'resource_count',
+                'first',
+                'last',
+                'prev',
+                'next',
+                ('resources', 'resources', 'model_list', 'CatalogObject', None),
+            ),
+            ('offset', 'limit', 'total_count', 'resource_count', 'first', 'last', 'prev', 'next', 'resources'),
+            False,
+        ),
+        'ObjectSearchResult': (
+            (
+                (
+                    'offset',
+                    'offset',
+                    'value',
+                    None,
+                    "Required property 'offset' not present in ObjectSearchResult JSON",
+                ),
+                ('limit', 'limit', 'value', None, "Required property 'limit' not present in ObjectSearchResult JSON"),
+                'total_count',
+                'resource_count',
+                'first',
+                'last',
+                'prev',
+                'next',
+                ('resources', 'resources', 'model_list', 'CatalogObject', None),
+            ),
+            ('offset', 'limit', 'total_count', 'resource_count', 'first', 'last', 'prev', 'next', 'resources'),
+            False,
+        ),
+        'Offering': (
+            (
+                'id',
+                ('_rev', 'rev', 'value', None, None),
+                'url',
+                'crn',
+                'label',
+                'name',
+                'offering_icon_url',
+                'offering_docs_url',
+                'offering_support_url',
+                'tags',
+                'keywords',
+                ('rating', 'rating', 'model', 'Rating', None),
+                ('created', 'created', 'converted', 'lazy_datetime', None),
+                ('updated', 'updated', 'converted', 'lazy_datetime', None),
+                'short_description',
+                'long_description',
+                ('features', 'features', 'model_list', 'Feature', None),
+                ('kinds', 'kinds', 'model_list', 'Kind', None),
+                'permit_request_ibm_public_publish',
+                'ibm_publish_approved',
+                'public_publish_approved',
+                'public_original_crn',
+                'publish_public_crn',
+                'portal_approval_record',
+                'portal_ui_url',
+                'catalog_id',
+                'catalog_name',
+                'metadata',
+                'disclaimer',
+                'hidden',
+                'provider',
+                ('provider_info', 'provider_info', 'model', 'ProviderInfo', None),
+                ('repo_info', 'repo_info', 'model', 'RepoInfo', None),
+                ('support', 'support', 'model', 'Support', None),
+                ('media', 'media', 'model_list', 'MediaItem', None),
+            ),
+            (
+                'id',
+                'rev',
+                'url',
+                'crn',
+                'label',
+                'name',
+                'offering_icon_url',
+                'offering_docs_url',
+                'offering_support_url',
+                'tags',
+                'keywords',
+                'rating',
+                'created',
+                'updated',
+                'short_description',
+                'long_description',
+                'features',
+                'kinds',
+                'permit_request_ibm_public_publish',
+                'ibm_publish_approved',
+                'public_publish_approved',
+                'public_original_crn',
+                'publish_public_crn',
+                'portal_approval_record',
+                'portal_ui_url',
+                'catalog_id',
+                'catalog_name',
+                'metadata',
+                'disclaimer',
+                'hidden',
+                'provider',
+                'provider_info',
+                'repo_info',
+                'support',
+                'media',
+            ),
+            False,
+        ),
+        'OfferingInstance': (
+            (
+                'id',
+                ('_rev', 'rev', 'value', None, None),
+                'url',
+                'crn',
+                'label',
+                'catalog_id',
+                'offering_id',
+                'kind_format',
+                'version',
+                'cluster_id',
+                'cluster_region',
+                'cluster_namespaces',
+                'cluster_all_namespaces',
+                'schematics_workspace_id',
+                'resource_group_id',
+                'install_plan',
+                'channel',
+                'metadata',
+                ('last_operation', 'last_operation', 'model', 'OfferingInstanceLastOperation', None),
+            ),
+            (
+                'id',
+                'rev',
+                'url',
+                'crn',
+                'label',
+                'catalog_id',
+                'offering_id',
+                'kind_format',
+                'version',
+                'cluster_id',
+                'cluster_region',
+                'cluster_namespaces',
+                'cluster_all_namespaces',
+                'schematics_workspace_id',
+                'resource_group_id',
+                'install_plan',
+                'channel',
+                'metadata',
+                'last_operation',
+            ),
+            False,
+        ),
+        'OfferingInstanceLastOperation': (
+            (
+                'operation',
+                'state',
+                'message',
+                'transaction_id',
+                'updated',
+            ),
+            ('operation', 'state', 'message', 'transaction_id', 'updated'),
+            False,
+        ),
+        'OfferingSearchResult': (
+            (
+                (
+                    'offset',
+                    'offset',
+                    'value',
+                    None,
+                    "Required property 'offset' not present in OfferingSearchResult JSON",
+                ),
+                ('limit', 'limit', 'value', None, "Required property 'limit' not present in OfferingSearchResult JSON"),
+                'total_count',
+                'resource_count',
+                'first',
+                'last',
+                'prev',
+                'next',
+                ('resources', 'resources', 'model_list', 'Offering', None),
+            ),
+            ('offset', 'limit', 'total_count', 'resource_count', 'first', 'last', 'prev', 'next', 'resources'),
+            False,
+        ),
+        'OperatorDeployResult': (
+            (
+                'phase',
+                'message',
+                'link',
+                'name',
+                'version',
+                'namespace',
+                'package_name',
+                'catalog_id',
+            ),
+            ('phase', 'message', 'link', 'name', 'version', 'namespace', 'package_name', 'catalog_id'),
+            False,
+        ),
+        'Plan': (
+            (
+                'id',
+                'label',
+                'name',
+                'short_description',
+                'long_description',
+                'metadata',
+                'tags',
+                ('additional_features', 'additional_features', 'model_list', 'Feature', None),
+                ('created', 'created', 'converted', 'lazy_datetime', None),
+                ('updated', 'updated', 'converted', 'lazy_datetime', None),
+                ('deployments', 'deployments', 'model_list', 'Deployment', None),
+            ),
+            (
+                'id',
+                'label',
+                'name',
+                'short_description',
+                'long_description',
+                'metadata',
+                'tags',
+                'additional_features',
+                'created',
+                'updated',
+                'deployments',
+            ),
+            False,
+        ),
+        'ProviderInfo': (
+            (
+                'id',
+                'name',
+            ),
+            ('id', 'name'),
+            False,
+        ),
+        'PublishObject': (
+            (
+                'permit_ibm_public_publish',
+                'ibm_approved',
+                'public_approved',
+                'portal_approval_record',
+                'portal_url',
+            ),
+            ('permit_ibm_public_publish', 'ibm_approved', 'public_approved', 'portal_approval_record', 'portal_url'),
+            False,
+        ),
+        'Rating': (
+            (
+                'one_star_count',
+                'two_star_count',
+                'three_star_count',
+                'four_star_count',
+            ),
+            ('one_star_count', 'two_star_count', 'three_star_count', 'four_star_count'),
+            False,
+        ),
+        'RepoInfo': (
+            (
+                'token',
+                'type',
+            ),
+            ('token', 'type'),
+            False,
+        ),
+        'Resource': (
+            (
+                'type',
+                'value',
+            ),
+            ('type', 'value'),
+            False,
+        ),
+        'Script': (
+            (
+                'instructions',
+                'script',
+                'script_permission',
+                'delete_script',
+                'scope',
+            ),
+            ('instructions', 'script', 'script_permission', 'delete_script', 'scope'),
+            False,
+        ),
+        'State': (
+            (
+                'current',
+                ('current_entered', 'current_entered', 'converted', 'lazy_datetime', None),
+                'pending',
+                ('pending_requested', 'pending_requested', 'converted', 'lazy_datetime', None),
+                'previous',
+            ),
+            ('current', 'current_entered', 'pending', 'pending_requested', 'previous'),
+            False,
+        ),
+        'Support': (
+            (
+                'url',
+                'process',
+                'locations',
+            ),
+            ('url', 'process', 'locations'),
+            False,
+        ),
+        'SyndicationAuthorization': (
+            (
+                'token',
+                ('last_run', 'last_run', 'converted', 'lazy_datetime', None),
+            ),
+            ('token', 'last_run'),
+            False,
+        ),
+        'SyndicationCluster': (
+            (
+                'region',
+                'id',
+                'name',
+                'resource_group_name',
+                'type',
+                'namespaces',
+                'all_namespaces',
+            ),
+            ('region', 'id', 'name', 'resource_group_name', 'type', 'namespaces', 'all_namespaces'),
+            False,
+        ),
+        'SyndicationHistory': (
+            (
+                'namespaces',
+                ('clusters', 'clusters', 'model_list', 'SyndicationCluster', None),
+                ('last_run', 'last_run', 'converted', 'lazy_datetime', None),
+            ),
+            ('namespaces', 'clusters', 'last_run'),
+            False,
+        ),
+        'SyndicationResource': (
+            (
+                'remove_related_components',
+                ('clusters', 'clusters', 'model_list', 'SyndicationCluster', None),
+                ('history', 'history', 'model', 'SyndicationHistory', None),
+                ('authorization', 'authorization', 'model', 'SyndicationAuthorization', None),
+            ),
+            ('remove_related_components', 'clusters', 'history', 'authorization'),
+            False,
+        ),
+        'Validation': (
+            (
+                ('validated', 'validated', 'converted', 'lazy_datetime', None),
+                ('requested', 'requested', 'converted', 'lazy_datetime', None),
+                'state',
+                'last_operation',
+                'target',
+            ),
+            ('validated', 'requested', 'state', 'last_operation', 'target'),
+            False,
+        ),
+        'Version': (
+            (
+                'id',
+                ('_rev', 'rev', 'value', None, None),
+                'crn',
+                'version',
+                'sha',
+                ('created', 'created', 'converted', 'lazy_datetime', None),
+                ('updated', 'updated', 'converted', 'lazy_datetime', None),
+                'offering_id',
+                'catalog_id',
+                'kind_id',
+                'tags',
+                'repo_url',
+                'source_url',
+                'tgz_url',
+                ('configuration', 'configuration', 'model_list', 'Configuration', None),
+                'metadata',
+                ('validation', 'validation', 'model', 'Validation', None),
+                ('required_resources', 'required_resources', 'model_list', 'Resource', None),
+                'single_instance',
+                ('install', 'install', 'model', 'Script', None),
+                ('pre_install', 'pre_install', 'model_list', 'Script', None),
+                ('entitlement', 'entitlement', 'model', 'VersionEntitlement', None),
+                ('licenses', 'licenses', 'model_list', 'License', None),
+                'image_manifest_url',
+                'deprecated',
+                'package_version',
+                ('state', 'state', 'model', 'State', None),
+                'version_locator',
+                'console_url',
+                'long_description',
+                'whitelisted_accounts',
+            ),
+            (
+                'id',
+                'rev',
+                'crn',
+                'version',
+                'sha',
+                'created',
+                'updated',
+                'offering_id',
+                'catalog_id',
+                'kind_id',
+                'tags',
+                'repo_url',
+                'source_url',
+                'tgz_url',
+                'configuration',
+                'metadata',
+                'validation',
+                'required_resources',
+                'single_instance',
+                'install',
+                'pre_install',
+                'entitlement',
+                'licenses',
+                'image_manifest_url',
+                'deprecated',
+                'package_version',
+                'state',
+                'version_locator',
+                'console_url',
+                'long_description',
+                'whitelisted_accounts',
+            ),
+            False,
+        ),
+        'VersionEntitlement': (
+            (
+                'provider_name',
+                'provider_id',
+                'product_id',
+                'part_numbers',
+                'image_repo_name',
+            ),
+            ('provider_name', 'provider_id', 'product_id', 'part_numbers', 'image_repo_name'),
+            False,
+        ),
+        'VersionUpdateDescriptor': (
+            (
+                'version_locator',
+                'version',
+                ('state', 'state', 'model', 'State', None),
+                ('required_resources', 'required_resources', 'model_list', 'Resource', None),
+                'package_version',
+                'sha',
+                'can_update',
+                'messages',
+            ),
+            (
+                'version_locator',
+                'version',
+                'state',
+                'required_resources',
+                'package_version',
+                'sha',
+                'can_update',
+                'messages',
+            ),
+            False,
+        ),
+    },
+    'context_based_restrictions_v1': {
+        'APIType': (
+            (
+                (
+                    'api_type_id',
+                    'api_type_id',
+                    'value',
+                    None,
+                    "Required property 'api_type_id' not present in APIType JSON",
+                ),
+                (
+                    'display_name',
+                    'display_name',
+                    'value',
+                    None,
+                    "Required property 'display_name' not present in APIType JSON",
+                ),
+                (
+                    'description',
+                    'description',
+                    'value',
+                    None,
+                    "Required property 'description' not present in APIType JSON",
+                ),
+                (
+                    'actions',
+                    'actions',
+                    'model_list',
+                    'Action',
+                    "Required property 'actions' not present in APIType JSON",
+                ),
+            ),
+            ('api_type_id', 'display_name', 'description', 'actions'),
+            False,
+        ),
+        'AccountSettings': (
+            (
+                ('id', 'id', 'value', None, "Required property 'id' not present in AccountSettings JSON"),
+                ('crn', 'crn', 'value', None, "Required property 'crn' not present in AccountSettings JSON"),
+                (
+                    'rule_count_limit',
+                    'rule_count_limit',
+                    'value',
+                    None,
+                    "Required property 'rule_count_limit' not present in AccountSettings JSON",
+                ),
+                (
+                    'zone_count_limit',
+                    'zone_count_limit',
+                    'value',
+                    None,
+                    "Required property 'zone_count_limit' not present in AccountSettings JSON",
+                ),
+                (
+                    'current_rule_count',
+                    'current_rule_count',
+                    'value',
+                    None,
+                    "Required property 'current_rule_count' not present in AccountSettings JSON",
+                ),
+                (
+                    'current_zone_count',
+                    'current_zone_count',
+                    'value',
+                    None,
+                    "Required property 'current_zone_count' not present in AccountSettings JSON",
+                ),
+                ('href', 'href', 'value', None, "Required property 'href' not present in AccountSettings JSON"),
+                (
+                    'created_at',
+                    'created_at',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'created_at' not present in AccountSettings JSON",
+                ),
+                (
+                    'created_by_id',
+                    'created_by_id',
+                    'value',
+                    None,
+                    "Required property 'created_by_id' not present in AccountSettings JSON",
+                ),
+                (
+                    'last_modified_at',
+                    'last_modified_at',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'last_modified_at' not present in AccountSettings JSON",
+                ),
+                (
+                    'last_modified_by_id',
+                    'last_modified_by_id',
+                    'value',
+                    None,
+                    "Required property 'last_modified_by_id' not present in AccountSettings JSON",
+                ),
+            ),
+            (
+                'id',
+                'crn',
+                'rule_count_limit',
+                'zone_count_limit',
+                'current_rule_count',
+                'current_zone_count',
+                'href',
+                'created_at',
+                'created_by_id',
+                'last_modified_at',
+                'last_modified_by_id',
+            ),
+            False,
+        ),
+        'Action': (
+            (
+                ('action_id', 'action_id', 'value', None, "Required property 'action_id' not present in Action JSON"),
+                (
+                    'description',
+                    'description',
+                    'value',
+                    None,
+                    "Required property 'description' not present in Action JSON",
+                ),
+            ),
+            ('action_id', 'description'),
+            False,
+        ),
+        'NewRuleOperations': (
+            (
+                (
+                    'api_types',
+                    'api_types',
+                    'model_list',
+                    'NewRuleOperationsApiTypesItem',
+                    "Required property 'api_types' not present in NewRuleOperations JSON",
+                ),
+            ),
+            ('api_types',),
+            False,
+        ),
+        'NewRuleOperationsApiTypesItem': (
+            (
+                (
+                    'api_type_id',
+                    'api_type_id',
+                    'value',
+                    None,
+                    "Required property 'api_type_id' not present in NewRuleOperationsApiTypesItem JSON",
+                ),
+            ),
+            ('api_type_id',),
+            False,
+        ),
+        'OperationsList': (
+            (
+                (
+                    'api_types',
+                    'api_types',
+                    'model_list',
+                    'APIType',
+                    "Required property 'api_types' not present in OperationsList JSON",
+                ),
+            ),
+            ('api_types',),
+            False,
+        ),
+        'Resource': (
+            (
+                (
+                    'attributes',
+                    'attributes',
+                    'model_list',
+                    'ResourceAttribute',
+                    "Required property 'attributes' not present in Resource JSON",
+                ),
+                ('tags', 'tags', 'model_list', 'ResourceTagAttribute', None),
+            ),
+            ('attributes', 'tags'),
+            False,
+        ),
+        'ResourceAttribute': (
+            (
+                ('name', 'name', 'value', None, "Required property 'name' not present in ResourceAttribute JSON"),
+                ('value', 'value', 'value', None, "Required property 'value' not present in ResourceAttribute JSON"),
+                'operator',
+            ),
+            ('name', 'value', 'operator'),
+            False,
+        ),
+        'ResourceTagAttribute': (
+            (
+                ('name', 'name', 'value', None, "Required property 'name' not present in ResourceTagAttribute JSON"),
+                ('value', 'value', 'value', None, "Required property 'value' not present in ResourceTagAttribute JSON"),
+                'operator',
+            ),
+            ('name', 'value', 'operator'),
+            False,
+        ),
+        'Rule': (
+            (
+                ('id', 'id', 'value', None, "Required property 'id' not present in Rule JSON"),
+                ('crn', 'crn', 'value', None, "Required property 'crn' not present in Rule JSON"),
+                (
+                    'description',
+                    'description',
+                    'value',
+                    None,
+                    "Required property 'description' not present in Rule JSON",
+                ),
+                (
+                    'contexts',
+                    'contexts',
+                    'model_list',
+                    'RuleContext',
+                    "Required property 'contexts' not present in Rule JSON",
+                ),
+                (
+                    'resources',
+                    'resources',
+                    'model_list',
+                    'Resource',
+                    "Required property 'resources' not present in Rule JSON",
+                ),
+                ('operations', 'operations', 'model', 'NewRuleOperations', None),
+                'enforcement_mode',
+                ('href', 'href', 'value', None, "Required property 'href' not present in Rule JSON"),
+                (
+                    'created_at',
+                    'created_at',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'created_at' not present in Rule JSON",
+                ),
+                (
+                    'created_by_id',
+                    'created_by_id',
+                    'value',
+                    None,
+                    "Required property 'created_by_id' not present in Rule JSON",
+                ),
+                (
+                    'last_modified_at',
+                    'last_modified_at',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'last_modified_at' not present in Rule JSON",
+                ),
+                (
+                    'last_modified_by_id',
+                    'last_modified_by_id',
+                    'value',
+                    None,
+                    "Required property 'last_modified_by_id' not present in Rule JSON",
+                ),
+            ),
+            (
+                'id',
+                'crn',
+                'description',
+                'contexts',
+                'resources',
+                'operations',
+                'enforcement_mode',
+                'href',
+                'created_at',
+                'created_by_id',
+                'last_modified_at',
+                'last_modified_by_id',
+            ),
+            False,
+        ),
+        'RuleContext': (
+            (
+                (
+                    'attributes',
+                    'attributes',
+                    'model_list',
+                    'RuleContextAttribute',
+                    "Required property 'attributes' not present in RuleContext JSON",
+                ),
+            ),
+            ('attributes',),
+            False,
+        ),
+        'RuleContextAttribute': (
+            (
+                ('name', 'name', 'value', None, "Required property 'name' not present in RuleContextAttribute JSON"),
+                ('value', 'value', 'value', None, "Required property 'value' not present in RuleContextAttribute JSON"),
+            ),
+            ('name', 'value'),
+            False,
+        ),
+        'RuleList': (
+            (
+                ('count', 'count', 'value', None, "Required property 'count' not present in RuleList JSON"),
+                ('rules', 'rules', 'model_list', 'Rule', "Required property 'rules' not present in RuleList JSON"),
+            ),
+            ('count', 'rules'),
+            False,
+        ),
+        'ServiceRefTarget': (
+            (
+                (
+                    'service_name',
+                    'service_name',
+                    'value',
+                    None,
+                    "Required property 'service_name' not present in ServiceRefTarget JSON",
+                ),
+                'service_type',
+                ('locations', 'locations', 'model_list', 'ServiceRefTargetLocationsItem', None),
+            ),
+            ('service_name', 'service_type', 'locations'),
+            False,
+        ),
+        'ServiceRefTargetList': (
+            (
+                ('count', 'count', 'value', None, "Required property 'count' not present in ServiceRefTargetList JSON"),
+                (
+                    'targets',
+                    'targets',
+                    'model_list',
+                    'ServiceRefTarget',
+                    "Required property 'targets' not present in ServiceRefTargetList JSON",
+                ),
+            ),
+            ('count', 'targets'),
+            False,
+        ),
+        'ServiceRefTargetLocationsItem': (
+            (
+                (
+                    'name',
+                    'name',
+                    'value',
+                    None,
+                    "Required property 'name' not present in ServiceRefTargetLocationsItem JSON",
+                ),
+            ),
+            ('name',),
+            False,
+        ),
+        'ServiceRefValue': (
+            (
+                (
+                    'account_id',
+                    'account_id',
+                    'value',
+                    None,
+                    "Required property 'account_id' not present in ServiceRefValue JSON",
+                ),
+                'service_type',
+                'service_name',
+                'service_instance',
+                'location',
+            ),
+            ('account_id', 'service_type', 'service_name', 'service_instance', 'location'),
+            False,
+        ),
+        'Zone': (
+            (
+                ('id', 'id', 'value', None, "Required property 'id' not present in Zone JSON"),
+                ('crn', 'crn', 'value', None, "Required property 'crn' not present in Zone JSON"),
+                (
+                    'address_count',
+                    'address_count',
+                    'value',
+                    None,
+                    "Required property 'address_count' not present in Zone JSON",
+                ),
+                (
+                    'excluded_count',
+                    'excluded_count',
+                    'value',
+                    None,
+                    "Required property 'excluded_count' not present in Zone JSON",
+                ),
+                ('name', 'name', 'value', None, "Required property 'name' not present in Zone JSON"),
+                ('account_id', 'account_id', 'value', None, "Required property 'account_id' not present in Zone JSON"),
+                (
+                    'description',
+                    'description',
+                    'value',
+                    None,
+                    "Required property 'description' not present in Zone JSON",
+                ),
+                (
+                    'addresses',
+                    'addresses',
+                    'model_list',
+                    'Address',
+                    "Required property 'addresses' not present in Zone JSON",
+                ),
+                (
+                    'excluded',
+                    'excluded',
+                    'model_list',
+                    'Address',
+                    "Required property 'excluded' not present in Zone JSON",
+                ),
+                ('href', 'href', 'value', None, "Required property 'href' not present in Zone JSON"),
+                (
+                    'created_at',
+                    'created_at',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'created_at' not present in Zone JSON",
+                ),
+                (
+                    'created_by_id',
+                    'created_by_id',
+                    'value',
+                    None,
+                    "Required property 'created_by_id' not present in Zone JSON",
+                ),
+                (
+                    'last_modified_at',
+                    'last_modified_at',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'last_modified_at' not present in Zone JSON",
+                ),
+                (
+                    'last_modified_by_id',
+                    'last_modified_by_id',
+                    'value',
+                    None,
+                    "Required property 'last_modified_by_id' not present in Zone JSON",
+                ),
+            ),
+            (
+                'id',
+                'crn',
+                'address_count',
+                'excluded_count',
+                'name',
+                'account_id',
+                'description',
+                'addresses',
+                'excluded',
+                'href',
+                'created_at',
+                'created_by_id',
+                'last_modified_at',
+                'last_modified_by_id',
+            ),
+            False,
+        ),
+        'ZoneList': (
+            (
+                ('count', 'count', 'value', None, "Required property 'count' not present in ZoneList JSON"),
+                (
+                    'zones',
+                    'zones',
+                    'model_list',
+                    'ZoneSummary',
+                    "Required property 'zones' not present in ZoneList JSON",
+                ),
+            ),
+            ('count', 'zones'),
+            False,
+        ),
+        'ZoneSummary': (
+            (
+                ('id', 'id', 'value', None, "Required property 'id' not present in ZoneSummary JSON"),
+                ('crn', 'crn', 'value', None, "Required property 'crn' not present in ZoneSummary JSON"),
+                ('name', 'name', 'value', None, "Required property 'name' not present in ZoneSummary JSON"),
+                'description',
+                (
+                    'addresses_preview',
+                    'addresses_preview',
+                    'model_list',
+                    'Address',
+                    "Required property 'addresses_preview' not present in ZoneSummary JSON",
+                ),
+                (
+                    'address_count',
+                    'address_count',
+                    'value',
+                    None,
+                    "Required property 'address_count' not present in ZoneSummary JSON",
+                ),
+                (
+                    'excluded_count',
+                    'excluded_count',
+                    'value',
+                    None,
+                    "Required property 'excluded_count' not present in ZoneSummary JSON",
+                ),
+                ('href', 'href', 'value', None, "Required property 'href' not present in ZoneSummary JSON"),
+                (
+                    'created_at',
+                    'created_at',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'created_at' not present in ZoneSummary JSON",
+                ),
+                (
+                    'created_by_id',
+                    'created_by_id',
+                    'value',
+                    None,
+                    "Required property 'created_by_id' not present in ZoneSummary JSON",
+                ),
+                (
+                    'last_modified_at',
+                    'last_modified_at',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'last_modified_at' not present in ZoneSummary JSON",
+                ),
+                (
+                    'last_modified_by_id',
+                    'last_modified_by_id',
+                    'value',
+                    None,
+                    "Required property 'last_modified_by_id' not present in ZoneSummary JSON",
+                ),
+            ),
+            (
+                'id',
+                'crn',
+                'name',
+                'description',
+                'addresses_preview',
+                'address_count',
+                'excluded_count',
+                'href',
+                'created_at',
+                'created_by_id',
+                'last_modified_at',
+                'last_modified_by_id',
+            ),
+            False,
+        ),
+        'AddressIPAddress': (
+            (
+                ('type', 'type', 'value', None, "Required property 'type' not present in AddressIPAddress JSON"),
+                ('value', 'value', 'value', None, "Required property 'value' not present in AddressIPAddress JSON"),
+            ),
+            ('type', 'value'),
+            False,
+        ),
+        'AddressIPAddressRange': (
+            (
+                ('type', 'type', 'value', None, "Required property 'type' not present in AddressIPAddressRange JSON"),
+                (
+                    'value',
+                    'value',
+                    'value',
+                    None,
+                    "Required property 'value' not present in AddressIPAddressRange JSON",
+                ),
+            ),
+            ('type', 'value'),
+            False,
+        ),
+        'AddressServiceRef': (
+            (
+                ('type', 'type', 'value', None, "Required property 'type' not present in AddressServiceRef JSON"),
+                (
+                    'ref',
+                    'ref',
+                    'model',
+                    'ServiceRefValue',
+                    "Required property 'ref' not present in AddressServiceRef JSON",
+                ),
+            ),
+            ('type', 'ref'),
+            False,
+        ),
+        'AddressSubnet': (
+            (
+                ('type', 'type', 'value', None, "Required property 'type' not present in AddressSubnet JSON"),
+                ('value', 'value', 'value', None, "Required property 'value' not present in AddressSubnet JSON"),
+            ),
+            ('type', 'value'),
+            False,
+        ),
+        'AddressVPC': (
+            (
+                ('type', 'type', 'value', None, "Required property 'type' not present in AddressVPC JSON"),
+                ('value', 'value', 'value', None, "Required property 'value' not present in AddressVPC JSON"),
+            ),
+            ('type', 'value'),
+            False,
+        ),
+    },
+    'enterprise_billing_units_v1': {
+        'BillingOption': (
+            (
+                'id',
+                'billing_unit_id',
+                ('start_date', 'start_date', 'converted', 'string_to_datetime', None),
+                ('end_date', 'end_date', 'converted', 'string_to_datetime', None),
+                'state',
+                'type',
+                'category',
+                'payment_instrument',
+                'duration_in_months',
+                'line_item_id',
+                'billing_system',
+                'renewal_mode_code',
+                ('updated_at', 'updated_at', 'converted', 'string_to_datetime', None),
+            ),
+            (
+                'id',
+                'billing_unit_id',
+                'start_date',
+                'end_date',
+                'state',
+                'type',
+                'category',
+                'payment_instrument',
+                'duration_in_months',
+                'line_item_id',
+                'billing_system',
+                'renewal_mode_code',
+                'updated_at',
+            ),
+            False,
+        ),
+        'BillingOptionsList': (
+            (
+                'rows_count',
+                'next_url',
+                ('resources', 'resources', 'model_list', 'BillingOption', None),
+            ),
+            ('rows_count', 'next_url', 'resources'),
+            False,
+        ),
+        'BillingUnit': (
+            (
+                'id',
+                'crn',
+                'name',
+                'enterprise_id',
+                'currency_code',
+                'country_code',
+                'master',
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+            ),
+            ('id', 'crn', 'name', 'enterprise_id', 'currency_code', 'country_code', 'master', 'created_at'),
+            False,
+        ),
+        'BillingUnitsList': (
+            (
+                'rows_count',
+                'next_url',
+                ('resources', 'resources', 'model_list', 'BillingUnit', None),
+            ),
+            ('rows_count', 'next_url', 'resources'),
+            False,
+        ),
+        'CreditPool': (
+            (
+                'type',
+                'currency_code',
+                'billing_unit_id',
+                ('term_credits', 'term_credits', 'model_list', 'TermCredits', None),
+                ('overage', 'overage', 'model', 'CreditPoolOverage', None),
+            ),
+            ('type', 'currency_code', 'billing_unit_id', 'term_credits', 'overage'),
+            False,
+        ),
+        'CreditPoolOverage': (
+            (
+                'cost',
+                'resources',
+            ),
+            ('cost', 'resources'),
+            False,
+        ),
+        'CreditPoolsList': (
+            (
+                'rows_count',
+                'next_url',
+                ('resources', 'resources', 'model_list', 'CreditPool', None),
+            ),
+            ('rows_count', 'next_url', 'resources'),
+            False,
+        ),
+        'TermCredits': (
+            (
+                'billing_option_id',
+                'category',
+                ('start_date', 'start_date', 'converted', 'string_to_datetime', None),
+                ('end_date', 'end_date', 'converted', 'string_to_datetime', None),
+                'total_credits',
+                'starting_balance',
+                'used_credits',
+                'current_balance',
+                'resources',
+            ),
+            (
+                'billing_option_id',
+                'category',
+                'start_date',
+                'end_date',
+                'total_credits',
+                'starting_balance',
+                'used_credits',
+                'current_balance',
+                'resources',
+            ),
+            False,
+        ),
+    },
+    'enterprise_management_v1': {
+        'Account': (
+            (
+                'url',
+                'id',
+                'crn',
+                'parent',
+                'enterprise_account_id',
+                'enterprise_id',
+                'enterprise_path',
+                'name',
+                'state',
+                'owner_iam_id',
+                'paid',
+                'owner_email',
+                'is_enterprise_account',
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+                'created_by',
+                ('updated_at', 'updated_at', 'converted', 'string_to_datetime', None),
+                'updated_by',
+            ),
+            (
+                'url',
+                'id',
+                'crn',
+                'parent',
+                'enterprise_account_id',
+                'enterprise_id',
+                'enterprise_path',
+                'name',
+                'state',
+                'owner_iam_id',
+                'paid',
+                'owner_email',
+                'is_enterprise_account',
+                'created_at',
+                'created_by',
+                'updated_at',
+                'updated_by',
+            ),
+            False,
+        ),
+        'AccountGroup': (
+            (
+                'url',
+                'id',
+                'crn',
+                'parent',
+                'enterprise_account_id',
+                'enterprise_id',
+                'enterprise_path',
+                'name',
+                'state',
+                'primary_contact_iam_id',
+                'primary_contact_email',
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+                'created_by',
+                ('updated_at', 'updated_at', 'converted', 'string_to_datetime', None),
+                'updated_by',
+            ),
+            (
+                'url',
+                'id',
+                'crn',
+                'parent',
+                'enterprise_account_id',
+                'enterprise_id',
+                'enterprise_path',
+                'name',
+                'state',
+                'primary_contact_iam_id',
+                'primary_contact_email',
+                'created_at',
+                'created_by',
+                'updated_at',
+                'updated_by',
+            ),
+            False,
+        ),
+        'CreateAccountGroupResponse': (
+            ('account_group_id',),
+            ('account_group_id',),
+            False,
+        ),
+        'CreateAccountResponse': (
+            ('account_id',),
+            ('account_id',),
+            False,
+        ),
+        'CreateEnterpriseResponse': (
+            (
+                'enterprise_id',
+                'enterprise_account_id',
+            ),
+            ('enterprise_id', 'enterprise_account_id'),
+            False,
+        ),
+        'Enterprise': (
+            (
+                'url',
+                'id',
+                'enterprise_account_id',
+                'crn',
+                'name',
+                'domain',
+                'state',
+                'primary_contact_iam_id',
+                'primary_contact_email',
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+                'created_by',
+                ('updated_at', 'updated_at', 'converted', 'string_to_datetime', None),
+                'updated_by',
+            ),
+            (
+                'url',
+                'id',
+                'enterprise_account_id',
+                'crn',
+                'name',
+                'domain',
+                'state',
+                'primary_contact_iam_id',
+                'primary_contact_email',
+                'created_at',
+                'created_by',
+                'updated_at',
+                'updated_by',
+            ),
+            False,
+        ),
+        'ListAccountGroupsResponse': (
+            (
+                'rows_count',
+                'next_url',
+                ('resources', 'resources', 'model_list', 'AccountGroup', None),
+            ),
+            ('rows_count', 'next_url', 'resources'),
+            False,
+        ),
+        'ListAccountsResponse': (
+            (
+                'rows_count',
+                'next_url',
+                ('resources', 'resources', 'model_list', 'Account', None),
+            ),
+            ('rows_count', 'next_url', 'resources'),
+            False,
+        ),
+        'ListEnterprisesResponse': (
+            (
+                'rows_count',
+                'next_url',
+                ('resources', 'resources', 'model_list', 'Enterprise', None),
+            ),
+            ('rows_count', 'next_url', 'resources'),
+            False,
+        ),
+    },
+    'enterprise_usage_reports_v1': {
+        'Link': (
+            ('href',),
+            ('href',),
+            False,
+        ),
+        'MetricUsage': (
+            (
+                ('metric', 'metric', 'value', None, "Required property 'metric' not present in MetricUsage JSON"),
+                ('unit', 'unit', 'value', None, "Required property 'unit' not present in MetricUsage JSON"),
+                ('quantity', 'quantity', 'value', None, "Required property 'quantity' not present in MetricUsage JSON"),
+                (
+                    'rateable_quantity',
+                    'rateable_quantity',
+                    'value',
+                    None,
+                    "Required property 'rateable_quantity' not present in MetricUsage JSON",
+                ),
+                ('cost', 'cost', 'value', None, "Required property 'cost' not present in MetricUsage JSON"),
+                (
+                    'rated_cost',
+                    'rated_cost',
+                    'value',
+                    None,
+                    "Required property 'rated_cost' not present in MetricUsage JSON",
+                ),
+                'price',
+            ),
+            ('metric', 'unit', 'quantity', 'rateable_quantity', 'cost', 'rated_cost', 'price'),
+            False,
+        ),
+        'PlanUsage': (
+            (
+                ('plan_id', 'plan_id', 'value', None, "Required property 'plan_id' not present in PlanUsage JSON"),
+                'pricing_region',
+                'pricing_plan_id',
+                ('billable', 'billable', 'value', None, "Required property 'billable' not present in PlanUsage JSON"),
+                ('cost', 'cost', 'value', None, "Required property 'cost' not present in PlanUsage JSON"),
+                (
+                    'rated_cost',
+                    'rated_cost',
+                    'value',
+                    None,
+                    "Required property 'rated_cost' not present in PlanUsage JSON",
+                ),
+                (
+                    'usage',
+                    'usage',
+                    'model_list',
+                    'MetricUsage',
+                    "Required property 'usage' not present in PlanUsage JSON",
+                ),
+            ),
+            ('plan_id', 'pricing_region', 'pricing_plan_id', 'billable', 'cost', 'rated_cost', 'usage'),
+            False,
+        ),
+        'Reports': (
+            (
+                'limit',
+                ('first', 'first', 'model', 'Link', None),
+                ('next', 'next', 'model', 'Link', None),
+                ('reports', 'reports', 'model_list', 'ResourceUsageReport', None),
+            ),
+            ('limit', 'first', 'next', 'reports'),
+            False,
+        ),
+        'ResourceUsage': (
+            (
+                (
+                    'resource_id',
+                    'resource_id',
+                    'value',
+                    None,
+                    "Required property 'resource_id' not present in ResourceUsage JSON",
+                ),
+                (
+                    'billable_cost',
+                    'billable_cost',
+                    'value',
+                    None,
+                    "Required property 'billable_cost' not present in ResourceUsage JSON",
+                ),
+                (
+                    'billable_rated_cost',
+                    'billable_rated_cost',
+                    'value',
+                    None,
+                    "Required property 'billable_rated_cost' not present in ResourceUsage JSON",
+                ),
+                (
+                    'non_billable_cost',
+                    'non_billable_cost',
+                    'value',
+                    None,
+                    "Required property 'non_billable_cost' not present in ResourceUsage JSON",
+                ),
+                (
+                    'non_billable_rated_cost',
+                    'non_billable_rated_cost',
+                    'value',
+                    None,
+                    "Required property 'non_billable_rated_cost' not present in ResourceUsage JSON",
+                ),
+                (
+                    'plans',
+                    'plans',
+                    'model_list',
+                    'PlanUsage',
+                    "Required property 'plans' not present in ResourceUsage JSON",
+                ),
+            ),
+            (
+                'resource_id',
+                'billable_cost',
+                'billable_rated_cost',
+                'non_billable_cost',
+                'non_billable_rated_cost',
+                'plans',
+            ),
+            False,
+        ),
+        'ResourceUsageReport': (
+            (
+                (
+                    'entity_id',
+                    'entity_id',
+                    'value',
+                    None,
+                    "Required property 'entity_id' not present in ResourceUsageReport JSON",
+                ),
+                (
+                    'entity_type',
+                    'entity_type',
+                    'value',
+                    None,
+                    "Required property 'entity_type' not present in ResourceUsageReport JSON",
+                ),
+                (
+                    'entity_crn',
+                    'entity_crn',
+                    'value',
+                    None,
+                    "Required property 'entity_crn' not present in ResourceUsageReport JSON",
+                ),
+                (
+                    'entity_name',
+                    'entity_name',
+                    'value',
+                    None,
+                    "Required property 'entity_name' not present in ResourceUsageReport JSON",
+                ),
+                (
+                    'billing_unit_id',
+                    'billing_unit_id',
+                    'value',
+                    None,
+                    "Required property 'billing_unit_id' not present in ResourceUsageReport JSON",
+                ),
+                (
+                    'billing_unit_crn',
+                    'billing_unit_crn',
+                    'value',
+                    None,
+                    "Required property 'billing_unit_crn' not present in ResourceUsageReport JSON",
+                ),
+                (
+                    'billing_unit_name',
+                    'billing_unit_name',
+                    'value',
+                    None,
+                    "Required property 'billing_unit_name' not present in ResourceUsageReport JSON",
+                ),
+                (
+                    'country_code',
+                    'country_code',
+                    'value',
+                    None,
+                    "Required property 'country_code' not present in ResourceUsageReport JSON",
+                ),
+                (
+                    'currency_code',
+                    'currency_code',
+                    'value',
+                    None,
+                    "Required property 'currency_code' not present in ResourceUsageReport JSON",
+                ),
+                ('month', 'month', 'value', None, "Required property 'month' not present in ResourceUsageReport JSON"),
+                (
+                    'billable_cost',
+                    'billable_cost',
+                    'value',
+                    None,
+                    "Required property 'billable_cost' not present in ResourceUsageReport JSON",
+                ),
+                (
+                    'non_billable_cost',
+                    'non_billable_cost',
+                    'value',
+                    None,
+                    "Required property 'non_billable_cost' not present in ResourceUsageReport JSON",
+                ),
+                (
+                    'billable_rated_cost',
+                    'billable_rated_cost',
+                    'value',
+                    None,
+                    "Required property 'billable_rated_cost' not present in ResourceUsageReport JSON",
+                ),
+                (
+                    'non_billable_rated_cost',
+                    'non_billable_rated_cost',
+                    'value',
+                    None,
+                    "Required property 'non_billable_rated_cost' not present in ResourceUsageReport JSON",
+                ),
+                (
+                    'resources',
+                    'resources',
+                    'model_list',
+                    'ResourceUsage',
+                    "Required property 'resources' not present in ResourceUsageReport JSON",
+                ),
+            ),
+            (
+                'entity_id',
+                'entity_type',
+                'entity_crn',
+                'entity_name',
+                'billing_unit_id',
+                'billing_unit_crn',
+                'billing_unit_name',
+                'country_code',
+                'currency_code',
+                'month',
+                'billable_cost',
+                'non_billable_cost',
+                'billable_rated_cost',
+                'non_billable_rated_cost',
+                'resources',
+            ),
+            False,
+        ),
+    },
+    'global_catalog_v1': {
+        'AliasMetaData': (
+            (
+                'type',
+                'plan_id',
+            ),
+            ('type', 'plan_id'),
+            False,
+        ),
+        'Amount': (
+            (
+                'country',
+                'currency',
+                ('prices', 'prices', 'model_list', 'Price', None),
+            ),
+            ('country', 'currency', 'prices'),
+            False,
+        ),
+        'Artifact': (
+            (
+                'name',
+                ('updated', 'updated', 'converted', 'string_to_datetime', None),
+                'url',
+                'etag',
+                'size',
+            ),
+            ('name', 'updated', 'url', 'etag', 'size'),
+            False,
+        ),
+        'Artifacts': (
+            (
+                'count',
+                ('resources', 'resources', 'model_list', 'Artifact', None),
+            ),
+            ('count', 'resources'),
+            False,
+        ),
+        'AuditSearchResult': (
+            (
+                'offset',
+                'limit',
+                'count',
+                'resource_count',
+                'first',
+                'last',
+                'prev',
+                'next',
+                ('resources', 'resources', 'model_list', 'Message', None),
+            ),
+            ('offset', 'limit', 'count', 'resource_count', 'first', 'last', 'prev', 'next', 'resources'),
+            False,
+        ),
+        'Broker': (
+            (
+                'name',
+                'guid',
+            ),
+            ('name', 'guid'),
+            False,
+        ),
+        'Bullets': (
+            (
+                'title',
+                'description',
+                'icon',
+                'quantity',
+            ),
+            ('title', 'description', 'icon', 'quantity'),
+            False,
+        ),
+        'CFMetaData': (
+            (
+                'type',
+                'iam_compatible',
+                'unique_api_key',
+                'provisionable',
+                'bindable',
+                'async_provisioning_supported',
+                'async_unprovisioning_supported',
+                'requires',
+                'plan_updateable',
+                'state',
+                'service_check_enabled',
+                'test_check_interval',
+                'service_key_supported',
+                'cf_guid',
+            ),
+            (
+                'type',
+                'iam_compatible',
+                'unique_api_key',
+                'provisionable',
+                'bindable',
+                'async_provisioning_supported',
+                'async_unprovisioning_supported',
+                'requires',
+                'plan_updateable',
+                'state',
+                'service_check_enabled',
+                'test_check_interval',
+                'service_key_supported',
+                'cf_guid',
+            ),
+            False,
+        ),
+        'Callbacks': (
+            (
+                'controller_url',
+                'broker_url',
+                'broker_proxy_url',
+                'dashboard_url',
+                'dashboard_data_url',
+                'dashboard_detail_tab_url',
+                'dashboard_detail_tab_ext_url',
+                'service_monitor_api',
+                'service_monitor_app',
+                'api_endpoint',
+            ),
+            (
+                'controller_url',
+                'broker_url',
+                'broker_proxy_url',
+                'dashboard_url',
+                'dashboard_data_url',
+                'dashboard_detail_tab_url',
+                'dashboard_detail_tab_ext_url',
+                'service_monitor_api',
+                'service_monitor_app',
+                'api_endpoint',
+            ),
+            False,
+        ),
+        'CatalogEntry': (
+            (
+                ('name', 'name', 'value', None, "Required property 'name' not present in CatalogEntry JSON"),
+                ('kind', 'kind', 'value', None, "Required property 'kind' not present in CatalogEntry JSON"),
+                (
+                    'overview_ui',
+                    'overview_ui',
+                    'model_dict',
+                    'Overview',
+                    "Required property 'overview_ui' not present in CatalogEntry JSON",
+                ),
+                ('images', 'images', 'model', 'Image', "Required property 'images' not present in CatalogEntry JSON"),
+                'parent_id',
+                (
+                    'disabled',
+                    'disabled',
+                    'value',
+                    None,
+                    "Required property 'disabled' not present in CatalogEntry JSON",
+                ),
+                ('tags', 'tags', 'value', None, "Required property 'tags' not present in CatalogEntry JSON"),
+                'group',
+                (
+                    'provider',
+                    'provider',
+                    'model',
+                    'Provider',
+                    "Required property 'provider' not present in CatalogEntry JSON",
+                ),
+                'active',
+                ('metadata', 'metadata', 'model', 'CatalogEntryMetadata', None),
+                'id',
+                'catalog_crn',
+                'url',
+                'children_url',
+                'geo_tags',
+                'pricing_tags',
+                ('created', 'created', 'converted', 'string_to_datetime', None),
+                ('updated', 'updated', 'converted', 'string_to_datetime', None),
+            ),
+            (
+                'name',
+                'kind',
+                'overview_ui',
+                'images',
+                'parent_id',
+                'disabled',
+                'tags',
+                'group',
+                'provider',
+                'active',
+                'metadata',
+                'id',
+                'catalog_crn',
+                'url',
+                'children_url',
+                'geo_tags',
+                'pricing_tags',
+                'created',
+                'updated',
+            ),
+            False,
+        ),
+        'CatalogEntryMetadata': (
+            (
+                'rc_compatible',
+                ('service', 'service', 'model', 'CFMetaData', None),
+                ('plan', 'plan', 'model', 'PlanMetaData', None),
+                ('alias', 'alias', 'model', 'AliasMetaData', None),
+                ('template', 'template', 'model', 'TemplateMetaData', None),
+                ('ui', 'ui', 'model', 'UIMetaData', None),
+                'compliance',
+                ('sla', 'sla', 'model', 'SLAMetaData', None),
+                ('callbacks', 'callbacks', 'model', 'Callbacks', None),
+                'original_name',
+                'version',
+                'other',
+                ('pricing', 'pricing', 'model', 'CatalogEntryMetadataPricing', None),
+                ('deployment', 'deployment', 'model', 'CatalogEntryMetadataDeployment', None),
+            ),
+            (
+                'rc_compatible',
+                'service',
+                'plan',
+                'alias',
+                'template',
+                'ui',
+                'compliance',
+                'sla',
+                'callbacks',
+                'original_name',
+                'version',
+                'other',
+                'pricing',
+                'deployment',
+            ),
+            False,
+        ),
+        'CatalogEntryMetadataDeployment': (
+            (
+                'location',
+                'location_url',
+                'original_location',
+                'target_crn',
+                'service_crn',
+                'mccp_id',
+                ('broker', 'broker', 'model', 'Broker', None),
+                'supports_rc_migration',
+                'target_network',
+            ),
+            (
+                'location',
+                'location_url',
+                'original_location',
+                'target_crn',
+                'service_crn',
+                'mccp_id',
+                'broker',
+                'supports_rc_migration',
+                'target_network',
+            ),
+            False,
+        ),
+        'CatalogEntryMetadataPricing': (
+            (
+                'type',
+                'origin',
+                ('starting_price', 'starting_price', 'model', 'StartingPrice', None),
+                ('metrics', 'metrics', 'model_list', 'Metrics', None),
+            ),
+            ('type', 'origin', 'starting_price', 'metrics'),
+            False,
+        ),
+        'DRMetaData': (
+            (
+                'dr',
+                'description',
+            ),
+            ('dr', 'description'),
+            False,
+        ),
+        'DeploymentBase': (
+            (
+                'location',
+                'location_url',
+                'original_location',
+                'target_crn',
+                'service_crn',
+                'mccp_id',
+                ('broker', 'broker', 'model', 'Broker', None),
+                'supports_rc_migration',
+                'target_network',
+            ),
+            (
+                'location',
+                'location_url',
+                'original_location',
+                'target_crn',
+                'service_crn',
+                'mccp_id',
+                'broker',
+                'supports_rc_migration',
+                'target_network',
+            ),
+            False,
+        ),
+        'EntrySearchResult': (
+            (
+                'offset',
+                'limit',
+                'count',
+                'resource_count',
+                'first',
+                'last',
+                'prev',
+                'next',
+                ('resources', 'resources', 'model_list', 'CatalogEntry', None),
+            ),
+            ('offset', 'limit', 'count', 'resource_count', 'first', 'last', 'prev', 'next', 'resources'),
+            False,
+        ),
+        'Image': (
+            (
+                ('image', 'image', 'value', None, "Required property 'image' not present in Image JSON"),
+                'small_image',
+                'medium_image',
+                'feature_image',
+            ),
+            ('image', 'small_image', 'medium_image', 'feature_image'),
+            False,
+        ),
+        'Message': (
+            (
+                'id',
+                ('effective', 'effective', 'model', 'Visibility', None),
+                ('time', 'time', 'converted', 'string_to_datetime', None),
+                'who_id',
+                'who_name',
+                'who_email',
+                'instance',
+                'gid',
+                'type',
+                'message',
+                'data',
+            ),
+            (
+                'id',
+                'effective',
+                'time',
+                'who_id',
+                'who_name',
+                'who_email',
+                'instance',
+                'gid',
+                'type',
+                'message',
+                'data',
+            ),
+            False,
+        ),
+        'Metrics': (
+            (
+                'part_ref',
+                'metric_id',
+                'tier_model',
+                'charge_unit',
+                'charge_unit_name',
+                'charge_unit_quantity',
+                'resource_display_name',
+                'charge_unit_display_name',
+                'usage_cap_qty',
+                'display_cap',
+                ('effective_from', 'effective_from', 'converted', 'string_to_datetime', None),
+                ('effective_until', 'effective_until', 'converted', 'string_to_datetime', None),
+                ('amounts', 'amounts', 'model_list', 'Amount', None),
+            ),
+            (
+                'part_ref',
+                'metric_id',
+                'tier_model',
+                'charge_unit',
+                'charge_unit_name',
+                'charge_unit_quantity',
+                'resource_display_name',
+                'charge_unit_display_name',
+                'usage_cap_qty',
+                'display_cap',
+                'effective_from',
+                'effective_until',
+                'amounts',
+            ),
+            False,
+        ),
+        'ObjectMetadataSet': (
+            (
+                'rc_compatible',
+                ('service', 'service', 'model', 'CFMetaData', None),
+                ('plan', 'plan', 'model', 'PlanMetaData', None),
+                ('alias', 'alias', 'model', 'AliasMetaData', None),
+                ('template', 'template', 'model', 'TemplateMetaData', None),
+                ('ui', 'ui', 'model', 'UIMetaData', None),
+                'compliance',
+                ('sla', 'sla', 'model', 'SLAMetaData', None),
+                ('callbacks', 'callbacks', 'model', 'Callbacks', None),
+                'original_name',
+                'version',
+                'other',
+                ('pricing', 'pricing', 'model', 'PricingSet', None),
+                ('deployment', 'deployment', 'model', 'DeploymentBase', None),
+            ),
+            (
+                'rc_compatible',
+                'service',
+                'plan',
+                'alias',
+                'template',
+                'ui',
+                'compliance',
+                'sla',
+                'callbacks',
+                'original_name',
+                'version',
+                'other',
+                'pricing',
+                'deployment',
+            ),
+            False,
+        ),
+        'Overview': (
+            (
+                (
+                    'display_name',
+                    'display_name',
+                    'value',
+                    None,
+                    "Required property 'display_name' not present in Overview JSON",
+                ),
+                (
+                    'long_description',
+                    'long_description',
+                    'value',
+                    None,
+                    "Required property 'long_description' not present in Overview JSON",
+                ),
+                (
+                    'description',
+                    'description',
+                    'value',
+                    None,
+                    "Required property 'description' not present in Overview JSON",
+                ),
+                'featured_description',
+            ),
+            ('display_name', 'long_description', 'description', 'featured_description'),
+            False,
+        ),
+        'PlanMetaData': (
+            (
+                'bindable',
+                'reservable',
+                'allow_internal_users',
+                'async_provisioning_supported',
+                'async_unprovisioning_supported',
+                'test_check_interval',
+                'single_scope_instance',
+                'service_check_enabled',
+                'cf_guid',
+            ),
+            (
+                'bindable',
+                'reservable',
+                'allow_internal_users',
+                'async_provisioning_supported',
+                'async_unprovisioning_supported',
+                'test_check_interval',
+                'single_scope_instance',
+                'service_check_enabled',
+                'cf_guid',
+            ),
+            False,
+        ),
+        'Price': (
+            (
+                'quantity_tier',
+                ('Price', 'price', 'value', None, None),
+            ),
+            ('quantity_tier', 'price'),
+            False,
+        ),
+        'PricingGet': (
+            (
+                'type',
+                'origin',
+                ('starting_price', 'starting_price', 'model', 'StartingPrice', None),
+                ('metrics', 'metrics', 'model_list', 'Metrics', None),
+            ),
+            ('type', 'origin', 'starting_price', 'metrics'),
+            False,
+        ),
+        'PricingSet': (
+            (
+                'type',
+                'origin',
+                ('starting_price', 'starting_price', 'model', 'StartingPrice', None),
+            ),
+            ('type', 'origin', 'starting_price'),
+            False,
+        ),
+        'Provider': (
+            (
+                ('email', 'email', 'value', None, "Required property 'email' not present in Provider JSON"),
+                ('name', 'name', 'value', None, "Required property 'name' not present in Provider JSON"),
+                'contact',
+                'support_email',
+                'phone',
+            ),
+            ('email', 'name', 'contact', 'support_email', 'phone'),
+            False,
+        ),
+        'SLAMetaData': (
+            (
+                'terms',
+                'tenancy',
+                'provisioning',
+                'responsiveness',
+                ('dr', 'dr', 'model', 'DRMetaData', None),
+            ),
+            ('terms', 'tenancy', 'provisioning', 'responsiveness', 'dr'),
+            False,
+        ),
+        'SourceMetaData': (
+            (
+                'path',
+                'type',
+                'url',
+            ),
+            ('path', 'type', 'url'),
+            False,
+        ),
+        'StartingPrice': (
+            (
+                'plan_id',
+                'deployment_id',
+                'unit',
+                ('amount', 'amount', 'model_list', 'Amount', None),
+            ),
+            ('plan_id', 'deployment_id', 'unit', 'amount'),
+            False,
+        ),
+        'Strings': (
+            (
+                ('bullets', 'bullets', 'model_list', 'Bullets', None),
+                ('media', 'media', 'model_list', 'UIMetaMedia', None),
+                'not_creatable_msg',
+                ('not_creatable__robot_msg', 'not_creatable_robot_msg', 'value', None, None),
+                'deprecation_warning',
+                'popup_warning_message',
+                'instruction',
+            ),
+            (
+                'bullets',
+                'media',
+                'not_creatable_msg',
+                'not_creatable_robot_msg',
+                'deprecation_warning',
+                'popup_warning_message',
+                'instruction',
+            ),
+            False,
+        ),
+        'TemplateMetaData': (
+            (
+                'services',
+                'default_memory',
+                'start_cmd',
+                ('source', 'source', 'model', 'SourceMetaData', None),
+                'runtime_catalog_id',
+                'cf_runtime_id',
+                'template_id',
+                'executable_file',
+                'buildpack',
+                'environment_variables',
+            ),
+            (
+                'services',
+                'default_memory',
+                'start_cmd',
+                'source',
+                'runtime_catalog_id',
+                'cf_runtime_id',
+                'template_id',
+                'executable_file',
+                'buildpack',
+                'environment_variables',
+            ),
+            False,
+        ),
+        'UIMetaData': (
+            (
+                ('strings', 'strings', 'model_dict', 'Strings', None),
+                ('urls', 'urls', 'model', 'URLS', None),
+                'embeddable_dashboard',
+                'embeddable_dashboard_full_width',
+                'navigation_order',
+                'not_creatable',
+                'primary_offering_id',
+                'accessible_during_provision',
+                'side_by_side_index',
+                ('end_of_service_time', 'end_of_service_time', 'converted', 'string_to_datetime', None),
+                'hidden',
+                'hide_lite_metering',
+                'no_upgrade_next_step',
+            ),
+            (
+                'strings',
+                'urls',
+                'embeddable_dashboard',
+                'embeddable_dashboard_full_width',
+                'navigation_order',
+                'not_creatable',
+                'primary_offering_id',
+                'accessible_during_provision',
+                'side_by_side_index',
+                'end_of_service_time',
+                'hidden',
+                'hide_lite_metering',
+                'no_upgrade_next_step',
+            ),
+            False,
+        ),
+        'UIMetaMedia': (
+            (
+                'caption',
+                'thumbnail_url',
+                'type',
+                ('URL', 'url', 'value', None, None),
+                ('source', 'source', 'model', 'Bullets', None),
+            ),
+            ('caption', 'thumbnail_url', 'type', 'url', 'source'),
+            False,
+        ),
+        'URLS': (
+            (
+                'doc_url',
+                'instructions_url',
+                'api_url',
+                'create_url',
+                'sdk_download_url',
+                'terms_url',
+                'custom_create_page_url',
+                'catalog_details_url',
+                'deprecation_doc_url',
+                'dashboard_url',
+                'registration_url',
+                'apidocsurl',
+            ),
+            (
+                'doc_url',
+                'instructions_url',
+                'api_url',
+                'create_url',
+                'sdk_download_url',
+                'terms_url',
+                'custom_create_page_url',
+                'catalog_details_url',
+                'deprecation_doc_url',
+                'dashboard_url',
+                'registration_url',
+                'apidocsurl',
+            ),
+            False,
+        ),
+        'Visibility': (
+            (
+                'restrictions',
+                'owner',
+                'extendable',
+                ('include', 'include', 'model', 'VisibilityDetail', None),
+                ('exclude', 'exclude', 'model', 'VisibilityDetail', None),
+                'approved',
+            ),
+            ('restrictions', 'owner', 'extendable', 'include', 'exclude', 'approved'),
+            False,
+        ),
+        'VisibilityDetail': (
+            (
+                (
+                    'accounts',
+                    'accounts',
+                    'model',
+                    'VisibilityDetailAccounts',
+                    "Required property 'accounts' not present in VisibilityDetail JSON",
+                ),
+            ),
+            ('accounts',),
+            False,
+        ),
+        'VisibilityDetailAccounts': (
+            (('_accountid_', 'accountid', 'value', None, None),),
+            ('accountid',),
+            False,
+        ),
+    },
+    'global_search_v2': {
+        'ResultItem': (
+            ('crn',),
+            ('crn',),
+            True,
+        ),
+        'ScanResult': (
+            (
+                (
+                    'search_cursor',
+                    'search_cursor',
+                    'value',
+                    None,
+                    "Required property 'search_cursor' not present in ScanResult JSON",
+                ),
+                'limit',
+                (
+                    'items',
+                    'items',
+                    'model_list',
+                    'ResultItem',
+                    "Required property 'items' not present in ScanResult JSON",
+                ),
+            ),
+            ('search_cursor', 'limit', 'items'),
+            False,
+        ),
+        'SupportedTypesList': (
+            ('supported_types',),
+            ('supported_types',),
+            False,
+        ),
+    },
+    'global_tagging_v1': {
+        'CreateTagResults': (
+            (('results', 'results', 'model_list', 'CreateTagResultsResultsItem', None),),
+            ('results',),
+            False,
+        ),
+        'CreateTagResultsResultsItem': (
+            (
+                'tag_name',
+                'is_error',
+            ),
+            ('tag_name', 'is_error'),
+            False,
+        ),
+        'DeleteTagResults': (
+            (('results', 'results', 'model_list', 'DeleteTagResultsItem', None),),
+            ('results',),
+            False,
+        ),
+        'DeleteTagResultsItem': (
+            (
+                'provider',
+                'is_error',
+            ),
+            ('provider', 'is_error'),
+            True,
+        ),
+        'DeleteTagsResult': (
+            (
+                'total_count',
+                'errors',
+                ('items', 'items', 'model_list', 'DeleteTagsResultItem', None),
+            ),
+            ('total_count', 'errors', 'items'),
+            False,
+        ),
+        'DeleteTagsResultItem': (
+            (
+                'tag_name',
+                'is_error',
+            ),
+            ('tag_name', 'is_error'),
+            False,
+        ),
+        'Resource': (
+            (
+                (
+                    'resource_id',
+                    'resource_id',
+                    'value',
+                    None,
+                    "Required property 'resource_id' not present in Resource JSON",
+                ),
+                'resource_type',
+            ),
+            ('resource_id', 'resource_type'),
+            False,
+        ),
+        'Tag': (
+            (('name', 'name', 'value', None, "Required property 'name' not present in Tag JSON"),),
+            ('name',),
+            False,
+        ),
+        'TagList': (
+            (
+                'total_count',
+                'offset',
+                'limit',
+                ('items', 'items', 'model_list', 'Tag', None),
+            ),
+            ('total_count', 'offset', 'limit', 'items'),
+            False,
+        ),
+        'TagResults': (
+            (('results', 'results', 'model_list', 'TagResultsItem', None),),
+            ('results',),
+            False,
+        ),
+        'TagResultsItem': (
+            (
+                (
+                    'resource_id',
+                    'resource_id',
+                    'value',
+                    None,
+                    "Required property 'resource_id' not present in TagResultsItem JSON",
+                ),
+                'is_error',
+            ),
+            ('resource_id', 'is_error'),
+            False,
+        ),
+    },
+    'iam_access_groups_v2': {
+        'AccountSettings': (
+            (
+                'account_id',
+                ('last_modified_at', 'last_modified_at', 'converted', 'string_to_datetime', None),
+                'last_modified_by_id',
+                'public_access_enabled',
+            ),
+            ('account_id', 'last_modified_at', 'last_modified_by_id', 'public_access_enabled'),
+            False,
+        ),
+        'AddGroupMembersRequestMembersItem': (
+            (
+                (
+                    'iam_id',
+                    'iam_id',
+                    'value',
+                    None,
+                    "Required property 'iam_id' not present in AddGroupMembersRequestMembersItem JSON",
+                ),
+                (
+                    'type',
+                    'type',
+                    'value',
+                    None,
+                    "Required property 'type' not present in AddGroupMembersRequestMembersItem JSON",
+                ),
+            ),
+            ('iam_id', 'type'),
+            False,
+        ),
+        'AddGroupMembersResponse': (
+            (('members', 'members', 'model_list', 'AddGroupMembersResponseMembersItem', None),),
+            ('members',),
+            False,
+        ),
+        'AddGroupMembersResponseMembersItem': (
+            (
+                'iam_id',
+                'type',
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+                'created_by_id',
+                'status_code',
+                'trace',
+                ('errors', 'errors', 'model_list', 'Error', None),
+            ),
+            ('iam_id', 'type', 'created_at', 'created_by_id', 'status_code', 'trace', 'errors'),
+            False,
+        ),
+        'AddMembershipMultipleGroupsResponse': (
+            (
+                'iam_id',
+                ('groups', 'groups', 'model_list', 'AddMembershipMultipleGroupsResponseGroupsItem', None),
+            ),
+            ('iam_id', 'groups'),
+            False,
+        ),
+        'AddMembershipMultipleGroupsResponseGroupsItem': (
+            (
+                'access_group_id',
+                'status_code',
+                'trace',
+                ('errors', 'errors', 'model_list', 'Error', None),
+            ),
+            ('access_group_id', 'status_code', 'trace', 'errors'),
+            False,
+        ),
+        'DeleteFromAllGroupsResponse': (
+            (
+                'iam_id',
+                ('groups', 'groups', 'model_list', 'DeleteFromAllGroupsResponseGroupsItem', None),
+            ),
+            ('iam_id', 'groups'),
+            False,
+        ),
+        'DeleteFromAllGroupsResponseGroupsItem': (
+            (
+                'access_group_id',
+                'status_code',
+                'trace',
+                ('errors', 'errors', 'model_list', 'Error', None),
+            ),
+            ('access_group_id', 'status_code', 'trace', 'errors'),
+            False,
+        ),
+        'DeleteGroupBulkMembersResponse': (
+            (
+                'access_group_id',
+                ('members', 'members', 'model_list', 'DeleteGroupBulkMembersResponseMembersItem', None),
+            ),
+            ('access_group_id', 'members'),
+            False,
+        ),
+        'DeleteGroupBulkMembersResponseMembersItem': (
+            (
+                'iam_id',
+                'trace',
+                'status_code',
+                ('errors', 'errors', 'model_list', 'Error', None),
+            ),
+            ('iam_id', 'trace', 'status_code', 'errors'),
+            False,
+        ),
+        'Error': (
+            (
+                'code',
+                'message',
+            ),
+            ('code', 'message'),
+            False,
+        ),
+        'Group': (
+            (
+                'id',
+                'name',
+                'description',
+                'account_id',
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+                'created_by_id',
+                ('last_modified_at', 'last_modified_at', 'converted', 'string_to_datetime', None),
+                'last_modified_by_id',
+                'href',
+                'is_federated',
+            ),
+            (
+                'id',
+                'name',
+                'description',
+                'account_id',
+                'created_at',
+                'created_by_id',
+                'last_modified_at',
+                'last_modified_by_id',
+                'href',
+                'is_federated',
+            ),
+            False,
+        ),
+        'GroupMembersList': (
+            (
+                ('limit', 'limit', 'value', None, "Required property 'limit' not present in GroupMembersList JSON"),
+                ('offset', 'offset', 'value', None, "Required property 'offset' not present in GroupMembersList JSON"),
+                (
+                    'total_count',
+                    'total_count',
+                    'value',
+                    None,
+                    "Required property 'total_count' not present in GroupMembersList JSON",
+                ),
+                ('first', 'first', 'model', 'HrefStruct', None),
+                ('previous', 'previous', 'model', 'HrefStruct', None),
+                ('next', 'next', 'model', 'HrefStruct', None),
+                ('last', 'last', 'model', 'HrefStruct', None),
+                ('members', 'members', 'model_list', 'ListGroupMembersResponseMember', None),
+            ),
+            ('limit', 'offset', 'total_count', 'first', 'previous', 'next', 'last', 'members'),
+            False,
+        ),
+        'GroupsList': (
+            (
+                ('limit', 'limit', 'value', None, "Required property 'limit' not present in GroupsList JSON"),
+                ('offset', 'offset', 'value', None, "Required property 'offset' not present in GroupsList JSON"),
+                (
+                    'total_count',
+                    'total_count',
+                    'value',
+                    None,
+                    "Required property 'total_count' not present in GroupsList JSON",
+                ),
+                ('first', 'first', 'model', 'HrefStruct', None),
+                ('previous', 'previous', 'model', 'HrefStruct', None),
+                ('next', 'next', 'model', 'HrefStruct', None),
+                ('last', 'last', 'model', 'HrefStruct', None),
+                ('groups', 'groups', 'model_list', 'Group', None),
+            ),
+            ('limit', 'offset', 'total_count', 'first', 'previous', 'next', 'last', 'groups'),
+            False,
+        ),
+        'HrefStruct': (
+            ('href',),
+            ('href',),
+            False,
+        ),
+        'ListGroupMembersResponseMember': (
+            (
+                'iam_id',
+                'type',
+                'membership_type',
+                'name',
+                'email',
+                'description',
+                'href',
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+                'created_by_id',
+            ),
+            (
+                'iam_id',
+                'type',
+                'membership_type',
+                'name',
+                'email',
+                'description',
+                'href',
+                'created_at',
+                'created_by_id',
+            ),
+            False,
+        ),
+        'Rule': (
+            (
+                'id',
+                'name',
+                'expiration',
+                'realm_name',
+                'access_group_id',
+                'account_id',
+                ('conditions', 'conditions', 'model_list', 'RuleConditions', None),
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+                'created_by_id',
+                ('last_modified_at', 'last_modified_at', 'converted', 'string_to_datetime', None),
+                'last_modified_by_id',
+            ),
+            (
+                'id',
+                'name',
+                'expiration',
+                'realm_name',
+                'access_group_id',
+                'account_id',
+                'conditions',
+                'created_at',
+                'created_by_id',
+                'last_modified_at',
+                'last_modified_by_id',
+            ),
+            False,
+        ),
+        'RuleConditions': (
+            (
+                ('claim', 'claim', 'value', None, "Required property 'claim' not present in RuleConditions JSON"),
+                (
+                    'operator',
+                    'operator',
+                    'value',
+                    None,
+                    "Required property 'operator' not present in RuleConditions JSON",
+                ),
+                ('value', 'value', 'value', None, "Required property 'value' not present in RuleConditions JSON"),
+            ),
+            ('claim', 'operator', 'value'),
+            False,
+        ),
+        'RulesList': (
+            (('rules', 'rules', 'model_list', 'Rule', None),),
+            ('rules',),
+            False,
+        ),
+    },
+    'iam_identity_v1': {
+        'AccountSettingsResponse': (
+            (
+                ('context', 'context', 'model', 'ResponseContext', None),
+                (
+                    'account_id',
+                    'account_id',
+                    'value',
+                    None,
+                    "Required property 'account_id' not present in AccountSettingsResponse JSON",
+                ),
+                (
+                    'restrict_create_service_id',
+                    'restrict_create_service_id',
+                    'value',
+                    None,
+                    "Required property 'restrict_create_service_id' not present in AccountSettingsResponse JSON",
+                ),
+                (
+                    'restrict_create_platform_apikey',
+                    'restrict_create_platform_apikey',
+                    'value',
+                    None,
+                    "Required property 'restrict_create_platform_apikey' not present in AccountSettingsResponse JSON",
+                ),
+                (
+                    'allowed_ip_addresses',
+                    'allowed_ip_addresses',
+                    'value',
+                    None,
+                    "Required property 'allowed_ip_addresses' not present in AccountSettingsResponse JSON",
+                ),
+                (
+                    'entity_tag',
+                    'entity_tag',
+                    'value',
+                    None,
+                    "Required property 'entity_tag' not present in AccountSettingsResponse JSON",
+                ),
+                ('mfa', 'mfa', 'value', None, "Required property 'mfa' not present in AccountSettingsResponse JSON"),
+                (
+                    'user_mfa',
+                    'user_mfa',
+                    'model_list',
+                    'AccountSettingsUserMFA',
+                    "Required property 'user_mfa' not present in AccountSettingsResponse JSON",
+                ),
+                ('history', 'history', 'model_list', 'EnityHistoryRecord', None),
+                (
+                    'session_expiration_in_seconds',
+                    'session_expiration_in_seconds',
+                    'value',
+                    None,
+                    "Required property 'session_expiration_in_seconds' not present in AccountSettingsResponse JSON",
+                ),
+                (
+                    'session_invalidation_in_seconds',
+                    'session_invalidation_in_seconds',
+                    'value',
+                    None,
+                    "Required property 'session_invalidation_in_seconds' not present in AccountSettingsResponse JSON",
+                ),
+                (
+                    'max_sessions_per_identity',
+                    'max_sessions_per_identity',
+                    'value',
+                    None,
+                    "Required property 'max_sessions_per_identity' not present in AccountSettingsResponse JSON",
+                ),
+                (
+                    'system_access_token_expiration_in_seconds',
+                    'system_access_token_expiration_in_seconds',
+                    'value',
+                    None,
+                    "Required property 'system_access_token_expiration_in_seconds' not present in AccountSettingsResponse JSON",
+                ),
+                (
+                    'system_refresh_token_expiration_in_seconds',
+                    'system_refresh_token_expiration_in_seconds',
+                    'value',
+                    None,
+                    "Required property 'system_refresh_token_expiration_in_seconds' not present in AccountSettingsResponse JSON",
+                ),
+            ),
+            (
+                'context',
+                'account_id',
+                'restrict_create_service_id',
+                'restrict_create_platform_apikey',
+                'allowed_ip_addresses',
+                'entity_tag',
+                'mfa',
+                'user_mfa',
+                'history',
+                'session_expiration_in_seconds',
+                'session_invalidation_in_seconds',
+                'max_sessions_per_identity',
+                'system_access_token_expiration_in_seconds',
+                'system_refresh_token_expiration_in_seconds',
+            ),
+            False,
+        ),
+        'AccountSettingsUserMFA': (
+            (
+                (
+                    'iam_id',
+                    'iam_id',
+                    'value',
+                    None,
+                    "Required property 'iam_id' not present in AccountSettingsUserMFA JSON",
+                ),
+                ('mfa', 'mfa', 'value', None, "Required property 'mfa' not present in AccountSettingsUserMFA JSON"),
+            ),
+            ('iam_id', 'mfa'),
+            False,
+        ),
+        'Activity': (
+            (
+                'last_authn',
+                (
+                    'authn_count',
+                    'authn_count',
+                    'value',
+                    None,
+                    "Required property 'authn_count' not present in Activity JSON",
+                ),
+            ),
+            ('last_authn', 'authn_count'),
+            False,
+        ),
+        'ApiKey': (
+            (
+                ('context', 'context', 'model', 'ResponseContext', None),
+                ('id', 'id', 'value', None, "Required property 'id' not present in ApiKey JSON"),
+                'entity_tag',
+                ('crn', 'crn', 'value', None, "Required property 'crn' not present in ApiKey JSON"),
+                ('locked', 'locked', 'value', None, "Required property 'locked' not present in ApiKey JSON"),
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+                (
+                    'created_by',
+                    'created_by',
+                    'value',
+                    None,
+                    "Required property 'created_by' not present in ApiKey JSON",
+                ),
+                ('modified_at', 'modified_at', 'converted', 'string_to_datetime', None),
+                ('name', 'name', 'value', None, "Required property 'name' not present in ApiKey JSON"),
+                'description',
+                ('iam_id', 'iam_id', 'value', None, "Required property 'iam_id' not present in ApiKey JSON"),
+                (
+                    'account_id',
+                    'account_id',
+                    'value',
+                    None,
+                    "Required property 'account_id' not present in ApiKey JSON",
+                ),
+                ('apikey', 'apikey', 'value', None, "Required property 'apikey' not present in ApiKey JSON"),
+                ('history', 'history', 'model_list', 'EnityHistoryRecord', None),
+                ('activity', 'activity', 'model', 'Activity', None),
+            ),
+            (
+                'context',
+                'id',
+                'entity_tag',
+                'crn',
+                'locked',
+                'created_at',
+                'created_by',
+                'modified_at',
+                'name',
+                'description',
+                'iam_id',
+                'account_id',
+                'apikey',
+                'history',
+                'activity',
+            ),
+            False,
+        ),
+        'ApiKeyInsideCreateServiceIdRequest': (
+            (
+                (
+                    'name',
+                    'name',
+                    'value',
+                    None,
+                    "Required property 'name' not present in ApiKeyInsideCreateServiceIdRequest JSON",
+                ),
+                'description',
+                'apikey',
+                'store_value',
+            ),
+            ('name', 'description', 'apikey', 'store_value'),
+            False,
+        ),
+        'ApiKeyList': (
+            (
+                ('context', 'context', 'model', 'ResponseContext', None),
+                'offset',
+                'limit',
+                'first',
+                'previous',
+                'next',
+                (
+                    'apikeys',
+                    'apikeys',
+                    'model_list',
+                    'ApiKey',
+                    "Required property 'apikeys' not present in ApiKeyList JSON",
+                ),
+            ),
+            ('context', 'offset', 'limit', 'first', 'previous', 'next', 'apikeys'),
+            False,
+        ),
+        'ApikeyActivity': (
+            (
+                ('id', 'id', 'value', None, "Required property 'id' not present in ApikeyActivity JSON"),
+                'name',
+                ('type', 'type', 'value', None, "Required property 'type' not present in ApikeyActivity JSON"),
+                ('serviceid', 'serviceid', 'model', 'ApikeyActivityServiceid', None),
+                ('user', 'user', 'model', 'ApikeyActivityUser', None),
+                'last_authn',
+            ),
+            ('id', 'name', 'type', 'serviceid', 'user', 'last_authn'),
+            False,
+        ),
+        'ApikeyActivityServiceid': (
+            (
+                'id',
+                'name',
+            ),
+            ('id', 'name'),
+            False,
+        ),
+        'ApikeyActivityUser': (
+            (
+                'iam_id',
+                'name',
+                'username',
+                'email',
+            ),
+            ('iam_id', 'name', 'username', 'email'),
+            False,
+        ),
+        'CreateProfileLinkRequestLink': (
+            (
+                (
+                    'crn',
+                    'crn',
+                    'value',
+                    None,
+                    "Required property 'crn' not present in CreateProfileLinkRequestLink JSON",
+                ),
+                (
+                    'namespace',
+                    'namespace',
+                    'value',
+                    None,
+                    "Required property 'namespace' not present in CreateProfileLinkRequestLink JSON",
+                ),
+                'name',
+            ),
+            ('crn', 'namespace', 'name'),
+            False,
+        ),
+        'EnityHistoryRecord': (
+            (
+                (
+                    'timestamp',
+                    'timestamp',
+                    'value',
+                    None,
+                    "Required property 'timestamp' not present in EnityHistoryRecord JSON",
+                ),
+                (
+                    'iam_id',
+                    'iam_id',
+                    'value',
+                    None,
+                    "Required property 'iam_id' not present in EnityHistoryRecord JSON",
+                ),
+                (
+                    'iam_id_account',
+                    'iam_id_account',
+                    'value',
+                    None,
+                    "Required property 'iam_id_account' not present in EnityHistoryRecord JSON",
+                ),
+                (
+                    'action',
+                    'action',
+                    'value',
+                    None,
+                    "Required property 'action' not present in EnityHistoryRecord JSON",
+                ),
+                (
+                    'params',
+                    'params',
+                    'value',
+                    None,
+                    "Required property 'params' not present in EnityHistoryRecord JSON",
+                ),
+                (
+                    'message',
+                    'message',
+                    'value',
+                    None,
+                    "Required property 'message' not present in EnityHistoryRecord JSON",
+                ),
+            ),
+            ('timestamp', 'iam_id', 'iam_id_account', 'action', 'params', 'message'),
+            False,
+        ),
+        'EntityActivity': (
+            (
+                ('id', 'id', 'value', None, "Required property 'id' not present in EntityActivity JSON"),
+                'name',
+                'last_authn',
+            ),
+            ('id', 'name', 'last_authn'),
+            False,
+        ),
+        'ProfileClaimRule': (
+            (
+                ('id', 'id', 'value', None, "Required property 'id' not present in ProfileClaimRule JSON"),
+                (
+                    'entity_tag',
+                    'entity_tag',
+                    'value',
+                    None,
+                    "Required property 'entity_tag' not present in ProfileClaimRule JSON",
+                ),
+                (
+                    'created_at',
+                    'created_at',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'created_at' not present in ProfileClaimRule JSON",
+                ),
+                ('modified_at', 'modified_at', 'converted', 'string_to_datetime', None),
+                'name',
+                ('type', 'type', 'value', None, "Required property 'type' not present in ProfileClaimRule JSON"),
+                'realm_name',
+                (
+                    'expiration',
+                    'expiration',
+                    'value',
+                    None,
+                    "Required property 'expiration' not present in ProfileClaimRule JSON",
+                ),
+                'cr_type',
+                (
+                    'conditions',
+                    'conditions',
+                    'model_list',
+                    'ProfileClaimRuleConditions',
+                    "Required property 'conditions' not present in ProfileClaimRule JSON",
+                ),
+            ),
+            (
+                'id',
+                'entity_tag',
+                'created_at',
+                'modified_at',
+                'name',
+                'type',
+                'realm_name',
+                'expiration',
+                'cr_type',
+                'conditions',
+            ),
+            False,
+        ),
+        'ProfileClaimRuleConditions': (
+            (
+                (
+                    'claim',
+                    'claim',
+                    'value',
+                    None,
+                    "Required property 'claim' not present in ProfileClaimRuleConditions JSON",
+                ),
+                (
+                    'operator',
+                    'operator',
+                    'value',
+                    None,
+                    "Required property 'operator' not present in ProfileClaimRuleConditions JSON",
+                ),
+                (
+                    'value',
+                    'value',
+                    'value',
+                    None,
+                    "Required property 'value' not present in ProfileClaimRuleConditions JSON",
+                ),
+            ),
+            ('claim', 'operator', 'value'),
+            False,
+        ),
+        'ProfileClaimRuleList': (
+            (
+                ('context', 'context', 'model', 'ResponseContext', None),
+                (
+                    'rules',
+                    'rules',
+                    'model_list',
+                    'ProfileClaimRule',
+                    "Required property 'rules' not present in ProfileClaimRuleList JSON",
+                ),
+            ),
+            ('context', 'rules'),
+            False,
+        ),
+        'ProfileLink': (
+            (
+                ('id', 'id', 'value', None, "Required property 'id' not present in ProfileLink JSON"),
+                (
+                    'entity_tag',
+                    'entity_tag',
+                    'value',
+                    None,
+                    "Required property 'entity_tag' not present in ProfileLink JSON",
+                ),
+                (
+                    'created_at',
+                    'created_at',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'created_at' not present in ProfileLink JSON",
+                ),
+                (
+                    'modified_at',
+                    'modified_at',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'modified_at' not present in ProfileLink JSON",
+                ),
+                'name',
+                ('cr_type', 'cr_type', 'value', None, "Required property 'cr_type' not present in ProfileLink JSON"),
+                (
+                    'link',
+                    'link',
+                    'model',
+                    'ProfileLinkLink',
+                    "Required property 'link' not present in ProfileLink JSON",
+                ),
+            ),
+            ('id', 'entity_tag', 'created_at', 'modified_at', 'name', 'cr_type', 'link'),
+            False,
+        ),
+        'ProfileLinkLink': (
+            (
+                'crn',
+                'namespace',
+                'name',
+            ),
+            ('crn', 'namespace', 'name'),
+            False,
+        ),
+        'ProfileLinkList': (
+            (
+                (
+                    'links',
+                    'links',
+                    'model_list',
+                    'ProfileLink',
+                    "Required property 'links' not present in ProfileLinkList JSON",
+                ),
+            ),
+            ('links',),
+            False,
+        ),
+        'Report': (
+            (
+                (
+                    'created_by',
+                    'created_by',
+                    'value',
+                    None,
+                    "Required property 'created_by' not present in Report JSON",
+                ),
+                ('reference', 'reference', 'value', None, "Required property 'reference' not present in Report JSON"),
+                (
+                    'report_duration',
+                    'report_duration',
+                    'value',
+                    None,
+                    "Required property 'report_duration' not present in Report JSON",
+                ),
+                (
+                    'report_start_time',
+                    'report_start_time',
+                    'value',
+                    None,
+                    "Required property 'report_start_time' not present in Report JSON",
+                ),
+                (
+                    'report_end_time',
+                    'report_end_time',
+                    'value',
+                    None,
+                    "Required property 'report_end_time' not present in Report JSON",
+                ),
+                ('users', 'users', 'model_list', 'UserActivity', None),
+                ('apikeys', 'apikeys', 'model_list', 'ApikeyActivity', None),
+                ('serviceids', 'serviceids', 'model_list', 'EntityActivity', None),
+                ('profiles', 'profiles', 'model_list', 'EntityActivity', None),
+            ),
+            (
+                'created_by',
+                'reference',
+                'report_duration',
+                'report_start_time',
+                'report_end_time',
+                'users',
+                'apikeys',
+                'serviceids',
+                'profiles',
+            ),
+            False,
+        ),
+        'ReportReference': (
+            (
+                (
+                    'reference',
+                    'reference',
+                    'value',
+                    None,
+                    "Required property 'reference' not present in ReportReference JSON",
+                ),
+            ),
+            ('reference',),
+            False,
+        ),
+        'ResponseContext': (
+            (
+                'transaction_id',
+                'operation',
+                'user_agent',
+                'url',
+                'instance_id',
+                'thread_id',
+                'host',
+                'start_time',
+                'end_time',
+                'elapsed_time',
+                'cluster_name',
+            ),
+            (
+                'transaction_id',
+                'operation',
+                'user_agent',
+                'url',
+                'instance_id',
+                'thread_id',
+                'host',
+                'start_time',
+                'end_time',
+                'elapsed_time',
+                'cluster_name',
+            ),
+            False,
+        ),
+        'ServiceId': (
+            (
+                ('context', 'context', 'model', 'ResponseContext', None),
+                ('id', 'id', 'value', None, "Required property 'id' not present in ServiceId JSON"),
+                ('iam_id', 'iam_id', 'value', None, "Required property 'iam_id' not present in ServiceId JSON"),
+                (
+                    'entity_tag',
+                    'entity_tag',
+                    'value',
+                    None,
+                    "Required property 'entity_tag' not present in ServiceId JSON",
+                ),
+                ('crn', 'crn', 'value', None, "Required property 'crn' not present in ServiceId JSON"),
+                ('locked', 'locked', 'value', None, "Required property 'locked' not present in ServiceId JSON"),
+                (
+                    'created_at',
+                    'created_at',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'created_at' not present in ServiceId JSON",
+                ),
+                (
+                    'modified_at',
+                    'modified_at',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'modified_at' not present in ServiceId JSON",
+                ),
+                (
+                    'account_id',
+                    'account_id',
+                    'value',
+                    None,
+                    "Required property 'account_id' not present in ServiceId JSON",
+                ),
+                ('name', 'name', 'value', None, "Required property 'name' not present in ServiceId JSON"),
+                'description',
+                'unique_instance_crns',
+                ('history', 'history', 'model_list', 'EnityHistoryRecord', None),
+                ('apikey', 'apikey', 'model', 'ApiKey', None),
+                ('activity', 'activity', 'model', 'Activity', None),
+            ),
+            (
+                'context',
+                'id',
+                'iam_id',
+                'entity_tag',
+                'crn',
+                'locked',
+                'created_at',
+                'modified_at',
+                'account_id',
+                'name',
+                'description',
+                'unique_instance_crns',
+                'history',
+                'apikey',
+                'activity',
+            ),
+            False,
+        ),
+        'ServiceIdList': (
+            (
+                ('context', 'context', 'model', 'ResponseContext', None),
+                'offset',
+                'limit',
+                'first',
+                'previous',
+                'next',
+                (
+                    'serviceids',
+                    'serviceids',
+                    'model_list',
+                    'ServiceId',
+                    "Required property 'serviceids' not present in ServiceIdList JSON",
+                ),
+            ),
+            ('context', 'offset', 'limit', 'first', 'previous', 'next', 'serviceids'),
+            False,
+        ),
+        'TrustedProfile': (
+            (
+                ('context', 'context', 'model', 'ResponseContext', None),
+                ('id', 'id', 'value', None, "Required property 'id' not present in TrustedProfile JSON"),
+                (
+                    'entity_tag',
+                    'entity_tag',
+                    'value',
+                    None,
+                    "Required property 'entity_tag' not present in TrustedProfile JSON",
+                ),
+                ('crn', 'crn', 'value', None, "Required property 'crn' not present in TrustedProfile JSON"),
+                ('name', 'name', 'value', None, "Required property 'name' not present in TrustedProfile JSON"),
+                'description',
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+                ('modified_at', 'modified_at', 'converted', 'string_to_datetime', None),
+                ('iam_id', 'iam_id', 'value', None, "Required property 'iam_id' not present in TrustedProfile JSON"),
+                (
+                    'account_id',
+                    'account_id',
+                    'value',
+                    None,
+                    "Required property 'account_id' not present in TrustedProfile JSON",
+                ),
+                'ims_account_id',
+                'ims_user_id',
+                ('history', 'history', 'model_list', 'EnityHistoryRecord', None),
+                ('activity', 'activity', 'model', 'Activity', None),
+            ),
+            (
+                'context',
+                'id',
+                'entity_tag',
+                'crn',
+                'name',
+                'description',
+                'created_at',
+                'modified_at',
+                'iam_id',
+                'account_id',
+                'ims_account_id',
+                'ims_user_id',
+                'history',
+                'activity',
+            ),
+            False,
+        ),
+        'TrustedProfilesList': (
+            (
+                ('context', 'context', 'model', 'ResponseContext', None),
+                'offset',
+                'limit',
+                'first',
+                'previous',
+                'next',
+                (
+                    'profiles',
+                    'profiles',
+                    'model_list',
+                    'TrustedProfile',
+                    "Required property 'profiles' not present in TrustedProfilesList JSON",
+                ),
+            ),
+            ('context', 'offset', 'limit', 'first', 'previous', 'next', 'profiles'),
+            False,
+        ),
+        'UserActivity': (
+            (
+                ('iam_id', 'iam_id', 'value', None, "Required property 'iam_id' not present in UserActivity JSON"),
+                'name',
+                (
+                    'username',
+                    'username',
+                    'value',
+                    None,
+                    "Required property 'username' not present in UserActivity JSON",
+                ),
+                'email',
+                'last_authn',
+            ),
+            ('iam_id', 'name', 'username', 'email', 'last_authn'),
+            False,
+        ),
+    },
+    'iam_policy_management_v1': {
+        'CustomRole': (
+            (
+                'id',
+                'display_name',
+                'description',
+                'actions',
+                'crn',
+                'name',
+                'account_id',
+                'service_name',
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+                'created_by_id',
+                ('last_modified_at', 'last_modified_at', 'converted', 'string_to_datetime', None),
+                'last_modified_by_id',
+                'href',
+            ),
+            (
+                'id',
+                'display_name',
+                'description',
+                'actions',
+                'crn',
+                'name',
+                'account_id',
+                'service_name',
+                'created_at',
+                'created_by_id',
+                'last_modified_at',
+                'last_modified_by_id',
+                'href',
+            ),
+            False,
+        ),
+        'Policy': (
+            (
+                'id',
+                'type',
+                'description',
+                ('subjects', 'subjects', 'model_list', 'PolicySubject', None),
+                ('roles', 'roles', 'model_list', 'PolicyRole', None),
+                ('resources', 'resources', 'model_list', 'PolicyResource', None),
+                'href',
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+                'created_by_id',
+                ('last_modified_at', 'last_modified_at', 'converted', 'string_to_datetime', None),
+                'last_modified_by_id',
+                'state',
+            ),
+            (
+                'id',
+                'type',
+                'description',
+                'subjects',
+                'roles',
+                'resources',
+                'href',
+                'created_at',
+                'created_by_id',
+                'last_modified_at',
+                'last_modified_by_id',
+                'state',
+            ),
+            False,
+        ),
+        'PolicyList': (
+            (('policies', 'policies', 'model_list', 'Policy', None),),
+            ('policies',),
+            False,
+        ),
+        'PolicyResource': (
+            (
+                ('attributes', 'attributes', 'model_list', 'ResourceAttribute', None),
+                ('tags', 'tags', 'model_list', 'ResourceTag', None),
+            ),
+            ('attributes', 'tags'),
+            False,
+        ),
+        'PolicyRole': (
+            (
+                ('role_id', 'role_id', 'value', None, "Required property 'role_id' not present in PolicyRole JSON"),
+                'display_name',
+                'description',
+            ),
+            ('role_id', 'display_name', 'description'),
+            False,
+        ),
+        'PolicySubject': (
+            (('attributes', 'attributes', 'model_list', 'SubjectAttribute', None),),
+            ('attributes',),
+            False,
+        ),
+        'ResourceAttribute': (
+            (
+                ('name', 'name', 'value', None, "Required property 'name' not present in ResourceAttribute JSON"),
+                ('value', 'value', 'value', None, "Required property 'value' not present in ResourceAttribute JSON"),
+                'operator',
+            ),
+            ('name', 'value', 'operator'),
+            False,
+        ),
+        'ResourceTag': (
+            (
+                ('name', 'name', 'value', None, "Required property 'name' not present in ResourceTag JSON"),
+                ('value', 'value', 'value', None, "Required property 'value' not present in ResourceTag JSON"),
+                'operator',
+            ),
+            ('name', 'value', 'operator'),
+            False,
+        ),
+        'Role': (
+            (
+                'display_name',
+                'description',
+                'actions',
+                'crn',
+            ),
+            ('display_name', 'description', 'actions', 'crn'),
+            False,
+        ),
+        'RoleList': (
+            (
+                ('custom_roles', 'custom_roles', 'model_list', 'CustomRole', None),
+                ('service_roles', 'service_roles', 'model_list', 'Role', None),
+                ('system_roles', 'system_roles', 'model_list', 'Role', None),
+            ),
+            ('custom_roles', 'service_roles', 'system_roles'),
+            False,
+        ),
+        'SubjectAttribute': (
+            (
+                ('name', 'name', 'value', None, "Required property 'name' not present in SubjectAttribute JSON"),
+                ('value', 'value', 'value', None, "Required property 'value' not present in SubjectAttribute JSON"),
+            ),
+            ('name', 'value'),
+            False,
+        ),
+    },
+    'ibm_cloud_shell_v1': {
+        'AccountSettings': (
+            (
+                ('_id', 'id', 'value', None, None),
+                ('_rev', 'rev', 'value', None, None),
+                'account_id',
+                'created_at',
+                'created_by',
+                'default_enable_new_features',
+                'default_enable_new_regions',
+                'enabled',
+                ('features', 'features', 'model_list', 'Feature', None),
+                ('regions', 'regions', 'model_list', 'RegionSetting', None),
+                'type',
+                'updated_at',
+                'updated_by',
+            ),
+            (
+                'id',
+                'rev',
+                'account_id',
+                'created_at',
+                'created_by',
+                'default_enable_new_features',
+                'default_enable_new_regions',
+                'enabled',
+                'features',
+                'regions',
+                'type',
+                'updated_at',
+                'updated_by',
+            ),
+            False,
+        ),
+        'Feature': (
+            (
+                'enabled',
+                'key',
+            ),
+            ('enabled', 'key'),
+            False,
+        ),
+        'RegionSetting': (
+            (
+                'enabled',
+                'key',
+            ),
+            ('enabled', 'key'),
+            False,
+        ),
+    },
+    'open_service_broker_v1': {
+        'Resp1874644Root': (
+            (
+                'active',
+                'enabled',
+                'last_active',
+            ),
+            ('active', 'enabled', 'last_active'),
+            False,
+        ),
+        'Resp1874650Root': (
+            (('services', 'services', 'model_list', 'Services', None),),
+            ('services',),
+            False,
+        ),
+        'Resp2079872Root': (
+            (
+                'dashboard_url',
+                'operation',
+            ),
+            ('dashboard_url', 'operation'),
+            False,
+        ),
+        'Resp2079874Root': (
+            ('operation',),
+            ('operation',),
+            False,
+        ),
+        'Resp2079876Root': (
+            (
+                'credentials',
+                'syslog_drain_url',
+                'route_service_url',
+                ('volume_mounts', 'volume_mounts', 'model_list', 'VolumeMount', None),
+            ),
+            ('credentials', 'syslog_drain_url', 'route_service_url', 'volume_mounts'),
+            False,
+        ),
+        'Resp2079894Root': (
+            (
+                'description',
+                ('state', 'state', 'value', None, "Required property 'state' not present in Resp2079894Root JSON"),
+            ),
+            ('description', 'state'),
+            False,
+        ),
+        'Resp2448145Root': (
+            (
+                'active',
+                (
+                    'enabled',
+                    'enabled',
+                    'value',
+                    None,
+                    "Required property 'enabled' not present in Resp2448145Root JSON",
+                ),
+                'last_active',
+            ),
+            ('active', 'enabled', 'last_active'),
+            False,
+        ),
+        'BindResource': (
+            (
+                'account_id',
+                'serviceid_crn',
+                'target_crn',
+                'app_guid',
+                'route',
+            ),
+            ('account_id', 'serviceid_crn', 'target_crn', 'app_guid', 'route'),
+            False,
+        ),
+        'Context': (
+            (
+                'account_id',
+                'crn',
+                'platform',
+            ),
+            ('account_id', 'crn', 'platform'),
+            False,
+        ),
+        'Plans': (
+            (
+                (
+                    'description',
+                    'description',
+                    'value',
+                    None,
+                    "Required property 'description' not present in Plans JSON",
+                ),
+                'free',
+                ('id', 'id', 'value', None, "Required property 'id' not present in Plans JSON"),
+                ('name', 'name', 'value', None, "Required property 'name' not present in Plans JSON"),
+            ),
+            ('description', 'free', 'id', 'name'),
+            False,
+        ),
+        'Services': (
+            (
+                ('bindable', 'bindable', 'value', None, "Required property 'bindable' not present in Services JSON"),
+                (
+                    'description',
+                    'description',
+                    'value',
+                    None,
+                    "Required property 'description' not present in Services JSON",
+                ),
+                ('id', 'id', 'value', None, "Required property 'id' not present in Services JSON"),
+                ('name', 'name', 'value', None, "Required property 'name' not present in Services JSON"),
+                'plan_updateable',
+                ('plans', 'plans', 'model_list', 'Plans', "Required property 'plans' not present in Services JSON"),
+            ),
+            ('bindable', 'description', 'id', 'name', 'plan_updateable', 'plans'),
+            False,
+        ),
+        'VolumeMount': (
+            (
+                ('driver', 'driver', 'value', None, "Required property 'driver' not present in VolumeMount JSON"),
+                (
+                    'container_dir',
+                    'container_dir',
+                    'value',
+                    None,
+                    "Required property 'container_dir' not present in VolumeMount JSON",
+                ),
+                ('mode', 'mode', 'value', None, "Required property 'mode' not present in VolumeMount JSON"),
+                (
+                    'device_type',
+                    'device_type',
+                    'value',
+                    None,
+                    "Required property 'device_type' not present in VolumeMount JSON",
+                ),
+                ('device', 'device', 'value', None, "Required property 'device' not present in VolumeMount JSON"),
+            ),
+            ('driver', 'container_dir', 'mode', 'device_type', 'device'),
+            False,
+        ),
+    },
+    'resource_controller_v2': {
+        'Credentials': (
+            (
+                ('REDACTED', 'redacted', 'value', None, None),
+                'apikey',
+                'iam_apikey_description',
+                'iam_apikey_name',
+                'iam_role_crn',
+                'iam_serviceid_crn',
+            ),
+            ('redacted', 'apikey', 'iam_apikey_description', 'iam_apikey_name', 'iam_role_crn', 'iam_serviceid_crn'),
+            True,
+        ),
+        'PlanHistoryItem': (
+            (
+                (
+                    'resource_plan_id',
+                    'resource_plan_id',
+                    'value',
+                    None,
+                    "Required property 'resource_plan_id' not present in PlanHistoryItem JSON",
+                ),
+                (
+                    'start_date',
+                    'start_date',
+                    'converted',
+                    'lazy_datetime',
+                    "Required property 'start_date' not present in PlanHistoryItem JSON",
+                ),
+                'requestor_id',
+            ),
+            ('resource_plan_id', 'start_date', 'requestor_id'),
+            False,
+        ),
+        'Reclamation': (
+            (
+                'id',
+                'entity_id',
+                'entity_type_id',
+                'entity_crn',
+                'resource_instance_id',
+                'resource_group_id',
+                'account_id',
+                'policy_id',
+                'state',
+                'target_time',
+                'custom_properties',
+                ('created_at', 'created_at', 'converted', 'lazy_datetime', None),
+                'created_by',
+                ('updated_at', 'updated_at', 'converted', 'lazy_datetime', None),
+                'updated_by',
+            ),
+            (
+                'id',
+                'entity_id',
+                'entity_type_id',
+                'entity_crn',
+                'resource_instance_id',
+                'resource_group_id',
+                'account_id',
+                'policy_id',
+                'state',
+                'target_time',
+                'custom_properties',
+                'created_at',
+                'created_by',
+                'updated_at',
+                'updated_by',
+            ),
+            False,
+        ),
+        'ReclamationsList': (
+            (('resources', 'resources', 'model_list', 'Reclamation', None),),
+            ('resources',),
+            False,
+        ),
+        'ResourceAlias': (
+            (
+                'id',
+                'guid',
+                'url',
+                ('created_at', 'created_at', 'converted', 'lazy_datetime', None),
+                ('updated_at', 'updated_at', 'converted', 'lazy_datetime', None),
+                ('deleted_at', 'deleted_at', 'converted', 'lazy_datetime', None),
+                'created_by',
+                'updated_by',
+                'deleted_by',
+                'name',
+                'resource_instance_id',
+                'target_crn',
+                'account_id',
+                'resource_id',
+                'resource_group_id',
+                'crn',
+                'region_instance_id',
+                'region_instance_crn',
+                'state',
+                'migrated',
+                'resource_instance_url',
+                'resource_bindings_url',
+                'resource_keys_url',
+            ),
+            (
+                'id',
+                'guid',
+                'url',
+                'created_at',
+                'updated_at',
+                'deleted_at',
+                'created_by',
+                'updated_by',
+                'deleted_by',
+                'name',
+                'resource_instance_id',
+                'target_crn',
+                'account_id',
+                'resource_id',
+                'resource_group_id',
+                'crn',
+                'region_instance_id',
+                'region_instance_crn',
+                'state',
+                'migrated',
+                'resource_instance_url',
+                'resource_bindings_url',
+                'resource_keys_url',
+            ),
+            False,
+        ),
+        'ResourceAliasesList': (
+            (
+                (
+                    'rows_count',
+                    'rows_count',
+                    'value',
+                    None,
+                    "Required property 'rows_count' not present in ResourceAliasesList JSON",
+                ),
+                (
+                    'next_url',
+                    'next_url',
+                    'value',
+                    None,
+                    "Required property 'next_url' not present in ResourceAliasesList JSON",
+                ),
+                (
+                    'resources',
+                    'resources',
+                    'model_list',
+                    'ResourceAlias',
+                    "Required property 'resources' not present in ResourceAliasesList JSON",
+                ),
+            ),
+            ('rows_count', 'next_url', 'resources'),
+            False,
+        ),
+        'ResourceBinding': (
+            (
+                'id',
+                'guid',
+                'url',
+                ('created_at', 'created_at', 'converted', 'lazy_datetime', None),
+                ('updated_at', 'updated_at', 'converted', 'lazy_datetime', None),
+                ('deleted_at', 'deleted_at', 'converted', 'lazy_datetime', None),
+                'created_by',
+                'updated_by',
+                'deleted_by',
+                'source_crn',
+                'target_crn',
+                'crn',
+                'region_binding_id',
+                'region_binding_crn',
+                'name',
+                'account_id',
+                'resource_group_id',
+                'state',
+                ('credentials', 'credentials', 'model', 'Credentials', None),
+                'iam_compatible',
+                'resource_id',
+                'migrated',
+                'resource_alias_url',
+            ),
+            (
+                'id',
+                'guid',
+                'url',
+                'created_at',
+                'updated_at',
+                'deleted_at',
+                'created_by',
+                'updated_by',
+                'deleted_by',
+                'source_crn',
+                'target_crn',
+                'crn',
+                'region_binding_id',
+                'region_binding_crn',
+                'name',
+                'account_id',
+                'resource_group_id',
+                'state',
+                'credentials',
+                'iam_compatible',
+                'resource_id',
+                'migrated',
+                'resource_alias_url',
+            ),
+            False,
+        ),
+        'ResourceBindingPostParameters': (
+            ('serviceid_crn',),
+            ('serviceid_crn',),
+            True,
+        ),
+        'ResourceBindingsList': (
+            (
+                (
+                    'rows_count',
+                    'rows_count',
+                    'value',
+                    None,
+                    "Required property 'rows_count' not present in ResourceBindingsList JSON",
+                ),
+                (
+                    'next_url',
+                    'next_url',
+                    'value',
+                    None,
+                    "Required property 'next_url' not present in ResourceBindingsList JSON",
+                ),
+                (
+                    'resources',
+                    'resources',
+                    'model_list',
+                    'ResourceBinding',
+                    "Required property 'resources' not present in ResourceBindingsList JSON",
+                ),
+            ),
+            ('rows_count', 'next_url', 'resources'),
+            False,
+        ),
+        'ResourceInstance': (
+            (
+                'id',
+                'guid',
+                'url',
+                ('created_at', 'created_at', 'converted', 'lazy_datetime', None),
+                ('updated_at', 'updated_at', 'converted', 'lazy_datetime', None),
+                ('deleted_at', 'deleted_at', 'converted', 'lazy_datetime', None),
+                'created_by',
+                'updated_by',
+                'deleted_by',
+                ('scheduled_reclaim_at', 'scheduled_reclaim_at', 'converted', 'lazy_datetime', None),
+                ('restored_at', 'restored_at', 'converted', 'lazy_datetime', None),
+                'restored_by',
+                'scheduled_reclaim_by',
+                'name',
+                'region_id',
+                'account_id',
+                'reseller_channel_id',
+                'resource_plan_id',
+                'resource_group_id',
+                'resource_group_crn',
+                'target_crn',
+                'parameters',
+                'allow_cleanup',
+                'crn',
+                'state',
+                'type',
+                'sub_type',
+                'resource_id',
+                'dashboard_url',
+                ('last_operation', 'last_operation', 'model', 'ResourceInstanceLastOperation', None),
+                'resource_aliases_url',
+                'resource_bindings_url',
+                'resource_keys_url',
+                ('plan_history', 'plan_history', 'model_list', 'PlanHistoryItem', None),
+                'migrated',
+                'extensions',
+                'controlled_by',
+                'locked',
+            ),
+            (
+                'id',
+                'guid',
+                'url',
+                'created_at',
+                'updated_at',
+                'deleted_at',
+                'created_by',
+                'updated_by',
+                'deleted_by',
+                'scheduled_reclaim_at',
+                'restored_at',
+                'restored_by',
+                'scheduled_reclaim_by',
+                'name',
+                'region_id',
+                'account_id',
+                'reseller_channel_id',
+                'resource_plan_id',
+                'resource_group_id',
+                'resource_group_crn',
+                'target_crn',
+                'parameters',
+                'allow_cleanup',
+                'crn',
+                'state',
+                'type',
+                'sub_type',
+                'resource_id',
+                'dashboard_url',
+                'last_operation',
+                'resource_aliases_url',
+                'resource_bindings_url',
+                'resource_keys_url',
+                'plan_history',
+                'migrated',
+                'extensions',
+                'controlled_by',
+                'locked',
+            ),
+            False,
+        ),
+        'ResourceInstanceLastOperation': (
+            (
+                (
+                    'type',
+                    'type',
+                    'value',
+                    None,
+                    "Required property 'type' not present in ResourceInstanceLastOperation JSON",
+                ),
+                (
+                    'state',
+                    'state',
+                    'value',
+                    None,
+                    "Required property 'state' not present in ResourceInstanceLastOperation JSON",
+                ),
+                'sub_type',
+                (
+                    'async',
+                    'async_',
+                    'value',
+                    None,
+                    "Required property 'async' not present in ResourceInstanceLastOperation JSON",
+                ),
+                (
+                    'description',
+                    'description',
+                    'value',
+                    None,
+                    "Required property 'description' not present in ResourceInstanceLastOperation JSON",
+                ),
+                'reason_code',
+                'poll_after',
+                (
+                    'cancelable',
+                    'cancelable',
+                    'value',
+                    None,
+                    "Required property 'cancelable' not present in ResourceInstanceLastOperation JSON",
+                ),
+                (
+                    'poll',
+                    'poll',
+                    'value',
+                    None,
+                    "Required property 'poll' not present in ResourceInstanceLastOperation JSON",
+                ),
+            ),
+            ('type', 'state', 'sub_type', 'async_', 'description', 'reason_code', 'poll_after', 'cancelable', 'poll'),
+            True,
+        ),
+        'ResourceInstancesList': (
+            (
+                (
+                    'rows_count',
+                    'rows_count',
+                    'value',
+                    None,
+                    "Required property 'rows_count' not present in ResourceInstancesList JSON",
+                ),
+                (
+                    'next_url',
+                    'next_url',
+                    'value',
+                    None,
+                    "Required property 'next_url' not present in ResourceInstancesList JSON",
+                ),
+                (
+                    'resources',
+                    'resources',
+                    'model_list',
+                    'ResourceInstance',
+                    "Required property 'resources' not present in ResourceInstancesList JSON",
+                ),
+            ),
+            ('rows_count', 'next_url', 'resources'),
+            False,
+        ),
+        'ResourceKey': (
+            (
+                'id',
+                'guid',
+                'url',
+                ('created_at', 'created_at', 'converted', 'lazy_datetime', None),
+                ('updated_at', 'updated_at', 'converted', 'lazy_datetime', None),
+                ('deleted_at', 'deleted_at', 'converted', 'lazy_datetime', None),
+                'created_by',
+                'updated_by',
+                'deleted_by',
+                'source_crn',
+                'name',
+                'crn',
+                'state',
+                'account_id',
+                'resource_group_id',
+                'resource_id',
+                ('credentials', 'credentials', 'model', 'Credentials', None),
+                'iam_compatible',
+                'migrated',
+                'resource_instance_url',
+                'resource_alias_url',
+            ),
+            (
+                'id',
+                'guid',
+                'url',
+                'created_at',
+                'updated_at',
+                'deleted_at',
+                'created_by',
+                'updated_by',
+                'deleted_by',
+                'source_crn',
+                'name',
+                'crn',
+                'state',
+                'account_id',
+                'resource_group_id',
+                'resource_id',
+                'credentials',
+                'iam_compatible',
+                'migrated',
+                'resource_instance_url',
+                'resource_alias_url',
+            ),
+            False,
+        ),
+        'ResourceKeyPostParameters': (
+            ('serviceid_crn',),
+            ('serviceid_crn',),
+            True,
+        ),
+        'ResourceKeysList': (
+            (
+                (
+                    'rows_count',
+                    'rows_count',
+                    'value',
+                    None,
+                    "Required property 'rows_count' not present in ResourceKeysList JSON",
+                ),
+                (
+                    'next_url',
+                    'next_url',
+                    'value',
+                    None,
+                    "Required property 'next_url' not present in ResourceKeysList JSON",
+                ),
+                (
+                    'resources',
+                    'resources',
+                    'model_list',
+                    'ResourceKey',
+                    "Required property 'resources' not present in ResourceKeysList JSON",
+                ),
+            ),
+            ('rows_count', 'next_url', 'resources'),
+            False,
+        ),
+    },
+    'resource_manager_v2': {
+        'QuotaDefinition': (
+            (
+                'id',
+                'name',
+                'type',
+                'number_of_apps',
+                'number_of_service_instances',
+                'default_number_of_instances_per_lite_plan',
+                'instances_per_app',
+                'instance_memory',
+                'total_app_memory',
+                'vsi_limit',
+                ('resource_quotas', 'resource_quotas', 'model_list', 'ResourceQuota', None),
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+                ('updated_at', 'updated_at', 'converted', 'string_to_datetime', None),
+            ),
+            (
+                'id',
+                'name',
+                'type',
+                'number_of_apps',
+                'number_of_service_instances',
+                'default_number_of_instances_per_lite_plan',
+                'instances_per_app',
+                'instance_memory',
+                'total_app_memory',
+                'vsi_limit',
+                'resource_quotas',
+                'created_at',
+                'updated_at',
+            ),
+            False,
+        ),
+        'QuotaDefinitionList': (
+            (
+                (
+                    'resources',
+                    'resources',
+                    'model_list',
+                    'QuotaDefinition',
+                    "Required property 'resources' not present in QuotaDefinitionList JSON",
+                ),
+            ),
+            ('resources',),
+            False,
+        ),
+        'ResCreateResourceGroup': (
+            (
+                'id',
+                'crn',
+            ),
+            ('id', 'crn'),
+            False,
+        ),
+        'ResourceGroup': (
+            (
+                'id',
+                'crn',
+                'account_id',
+                'name',
+                'state',
+                'default',
+                'quota_id',
+                'quota_url',
+                'payment_methods_url',
+                'resource_linkages',
+                'teams_url',
+                ('created_at', 'created_at', 'converted', 'string_to_datetime', None),
+                ('updated_at', 'updated_at', 'converted', 'string_to_datetime', None),
+            ),
+            (
+                'id',
+                'crn',
+                'account_id',
+                'name',
+                'state',
+                'default',
+                'quota_id',
+                'quota_url',
+                'payment_methods_url',
+                'resource_linkages',
+                'teams_url',
+                'created_at',
+                'updated_at',
+            ),
+            False,
+        ),
+        'ResourceGroupList': (
+            (
+                (
+                    'resources',
+                    'resources',
+                    'model_list',
+                    'ResourceGroup',
+                    "Required property 'resources' not present in ResourceGroupList JSON",
+                ),
+            ),
+            ('resources',),
+            False,
+        ),
+        'ResourceQuota': (
+            (
+                ('_id', 'id', 'value', None, None),
+                'resource_id',
+                'crn',
+                'limit',
+            ),
+            ('id', 'resource_id', 'crn', 'limit'),
+            False,
+        ),
+    },
+    'usage_metering_v4': {
+        'MeasureAndQuantity': (
+            (
+                (
+                    'measure',
+                    'measure',
+                    'value',
+                    None,
+                    "Required property 'measure' not present in MeasureAndQuantity JSON",
+                ),
+                (
+                    'quantity',
+                    'quantity',
+                    'value',
+                    None,
+                    "Required property 'quantity' not present in MeasureAndQuantity JSON",
+                ),
+            ),
+            ('measure', 'quantity'),
+            False,
+        ),
+        'ResourceInstanceUsage': (
+            (
+                (
+                    'resource_instance_id',
+                    'resource_instance_id',
+                    'value',
+                    None,
+                    "Required property 'resource_instance_id' not present in ResourceInstanceUsage JSON",
+                ),
+                (
+                    'plan_id',
+                    'plan_id',
+                    'value',
+                    None,
+                    "Required property 'plan_id' not present in ResourceInstanceUsage JSON",
+                ),
+                'region',
+                (
+                    'start',
+                    'start',
+                    'value',
+                    None,
+                    "Required property 'start' not present in ResourceInstanceUsage JSON",
+                ),
+                ('end', 'end', 'value', None, "Required property 'end' not present in ResourceInstanceUsage JSON"),
+                (
+                    'measured_usage',
+                    'measured_usage',
+                    'model_list',
+                    'MeasureAndQuantity',
+                    "Required property 'measured_usage' not present in ResourceInstanceUsage JSON",
+                ),
+                'consumer_id',
+            ),
+            ('resource_instance_id', 'plan_id', 'region', 'start', 'end', 'measured_usage', 'consumer_id'),
+            False,
+        ),
+        'ResourceUsageDetails': (
+            (
+                (
+                    'status',
+                    'status',
+                    'value',
+                    None,
+                    "Required property 'status' not present in ResourceUsageDetails JSON",
+                ),
+                (
+                    'location',
+                    'location',
+                    'value',
+                    None,
+                    "Required property 'location' not present in ResourceUsageDetails JSON",
+                ),
+                'code',
+                'message',
+            ),
+            ('status', 'location', 'code', 'message'),
+            False,
+        ),
+        'ResponseAccepted': (
+            (
+                (
+                    'resources',
+                    'resources',
+                    'model_list',
+                    'ResourceUsageDetails',
+                    "Required property 'resources' not present in ResponseAccepted JSON",
+                ),
+            ),
+            ('resources',),
+            False,
+        ),
+    },
+    'usage_reports_v4': {
+        'AccountSummary': (
+            (
+                (
+                    'account_id',
+                    'account_id',
+                    'value',
+                    None,
+                    "Required property 'account_id' not present in AccountSummary JSON",
+                ),
+                (
+                    'billing_month',
+                    'billing_month',
+                    'value',
+                    None,
+                    "Required property 'billing_month' not present in AccountSummary JSON",
+                ),
+                (
+                    'billing_country_code',
+                    'billing_country_code',
+                    'value',
+                    None,
+                    "Required property 'billing_country_code' not present in AccountSummary JSON",
+                ),
+                (
+                    'billing_currency_code',
+                    'billing_currency_code',
+                    'value',
+                    None,
+                    "Required property 'billing_currency_code' not present in AccountSummary JSON",
+                ),
+                (
+                    'resources',
+                    'resources',
+                    'model',
+                    'ResourcesSummary',
+                    "Required property 'resources' not present in AccountSummary JSON",
+                ),
+                (
+                    'offers',
+                    'offers',
+                    'model_list',
+                    'Offer',
+                    "Required property 'offers' not present in AccountSummary JSON",
+                ),
+                (
+                    'support',
+                    'support',
+                    'model_list',
+                    'SupportSummary',
+                    "Required property 'support' not present in AccountSummary JSON",
+                ),
+                (
+                    'subscription',
+                    'subscription',
+                    'model',
+                    'SubscriptionSummary',
+                    "Required property 'subscription' not present in AccountSummary JSON",
+                ),
+            ),
+            (
+                'account_id',
+                'billing_month',
+                'billing_country_code',
+                'billing_currency_code',
+                'resources',
+                'offers',
+                'support',
+                'subscription',
+            ),
+            False,
+        ),
+        'AccountUsage': (
+            (
+                (
+                    'account_id',
+                    'account_id',
+                    'value',
+                    None,
+                    "Required property 'account_id' not present in AccountUsage JSON",
+                ),
+                (
+                    'pricing_country',
+                    'pricing_country',
+                    'value',
+                    None,
+                    "Required property 'pricing_country' not present in AccountUsage JSON",
+                ),
+                (
+                    'currency_code',
+                    'currency_code',
+                    'value',
+                    None,
+                    "Required property 'currency_code' not present in AccountUsage JSON",
+                ),
+                ('month', 'month', 'value', None, "Required property 'month' not present in AccountUsage JSON"),
+                (
+                    'resources',
+                    'resources',
+                    'model_list',
+                    'Resource',
+                    "Required property 'resources' not present in AccountUsage JSON",
+                ),
+            ),
+            ('account_id', 'pricing_country', 'currency_code', 'month', 'resources'),
+            False,
+        ),
+        'Discount': (
+            (
+                ('ref', 'ref', 'value', None, "Required property 'ref' not present in Discount JSON"),
+                'name',
+                'display_name',
+                ('discount', 'discount', 'value', None, "Required property 'discount' not present in Discount JSON"),
+            ),
+            ('ref', 'name', 'display_name', 'discount'),
+            False,
+        ),
+        'InstanceUsage': (
+            (
+                (
+                    'account_id',
+                    'account_id',
+                    'value',
+                    None,
+                    "Required property 'account_id' not present in InstanceUsage JSON",
+                ),
+                (
+                    'resource_instance_id',
+                    'resource_instance_id',
+                    'value',
+                    None,
+                    "Required property 'resource_instance_id' not present in InstanceUsage JSON",
+                ),
+                'resource_instance_name',
+                (
+                    'resource_id',
+                    'resource_id',
+                    'value',
+                    None,
+                    "Required property 'resource_id' not present in InstanceUsage JSON",
+                ),
+                'resource_name',
+                'resource_group_id',
+                'resource_group_name',
+                'organization_id',
+                'organization_name',
+                'space_id',
+                'space_name',
+                'consumer_id',
+                'region',
+                'pricing_region',
+                (
+                    'pricing_country',
+                    'pricing_country',
+                    'value',
+                    None,
+                    "Required property 'pricing_country' not present in InstanceUsage JSON",
+                ),
+                (
+                    'currency_code',
+                    'currency_code',
+                    'value',
+                    None,
+                    "Required property 'currency_code' not present in InstanceUsage JSON",
+                ),
+                (
+                    'billable',
+                    'billable',
+                    'value',
+                    None,
+                    "Required property 'billable' not present in InstanceUsage JSON",
+                ),
+                ('plan_id', 'plan_id', 'value', None, "Required property 'plan_id' not present in InstanceUsage JSON"),
+                'plan_name',
+                ('month', 'month', 'value', None, "Required property 'month' not present in InstanceUsage JSON"),
+                (
+                    'usage',
+                    'usage',
+                    'model_list',
+                    'Metric',
+                    "Required property 'usage' not present in InstanceUsage JSON",
+                ),
+            ),
+            (
+                'account_id',
+                'resource_instance_id',
+                'resource_instance_name',
+                'resource_id',
+                'resource_name',
+                'resource_group_id',
+                'resource_group_name',
+                'organization_id',
+                'organization_name',
+                'space_id',
+                'space_name',
+                'consumer_id',
+                'region',
+                'pricing_region',
+                'pricing_country',
+                'currency_code',
+                'billable',
+                'plan_id',
+                'plan_name',
+                'month',
+                'usage',
+            ),
+            False,
+        ),
+        'InstancesUsageFirst': (
+            ('href',),
+            ('href',),
+            False,
+        ),
+        'InstancesUsageNext': (
+            (
+                'href',
+                'offset',
+            ),
+            ('href', 'offset'),
+            False,
+        ),
+        'InstancesUsage': (
+            (
+                'limit',
+                'count',
+                ('first', 'first', 'model', 'InstancesUsageFirst', None),
+                ('next', 'next', 'model', 'InstancesUsageNext', None),
+                ('resources', 'resources', 'model_list', 'InstanceUsage', None),
+            ),
+            ('limit', 'count', 'first', 'next', 'resources'),
+            False,
+        ),
+        'Metric': (
+            (
+                ('metric', 'metric', 'value', None, "Required property 'metric' not present in Metric JSON"),
+                'metric_name',
+                ('quantity', 'quantity', 'value', None, "Required property 'quantity' not present in Metric JSON"),
+                'rateable_quantity',
+                ('cost', 'cost', 'value', None, "Required property 'cost' not present in Metric JSON"),
+                (
+                    'rated_cost',
+                    'rated_cost',
+                    'value',
+                    None,
+                    "Required property 'rated_cost' not present in Metric JSON",
+                ),
+                'price',
+                'unit',
+                'unit_name',
+                'non_chargeable',
+                (
+                    'discounts',
+                    'discounts',
+                    'model_list',
+                    'Discount',
+                    "Required property 'discounts' not present in Metric JSON",
+                ),
+            ),
+            (
+                'metric',
+                'metric_name',
+                'quantity',
+                'rateable_quantity',
+                'cost',
+                'rated_cost',
+                'price',
+                'unit',
+                'unit_name',
+                'non_chargeable',
+                'discounts',
+            ),
+            False,
+        ),
+        'Offer': (
+            (
+                ('offer_id', 'offer_id', 'value', None, "Required property 'offer_id' not present in Offer JSON"),
+                (
+                    'credits_total',
+                    'credits_total',
+                    'value',
+                    None,
+                    "Required property 'credits_total' not present in Offer JSON",
+                ),
+                (
+                    'offer_template',
+                    'offer_template',
+                    'value',
+                    None,
+                    "Required property 'offer_template' not present in Offer JSON",
+                ),
+                (
+                    'valid_from',
+                    'valid_from',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'valid_from' not present in Offer JSON",
+                ),
+                (
+                    'expires_on',
+                    'expires_on',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'expires_on' not present in Offer JSON",
+                ),
+                (
+                    'credits',
+                    'credits',
+                    'model',
+                    'OfferCredits',
+                    "Required property 'credits' not present in Offer JSON",
+                ),
+            ),
+            ('offer_id', 'credits_total', 'offer_template', 'valid_from', 'expires_on', 'credits'),
+            False,
+        ),
+        'OfferCredits': (
+            (
+                (
+                    'starting_balance',
+                    'starting_balance',
+                    'value',
+                    None,
+                    "Required property 'starting_balance' not present in OfferCredits JSON",
+                ),
+                ('used', 'used', 'value', None, "Required property 'used' not present in OfferCredits JSON"),
+                ('balance', 'balance', 'value', None, "Required property 'balance' not present in OfferCredits JSON"),
+            ),
+            ('starting_balance', 'used', 'balance'),
+            False,
+        ),
+        'OrgUsage': (
+            (
+                (
+                    'account_id',
+                    'account_id',
+                    'value',
+                    None,
+                    "Required property 'account_id' not present in OrgUsage JSON",
+                ),
+                (
+                    'organization_id',
+                    'organization_id',
+                    'value',
+                    None,
+                    "Required property 'organization_id' not present in OrgUsage JSON",
+                ),
+                'organization_name',
+                (
+                    'pricing_country',
+                    'pricing_country',
+                    'value',
+                    None,
+                    "Required property 'pricing_country' not present in OrgUsage JSON",
+                ),
+                (
+                    'currency_code',
+                    'currency_code',
+                    'value',
+                    None,
+                    "Required property 'currency_code' not present in OrgUsage JSON",
+                ),
+                ('month', 'month', 'value', None, "Required property 'month' not present in OrgUsage JSON"),
+                (
+                    'resources',
+                    'resources',
+                    'model_list',
+                    'Resource',
+                    "Required property 'resources' not present in OrgUsage JSON",
+                ),
+            ),
+            (
+                'account_id',
+                'organization_id',
+                'organization_name',
+                'pricing_country',
+                'currency_code',
+                'month',
+                'resources',
+            ),
+            False,
+        ),
+        'Plan': (
+            (
+                ('plan_id', 'plan_id', 'value', None, "Required property 'plan_id' not present in Plan JSON"),
+                'plan_name',
+                'pricing_region',
+                ('billable', 'billable', 'value', None, "Required property 'billable' not present in Plan JSON"),
+                ('cost', 'cost', 'value', None, "Required property 'cost' not present in Plan JSON"),
+                ('rated_cost', 'rated_cost', 'value', None, "Required property 'rated_cost' not present in Plan JSON"),
+                ('usage', 'usage', 'model_list', 'Metric', "Required property 'usage' not present in Plan JSON"),
+                (
+                    'discounts',
+                    'discounts',
+                    'model_list',
+                    'Discount',
+                    "Required property 'discounts' not present in Plan JSON",
+                ),
+            ),
+            ('plan_id', 'plan_name', 'pricing_region', 'billable', 'cost', 'rated_cost', 'usage', 'discounts'),
+            False,
+        ),
+        'Resource': (
+            (
+                (
+                    'resource_id',
+                    'resource_id',
+                    'value',
+                    None,
+                    "Required property 'resource_id' not present in Resource JSON",
+                ),
+                'resource_name',
+                (
+                    'billable_cost',
+                    'billable_cost',
+                    'value',
+                    None,
+                    "Required property 'billable_cost' not present in Resource JSON",
+                ),
+                (
+                    'billable_rated_cost',
+                    'billable_rated_cost',
+                    'value',
+                    None,
+                    "Required property 'billable_rated_cost' not present in Resource JSON",
+                ),
+                (
+                    'non_billable_cost',
+                    'non_billable_cost',
+                    'value',
+                    None,
+                    "Required property 'non_billable_cost' not present in Resource JSON",
+                ),
+                (
+                    'non_billable_rated_cost',
+                    'non_billable_rated_cost',
+                    'value',
+                    None,
+                    "Required property 'non_billable_rated_cost' not present in Resource JSON",
+                ),
+                ('plans', 'plans', 'model_list', 'Plan', "Required property 'plans' not present in Resource JSON"),
+                (
+                    'discounts',
+                    'discounts',
+                    'model_list',
+                    'Discount',
+                    "Required property 'discounts' not present in Resource JSON",
+                ),
+            ),
+            (
+                'resource_id',
+                'resource_name',
+                'billable_cost',
+                'billable_rated_cost',
+                'non_billable_cost',
+                'non_billable_rated_cost',
+                'plans',
+                'discounts',
+            ),
+            False,
+        ),
+        'ResourceGroupUsage': (
+            (
+                (
+                    'account_id',
+                    'account_id',
+                    'value',
+                    None,
+                    "Required property 'account_id' not present in ResourceGroupUsage JSON",
+                ),
+                (
+                    'resource_group_id',
+                    'resource_group_id',
+                    'value',
+                    None,
+                    "Required property 'resource_group_id' not present in ResourceGroupUsage JSON",
+                ),
+                'resource_group_name',
+                (
+                    'pricing_country',
+                    'pricing_country',
+                    'value',
+                    None,
+                    "Required property 'pricing_country' not present in ResourceGroupUsage JSON",
+                ),
+                (
+                    'currency_code',
+                    'currency_code',
+                    'value',
+                    None,
+                    "Required property 'currency_code' not present in ResourceGroupUsage JSON",
+                ),
+                ('month', 'month', 'value', None, "Required property 'month' not present in ResourceGroupUsage JSON"),
+                (
+                    'resources',
+                    'resources',
+                    'model_list',
+                    'Resource',
+                    "Required property 'resources' not present in ResourceGroupUsage JSON",
+                ),
+            ),
+            (
+                'account_id',
+                'resource_group_id',
+                'resource_group_name',
+                'pricing_country',
+                'currency_code',
+                'month',
+                'resources',
+            ),
+            False,
+        ),
+        'ResourcesSummary': (
+            (
+                (
+                    'billable_cost',
+                    'billable_cost',
+                    'value',
+                    None,
+                    "Required property 'billable_cost' not present in ResourcesSummary JSON",
+                ),
+                (
+                    'non_billable_cost',
+                    'non_billable_cost',
+                    'value',
+                    None,
+                    "Required property 'non_billable_cost' not present in ResourcesSummary JSON",
+                ),
+            ),
+            ('billable_cost', 'non_billable_cost'),
+            False,
+        ),
+        'Subscription': (
+            (
+                (
+                    'subscription_id',
+                    'subscription_id',
+                    'value',
+                    None,
+                    "Required property 'subscription_id' not present in Subscription JSON",
+                ),
+                (
+                    'charge_agreement_number',
+                    'charge_agreement_number',
+                    'value',
+                    None,
+                    "Required property 'charge_agreement_number' not present in Subscription JSON",
+                ),
+                ('type', 'type', 'value', None, "Required property 'type' not present in Subscription JSON"),
+                (
+                    'subscription_amount',
+                    'subscription_amount',
+                    'value',
+                    None,
+                    "Required property 'subscription_amount' not present in Subscription JSON",
+                ),
+                (
+                    'start',
+                    'start',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'start' not present in Subscription JSON",
+                ),
+                ('end', 'end', 'converted', 'string_to_datetime', None),
+                (
+                    'credits_total',
+                    'credits_total',
+                    'value',
+                    None,
+                    "Required property 'credits_total' not present in Subscription JSON",
+                ),
+                (
+                    'terms',
+                    'terms',
+                    'model_list',
+                    'SubscriptionTerm',
+                    "Required property 'terms' not present in Subscription JSON",
+                ),
+            ),
+            (
+                'subscription_id',
+                'charge_agreement_number',
+                'type',
+                'subscription_amount',
+                'start',
+                'end',
+                'credits_total',
+                'terms',
+            ),
+            False,
+        ),
+        'SubscriptionSummary': (
+            (
+                'overage',
+                ('subscriptions', 'subscriptions', 'model_list', 'Subscription', None),
+            ),
+            ('overage', 'subscriptions'),
+            False,
+        ),
+        'SubscriptionTerm': (
+            (
+                (
+                    'start',
+                    'start',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'start' not present in SubscriptionTerm JSON",
+                ),
+                (
+                    'end',
+                    'end',
+                    'converted',
+                    'string_to_datetime',
+                    "Required property 'end' not present in SubscriptionTerm JSON",
+                ),
+                (
+                    'credits',
+                    'credits',
+                    'model',
+                    'SubscriptionTermCredits',
+                    "Required property 'credits' not present in SubscriptionTerm JSON",
+                ),
+            ),
+            ('start', 'end', 'credits'),
+            False,
+        ),
+        'SubscriptionTermCredits': (
+            (
+                (
+                    'total',
+                    'total',
+                    'value',
+                    None,
+                    "Required property 'total' not present in SubscriptionTermCredits JSON",
+                ),
+                (
+                    'starting_balance',
+                    'starting_balance',
+                    'value',
+                    None,
+                    "Required property 'starting_balance' not present in SubscriptionTermCredits JSON",
+                ),
+                ('used', 'used', 'value', None, "Required property 'used' not present in SubscriptionTermCredits JSON"),
+                (
+                    'balance',
+                    'balance',
+                    'value',
+                    None,
+                    "Required property 'balance' not present in SubscriptionTermCredits JSON",
+                ),
+            ),
+            ('total', 'starting_balance', 'used', 'balance'),
+            False,
+        ),
+        'SupportSummary': (
+            (
+                ('cost', 'cost', 'value', None, "Required property 'cost' not present in SupportSummary JSON"),
+                ('type', 'type', 'value', None, "Required property 'type' not present in SupportSummary JSON"),
+                ('overage', 'overage', 'value', None, "Required property 'overage' not present in SupportSummary JSON"),
+            ),
+            ('cost', 'type', 'overage'),
+            False,
+        ),
+    },
+    'user_management_v1': {
+        'InvitedUser': (
+            (
+                'email',
+                'id',
+                'state',
+            ),
+            ('email', 'id', 'state'),
+            False,
+        ),
+        'InvitedUserList': (
+            (('resources', 'resources', 'model_list', 'InvitedUser', None),),
+            ('resources',),
+            False,
+        ),
+        'UserList': (
+            (
+                (
+                    'total_results',
+                    'total_results',
+                    'value',
+                    None,
+                    "Required property 'total_results' not present in UserList JSON",
+                ),
+                ('limit', 'limit', 'value', None, "Required property 'limit' not present in UserList JSON"),
+                'first_url',
+                'next_url',
+                ('resources', 'resources', 'model_list', 'UserProfile', None),
+            ),
+            ('total_results', 'limit', 'first_url', 'next_url', 'resources'),
+            False,
+        ),
+        'UserProfile': (
+            (
+                'id',
+                'iam_id',
+                'realm',
+                'user_id',
+                'firstname',
+                'lastname',
+                'state',
+                'email',
+                'phonenumber',
+                'altphonenumber',
+                'photo',
+                'account_id',
+                'added_on',
+            ),
+            (
+                'id',
+                'iam_id',
+                'realm',
+                'user_id',
+                'firstname',
+                'lastname',
+                'state',
+                'email',
+                'phonenumber',
+                'altphonenumber',
+                'photo',
+                'account_id',
+                'added_on',
+            ),
+            False,
+        ),
+        'UserSettings': (
+            (
+                'language',
+                'notification_language',
+                'allowed_ip_addresses',
+                'self_manage',
+            ),
+            ('language', 'notification_language', 'allowed_ip_addresses', 'self_manage'),
+            False,
+        ),
+        'Attribute': (
+            (
+                'name',
+                'value',
+            ),
+            ('name', 'value'),
+            False,
+        ),
+        'InviteUser': (
+            (
+                'email',
+                'account_role',
+            ),
+            ('email', 'account_role'),
+            False,
+        ),
+        'InviteUserIamPolicy': (
+            (
+                ('type', 'type', 'value', None, "Required property 'type' not present in InviteUserIamPolicy JSON"),
+                ('roles', 'roles', 'model_list', 'Role', None),
+                ('resources', 'resources', 'model_list', 'Resource', None),
+            ),
+            ('type', 'roles', 'resources'),
+            False,
+        ),
+        'Resource': (
+            (('attributes', 'attributes', 'model_list', 'Attribute', None),),
+            ('attributes',),
+            False,
+        ),
+        'Role': (
+            ('role_id',),
+            ('role_id',),
+            False,
+        ),
+    },
+}
@@ -0,0 +1,377 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides helpers that drive the generated pagers (for example
+ResourceInstancesPager) without changing them.
+
+Each generated pager's get_next() method invokes exactly one client operation
+with arguments derived from its page context, then advances the page context
+from the result. The helpers below split a get_next() call into those two
+halves: `record_page_call()` returns the operation and arguments that the next
+get_next() call would send, and `replay_page_call()` feeds an already-obtained
+response back into the pager so that it advances exactly as if it had sent
+the request itself.
+
+The module also provides PrefetchingPager, which retrieves the next pages of a
+generated pager on a worker thread while the caller consumes the current one,
+and ParallelOffsetPager, which retrieves the pages of an offset-paged operation
+concurrently.
+"""
+
+import collections
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import queue
+import threading
+from typing import Iterator, List
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+from . import instrumentation
+
+
+class PageCall:
+    """
+    The client operation that a pager would invoke to retrieve its next page.
+
+    :attr str operation: The name of the client method, for example `list_resource_instances`.
+    :attr dict kwargs: The keyword arguments passed to the client method.
+    :attr int page: The number of the page, as reported to the instrumentation.
+    """
+
+    def __init__(self, operation: str, kwargs: dict, page: int = None) -> None:
+        self.operation = operation
+        self.kwargs = kwargs
+        self.page = page
+
+    def invoke(self, client) -> DetailedResponse:
+        """
+        Invoke the operation on a client.
+        """
+        with instrumentation.page_scope(self.page):
+            return getattr(client, self.operation)(**self.kwargs)
+
+
+class _RecordedCall(Exception):
+    def __init__(self, call: PageCall) -> None:
+        super().__init__(call.operation)
+        self.call = call
+
+
+class _RecordingClient:
+    """
+    Stands in for a pager's client and aborts get_next() as soon as it invokes an operation.
+    """
+
+    def __getattr__(self, name):
+        def record(**kwargs):
+            raise _RecordedCall(PageCall(name, kwargs, instrumentation.get_page()))
+
+        return record
+
+
+class _ReplayingClient:
+    """
+    Stands in for a pager's client and answers the next operation with a given response.
+    """
+
+    def __init__(self, response: DetailedResponse) -> None:
+        self._response = response
+
+    def __getattr__(self, name):
+        def replay(**kwargs):  # pylint: disable=unused-argument
+            return self._response
+
+        return replay
+
+
+def record_page_call(pager) -> PageCall:
+    """
+    Return the operation that the pager's next get_next() call would invoke,
+    without invoking it and without changing the state of the pager.
+
+    :param pager: A generated pager for which has_next() returns True.
+    :return: The recorded operation.
+    :rtype: PageCall
+    """
+    client = pager._client
+    pager._client = _RecordingClient()
+    try:
+        pager.get_next()
+    except _RecordedCall as recorded:
+        return recorded.call
+    finally:
+        pager._client = client
+    raise RuntimeError('{0}.get_next() did not invoke a client operation'.format(type(pager).__name__))
+
+
+def replay_page_call(pager, response: DetailedResponse) -> List[dict]:
+    """
+    Advance a pager with the response to the operation returned by
+    record_page_call(), as if its get_next() method had received it.
+
+    :param pager: The pager that the operation was recorded from.
+    :param DetailedResponse response: The response to the recorded operation.
+    :return: The page of results, as returned by the pager's get_next() method.
+    :rtype: List[dict]
+    """
+    client = pager._client
+    pager._client = _ReplayingClient(response)
+    try:
+        return pager.get_next()
+    finally:
+        pager._client = client
+
+
+class PrefetchingPager:
+    """
+    Wraps a generated pager so that the next pages are retrieved on a worker thread
+    while the caller is still consuming the current one.
+
+    The wrapped pager must not be used directly once it has been wrapped. The
+    worker thread stops when all pages have been retrieved or when close() is
+    called; use the PrefetchingPager as a context manager to close it when the
+    iteration ends early.
+
+    :param pager: A generated pager, for example a ResourceInstancesPager.
+    :param int depth: (optional) The number of pages retrieved ahead of the page
+           most recently returned to the caller.
+    """
+
+    _DONE = object()
+
+    def __init__(self, pager, *, depth: int = 1) -> None:
+        if depth < 1:
+            raise ValueError('depth must be at least 1')
+        self._pager = pager
+        self._depth = depth
+        self._pages = queue.Queue()
+        self._slots = threading.Semaphore(depth)
+        self._closed = False
+        self._head = None
+        self._thread = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are more results to be retrieved. This waits for the
+        next page to be retrieved if necessary.
+        """
+        return self._peek() is not self._DONE
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :rtype: List[dict]
+        """
+        page = self._peek()
+        if page is self._DONE:
+            raise StopIteration('No more results available')
+        self._head = None
+        self._slots.release()
+        return page
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
+    def close(self) -> None:
+        """
+        Stop retrieving pages ahead of the caller.
+        """
+        self._closed = True
+        self._slots.release()
+
+    def __enter__(self) -> 'PrefetchingPager':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _peek(self):
+        if self._head is None:
+            if self._closed:
+                return self._DONE
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._fetch_pages, daemon=True)
+                self._thread.start()
+            self._head = self._pages.get()
+            if isinstance(self._head, BaseException):
+                error, self._head = self._head, self._DONE
+                raise error
+        return self._head
+
+    def _fetch_pages(self) -> None:
+        try:
+            while True:
+                self._slots.acquire()  # pylint: disable=consider-using-with
+                if self._closed or not self._pager.has_next():
+                    break
+                self._pages.put(self._pager.get_next() or [])
+        except Exception as error:  # pylint: disable=broad-except
+            # Re-raised to the caller by the get_next() call that would have returned the failed page.
+            self._pages.put(error)
+        else:
+            self._pages.put(self._DONE)
+
+
+# The result properties that hold the items and the total number of items of the
+# offset-paged operations whose first page reports the total.
+OFFSET_PAGED_OPERATIONS = {
+    'get_cases': ('cases', 'total_count'),
+    'list_access_group_members': ('members', 'total_count'),
+    'list_access_groups': ('groups', 'total_count'),
+    'list_catalog_entries': ('resources', 'count'),
+    'list_offerings': ('resources', 'total_count'),
+    'search_objects': ('resources', 'total_count'),
+}
+
+
+class ParallelOffsetPager:
+    """
+    Retrieves all the pages of an offset-paged operation concurrently.
+
+    The first page is retrieved on its own to learn the total number of items and
+    the page size; the offsets of the remaining pages are then known up front and
+    they are retrieved by a bounded pool of worker threads. Pages are returned in
+    order regardless of the order in which they arrive, and at most
+    `2 * max_workers` pages are held in memory at once.
+
+    Example:
+        pager = ParallelOffsetPager(
+            client=global_catalog_service, operation='list_catalog_entries', limit=200, max_workers=8
+        )
+        for entry in pager:
+            ...
+
+    :param client: The service client.
+    :param str operation: The name of the client method, for example `list_catalog_entries`.
+    :param int limit: (optional) The page size requested from the service. If not
+           specified, the page size chosen by the service for the first page is used.
+    :param int max_workers: (optional) The number of pages retrieved concurrently.
+    :param str items_key: (optional) The result property that holds the items; required
+           for operations not listed in OFFSET_PAGED_OPERATIONS.
+    :param str total_key: (optional) The result property that holds the total number of
+           items; required for operations not listed in OFFSET_PAGED_OPERATIONS.
+    :param kwargs: The other arguments of the operation.
+    """
+
+    def __init__(
+        self,
+        *,
+        client,
+        operation: str,
+        limit: int = None,
+        max_workers: int = 4,
+        items_key: str = None,
+        total_key: str = None,
+        **kwargs,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        default_items_key, default_total_key = OFFSET_PAGED_OPERATIONS.get(operation, (None, None))
+        self._items_key = items_key or default_items_key
+        self._total_key = total_key or default_total_key
+        if self._items_key is None or self._total_key is None:
+            raise ValueError('items_key and total_key must be provided for operation {0}'.format(operation))
+        self._method = getattr(client, operation)
+        self._limit = limit
+        self._max_workers = max_workers
+        self._kwargs = kwargs
+        self._pages = None
+        self._head = None
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are more results to be retrieved.
+        """
+        if self._head is None:
+            if self._pages is None:
+                self._pages = self._retrieve_pages()
+            self._head = next(self._pages, None)
+        return self._head is not None
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration('No more results available')
+        page, self._head = self._head, None
+        return page
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def __iter__(self) -> Iterator[dict]:
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
+    def _get_page(self, offset: int, limit: int, page: int) -> dict:
+        with instrumentation.page_scope(page):
+            return self._method(offset=offset, limit=limit, **self._kwargs).get_result()
+
+    def _retrieve_pages(self) -> Iterator[List[dict]]:
+        first = self._get_page(0, self._limit, 1)
+        items = first.get(self._items_key) or []
+        yield items
+
+        total = first.get(self._total_key) or 0
+        if not items or len(items) >= total:
+            return
+        # A service may return fewer items than the limit requested, and still
+        # report that limit, so the first page sets the size of the others.
+        page_size = len(items)
+        offsets = enumerate(range(len(items), total, page_size), 2)
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            pending = collections.deque()
+            for number, offset in itertools.islice(offsets, 2 * self._max_workers):
+                pending.append(executor.submit(self._get_page, offset, page_size, number))
+            try:
+                while pending:
+                    page = pending.popleft().result()
+                    for number, offset in itertools.islice(offsets, 1):
+                        pending.append(executor.submit(self._get_page, offset, page_size, number))
+                    yield page.get(self._items_key) or []
+            finally:
+                for future in pending:
+                    future.cancel()
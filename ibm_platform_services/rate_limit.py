@@ -0,0 +1,388 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides an opt-in client-side rate limiter, which paces the
+requests sent to each service and host so that bulk jobs stay under the
+rate limits of the platform instead of provoking bursts of 429 responses.
+
+A RateLimiter holds a token bucket per service name and host. The clients
+that share a limiter share its buckets; DEFAULT_RATE_LIMITER is shared by
+all the clients of the process that use it:
+
+    from ibm_platform_services import rate_limit
+
+    rate_limit.DEFAULT_RATE_LIMITER.set_limit(20, service_name='global_tagging')
+    rate_limit.set_rate_limiter(tagging_service)
+
+A bucket without a configured limit lets requests through until the service
+answers 429 Too Many Requests. It then limits the rate to a fraction of the
+rate observed, waits for the delay of the Retry-After header, and sends the
+request again. The rate then grows back to just under the rate that was
+throttled, and only probes above it after `probe_interval` seconds without a
+429, so the throughput settles just under the service's limit. A request is
+only sent again if its body can be: bodies held in memory, and file objects
+that can seek back to where they started; a throttled request whose body is a
+generator or a file object that cannot seek raises its 429 error instead.
+
+The 429 responses retried by the retry policy of `enable_retries()` are not
+seen by the limiter; disable the retries of 429 responses, or leave them to
+the limiter.
+"""
+
+import asyncio
+import datetime
+import email.utils
+import functools
+import io
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from ibm_cloud_sdk_core import ApiException, BaseService, DetailedResponse
+
+from .middleware import SendMiddleware, install_middleware
+
+# The request bodies held in memory, which can be sent again as they are.
+_MEMORY_BODIES = (bytes, bytearray, memoryview, str, dict, list, tuple)
+
+
+class TokenBucket:
+    """
+    A token bucket that paces requests, and adapts its rate to the 429
+    responses of the service.
+
+    :param float rate: (optional) The maximum number of requests per second,
+           or None to send requests without a limit until one is throttled.
+    :param float burst: (optional) The number of requests that may be sent at
+           once after the bucket has been idle.
+    :param float backoff: (optional) The factor applied to the rate when a
+           request is throttled.
+    :param float probe_interval: (optional) The number of seconds after a 429
+           response during which the rate stays under the throttled rate.
+    :param clock: (optional) The function that returns the current time in seconds.
+
+    :attr float rate: The current rate, in requests per second, or None if unlimited.
+    :attr int throttled: The number of 429 responses received.
+    """
+
+    def __init__(
+        self,
+        rate: float = None,
+        *,
+        burst: float = 1,
+        backoff: float = 0.8,
+        probe_interval: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError('rate must be positive')
+        if not 0 < backoff < 1:
+            raise ValueError('backoff must be between 0 and 1')
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.backoff = backoff
+        self.probe_interval = probe_interval
+        self.throttled = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = burst
+        self._updated = clock()
+        # The rate at which the most recent 429 response was received, and until when to stay under it.
+        self._ceiling = None
+        self._probe_after = None
+        # Until when the requests are held after the most recent 429 response.
+        self._resume_at = None
+        # The requests that succeeded since _period_start, the end of the most recent hold.
+        self._successes = 0
+        self._period_start = self._updated
+
+    def reserve(self) -> float:
+        """
+        Reserve the sending of a request.
+
+        :return: The number of seconds to wait before sending it.
+        """
+        with self._lock:
+            now = self._clock()
+            if now > self._updated:
+                if self.rate is not None:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            if self.rate is None:
+                return self._updated - now
+            self._tokens -= 1
+            return self._updated - now + max(0.0, -self._tokens) / self.rate
+
+    def succeeded(self) -> None:
+        """
+        Record a request that was not throttled; the rate grows back towards its limit.
+        """
+        with self._lock:
+            self._successes += 1
+            if self.rate is None:
+                return
+            cap = self.max_rate
+            if self._ceiling is not None:
+                if self._clock() < self._probe_after:
+                    cap = 0.95 * self._ceiling if cap is None else min(cap, 0.95 * self._ceiling)
+                elif cap is None:
+                    # Probe above the throttled rate, by at most a half of it at a time.
+                    cap = 1.5 * self._ceiling
+            self.rate = max(self.rate, min(cap, self.rate * 1.02))
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Record a 429 response: lower the rate, and hold the requests until the
+        delay of its Retry-After header has passed.
+
+        :param float retry_after: (optional) The delay in seconds, if the response had one.
+        """
+        with self._lock:
+            now = self._clock()
+            self.throttled += 1
+            if self._resume_at is not None and now < self._resume_at:
+                # Sent before the previous 429 response was received: the rate is already lowered.
+                return
+            # The rate the service accepted: the requests that succeeded since the end of the
+            # previous hold, over the time until the service accepts requests again.
+            period = now - self._period_start + (retry_after or 0)
+            rate = self._successes / period if self._successes and period > 0 else None
+            if rate is None or (self.rate is not None and rate > self.rate):
+                rate = self.rate
+            # Without a rate to lower yet, the requests are only held.
+            if rate is not None:
+                if self._probe_after is None or now >= self._probe_after or rate < self._ceiling:
+                    self._ceiling = rate
+                self.rate = max(rate * self.backoff, 0.01)
+                self._probe_after = now + self.probe_interval
+            if retry_after is None:
+                retry_after = 1.0 if self.rate is None else 1 / self.rate
+            self._resume_at = now + retry_after
+            self._updated = max(self._updated, self._resume_at)
+            # No burst after the hold: the first request then goes at once, and the others at the new
+            # rate, after the requests already waiting.
+            self._tokens = min(self._tokens, 0) + 1
+            self._successes = 0
+            self._period_start = self._resume_at
+
+
+class RateLimiter:
+    """
+    The token buckets that pace the requests of the clients that share the
+    limiter, one per service name and host.
+
+    :param float rate: (optional) The maximum number of requests per second
+           to each service and host, or None to adapt to the 429 responses only.
+    :param float burst: (optional) The number of requests that may be sent at
+           once to a service and host after they have been idle.
+    :param int max_retries: (optional) The number of times a throttled request
+           is sent again.
+    :param clock: (optional) The function that returns the current time in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = None,
+        burst: float = 1,
+        max_retries: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_retries = max_retries
+        self._clock = clock
+        self._limits = {(None, None): (rate, burst)}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def set_limit(self, rate: Optional[float], burst: float = 1, *, service_name: str = None, host: str = None) -> None:
+        """
+        Set the maximum rate of the requests to a service, a host, or a
+        service on a host. The most specific limit applies; buckets already
+        created are replaced.
+
+        :param float rate: The maximum number of requests per second, or None to
+               adapt to the 429 responses only.
+        :param float burst: (optional) The number of requests that may be sent at once.
+        :param str service_name: (optional) The service name, for example `global_tagging`.
+        :param str host: (optional) The host name, with its port if it is not the default one.
+        """
+        with self._lock:
+            self._limits[(service_name, host)] = (rate, burst)
+            for key in [k for k in self._buckets if service_name in (None, k[0]) and host in (None, k[1])]:
+                del self._buckets[key]
+
+    def get_bucket(self, service_name: str, host: str) -> TokenBucket:
+        """
+        Return the token bucket of a service and host.
+        """
+        key = (service_name, host)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    rate, burst = self._get_limit(service_name, host)
+                    bucket = self._buckets[key] = TokenBucket(rate, burst=burst, clock=self._clock)
+        return bucket
+
+    @property
+    def buckets(self) -> Dict[Tuple[str, str], TokenBucket]:
+        """The token buckets created so far, by service name and host."""
+        return dict(self._buckets)
+
+    def _get_limit(self, service_name: str, host: str) -> Tuple[Optional[float], float]:
+        for key in ((service_name, host), (service_name, None), (None, host), (None, None)):
+            if key in self._limits:
+                return self._limits[key]
+        raise AssertionError('the default limit is always set')  # pragma: no cover
+
+
+DEFAULT_RATE_LIMITER = RateLimiter()
+
+
+def set_rate_limiter(service: BaseService, limiter: Optional[RateLimiter] = DEFAULT_RATE_LIMITER) -> BaseService:
+    """
+    Pace the requests of a service client with a rate limiter.
+
+    :param BaseService service: The service client.
+    :param RateLimiter limiter: (optional) The limiter; by default the limiter
+           shared by the whole process. None stops pacing the requests.
+    :return: The service client passed in.
+    """
+    service.rate_limiter = limiter
+    if limiter is not None:
+        install_middleware(service, _RateLimitedSend)
+    return service
+
+
+def get_rate_limiter(service: BaseService) -> Optional[RateLimiter]:
+    """
+    Return the rate limiter of a service client, or None.
+    """
+    return getattr(service, 'rate_limiter', None)
+
+
+def get_retry_after(headers) -> Optional[float]:
+    """
+    Return the delay in seconds of the Retry-After header of a response, if any.
+    The header holds either a number of seconds or an HTTP date.
+    """
+    value = headers.get('Retry-After') if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+def _rewinder(request: dict) -> Optional[Callable[[], None]]:
+    # Returns a function that prepares the body of a request to be sent again, or
+    # None if it cannot be: multipart files, generators and file objects that
+    # cannot seek are consumed when they are sent, and would be sent again empty.
+    data = request.get('data')
+    if request.get('files'):
+        return None
+    if data is None or isinstance(data, _MEMORY_BODIES):
+        return _no_rewind
+    try:
+        if data.seekable():
+            return functools.partial(data.seek, data.tell())
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+    return None
+
+
+def _no_rewind() -> None:
+    pass
+
+
+def _throttle(
+    limiter: RateLimiter,
+    bucket: TokenBucket,
+    error: ApiException,
+    attempt: int,
+    rewind: Optional[Callable[[], None]],
+) -> None:
+    # Records the response of a failed request, and raises the error unless the request is to be sent again.
+    if error.code != 429:
+        bucket.succeeded()
+        raise error
+    bucket.throttle(get_retry_after(getattr(error.http_response, 'headers', None)))
+    if attempt >= limiter.max_retries or rewind is None:
+        raise error
+    try:
+        rewind()
+    except (OSError, io.UnsupportedOperation):
+        raise error from None
+
+
+class _RateLimitedSend(SendMiddleware):
+    """
+    Replaces the send() method of a service client, pacing its requests with
+    the token bucket of their service and host.
+    """
+
+    def __call__(self, request: dict, **kwargs):
+        service = self.service
+        limiter = getattr(service, 'rate_limiter', None)
+        if limiter is None:
+            return self.send_next(service, request, **kwargs)
+        service_name = getattr(service, 'DEFAULT_SERVICE_NAME', type(service).__name__)
+        bucket = limiter.get_bucket(service_name, urlsplit(request['url']).netloc)
+        if getattr(service, 'is_async', False):
+            return self._send_async(service, limiter, bucket, request, kwargs)
+
+        attempt = 0
+        rewind = _rewinder(request)
+        while True:
+            delay = bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                response = self.send_next(service, request, **kwargs)
+            except ApiException as error:
+                _throttle(limiter, bucket, error, attempt, rewind)
+                attempt += 1
+                continue
+            bucket.succeeded()
+            return response
+
+    async def _send_async(self, service, limiter, bucket, request, kwargs) -> DetailedResponse:
+        attempt = 0
+        rewind = _rewinder(request)
+        while True:
+            delay = bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                response = await self.send_next(service, request, **kwargs)
+            except ApiException as error:
+                _throttle(limiter, bucket, error, attempt, rewind)
+                attempt += 1
+                continue
+            bucket.succeeded()
+            return response
@@ -26,15 +26,16 @@ API Version: 2.0
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, Iterator, List
 import json
 
 from ibm_cloud_sdk_core import BaseService, DetailedResponse, get_query_param
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
-from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
+from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string
 
-from .common import get_sdk_headers
+from . import instrumentation, json_codec
+from .common import LazyDatetimeAttribute, RequestTemplate, get_sdk_headers, lazy_datetime
 
 ##############################################################################
 # Service
@@ -47,6 +48,16 @@ class ResourceControllerV2(BaseService):
     DEFAULT_SERVICE_URL = 'https://resource-controller.cloud.ibm.com'
     DEFAULT_SERVICE_NAME = 'resource_controller'
 
+    # The prepared requests of the operations that are called at high rates.
+    _get_resource_instance_request = RequestTemplate(
+        'GET',
+        '/v2/resource_instances/{id}',
+        service_name=DEFAULT_SERVICE_NAME,
+        service_version='V2',
+        operation_id='get_resource_instance',
+        accept='application/json',
+    )
+
     @classmethod
     def new_instance(
         cls,
@@ -73,6 +84,8 @@ class ResourceControllerV2(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # Resource Instances
@@ -229,7 +242,7 @@ class ResourceControllerV2(BaseService):
             'parameters': parameters,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -258,22 +271,7 @@ class ResourceControllerV2(BaseService):
 
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_resource_instance'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['id']
-        path_param_values = self.encode_path_vars(id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v2/resource_instances/{id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = self._get_resource_instance_request.prepare(self, (id,), custom_headers=kwargs.pop('headers', None))
 
         response = self.send(request, **kwargs)
         return response
@@ -365,7 +363,7 @@ class ResourceControllerV2(BaseService):
             'allow_cleanup': allow_cleanup,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -685,7 +683,7 @@ class ResourceControllerV2(BaseService):
 
         data = {'name': name, 'source': source, 'parameters': parameters, 'role': role}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -794,7 +792,7 @@ class ResourceControllerV2(BaseService):
 
         data = {'name': name}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -932,7 +930,7 @@ class ResourceControllerV2(BaseService):
 
         data = {'source': source, 'target': target, 'name': name, 'parameters': parameters, 'role': role}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1042,7 +1040,7 @@ class ResourceControllerV2(BaseService):
 
         data = {'name': name}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1166,7 +1164,7 @@ class ResourceControllerV2(BaseService):
 
         data = {'name': name, 'source': source, 'target': target}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1280,7 +1278,7 @@ class ResourceControllerV2(BaseService):
 
         data = {'name': name}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1415,7 +1413,7 @@ class ResourceControllerV2(BaseService):
 
         data = {'request_by': request_by, 'comment': comment}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1628,6 +1626,9 @@ class PlanHistoryItem:
     :attr str requestor_id: (optional) The subject who made the plan change.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    start_date = LazyDatetimeAttribute()
+
     def __init__(self, resource_plan_id: str, start_date: datetime, *, requestor_id: str = None) -> None:
         """
         Initialize a PlanHistoryItem object.
@@ -1650,7 +1651,7 @@ class PlanHistoryItem:
         else:
             raise ValueError('Required property \'resource_plan_id\' not present in PlanHistoryItem JSON')
         if 'start_date' in _dict:
-            args['start_date'] = string_to_datetime(_dict.get('start_date'))
+            args['start_date'] = lazy_datetime(_dict.get('start_date'))
         else:
             raise ValueError('Required property \'start_date\' not present in PlanHistoryItem JSON')
         if 'requestor_id' in _dict:
@@ -1720,6 +1721,10 @@ class Reclamation:
     :attr str updated_by: (optional) The subject who updated the reclamation.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    created_at = LazyDatetimeAttribute()
+    updated_at = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -1811,11 +1816,11 @@ class Reclamation:
         if 'custom_properties' in _dict:
             args['custom_properties'] = _dict.get('custom_properties')
         if 'created_at' in _dict:
-            args['created_at'] = string_to_datetime(_dict.get('created_at'))
+            args['created_at'] = lazy_datetime(_dict.get('created_at'))
         if 'created_by' in _dict:
             args['created_by'] = _dict.get('created_by')
         if 'updated_at' in _dict:
-            args['updated_at'] = string_to_datetime(_dict.get('updated_at'))
+            args['updated_at'] = lazy_datetime(_dict.get('updated_at'))
         if 'updated_by' in _dict:
             args['updated_by'] = _dict.get('updated_by')
         return cls(**args)
@@ -1982,6 +1987,11 @@ class ResourceAlias:
           for the alias.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    created_at = LazyDatetimeAttribute()
+    updated_at = LazyDatetimeAttribute()
+    deleted_at = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -2086,11 +2096,11 @@ class ResourceAlias:
         if 'url' in _dict:
             args['url'] = _dict.get('url')
         if 'created_at' in _dict:
-            args['created_at'] = string_to_datetime(_dict.get('created_at'))
+            args['created_at'] = lazy_datetime(_dict.get('created_at'))
         if 'updated_at' in _dict:
-            args['updated_at'] = string_to_datetime(_dict.get('updated_at'))
+            args['updated_at'] = lazy_datetime(_dict.get('updated_at'))
         if 'deleted_at' in _dict:
-            args['deleted_at'] = string_to_datetime(_dict.get('deleted_at'))
+            args['deleted_at'] = lazy_datetime(_dict.get('deleted_at'))
         if 'created_by' in _dict:
             args['created_by'] = _dict.get('created_by')
         if 'updated_by' in _dict:
@@ -2331,6 +2341,11 @@ class ResourceBinding:
           that this binding is associated with.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    created_at = LazyDatetimeAttribute()
+    updated_at = LazyDatetimeAttribute()
+    deleted_at = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -2443,11 +2458,11 @@ class ResourceBinding:
         if 'url' in _dict:
             args['url'] = _dict.get('url')
         if 'created_at' in _dict:
-            args['created_at'] = string_to_datetime(_dict.get('created_at'))
+            args['created_at'] = lazy_datetime(_dict.get('created_at'))
         if 'updated_at' in _dict:
-            args['updated_at'] = string_to_datetime(_dict.get('updated_at'))
+            args['updated_at'] = lazy_datetime(_dict.get('updated_at'))
         if 'deleted_at' in _dict:
-            args['deleted_at'] = string_to_datetime(_dict.get('deleted_at'))
+            args['deleted_at'] = lazy_datetime(_dict.get('deleted_at'))
         if 'created_by' in _dict:
             args['created_by'] = _dict.get('created_by')
         if 'updated_by' in _dict:
@@ -2800,6 +2815,13 @@ class ResourceInstance:
           is locked or not.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    created_at = LazyDatetimeAttribute()
+    updated_at = LazyDatetimeAttribute()
+    deleted_at = LazyDatetimeAttribute()
+    scheduled_reclaim_at = LazyDatetimeAttribute()
+    restored_at = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -2969,11 +2991,11 @@ class ResourceInstance:
         if 'url' in _dict:
             args['url'] = _dict.get('url')
         if 'created_at' in _dict:
-            args['created_at'] = string_to_datetime(_dict.get('created_at'))
+            args['created_at'] = lazy_datetime(_dict.get('created_at'))
         if 'updated_at' in _dict:
-            args['updated_at'] = string_to_datetime(_dict.get('updated_at'))
+            args['updated_at'] = lazy_datetime(_dict.get('updated_at'))
         if 'deleted_at' in _dict:
-            args['deleted_at'] = string_to_datetime(_dict.get('deleted_at'))
+            args['deleted_at'] = lazy_datetime(_dict.get('deleted_at'))
         if 'created_by' in _dict:
             args['created_by'] = _dict.get('created_by')
         if 'updated_by' in _dict:
@@ -2981,9 +3003,9 @@ class ResourceInstance:
         if 'deleted_by' in _dict:
             args['deleted_by'] = _dict.get('deleted_by')
         if 'scheduled_reclaim_at' in _dict:
-            args['scheduled_reclaim_at'] = string_to_datetime(_dict.get('scheduled_reclaim_at'))
+            args['scheduled_reclaim_at'] = lazy_datetime(_dict.get('scheduled_reclaim_at'))
         if 'restored_at' in _dict:
-            args['restored_at'] = string_to_datetime(_dict.get('restored_at'))
+            args['restored_at'] = lazy_datetime(_dict.get('restored_at'))
         if 'restored_by' in _dict:
             args['restored_by'] = _dict.get('restored_by')
         if 'scheduled_reclaim_by' in _dict:
@@ -3491,6 +3513,11 @@ class ResourceKey:
           that this binding is associated with.
     """
 
+    # Date-time properties, parsed from their string form on first access.
+    created_at = LazyDatetimeAttribute()
+    updated_at = LazyDatetimeAttribute()
+    deleted_at = LazyDatetimeAttribute()
+
     def __init__(
         self,
         *,
@@ -3592,11 +3619,11 @@ class ResourceKey:
         if 'url' in _dict:
             args['url'] = _dict.get('url')
         if 'created_at' in _dict:
-            args['created_at'] = string_to_datetime(_dict.get('created_at'))
+            args['created_at'] = lazy_datetime(_dict.get('created_at'))
         if 'updated_at' in _dict:
-            args['updated_at'] = string_to_datetime(_dict.get('updated_at'))
+            args['updated_at'] = lazy_datetime(_dict.get('updated_at'))
         if 'deleted_at' in _dict:
-            args['deleted_at'] = string_to_datetime(_dict.get('deleted_at'))
+            args['deleted_at'] = lazy_datetime(_dict.get('deleted_at'))
         if 'created_by' in _dict:
             args['created_by'] = _dict.get('created_by')
         if 'updated_by' in _dict:
@@ -3943,20 +3970,21 @@ class ResourceInstancesPager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.list_resource_instances(
-            guid=self._guid,
-            name=self._name,
-            resource_group_id=self._resource_group_id,
-            resource_id=self._resource_id,
-            resource_plan_id=self._resource_plan_id,
-            type=self._type,
-            sub_type=self._sub_type,
-            limit=self._limit,
-            state=self._state,
-            updated_from=self._updated_from,
-            updated_to=self._updated_to,
-            start=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.list_resource_instances(
+                guid=self._guid,
+                name=self._name,
+                resource_group_id=self._resource_group_id,
+                resource_id=self._resource_id,
+                resource_plan_id=self._resource_plan_id,
+                type=self._type,
+                sub_type=self._sub_type,
+                limit=self._limit,
+                state=self._state,
+                updated_from=self._updated_from,
+                updated_to=self._updated_to,
+                start=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next_url')
@@ -3968,6 +3996,18 @@ class ResourceInstancesPager:
 
         return result.get('resources')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of ResourceInstance.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
@@ -4020,11 +4060,12 @@ class ResourceAliasesForInstancePager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.list_resource_aliases_for_instance(
-            id=self._id,
-            limit=self._limit,
-            start=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.list_resource_aliases_for_instance(
+                id=self._id,
+                limit=self._limit,
+                start=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next_url')
@@ -4036,6 +4077,18 @@ class ResourceAliasesForInstancePager:
 
         return result.get('resources')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of ResourceAlias.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
@@ -4088,11 +4141,12 @@ class ResourceKeysForInstancePager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.list_resource_keys_for_instance(
-            id=self._id,
-            limit=self._limit,
-            start=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.list_resource_keys_for_instance(
+                id=self._id,
+                limit=self._limit,
+                start=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next_url')
@@ -4104,6 +4158,18 @@ class ResourceKeysForInstancePager:
 
         return result.get('resources')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of ResourceKey.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
@@ -4172,16 +4238,17 @@ class ResourceKeysPager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.list_resource_keys(
-            guid=self._guid,
-            name=self._name,
-            resource_group_id=self._resource_group_id,
-            resource_id=self._resource_id,
-            limit=self._limit,
-            updated_from=self._updated_from,
-            updated_to=self._updated_to,
-            start=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.list_resource_keys(
+                guid=self._guid,
+                name=self._name,
+                resource_group_id=self._resource_group_id,
+                resource_id=self._resource_id,
+                limit=self._limit,
+                updated_from=self._updated_from,
+                updated_to=self._updated_to,
+                start=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next_url')
@@ -4193,6 +4260,18 @@ class ResourceKeysPager:
 
         return result.get('resources')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of ResourceKey.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
@@ -4266,17 +4345,18 @@ class ResourceBindingsPager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.list_resource_bindings(
-            guid=self._guid,
-            name=self._name,
-            resource_group_id=self._resource_group_id,
-            resource_id=self._resource_id,
-            region_binding_id=self._region_binding_id,
-            limit=self._limit,
-            updated_from=self._updated_from,
-            updated_to=self._updated_to,
-            start=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.list_resource_bindings(
+                guid=self._guid,
+                name=self._name,
+                resource_group_id=self._resource_group_id,
+                resource_id=self._resource_id,
+                region_binding_id=self._region_binding_id,
+                limit=self._limit,
+                updated_from=self._updated_from,
+                updated_to=self._updated_to,
+                start=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next_url')
@@ -4288,6 +4368,18 @@ class ResourceBindingsPager:
 
         return result.get('resources')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of ResourceBinding.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
@@ -4365,18 +4457,19 @@ class ResourceAliasesPager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.list_resource_aliases(
-            guid=self._guid,
-            name=self._name,
-            resource_instance_id=self._resource_instance_id,
-            region_instance_id=self._region_instance_id,
-            resource_id=self._resource_id,
-            resource_group_id=self._resource_group_id,
-            limit=self._limit,
-            updated_from=self._updated_from,
-            updated_to=self._updated_to,
-            start=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.list_resource_aliases(
+                guid=self._guid,
+                name=self._name,
+                resource_instance_id=self._resource_instance_id,
+                region_instance_id=self._region_instance_id,
+                resource_id=self._resource_id,
+                resource_group_id=self._resource_group_id,
+                limit=self._limit,
+                updated_from=self._updated_from,
+                updated_to=self._updated_to,
+                start=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next_url')
@@ -4388,6 +4481,18 @@ class ResourceAliasesPager:
 
         return result.get('resources')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of ResourceAlias.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
@@ -4440,11 +4545,12 @@ class ResourceBindingsForAliasPager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.list_resource_bindings_for_alias(
-            id=self._id,
-            limit=self._limit,
-            start=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.list_resource_bindings_for_alias(
+                id=self._id,
+                limit=self._limit,
+                start=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next_url')
@@ -4456,6 +4562,18 @@ class ResourceBindingsForAliasPager:
 
         return result.get('resources')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of ResourceBinding.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
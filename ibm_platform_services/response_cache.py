@@ -0,0 +1,297 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides an opt-in, read-through cache for the results of GET
+operations that return slow-changing reference data, such as catalog entries,
+pricing, IAM roles and quota definitions.
+
+A ResponseCache is set on one or more service clients:
+
+    from ibm_platform_services import response_cache
+
+    cache = response_cache.ResponseCache(ttls={'get_catalog_entry': 600, 'get_pricing': 600})
+    response_cache.set_cache(global_catalog_service, cache)
+
+The result of a cached operation is reused until its time to live expires.
+When the service returned an ETag with it, the expired result is then
+revalidated with an If-None-Match request, and reused again if the service
+answers 304 Not Modified. The least recently used results are evicted when
+the cache holds more than `max_entries` results or `max_bytes` bytes.
+
+Results are cached per operation, URL, query parameters, request headers and
+credentials, so a cache can be shared by clients that use different
+credentials. Each hit returns a new copy of the result, which the caller may
+modify. The calls answered from the cache are not sent, so they are not
+reported to the client's instrumentation; the cache counts its hits and
+misses per operation instead.
+"""
+
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Optional
+
+from requests.structures import CaseInsensitiveDict
+from ibm_cloud_sdk_core import ApiException, BaseService, DetailedResponse
+
+from . import instrumentation, json_codec
+from .common import request_key
+from .middleware import SendMiddleware, install_middleware
+
+# The times to live, in seconds, of the operations cached by default.
+DEFAULT_TTLS = {
+    'get_catalog_entry': 300,
+    'get_pricing': 300,
+    'list_roles': 300,
+    'get_role': 300,
+    'list_quota_definitions': 3600,
+    'list_available_service_operations': 3600,
+}
+
+
+class _Entry:
+    """
+    A cached result, kept as the encoded JSON document so that every hit
+    returns a new copy.
+    """
+
+    __slots__ = ('operation_id', 'body', 'headers', 'status_code', 'etag', 'expires')
+
+    def __init__(self, operation_id, body, headers, status_code, etag, expires) -> None:
+        self.operation_id = operation_id
+        self.body = body
+        self.headers = headers
+        self.status_code = status_code
+        self.etag = etag
+        self.expires = expires
+
+    def response(self, codec: json_codec.JSONCodec) -> DetailedResponse:
+        return DetailedResponse(
+            response=codec.loads(self.body), headers=CaseInsensitiveDict(self.headers), status_code=self.status_code
+        )
+
+
+class ResponseCache:
+    """
+    A read-through cache of the results of GET operations.
+
+    :param dict ttls: (optional) The time to live, in seconds, of the results of
+           each cached operation, by operation id. Only these operations are
+           cached. Defaults to DEFAULT_TTLS.
+    :param int max_entries: (optional) The maximum number of results held.
+    :param int max_bytes: (optional) The maximum total size of the results held,
+           as encoded JSON documents.
+    :param clock: (optional) The function that returns the current time in seconds.
+
+    :attr Counter hits: The number of calls answered from the cache, by operation
+          id, including the results revalidated by the service.
+    :attr Counter misses: The number of calls whose result was not cached or had
+          expired without an ETag, by operation id.
+    :attr Counter revalidations: The number of expired results that the service
+          confirmed as unchanged, by operation id.
+    :attr int evictions: The number of results evicted to respect the size bounds.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttls: Dict[str, float] = None,
+        max_entries: int = 1024,
+        max_bytes: int = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = Counter()
+        self.misses = Counter()
+        self.revalidations = Counter()
+        self.evictions = 0
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """The total size of the results held, in bytes."""
+        return self._size
+
+    def get_ttl(self, operation_id: Optional[str]) -> Optional[float]:
+        """
+        Return the time to live of the results of an operation, or None if it is not cached.
+        """
+        return self.ttls.get(operation_id)
+
+    def invalidate(self, operation_id: str = None) -> None:
+        """
+        Remove the results of an operation from the cache, or all results.
+        """
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if operation_id in (None, e.operation_id)]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """
+        Remove all results from the cache and reset its counters.
+        """
+        self.invalidate()
+        self.hits.clear()
+        self.misses.clear()
+        self.revalidations.clear()
+        self.evictions = 0
+
+    def _lookup(self, key: tuple):
+        # Returns the entry for the key, if any, and whether it is still fresh; a fresh entry is a hit.
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            if entry.expires > self._clock():
+                self._entries.move_to_end(key)
+                self.hits[entry.operation_id] += 1
+                return entry, True
+            if entry.etag is None:
+                self._remove(key)
+                return None, False
+            return entry, False
+
+    def _store(self, key: tuple, entry: Optional[_Entry]) -> None:
+        # Records a miss, and stores its result unless it is not cacheable.
+        with self._lock:
+            self.misses[key[0]] += 1
+            if key in self._entries:
+                self._remove(key)
+            if entry is None or (self.max_bytes is not None and len(entry.body) > self.max_bytes):
+                return
+            self._entries[key] = entry
+            self._size += len(entry.body)
+            while len(self._entries) > self.max_entries or (self.max_bytes is not None and self._size > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _refresh(self, key: tuple, entry: _Entry, ttl: float) -> None:
+        # Records the revalidation of an expired entry, which is a hit.
+        with self._lock:
+            self.hits[entry.operation_id] += 1
+            self.revalidations[entry.operation_id] += 1
+            entry.expires = self._clock() + ttl
+            if self._entries.get(key) is entry:
+                self._entries.move_to_end(key)
+
+    def _remove(self, key: tuple) -> None:
+        entry = self._entries.pop(key)
+        self._size -= len(entry.body)
+
+
+def set_cache(service: BaseService, cache: Optional[ResponseCache]) -> BaseService:
+    """
+    Set the response cache of a service client.
+
+    :param BaseService service: The service client.
+    :param ResponseCache cache: The cache, or None to stop caching.
+    :return: The service client passed in.
+    """
+    service.response_cache = cache
+    if cache is not None:
+        install_middleware(service, _CachingSend)
+    return service
+
+
+def get_cache(service: BaseService) -> Optional[ResponseCache]:
+    """
+    Return the response cache of a service client, or None.
+    """
+    return getattr(service, 'response_cache', None)
+
+
+def _is_cacheable(response: DetailedResponse) -> bool:
+    if response.get_status_code() != 200 or not isinstance(response.get_result(), (dict, list)):
+        return False
+    return 'no-store' not in response.get_headers().get('Cache-Control', '')
+
+
+class _CachingSend(SendMiddleware):
+    """
+    Replaces the send() method of a service client, answering the calls of the
+    cached operations from its cache.
+    """
+
+    def __call__(self, request: dict, **kwargs):
+        service = self.service
+        cache = getattr(service, 'response_cache', None)
+        operation_id = instrumentation.current_operation_id()
+        ttl = None if cache is None else cache.get_ttl(operation_id)
+        if ttl is None or request['method'] != 'GET' or kwargs.get('stream') or request.get('data'):
+            return self.send_next(service, request, **kwargs)
+
+        codec = json_codec.get_codec(service)
+        key = request_key(operation_id, request, service.get_authenticator())
+        entry, fresh = cache._lookup(key)  # pylint: disable=protected-access
+        if fresh:
+            instrumentation.discard_operation()
+            response = entry.response(codec)
+            return _resolved(response) if getattr(service, 'is_async', False) else response
+
+        if entry is not None:
+            request['headers'] = dict(request.get('headers') or {}, **{'If-None-Match': entry.etag})
+        try:
+            response = self.send_next(service, request, **kwargs)
+        except ApiException as error:
+            return self._not_modified(cache, key, entry, ttl, codec, error)
+        if getattr(service, 'is_async', False):
+            return self._await_response(cache, key, entry, ttl, codec, response)
+        return self._received(cache, key, ttl, codec, response)
+
+    async def _await_response(self, cache, key, entry, ttl, codec, response) -> DetailedResponse:
+        try:
+            response = await response
+        except ApiException as error:
+            return self._not_modified(cache, key, entry, ttl, codec, error)
+        return self._received(cache, key, ttl, codec, response)
+
+    @staticmethod
+    def _not_modified(cache, key, entry, ttl, codec, error) -> DetailedResponse:
+        if entry is None or error.code != 304:
+            raise error
+        cache._refresh(key, entry, ttl)  # pylint: disable=protected-access
+        return entry.response(codec)
+
+    @staticmethod
+    def _received(cache, key, ttl, codec, response) -> DetailedResponse:
+        entry = None
+        if _is_cacheable(response):
+            headers = response.get_headers()
+            entry = _Entry(
+                key[0],
+                codec.dumps(response.get_result()),
+                CaseInsensitiveDict(headers),
+                response.get_status_code(),
+                headers.get('ETag'),
+                cache._clock() + ttl,  # pylint: disable=protected-access
+            )
+        cache._store(key, entry)  # pylint: disable=protected-access
+        return response
+
+
+async def _resolved(response: DetailedResponse) -> DetailedResponse:
+    return response
@@ -0,0 +1,213 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides opt-in coalescing of identical concurrent GET requests.
+
+When several threads, or several tasks of an asyncio client, call the same
+GET operation with the same arguments and credentials while a request for it
+is already in flight, only that request is sent: the other calls wait for
+it and receive its result.
+
+    from ibm_platform_services import single_flight
+
+    group = single_flight.SingleFlight()
+    single_flight.set_single_flight(global_catalog_service, group)
+
+A SingleFlight may be shared by several clients, so that their identical
+requests are coalesced too. Calls are identical when they have the same
+operation, URL, query parameters, result-selecting request headers and
+credentials; see common.request_key(). Every caller receives its own copy of
+a JSON result, and the calls that share a failed request raise the same
+exception.
+"""
+
+import asyncio
+import threading
+from collections import Counter
+from typing import Iterable, Optional
+
+from requests.structures import CaseInsensitiveDict
+from ibm_cloud_sdk_core import BaseService, DetailedResponse
+
+from . import instrumentation, json_codec
+from .common import request_key
+from .middleware import SendMiddleware, install_middleware
+
+
+class _Flight:
+    """
+    A request in flight, and its outcome once it has completed.
+    """
+
+    __slots__ = ('done', 'task', 'followers', 'response', 'body', 'error')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.task = None
+        self.followers = 0
+        self.response = None
+        # The encoded JSON result, from which the followers decode their copies.
+        self.body = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    A group of service clients whose identical concurrent GET requests are coalesced.
+
+    :param operations: (optional) The ids of the operations to coalesce; by
+           default all GET operations are coalesced.
+
+    :attr Counter sent: The number of requests sent, by operation id.
+    :attr Counter coalesced: The number of calls that received the result of a
+          request sent for another call, by operation id.
+    """
+
+    def __init__(self, *, operations: Iterable[str] = None) -> None:
+        self.operations = None if operations is None else frozenset(operations)
+        self.sent = Counter()
+        self.coalesced = Counter()
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def coalesces(self, operation_id: Optional[str]) -> bool:
+        """
+        Return true if the calls of an operation are coalesced.
+        """
+        return operation_id is not None and (self.operations is None or operation_id in self.operations)
+
+    def _join(self, key: tuple, operation_id: str):
+        # Returns the flight for the key, and whether the caller leads it and must send its request.
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.followers += 1
+                self.coalesced[operation_id] += 1
+                return flight, False
+            flight = self._flights[key] = _Flight()
+            self.sent[operation_id] += 1
+            return flight, True
+
+    def _land(self, key: tuple) -> int:
+        # Removes the flight for the key, and returns the number of its followers.
+        with self._lock:
+            return self._flights.pop(key).followers
+
+
+def set_single_flight(service: BaseService, group: Optional[SingleFlight]) -> BaseService:
+    """
+    Coalesce the identical concurrent GET requests of a service client.
+
+    :param BaseService service: The service client.
+    :param SingleFlight group: The group, or None to stop coalescing.
+    :return: The service client passed in.
+    """
+    service.single_flight = group
+    if group is not None:
+        install_middleware(service, _CoalescingSend)
+    return service
+
+
+def get_single_flight(service: BaseService) -> Optional[SingleFlight]:
+    """
+    Return the single-flight group of a service client, or None.
+    """
+    return getattr(service, 'single_flight', None)
+
+
+def _copy(service: BaseService, response: DetailedResponse, body: Optional[bytes]) -> DetailedResponse:
+    # Decodes a new copy of a shared JSON result.
+    if body is None:
+        return response
+    return DetailedResponse(
+        response=json_codec.get_codec(service).loads(body),
+        headers=CaseInsensitiveDict(response.get_headers()),
+        status_code=response.get_status_code(),
+    )
+
+
+def _encode(service: BaseService, response: DetailedResponse) -> Optional[bytes]:
+    if isinstance(response.get_result(), (dict, list)):
+        return json_codec.get_codec(service).dumps(response.get_result())
+    return None
+
+
+class _CoalescingSend(SendMiddleware):
+    """
+    Replaces the send() method of a service client, coalescing its identical
+    concurrent GET requests.
+    """
+
+    def __call__(self, request: dict, **kwargs):
+        service = self.service
+        group = getattr(service, 'single_flight', None)
+        operation_id = instrumentation.current_operation_id()
+        if (
+            group is None
+            or request['method'] != 'GET'
+            or kwargs.get('stream')
+            or request.get('data')
+            or not group.coalesces(operation_id)
+        ):
+            return self.send_next(service, request, **kwargs)
+
+        key = request_key(operation_id, request, service.get_authenticator())
+        if getattr(service, 'is_async', False):
+            return self._coalesce_task(service, group, key, request, kwargs)
+
+        flight, leader = group._join(key, operation_id)  # pylint: disable=protected-access
+        if not leader:
+            instrumentation.discard_operation()
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return _copy(service, flight.response, flight.body)
+        try:
+            flight.response = self.send_next(service, request, **kwargs)
+            return flight.response
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            # The result is copied for the followers before the leader can modify it.
+            if group._land(key) and flight.error is None:  # pylint: disable=protected-access
+                flight.body = _encode(service, flight.response)
+            flight.done.set()
+
+    async def _coalesce_task(self, service, group, key, request, kwargs) -> DetailedResponse:
+        # The calls of asyncio clients are coalesced per event loop: they await the
+        # task that sends the request, and only the loop's thread touches its flight.
+        operation_id = key[0]
+        key = (asyncio.get_running_loop(),) + key
+        flight, leader = group._join(key, operation_id)  # pylint: disable=protected-access
+        if not leader:
+            instrumentation.discard_operation()
+            await asyncio.shield(flight.task)
+            return _copy(service, flight.response, flight.body)
+
+        async def send():
+            try:
+                flight.response = await self.send_next(service, request, **kwargs)
+            finally:
+                if group._land(key) and flight.response is not None:  # pylint: disable=protected-access
+                    flight.body = _encode(service, flight.response)
+
+        flight.task = asyncio.ensure_future(send())
+        # The task runs in a copy of this context, where the operation is taken.
+        instrumentation.discard_operation()
+        await asyncio.shield(flight.task)
+        return flight.response
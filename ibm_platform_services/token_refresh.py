@@ -0,0 +1,216 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides opt-in proactive refreshing of the IAM tokens of
+service clients, on a background thread.
+
+By default a client fetches its token from the token service in the request
+that finds the token missing or due for a refresh, and that request waits
+for the token service. A TokenRefresher fetches the token as soon as a
+client is registered with it, then renews it shortly before the token
+manager would, so that no request waits for the token service while the
+token service is reachable:
+
+    from ibm_platform_services import token_refresh
+
+    token_refresh.set_token_refresher(resource_controller_service)
+
+The clients registered with a refresher whose token managers are configured
+alike, with the same credentials, scope, client id and secret, headers,
+proxies and TLS settings, share one token manager, and therefore one token
+and one refresh. The credentials of an authenticator must not be changed once
+its client is registered. The refresher keeps renewing the tokens of its
+clients for the lifetime of the process, or until it is closed; if a
+refresh fails, the request that needs the token fetches it as before.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Type, TypeVar
+
+from ibm_cloud_sdk_core import BaseService
+from ibm_cloud_sdk_core.authenticators import Authenticator
+from ibm_cloud_sdk_core.token_managers.token_manager import TokenManager
+
+from .common import auth_configuration, auth_scope
+
+ServiceType = TypeVar('ServiceType', bound=BaseService)
+
+
+class TokenRefresher:
+    """
+    Renews the tokens of the registered authenticators on a background thread.
+
+    :param float lead_time: (optional) The number of seconds before the refresh
+           time of a token at which it is renewed. Tokens that live too short for
+           it are renewed halfway to their refresh time instead.
+    :param float retry_interval: (optional) The number of seconds after which a
+           failed refresh is tried again.
+
+    :attr int refreshes: The number of tokens fetched by the refresher.
+    :attr int failures: The number of token requests of the refresher that failed.
+    """
+
+    def __init__(self, *, lead_time: float = 60.0, retry_interval: float = 5.0) -> None:
+        self.lead_time = lead_time
+        self.retry_interval = retry_interval
+        self.refreshes = 0
+        self.failures = 0
+        self._token_managers = {}
+        # When each token manager is next renewed, by credentials; None while it is being renewed.
+        self._due = {}
+        # The credentials whose most recent refresh failed.
+        self._failed = set()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def new_instance(self, service_class: Type[ServiceType], service_name: str = None) -> ServiceType:
+        """
+        Return a new client of the specified service class, constructed with its
+        `new_instance()` method and registered with this refresher.
+
+        :param type service_class: The service class, for example `ResourceControllerV2`.
+        :param str service_name: (optional) The name used to look up the external
+               configuration; defaults to the service class' DEFAULT_SERVICE_NAME.
+        :return: The new service client.
+        """
+        if service_name is None:
+            service_name = service_class.DEFAULT_SERVICE_NAME
+        return set_token_refresher(service_class.new_instance(service_name=service_name), self)
+
+    def register(self, authenticator: Authenticator) -> TokenManager:
+        """
+        Renew the token of an authenticator in the background. If another
+        authenticator whose token manager is configured alike is registered
+        already, the authenticator is given its token manager.
+
+        :param Authenticator authenticator: An authenticator with a token manager,
+               for example an IAMAuthenticator.
+        :return: The token manager of the authenticator.
+        """
+        token_manager = getattr(authenticator, 'token_manager', None)
+        if not isinstance(token_manager, TokenManager):
+            raise ValueError('The authenticator does not use a token manager')
+        scope = auth_scope(authenticator)
+        with self._condition:
+            if self._closed:
+                raise ValueError('The token refresher is closed')
+            shared = self._token_managers.get(scope)
+            if shared is not None and not _configured_alike(shared, token_manager):
+                # The scope is a digest, which does not tell every configuration apart.
+                scope = '{0}/{1}'.format(scope, id(token_manager))
+                shared = self._token_managers.get(scope)
+            if shared is None:
+                shared = self._token_managers[scope] = token_manager
+                self._due[scope] = 0
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name='TokenRefresher', daemon=True)
+                    self._thread.start()
+                self._condition.notify()
+            authenticator.token_manager = shared
+            return shared
+
+    @property
+    def token_managers(self) -> Dict[str, TokenManager]:
+        """The token managers renewed by the refresher, by credentials."""
+        return dict(self._token_managers)
+
+    def close(self) -> None:
+        """
+        Stop renewing tokens; the clients then fetch their tokens when their requests need them.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                scope = None
+                while not self._closed:
+                    pending = [(due, key) for key, due in self._due.items() if due is not None]
+                    if pending:
+                        due, scope = min(pending)
+                        if due <= time.time():
+                            break
+                        self._condition.wait(due - time.time())
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+                self._due[scope] = None
+                token_manager = self._token_managers[scope]
+            # After a failure the requests no longer wait for the retries; they fetch the token themselves.
+            paced = scope not in self._failed
+            due = self._refresh(token_manager, paced)
+            with self._condition:
+                self._due[scope] = due
+                if due is None:
+                    self._failed.add(scope)
+                    self._due[scope] = time.time() + self.retry_interval
+                else:
+                    self._failed.discard(scope)
+
+    def _refresh(self, token_manager: TokenManager, paced: bool) -> Optional[float]:
+        # Fetches a new token, and returns when to renew it, or None if the fetch failed.
+        try:
+            if paced and token_manager._is_token_expired():  # pylint: disable=protected-access
+                # The requests that need the token meanwhile wait for this fetch rather than send their own.
+                token_manager.paced_request_token()
+            else:
+                token_manager._save_token_info(token_manager.request_token())  # pylint: disable=protected-access
+        except Exception:  # pylint: disable=broad-except
+            if paced:
+                token_manager.request_time = 0
+            self.failures += 1
+            return None
+        self.refreshes += 1
+        now = time.time()
+        return max(token_manager.refresh_time - self.lead_time, now + (token_manager.refresh_time - now) / 2)
+
+
+DEFAULT_TOKEN_REFRESHER = TokenRefresher()
+
+
+def set_token_refresher(service: ServiceType, refresher: TokenRefresher = DEFAULT_TOKEN_REFRESHER) -> ServiceType:
+    """
+    Renew the token of a service client in the background.
+
+    :param BaseService service: The service client; its authenticator must use a
+           token manager, for example an IAMAuthenticator.
+    :param TokenRefresher refresher: (optional) The refresher; by default the
+           refresher shared by the whole process.
+    :return: The service client passed in.
+    """
+    refresher.register(service.get_authenticator())
+    service.token_refresher = refresher
+    return service
+
+
+def get_token_refresher(service: BaseService) -> Optional[TokenRefresher]:
+    """
+    Return the token refresher of a service client, or None.
+    """
+    return getattr(service, 'token_refresher', None)
+
+
+def _configured_alike(token_manager: TokenManager, other: TokenManager) -> bool:
+    # Token managers are shared only if every attribute that configures them is equal.
+    return type(token_manager) is type(other) and auth_configuration(token_manager) == auth_configuration(other)
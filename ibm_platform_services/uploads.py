@@ -0,0 +1,330 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides streaming uploads of large request bodies, such as the
+attachments of CaseManagementV1.upload_file() and the artifacts of
+GlobalCatalogV1.upload_artifact(), which are otherwise read whole into memory
+before they are sent.
+
+An UploadStream reads a path, a file object or a buffer such as an mmap in
+chunks, knows its length without reading it, and reports its progress:
+
+    from ibm_platform_services import uploads
+
+    artifact = uploads.UploadStream('/tmp/artifact.tgz', progress=lambda sent, total: print(sent, total))
+    global_catalog_service.upload_artifact('entry-id', 'artifact.tgz', artifact=artifact)
+
+Multipart bodies are built in memory by the HTTP client. Once streaming
+uploads are enabled on a client, its multipart bodies are instead encoded as
+they are sent, with their Content-Length computed from the lengths of their
+parts, or with chunked transfer encoding when a length is not known:
+
+    uploads.set_streaming_uploads(case_management_service)
+    case_management_service.upload_file(
+        'CS1234567', [FileWithMetadata(uploads.UploadStream('/tmp/bundle.zip'), filename='bundle.zip')]
+    )
+
+The asyncio clients stream the file objects of their multipart bodies
+already, and are left as they are.
+"""
+
+import binascii
+import io
+import mmap
+import os
+from typing import BinaryIO, Callable, Iterator, List, Optional, Union
+
+from ibm_cloud_sdk_core import BaseService
+from urllib3.fields import RequestField
+
+from .common import stream_size
+from .middleware import SendMiddleware, install_middleware
+
+# The default size of the chunks in which a body is read and sent.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadStream(io.RawIOBase):
+    """
+    A request body read in chunks from a path, a file object or a buffer.
+
+    :param source: The path of a file, a binary file object open for reading,
+           or a buffer such as bytes or an mmap. A file object is read from its
+           current position.
+    :param progress: (optional) A function called with the number of bytes read
+           so far and the length of the body, or None if it is not known, after
+           each read.
+    :param int chunk_size: (optional) The size of the chunks in which the body
+           is iterated over.
+
+    :attr int len: The length of the body, or None if it is not known.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, os.PathLike, BinaryIO, bytes, bytearray, memoryview, mmap.mmap],
+        *,
+        progress: Callable[[int, Optional[int]], None] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        super().__init__()
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        self._owned = None
+        if isinstance(source, (str, os.PathLike)):
+            source = self._owned = open(source, 'rb')  # pylint: disable=consider-using-with
+        if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            self._buffer = memoryview(source).cast('B')
+            self._file = None
+            self._start = 0
+            self.len = len(self._buffer)
+        else:
+            self._buffer = None
+            self._file = source
+            try:
+                self._start = source.tell() if source.seekable() else None
+            except (AttributeError, OSError):
+                self._start = None
+            self.len = stream_size(source)
+        name = getattr(source, 'name', None)
+        if isinstance(name, str):
+            self.name = name
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self._position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if self._buffer is not None:
+            end = len(self._buffer) if size is None or size < 0 else min(self._position + size, len(self._buffer))
+            chunk = self._buffer[self._position : end].tobytes()
+        else:
+            chunk = self._file.read(-1 if size is None else size)
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+        if chunk:
+            self._position += len(chunk)
+            if self.progress is not None:
+                self.progress(self._position, self.len)
+        return chunk
+
+    def readinto(self, b) -> int:
+        chunk = self.read(len(b))
+        b[: len(chunk)] = chunk
+        return len(chunk)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self._start is not None
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            if self.len is None:
+                raise io.UnsupportedOperation('The length of the body is not known')
+            offset += self.len
+        if self._start is None:
+            raise io.UnsupportedOperation('The body cannot be read again')
+        if offset < 0:
+            raise ValueError('negative seek position {0}'.format(offset))
+        if self._file is not None:
+            self._file.seek(self._start + offset)
+        self._position = offset
+        return offset
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(lambda: self.read(self.chunk_size), b'')
+
+    def close(self) -> None:
+        if self._owned is not None:
+            self._owned.close()
+        if self._buffer is not None:
+            self._buffer.release()
+        super().close()
+
+
+class MultipartBody:
+    """
+    A multipart/form-data request body, encoded as it is read.
+
+    :param list files: The files of the body, in the form the HTTP client takes
+           them: a list of `(name, value)` tuples whose value is either the
+           content of the part or a `(filename, content[, content_type[, headers]])`
+           tuple. The contents are bytes, strings, UploadStreams or file objects.
+    :param dict fields: (optional) The form fields sent before the files.
+    :param str boundary: (optional) The boundary of the parts; random by default.
+    :param progress: (optional) A function called with the number of bytes read
+           so far and the length of the body, or None if it is not known.
+    :param int chunk_size: (optional) The size of the chunks in which the body
+           is iterated over.
+
+    :attr int len: The length of the body, or None if the length of one of its
+          files is not known.
+    """
+
+    def __init__(
+        self,
+        files: List[tuple],
+        *,
+        fields: dict = None,
+        boundary: str = None,
+        progress: Callable[[int, Optional[int]], None] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.boundary = boundary or binascii.hexlify(os.urandom(16)).decode('ascii')
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self._parts = []
+        for name, value in (fields or {}).items():
+            field = RequestField(name=name, data=value)
+            field.make_multipart()
+            self._add(field, value)
+        for name, value in files:
+            content_type = headers = None
+            if isinstance(value, (tuple, list)):
+                filename, content = value[0], value[1]
+                if len(value) > 2:
+                    content_type = value[2]
+                if len(value) > 3:
+                    headers = value[3]
+            else:
+                filename, content = getattr(value, 'name', None) or name, value
+                if not isinstance(filename, str):
+                    filename = name
+                filename = os.path.basename(filename)
+            if content is None:
+                continue
+            field = RequestField(name=name, data=content, filename=filename, headers=headers)
+            field.make_multipart(content_type=content_type)
+            self._add(field, content)
+        self._parts.append('--{0}--\r\n'.format(self.boundary).encode('latin-1'))
+        lengths = [len(part) if isinstance(part, bytes) else part.len for part in self._parts]
+        self.len = None if None in lengths else sum(lengths)
+        self._index = 0
+        self._offset = 0
+        self._position = 0
+
+    def _add(self, field: RequestField, content) -> None:
+        self._parts.append('--{0}\r\n{1}'.format(self.boundary, field.render_headers()).encode('utf-8'))
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        elif isinstance(content, int):
+            content = str(content).encode('ascii')
+        if not isinstance(content, (bytes, UploadStream)):
+            content = UploadStream(content, chunk_size=self.chunk_size)
+        self._parts.append(content)
+        self._parts.append(b'\r\n')
+
+    @property
+    def content_type(self) -> str:
+        """The Content-Type header of the body."""
+        return 'multipart/form-data; boundary={0}'.format(self.boundary)
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Return the next bytes of the body, at most `size` of them; all of them if `size` is negative.
+        """
+        if size is None:
+            size = -1
+        chunks = []
+        while self._index < len(self._parts) and size:
+            part = self._parts[self._index]
+            if isinstance(part, bytes):
+                chunk = part[self._offset :] if size < 0 else part[self._offset : self._offset + size]
+                self._offset += len(chunk)
+            else:
+                chunk = part.read(size)
+            if not chunk:
+                self._index += 1
+                self._offset = 0
+                continue
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        data = b''.join(chunks)
+        if data:
+            self._position += len(data)
+            if self.progress is not None:
+                self.progress(self._position, self.len)
+        return data
+
+    def tell(self) -> int:
+        """
+        Return the number of bytes of the body read so far.
+        """
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Start reading the body again, when it is sent again. Only its start can be sought.
+        """
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation('Only the start of the body can be sought')
+        for part in self._parts:
+            if isinstance(part, UploadStream):
+                part.seek(0)
+        self._index = self._offset = self._position = 0
+        return 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(lambda: self.read(self.chunk_size), b'')
+
+
+def set_streaming_uploads(service: BaseService, chunk_size: Optional[int] = DEFAULT_CHUNK_SIZE) -> BaseService:
+    """
+    Encode the multipart bodies of a service client as they are sent, rather than in memory.
+
+    :param BaseService service: The service client.
+    :param int chunk_size: (optional) The size of the chunks in which the bodies
+           are sent when their length is not known, or None to stop streaming them.
+    :return: The service client passed in.
+    """
+    service.upload_chunk_size = chunk_size
+    if chunk_size is not None:
+        install_middleware(service, _StreamingUploadSend)
+    return service
+
+
+def get_streaming_uploads(service: BaseService) -> Optional[int]:
+    """
+    Return the chunk size of the streaming uploads of a service client, or None if they are not enabled.
+    """
+    return getattr(service, 'upload_chunk_size', None)
+
+
+class _StreamingUploadSend(SendMiddleware):
+    """
+    Replaces the send() method of a service client, sending its multipart
+    bodies as a MultipartBody.
+    """
+
+    def __call__(self, request: dict, **kwargs):
+        service = self.service
+        chunk_size = getattr(service, 'upload_chunk_size', None)
+        if chunk_size is None or not request.get('files') or getattr(service, 'is_async', False):
+            return self.send_next(service, request, **kwargs)
+        data = request.get('data')
+        body = MultipartBody(request['files'], fields=data if isinstance(data, dict) else None, chunk_size=chunk_size)
+        # The prepared request may be sent again, so it is left as it is.
+        request = dict(request, headers=request['headers'].copy(), files=None, data=body)
+        request['headers']['Content-Type'] = body.content_type
+        return self.send_next(service, request, **kwargs)
@@ -0,0 +1,256 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module exports the metrics of the instance usage reports of
+UsageReportsV4.get_resource_usage_account(), get_resource_usage_resource_group()
+and get_resource_usage_org() as columns, one row per metric of each instance,
+following the `_start` offsets of the pages of the report:
+
+    from ibm_platform_services import usage_export
+
+    columns = usage_export.export_usage(usage_reports_service.get_resource_usage_account, account_id, '2022-06')
+    total = sum(columns.cost)
+
+    usage_export.export_usage_csv(
+        usage_reports_service.get_resource_usage_org, account_id, organization_id, '2022-06', destination='usage.csv'
+    )
+
+The rows are read from the decoded JSON of each page rather than from
+InstanceUsage and Metric objects. The numeric columns are kept in arrays of
+doubles and the text columns in lists, so UsageColumns.to_numpy() converts
+them to NumPy arrays without copying the numbers; the quantity, cost or rated
+cost of a metric that has none is NaN. to_numpy() and export_usage_npz()
+require the numpy package, which is installed with
+`pip install ibm-platform-services[numpy]`; the rest of the module does not.
+
+export_usage_csv() writes each page as it is received, so the report is never
+held in memory.
+"""
+
+from array import array
+import csv
+import io
+import os
+from typing import Callable, Dict, Iterator, List, TextIO, Union
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# The columns of an export, in order.
+COLUMNS = ('resource_instance_id', 'plan_id', 'metric', 'quantity', 'cost', 'rated_cost', 'currency_code')
+
+# The columns that hold numbers.
+NUMERIC_COLUMNS = ('quantity', 'cost', 'rated_cost')
+
+_NAN = float('nan')
+
+
+class UsageColumns:
+    """
+    The metrics of instance usage reports, as columns.
+
+    :attr List[str] resource_instance_id: The ID of the resource instance of each row.
+    :attr List[str] plan_id: The ID of the plan of the instance.
+    :attr List[str] metric: The ID of the metric.
+    :attr array quantity: The aggregated value of the metric, as doubles.
+    :attr array cost: The cost incurred by the metric, as doubles.
+    :attr array rated_cost: The pre-discounted cost incurred by the metric, as doubles.
+    :attr List[str] currency_code: The currency of the costs.
+    """
+
+    def __init__(self) -> None:
+        self.resource_instance_id: List[str] = []
+        self.plan_id: List[str] = []
+        self.metric: List[str] = []
+        self.quantity = array('d')
+        self.cost = array('d')
+        self.rated_cost = array('d')
+        self.currency_code: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.metric)
+
+    def add_page(self, result: dict) -> int:
+        """
+        Add the rows of a page of a report.
+
+        :param dict result: The result of the operation, an `InstancesUsage` dict.
+        :return: The number of rows added.
+        """
+        count = len(self.metric)
+        for resource in result.get('resources') or []:
+            metrics = resource.get('usage') or []
+            if not metrics:
+                continue
+            instance_id = resource.get('resource_instance_id')
+            plan_id = resource.get('plan_id')
+            currency_code = resource.get('currency_code')
+            self.resource_instance_id.extend([instance_id] * len(metrics))
+            self.plan_id.extend([plan_id] * len(metrics))
+            self.currency_code.extend([currency_code] * len(metrics))
+            self.metric.extend([metric.get('metric') for metric in metrics])
+            self.quantity.extend([_number(metric.get('quantity')) for metric in metrics])
+            self.cost.extend([_number(metric.get('cost')) for metric in metrics])
+            self.rated_cost.extend([_number(metric.get('rated_cost')) for metric in metrics])
+        return len(self.metric) - count
+
+    def columns(self) -> Dict[str, Union[List[str], array]]:
+        """
+        Return the columns by name, in the order of COLUMNS.
+        """
+        return {name: getattr(self, name) for name in COLUMNS}
+
+    def rows(self) -> Iterator[tuple]:
+        """
+        Return an iterator over the rows, as tuples of the values of COLUMNS.
+        """
+        return zip(*(getattr(self, name) for name in COLUMNS))
+
+    def to_numpy(self) -> Dict[str, 'numpy.ndarray']:
+        """
+        Return the columns by name as NumPy arrays: float64 arrays that share the
+        memory of the numeric columns, and unicode arrays. No rows can be added
+        while the float64 arrays are in use.
+        """
+        _require_numpy('UsageColumns.to_numpy()')
+        arrays = {}
+        for name in COLUMNS:
+            column = getattr(self, name)
+            if name in NUMERIC_COLUMNS:
+                arrays[name] = numpy.frombuffer(column, dtype=numpy.float64) if column else numpy.empty(0)
+            else:
+                arrays[name] = numpy.array([value or '' for value in column], dtype=str)
+        return arrays
+
+    def write_csv(self, file: TextIO, header: bool = True) -> None:
+        """
+        Write the rows to a text file object as CSV.
+
+        :param file: The file, opened with `newline=''`.
+        :param bool header: (optional) If false, the row of column names is not written.
+        """
+        writer = csv.writer(file)
+        if header:
+            writer.writerow(COLUMNS)
+        writer.writerows(self.rows())
+
+
+def iter_usage_pages(operation: Callable[..., DetailedResponse], *args, **kwargs) -> Iterator[dict]:
+    """
+    Return an iterator over the pages of a report, following their `_start` offsets.
+
+    :param operation: The operation, for example
+           `usage_reports_service.get_resource_usage_account`.
+    :param args: The positional arguments of the operation.
+    :param kwargs: The keyword arguments of the operation; `start` is the offset
+           of the first page.
+    :return: The results of the operation, `InstancesUsage` dicts.
+    """
+    while True:
+        result = operation(*args, **kwargs).get_result()
+        yield result
+        offset = (result.get('next') or {}).get('offset')
+        if not offset or offset == kwargs.get('start'):
+            return
+        kwargs['start'] = offset
+
+
+def export_usage(operation: Callable[..., DetailedResponse], *args, **kwargs) -> UsageColumns:
+    """
+    Return the rows of every page of a report as columns.
+
+    :param operation: The operation, for example
+           `usage_reports_service.get_resource_usage_resource_group`.
+    :param args: The positional arguments of the operation.
+    :param kwargs: The keyword arguments of the operation.
+    :rtype: UsageColumns
+    """
+    columns = UsageColumns()
+    for result in iter_usage_pages(operation, *args, **kwargs):
+        columns.add_page(result)
+    return columns
+
+
+def export_usage_csv(
+    operation: Callable[..., DetailedResponse], *args, destination: Union[str, os.PathLike, TextIO], **kwargs
+) -> int:
+    """
+    Write the rows of every page of a report as CSV, one page at a time.
+
+    :param operation: The operation, for example
+           `usage_reports_service.get_resource_usage_org`.
+    :param args: The positional arguments of the operation.
+    :param destination: The path of the file to write, or a text file object
+           opened with `newline=''`.
+    :param kwargs: The keyword arguments of the operation.
+    :return: The number of rows written.
+    """
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, 'w', newline='', encoding='utf-8') as file:
+            return _write_csv(file, operation, args, kwargs)
+    return _write_csv(destination, operation, args, kwargs)
+
+
+def export_usage_npz(
+    operation: Callable[..., DetailedResponse],
+    *args,
+    destination: Union[str, os.PathLike, io.IOBase],
+    compressed: bool = True,
+    **kwargs,
+) -> int:
+    """
+    Write the rows of every page of a report to a NumPy `.npz` file, with one
+    array for each column.
+
+    :param operation: The operation, for example
+           `usage_reports_service.get_resource_usage_account`.
+    :param args: The positional arguments of the operation.
+    :param destination: The path of the file to write, or a binary file object.
+    :param bool compressed: (optional) If false, the arrays are stored uncompressed.
+    :param kwargs: The keyword arguments of the operation.
+    :return: The number of rows written.
+    """
+    _require_numpy('export_usage_npz()')
+    columns = export_usage(operation, *args, **kwargs)
+    save = numpy.savez_compressed if compressed else numpy.savez
+    save(destination, **columns.to_numpy())
+    return len(columns)
+
+
+def _write_csv(file: TextIO, operation, args, kwargs) -> int:
+    csv.writer(file).writerow(COLUMNS)
+    count = 0
+    for result in iter_usage_pages(operation, *args, **kwargs):
+        columns = UsageColumns()
+        count += columns.add_page(result)
+        columns.write_csv(file, header=False)
+    return count
+
+
+def _number(value) -> float:
+    return _NAN if value is None else value
+
+
+def _require_numpy(feature: str) -> None:
+    if numpy is None:
+        raise ImportError(
+            '{0} requires the numpy package; install it with "pip install ibm-platform-services[numpy]"'.format(feature)
+        )
@@ -33,6 +33,7 @@ from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model
 
+from . import instrumentation, json_codec
 from .common import get_sdk_headers
 
 ##############################################################################
@@ -72,6 +73,8 @@ class UsageMeteringV4(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # Resource Usage
@@ -104,7 +107,7 @@ class UsageMeteringV4(BaseService):
         )
         headers.update(sdk_headers)
 
-        data = json.dumps(resource_usage)
+        data = json_codec.encode(self, resource_usage)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -22,7 +22,7 @@ Manage the lifecycle of your users using User Management APIs.
 API Version: 1.0
 """
 
-from typing import Dict, List
+from typing import Dict, Iterator, List
 import json
 
 from ibm_cloud_sdk_core import BaseService, DetailedResponse, get_query_param
@@ -30,6 +30,7 @@ from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model
 
+from . import instrumentation, json_codec
 from .common import get_sdk_headers
 
 ##############################################################################
@@ -69,6 +70,8 @@ class UserManagementV1(BaseService):
                about initializing the authenticator of your choice.
         """
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
+        json_codec.install(self)
+        instrumentation.install(self)
 
     #########################
     # Users
@@ -177,7 +180,7 @@ class UserManagementV1(BaseService):
 
         data = {'users': users, 'iam_policy': iam_policy, 'access_groups': access_groups}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -308,7 +311,7 @@ class UserManagementV1(BaseService):
             'photo': photo,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -391,7 +394,7 @@ class UserManagementV1(BaseService):
 
         data = {'account_id': account_id}
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -550,7 +553,7 @@ class UserManagementV1(BaseService):
             'self_manage': self_manage,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
-        data = json.dumps(data)
+        data = json_codec.encode(self, data)
         headers['content-type'] = 'application/json'
 
         if 'headers' in kwargs:
@@ -1430,12 +1433,13 @@ class UsersPager:
         if not self.has_next():
             raise StopIteration(message='No more results available')
 
-        result = self._client.list_users(
-            account_id=self._account_id,
-            limit=self._limit,
-            user_id=self._user_id,
-            start=self._page_context.get('next'),
-        ).get_result()
+        with instrumentation.pager_page(self):
+            result = self._client.list_users(
+                account_id=self._account_id,
+                limit=self._limit,
+                user_id=self._user_id,
+                start=self._page_context.get('next'),
+            ).get_result()
 
         next = None
         next_page_link = result.get('next_url')
@@ -1447,6 +1451,18 @@ class UsersPager:
 
         return result.get('resources')
 
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Returns an iterator that yields the results one at a time, retrieving
+        the next page of results only when the current one has been consumed.
+        :return: An Iterator[dict], where each element is a dict that represents an instance of UserProfile.
+        :rtype: Iterator[dict]
+        """
+        while self.has_next():
+            next_page = self.get_next()
+            if next_page:
+                yield from next_page
+
     def get_all(self) -> List[dict]:
         """
         Returns all results by invoking get_next() repeatedly
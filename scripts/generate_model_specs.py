@@ -0,0 +1,339 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generate ibm_platform_services/model_specs.py, the field spec tables from which
+the deserialization module compiles its decoders, by analyzing the source of
+the generated `from_dict()` and `__init__()` methods of the model classes of
+the service modules. Run it whenever the service modules are generated again,
+with the package installed (`make install_project`), then format the result
+with black:
+
+    python scripts/generate_model_specs.py
+    black ibm_platform_services/model_specs.py
+
+The model classes whose `from_dict()` method does something else than read
+each property (for example the base classes that select a subclass through a
+discriminator) are left out of the tables, and are decoded with their own
+`from_dict()` method.
+"""
+
+import ast
+import glob
+import importlib
+import inspect
+import os
+import sys
+import textwrap
+from typing import Dict, List, Optional
+
+import ibm_platform_services
+from ibm_platform_services.deserialization import CONVERTED, MODEL, MODEL_DICT, MODEL_LIST, VALUE, FieldSpec
+
+_MISSING = object()
+
+
+def generate_model_specs() -> Dict[str, Dict[str, tuple]]:
+    """
+    Return the field spec tables of the model classes of the service modules,
+    as MODEL_SPECS of model_specs.py holds them.
+    """
+    specs = {}
+    package = os.path.dirname(ibm_platform_services.__file__)
+    for path in sorted(glob.glob(os.path.join(package, '*_v[0-9].py'))):
+        module_name = os.path.basename(path)[:-3]
+        module = importlib.import_module('ibm_platform_services.' + module_name)
+        tables = {}
+        for name, value in vars(module).items():
+            if inspect.isclass(value) and value.__module__ == module.__name__ and 'from_dict' in vars(value):
+                try:
+                    tables[name] = _analyze(value)
+                except (OSError, TypeError, _Unsupported):
+                    continue
+        if tables:
+            specs[module_name] = tables
+    return specs
+
+
+def write_model_specs(path: str = None) -> None:
+    """
+    Write model_specs.py, by default into the package.
+    """
+    if path is None:
+        path = os.path.join(os.path.dirname(ibm_platform_services.__file__), 'model_specs.py')
+    lines = [_HEADER, 'MODEL_SPECS = {']
+    for module_name, tables in generate_model_specs().items():
+        lines.append('    {0!r}: {{'.format(module_name))
+        for name, (fields, attributes, additional_properties) in tables.items():
+            lines.append('        {0!r}: ('.format(name))
+            lines.append('            (')
+            lines += ['                {0!r},'.format(field) for field in fields]
+            lines.append('            ),')
+            lines.append('            {0!r},'.format(attributes))
+            lines.append('            {0!r},'.format(additional_properties))
+            lines.append('        ),')
+        lines.append('    },')
+    lines.append('}')
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('\n'.join(lines) + '\n')
+
+
+_HEADER = '''# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Generated by `python scripts/generate_model_specs.py`; do not edit.
+
+"""
+The field spec tables of the model classes of the service modules, from which
+the deserialization module compiles its decoders.
+
+MODEL_SPECS maps the name of each service module to the tables of its model
+classes, by class name. A table holds the properties read by `from_dict()`,
+in the order it reads them: the JSON name of a property that is copied as is
+to the attribute of the same name, or a tuple of the JSON name, the attribute
+name, the kind of FieldSpec, the name of the nested model class or conversion
+function in the service module, and the message of the ValueError raised when
+the property is required and missing. It then holds the attributes set by the
+constructor, in the order it sets them, and whether the model keeps additional
+properties.
+"""
+'''
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _parse_method(model_class: type, name: str) -> ast.FunctionDef:
+    method = model_class.__dict__.get(name)
+    if isinstance(method, classmethod):
+        method = method.__func__
+    if method is None:
+        raise _Unsupported(name)
+    return ast.parse(textwrap.dedent(inspect.getsource(method))).body[0]
+
+
+def _matches(node, source: str) -> bool:
+    return ast.dump(node) == ast.dump(ast.parse(source).body[0])
+
+
+def _literal(node):
+    if isinstance(node, ast.Constant):
+        return node.value
+    # String literals are parsed as ast.Str before Python 3.8.
+    if type(node).__name__ == 'Str':
+        return node.s
+    return _MISSING
+
+
+def _is_docstring(statement) -> bool:
+    return isinstance(statement, ast.Expr) and isinstance(_literal(statement.value), str)
+
+
+def _is_dict_get(node, key: str) -> bool:
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == '_dict'
+        and node.func.attr == 'get'
+        and len(node.args) == 1
+        and _literal(node.args[0]) == key
+    )
+
+
+def _from_dict_class(node, namespace: dict) -> type:
+    # Matches `X.from_dict(<arg>)` and returns X.
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == 'from_dict'
+        and isinstance(node.func.value, ast.Name)
+        and len(node.args) == 1
+        and node.func.value.id in namespace
+    ):
+        return namespace[node.func.value.id]
+    raise _Unsupported(ast.dump(node))
+
+
+def _is_name(node, name: str) -> bool:
+    return isinstance(node, ast.Name) and node.id == name
+
+
+def _parse_field(key: str, arg: str, value, namespace: dict) -> FieldSpec:
+    if _is_dict_get(value, key):
+        return FieldSpec(key, arg, VALUE)
+    if isinstance(value, ast.ListComp) and len(value.generators) == 1:
+        generator = value.generators[0]
+        if (
+            isinstance(generator.target, ast.Name)
+            and _is_dict_get(generator.iter, key)
+            and not generator.ifs
+            and isinstance(value.elt, ast.Call)
+            and value.elt.args
+            and _is_name(value.elt.args[0], generator.target.id)
+        ):
+            return FieldSpec(key, arg, MODEL_LIST, _from_dict_class(value.elt, namespace))
+    if isinstance(value, ast.DictComp) and len(value.generators) == 1:
+        generator = value.generators[0]
+        target = generator.target
+        iterable = generator.iter
+        if (
+            isinstance(target, ast.Tuple)
+            and len(target.elts) == 2
+            and _is_name(value.key, getattr(target.elts[0], 'id', None))
+            and isinstance(value.value, ast.Call)
+            and value.value.args
+            and _is_name(value.value.args[0], getattr(target.elts[1], 'id', None))
+            and isinstance(iterable, ast.Call)
+            and isinstance(iterable.func, ast.Attribute)
+            and iterable.func.attr == 'items'
+            and not iterable.args
+            and _is_dict_get(iterable.func.value, key)
+            and not generator.ifs
+        ):
+            return FieldSpec(key, arg, MODEL_DICT, _from_dict_class(value.value, namespace))
+    if isinstance(value, ast.Call) and len(value.args) == 1 and _is_dict_get(value.args[0], key):
+        if isinstance(value.func, ast.Name) and callable(namespace.get(value.func.id)):
+            return FieldSpec(key, arg, CONVERTED, namespace[value.func.id])
+        return FieldSpec(key, arg, MODEL, _from_dict_class(value, namespace))
+    raise _Unsupported(ast.dump(value))
+
+
+def _parse_required_message(orelse: list) -> Optional[str]:
+    if not orelse:
+        return None
+    if (
+        len(orelse) == 1
+        and isinstance(orelse[0], ast.Raise)
+        and isinstance(orelse[0].exc, ast.Call)
+        and _is_name(orelse[0].exc.func, 'ValueError')
+        and len(orelse[0].exc.args) == 1
+        and isinstance(_literal(orelse[0].exc.args[0]), str)
+    ):
+        return _literal(orelse[0].exc.args[0])
+    raise _Unsupported(ast.dump(orelse[0]))
+
+
+def _is_additional_properties(statement) -> bool:
+    # Matches `args.update({k: v for (k, v) in _dict.items() if k not in cls._properties})`.
+    return _matches(statement, 'args.update({k: v for (k, v) in _dict.items() if k not in cls._properties})')
+
+
+def _analyze_from_dict(model_class: type, namespace: dict):
+    function = _parse_method(model_class, 'from_dict')
+    body = [statement for statement in function.body if not _is_docstring(statement)]
+    if len(body) < 2 or not _matches(body[0], 'args = {}') or not _matches(body[-1], 'return cls(**args)'):
+        raise _Unsupported('from_dict')
+    fields = []
+    additional_properties = False
+    for statement in body[1:-1]:
+        if _is_additional_properties(statement) and not additional_properties:
+            additional_properties = True
+            continue
+        if (
+            additional_properties
+            or not isinstance(statement, ast.If)
+            or not isinstance(statement.test, ast.Compare)
+            or not isinstance(_literal(statement.test.left), str)
+            or not isinstance(statement.test.ops[0], ast.In)
+            or not _is_name(statement.test.comparators[0], '_dict')
+            or len(statement.body) != 1
+            or not isinstance(statement.body[0], ast.Assign)
+        ):
+            raise _Unsupported(ast.dump(statement))
+        key = _literal(statement.test.left)
+        target = statement.body[0].targets[0]
+        if not (isinstance(target, ast.Subscript) and _is_name(target.value, 'args')):
+            raise _Unsupported(ast.dump(statement))
+        # The subscript is wrapped in ast.Index before Python 3.9.
+        subscript = target.slice.value if type(target.slice).__name__ == 'Index' else target.slice
+        arg = _literal(subscript)
+        if not isinstance(arg, str):
+            raise _Unsupported(ast.dump(statement))
+        field = _parse_field(key, arg, statement.body[0].value, namespace)
+        fields.append(field._replace(required_message=_parse_required_message(statement.orelse)))
+    return fields, additional_properties
+
+
+def _analyze_init(model_class: type) -> List[str]:
+    # Returns the attributes set by the constructor, which must do nothing else.
+    function = _parse_method(model_class, '__init__')
+    attributes = []
+    for statement in function.body:
+        if _is_docstring(statement):
+            continue
+        if (
+            isinstance(statement, ast.Assign)
+            and len(statement.targets) == 1
+            and isinstance(statement.targets[0], ast.Attribute)
+            and _is_name(statement.targets[0].value, 'self')
+            and _is_name(statement.value, statement.targets[0].attr)
+        ):
+            attributes.append(statement.targets[0].attr)
+            continue
+        if _matches(statement, 'for _key, _value in kwargs.items():\n    setattr(self, _key, _value)'):
+            continue
+        raise _Unsupported(ast.dump(statement))
+    return attributes
+
+
+def _analyze(model_class: type) -> tuple:
+    # Returns the table of a model class, as model_specs.py holds it.
+    namespace = vars(sys.modules[model_class.__module__])
+    fields, additional_properties = _analyze_from_dict(model_class, namespace)
+    parameters = inspect.signature(model_class.__init__).parameters
+    attributes = _analyze_init(model_class)
+    for name in attributes:
+        parameter = parameters.get(name)
+        if parameter is None or parameter.kind not in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY):
+            raise _Unsupported(name)
+    args = {field.arg for field in fields}
+    if not args <= set(attributes):
+        raise _Unsupported('from_dict() passes an unknown argument')
+    for name in attributes:
+        if parameters[name].default is inspect.Parameter.empty and name not in args:
+            raise _Unsupported('from_dict() does not pass ' + name)
+    return tuple(_entry(field, namespace) for field in fields), tuple(attributes), additional_properties
+
+
+def _entry(field: FieldSpec, namespace: dict):
+    # The properties copied as is are listed by name; the targets of the others by their name in the module.
+    if field.kind == VALUE and field.key == field.arg and field.required_message is None:
+        return field.key
+    target = None
+    if field.target is not None:
+        target = field.target.__name__
+        if namespace.get(target) is not field.target:
+            raise _Unsupported(target)
+    return (field.key, field.arg, field.kind, target, field.required_message)
+
+
+if __name__ == '__main__':
+    write_model_specs()
@@ -48,6 +48,11 @@ setup(
     license='Apache 2.0',
     install_requires=install_requires,
     tests_require=tests_require,
+    extras_require={
+        'async': ['aiohttp>=3.8.0,<4.0.0'],
+        'orjson': ['orjson>=3.6.0,<4.0.0'],
+        'numpy': ['numpy>=1.17.0,<2.0.0'],
+    },
     author='IBM',
     author_email='devxsdk@us.ibm.com',
     long_description=readme,
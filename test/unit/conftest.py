@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Fixtures shared by the unit tests that need a real HTTP server, such as those
+of connection reuse, streaming and concurrency, which `responses` cannot mock
+"""
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+
+
+class LocalHandler(BaseHTTPRequestHandler):
+    """
+    The base class of the request handlers of the local servers, which keeps
+    connections alive and does not log.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def read_body(self):
+        """
+        Read the body of the request, sent with a Content-Length or in chunks.
+        """
+        if self.headers.get('Transfer-Encoding') != 'chunked':
+            return self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        body = b''
+        while True:
+            size = int(self.rfile.readline().strip(), 16)
+            body += self.rfile.read(size + 2)[:size]
+            if not size:
+                return body
+
+    def respond(self, status, result=None, headers=None):
+        """
+        Send a response with a JSON body.
+        """
+        body = json.dumps({} if result is None else result).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """
+    Return a function that starts a local server with a handler class, and sets
+    attributes of the server; the servers are stopped after the test.
+    """
+    servers = []
+
+    def start(handler_class, **attributes):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), handler_class)
+        for name, value in attributes.items():
+            setattr(server, name, value)
+        server.url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def make_client(service_class, url, authenticator=None):
+    """
+    Return a client of a service class sending its requests to a URL.
+    """
+    client = service_class(authenticator=authenticator or NoAuthAuthenticator())
+    client.set_service_url(url)
+    return client
@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the asyncio service clients, run against a local aiohttp server
+"""
+
+import asyncio
+import time
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import jwt
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web  # pylint: disable=wrong-import-position
+
+from ibm_platform_services import (
+    aio,
+    compression,
+    instrumentation,
+    rate_limit,
+    response_cache,
+    single_flight,
+    token_refresh,
+)  # pylint: disable=wrong-import-position
+from ibm_platform_services.resource_controller_v2 import ResourceControllerV2  # pylint: disable=wrong-import-position
+from ibm_platform_services.usage_metering_v4 import ResourceInstanceUsage  # pylint: disable=wrong-import-position
+
+INSTANCES = [{'id': 'instance-{0}'.format(i)} for i in range(25)]
+
+
+class _State:
+    """
+    The requests received by the local server.
+    """
+
+    def __init__(self):
+        self.authorization = []
+        self.usage = []
+        self.token_requests = 0
+        # The number of requests for the instance 'busy' answered with a 429 response.
+        self.throttle = 0
+
+
+def _make_app(state):
+    async def list_resource_instances(request):
+        limit = int(request.query.get('limit', 10))
+        start = int(request.query.get('start', 0))
+        resources = INSTANCES[start : start + limit]
+        result = {'rows_count': len(resources), 'resources': resources, 'next_url': None}
+        if start + limit < len(INSTANCES):
+            result['next_url'] = '/v2/resource_instances?limit={0}&start={1}'.format(limit, start + limit)
+        return web.json_response(result)
+
+    async def get_resource_instance(request):
+        await asyncio.sleep(float(request.query.get('delay', 0)))
+        if request.match_info['id'] == 'missing':
+            return web.json_response({'message': 'Instance not found'}, status=404)
+        if request.match_info['id'] == 'busy' and state.throttle > 0:
+            state.throttle -= 1
+            return web.json_response({'message': 'Too many requests'}, status=429, headers={'Retry-After': '0.1'})
+        state.authorization.append(request.headers.get('Authorization'))
+        return web.json_response({'id': request.match_info['id']})
+
+    async def report_resource_usage(request):
+        state.usage.append(await request.json())
+        return web.json_response({'resources': [{'status': 201}]}, status=202)
+
+    async def token(request):  # pylint: disable=unused-argument
+        state.token_requests += 1
+        now = int(time.time())
+        access_token = jwt.encode({'iat': now, 'exp': now + 3600}, 'x' * 32, algorithm='HS256')
+        return web.json_response(
+            {'access_token': access_token, 'refresh_token': 'refresh', 'token_type': 'Bearer', 'expires_in': 3600}
+        )
+
+    app = web.Application()
+    app.router.add_get('/v2/resource_instances', list_resource_instances)
+    app.router.add_get('/v2/resource_instances/{id}', get_resource_instance)
+    app.router.add_post('/v4/metering/resources/{resource_id}/usage', report_resource_usage)
+    app.router.add_post('/identity/token', token)
+    return app
+
+
+def run_with_server(test):
+    """
+    Run a coroutine test against a local server; the test receives the server state and URL.
+    """
+
+    async def main():
+        state = _State()
+        runner = web.AppRunner(_make_app(state))
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+        try:
+            await test(state, 'http://127.0.0.1:{0}'.format(port))
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+
+def _client(url, service_class_name='AsyncResourceControllerV2', authenticator=None):
+    client = getattr(aio, service_class_name)(authenticator=authenticator or NoAuthAuthenticator())
+    client.set_service_url(url)
+    return client
+
+
+class TestAsyncServices:
+    """
+    Test Class for the asyncio service clients
+    """
+
+    def test_async_classes(self):
+        """
+        Every service class has an asyncio variant that subclasses it.
+        """
+        for name in aio._SERVICE_CLASSES:
+            async_class = getattr(aio, 'Async' + name)
+            assert async_class.__name__ == 'Async' + name
+            assert issubclass(async_class, aio.AsyncServiceMixin)
+            assert async_class.__mro__[2].__name__ == name
+            assert async_class.is_async
+        assert issubclass(aio.AsyncResourceControllerV2, ResourceControllerV2)
+        assert not getattr(ResourceControllerV2, 'is_async', False)
+        with pytest.raises(AttributeError):
+            aio.AsyncNoSuchServiceV1  # pylint: disable=pointless-statement
+
+    def test_new_instance(self, monkeypatch):
+        """
+        new_instance() works for asyncio clients.
+        """
+        monkeypatch.setenv('TEST_SERVICE_AUTH_TYPE', 'noAuth')
+        client = aio.AsyncResourceControllerV2.new_instance(service_name='TEST_SERVICE')
+        assert isinstance(client, aio.AsyncResourceControllerV2)
+        assert isinstance(client.get_authenticator(), NoAuthAuthenticator)
+
+    def test_get(self):
+        """
+        An operation returns an awaitable that resolves to a DetailedResponse.
+        """
+
+        async def test(state, url):  # pylint: disable=unused-argument
+            async with _client(url) as client:
+                response = await client.get_resource_instance(id='abc')
+                assert isinstance(response, DetailedResponse)
+                assert response.get_status_code() == 200
+                assert response.get_result() == {'id': 'abc'}
+                assert response.get_headers()['content-type'].startswith('application/json')
+
+        run_with_server(test)
+
+    def test_error(self):
+        """
+        An error response raises an ApiException carrying the error message.
+        """
+
+        async def test(state, url):  # pylint: disable=unused-argument
+            async with _client(url) as client:
+                with pytest.raises(ApiException) as excinfo:
+                    await client.get_resource_instance(id='missing')
+                assert excinfo.value.code == 404
+                assert excinfo.value.message == 'Instance not found'
+
+        run_with_server(test)
+
+    def test_post_body(self):
+        """
+        Request bodies are sent as for the synchronous clients.
+        """
+
+        async def test(state, url):
+            async with _client(url, 'AsyncUsageMeteringV4') as client:
+                usage = ResourceInstanceUsage(
+                    resource_instance_id='crn:instance', plan_id='plan', start=1, end=2, measured_usage=[]
+                )
+                response = await client.report_resource_usage('resource', [usage])
+                assert response.get_status_code() == 202
+                assert state.usage[0][0]['resource_instance_id'] == 'crn:instance'
+
+        run_with_server(test)
+
+    def test_compression(self):
+        """
+        The large request bodies of the asyncio clients are compressed.
+        """
+
+        async def test(state, url):
+            gzip_compression = compression.GzipCompression(threshold=256)
+            async with _client(url, 'AsyncUsageMeteringV4') as client:
+                compression.set_compression(client, gzip_compression)
+                usage = [
+                    ResourceInstanceUsage(
+                        resource_instance_id='crn:instance-{0}'.format(i),
+                        plan_id='plan',
+                        start=1,
+                        end=2,
+                        measured_usage=[],
+                    )
+                    for i in range(50)
+                ]
+                response = await client.report_resource_usage('resource', usage)
+                assert response.get_status_code() == 202
+            assert len(state.usage[0]) == 50
+            assert gzip_compression.requests_compressed['report_resource_usage'] == 1
+            assert (
+                gzip_compression.request_wire_bytes['report_resource_usage']
+                < gzip_compression.request_bytes['report_resource_usage']
+            )
+
+        run_with_server(test)
+
+    def test_concurrent_requests(self):
+        """
+        Requests run concurrently on the event loop.
+        """
+
+        async def test(state, url):  # pylint: disable=unused-argument
+            async with _client(url) as client:
+                # Each request takes 0.2 seconds on the server.
+                start = time.perf_counter()
+                responses = await asyncio.gather(*[_delayed_get(client, i) for i in range(20)])
+                assert time.perf_counter() - start < 2
+                assert [r.get_result()['id'] for r in responses] == [str(i) for i in range(20)]
+
+        run_with_server(test)
+
+    def test_token_refresh(self):
+        """
+        The IAM token is fetched without blocking the event loop and shared by concurrent requests.
+        """
+
+        async def test(state, url):
+            authenticator = IAMAuthenticator('apikey', url=url)
+            async with _client(url, authenticator=authenticator) as client:
+                await asyncio.gather(*[client.get_resource_instance(id=str(i)) for i in range(5)])
+            assert state.token_requests == 1
+            assert all(header.startswith('Bearer ') for header in state.authorization)
+
+        run_with_server(test)
+
+    def test_token_refresher(self):
+        """
+        The token of an asyncio client is fetched by the token refresher, ahead of its requests.
+        """
+
+        async def test(state, url):
+            refresher = token_refresh.TokenRefresher()
+            authenticator = IAMAuthenticator('apikey', url=url)
+            async with _client(url, authenticator=authenticator) as client:
+                token_refresh.set_token_refresher(client, refresher)
+                while authenticator.token_manager.access_token is None:
+                    await asyncio.sleep(0.01)
+                await asyncio.gather(*[client.get_resource_instance(id=str(i)) for i in range(5)])
+            refresher.close()
+            assert state.token_requests == refresher.refreshes == 1
+            assert len(state.authorization) == 5
+
+        run_with_server(test)
+
+
+async def _delayed_get(client, i):
+    request = client.prepare_request(
+        method='GET', url='/v2/resource_instances/{0}'.format(i), params={'delay': '0.2'}, headers={}
+    )
+    return await client.send(request)
+
+
+class TestAsyncPagers:
+    """
+    Test Class for the asyncio pagers
+    """
+
+    def test_async_for(self):
+        """
+        An asyncio pager supports `async for` across pages.
+        """
+
+        async def test(state, url):  # pylint: disable=unused-argument
+            async with _client(url) as client:
+                pager = aio.AsyncResourceInstancesPager(client=client, limit=10)
+                ids = [instance['id'] async for instance in pager]
+                assert ids == [instance['id'] for instance in INSTANCES]
+                assert not pager.has_next()
+                with pytest.raises(StopAsyncIteration):
+                    await pager.get_next()
+
+        run_with_server(test)
+
+    def test_get_all(self):
+        """
+        get_all() returns the results of all pages.
+        """
+
+        async def test(state, url):  # pylint: disable=unused-argument
+            async with _client(url) as client:
+                pager = aio.AsyncResourceInstancesPager(client=client, limit=7)
+                page = await pager.get_next()
+                assert len(page) == 7
+                rest = await pager.get_all()
+                assert len(rest) == len(INSTANCES) - 7
+
+        run_with_server(test)
+
+    def test_instrumentation(self):
+        """
+        The asyncio clients report their calls, with the page numbers of their pagers.
+        """
+
+        class Recorder(instrumentation.Instrumentation):
+            def __init__(self):
+                self.ended = []
+
+            def end_operation(self, metrics):
+                self.ended.append(metrics)
+
+        async def test(state, url):  # pylint: disable=unused-argument
+            recorder = Recorder()
+            async with _client(url) as client:
+                instrumentation.set_instrumentation(client, recorder)
+                await client.get_resource_instance(id='abc')
+                with pytest.raises(ApiException):
+                    await client.get_resource_instance(id='missing')
+                await aio.AsyncResourceInstancesPager(client=client, limit=10).get_all()
+
+            get, error, *pages = recorder.ended
+            assert (get.operation_id, get.status_code, get.page, get.error) == (
+                'get_resource_instance',
+                200,
+                None,
+                None,
+            )
+            assert get.response_bytes == len(b'{"id": "abc"}')
+            assert get.request_bytes == 0
+            assert min(get.prepare_time, get.network_time, get.deserialization_time) >= 0
+            assert error.status_code == 404
+            assert isinstance(error.error, ApiException)
+            assert [(m.operation_id, m.page) for m in pages] == [('list_resource_instances', i) for i in (1, 2, 3)]
+
+        run_with_server(test)
+
+    def test_response_cache(self):
+        """
+        The asyncio clients answer the cached operations from their response cache.
+        """
+
+        async def test(state, url):
+            cache = response_cache.ResponseCache(ttls={'get_resource_instance': 60})
+            async with _client(url) as client:
+                response_cache.set_cache(client, cache)
+                first = await client.get_resource_instance(id='abc')
+                second = await client.get_resource_instance(id='abc')
+                assert second.get_result() == first.get_result() == {'id': 'abc'}
+                with pytest.raises(ApiException):
+                    await client.get_resource_instance(id='missing')
+            assert len(state.authorization) == 1
+            assert (cache.hits['get_resource_instance'], cache.misses['get_resource_instance']) == (1, 1)
+
+        run_with_server(test)
+
+    def test_single_flight(self):
+        """
+        Identical concurrent calls of the asyncio clients are coalesced.
+        """
+
+        async def test(state, url):
+            group = single_flight.SingleFlight()
+            async with _client(url) as client:
+                single_flight.set_single_flight(client, group)
+                responses = await asyncio.gather(*[client.get_resource_instance(id='abc') for _ in range(20)])
+                assert all(r.get_result() == {'id': 'abc'} for r in responses)
+                assert len({id(r.get_result()) for r in responses}) == 20
+                errors = await asyncio.gather(
+                    *[client.get_resource_instance(id='missing') for _ in range(5)], return_exceptions=True
+                )
+                assert all(isinstance(e, ApiException) and e.code == 404 for e in errors)
+            assert len(state.authorization) == 1
+            assert (group.sent['get_resource_instance'], group.coalesced['get_resource_instance']) == (2, 23)
+
+        run_with_server(test)
+
+    def test_rate_limit(self):
+        """
+        The requests of the asyncio clients are paced, and sent again after a 429 response.
+        """
+
+        async def test(state, url):
+            limiter = rate_limit.RateLimiter(rate=50)
+            async with _client(url) as client:
+                rate_limit.set_rate_limiter(client, limiter)
+                start = time.monotonic()
+                await asyncio.gather(*[client.get_resource_instance(id='abc') for _ in range(6)])
+                assert time.monotonic() - start >= 0.1
+                state.throttle = 2
+                start = time.monotonic()
+                response = await client.get_resource_instance(id='busy')
+                assert response.get_result() == {'id': 'busy'}
+                assert time.monotonic() - start >= 0.2
+            (bucket,) = limiter.buckets.values()
+            assert bucket.throttled == 2
+            assert bucket.rate < 50
+
+        run_with_server(test)
+
+    def test_pager_classes(self):
+        """
+        Every pager has an asyncio variant.
+        """
+        for name in aio._PAGER_CLASSES:
+            pager_class = getattr(aio, 'Async' + name)
+            assert issubclass(pager_class, aio.AsyncPager)
+            assert pager_class._pager_class.__name__ == name
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for BatchExecutor, run against a local server
+"""
+
+from collections import Counter
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+import pytest
+import requests
+
+from ibm_platform_services.batch import BatchExecutor, BatchResult
+from ibm_platform_services.resource_controller_v2 import ResourceControllerV2
+
+from .conftest import LocalHandler, make_client
+
+
+class _Handler(LocalHandler):
+    def do_GET(self):  # pylint: disable=invalid-name
+        self._serve(self.path.split('?')[0].rsplit('/', 1)[-1])
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self._serve(json.loads(self.read_body())['name'])
+
+    def _serve(self, instance_id):
+        server = self.server
+        with server.lock:
+            server.requests[instance_id] += 1
+            attempt = server.requests[instance_id]
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.times.append(time.monotonic())
+        time.sleep(0.2 if instance_id.startswith('slow') else 0.02)
+        with server.lock:
+            server.in_flight -= 1
+        headers = {}
+        if instance_id == 'missing':
+            status = 404
+        elif instance_id.startswith('flaky') and attempt == 1:
+            status = 503
+        elif instance_id == 'busy' and attempt == 1:
+            status, headers = 429, {'Retry-After': '0.3'}
+        else:
+            status = 200
+        self.respond(status, {'id': instance_id}, headers)
+
+
+@pytest.fixture
+def server(local_server):
+    return local_server(_Handler, lock=threading.Lock(), requests=Counter(), times=[], in_flight=0, max_in_flight=0)
+
+
+def _client(url):
+    client = make_client(ResourceControllerV2, url)
+    client.get_http_client().mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=16))
+    return client
+
+
+class TestBatchExecutor:
+    """
+    Test Class for BatchExecutor
+    """
+
+    def test_ordered(self, server):
+        """
+        The results are returned in the order of the arguments, with bounded concurrency.
+        """
+        client = _client(server.url)
+        ids = ['instance-{0}'.format(i) for i in range(40)]
+        with BatchExecutor(max_workers=4) as executor:
+            results = list(executor.map(client.get_resource_instance, ids))
+        assert [r.index for r in results] == list(range(40))
+        assert [r.get_result()['id'] for r in results] == ids
+        assert all(r.attempts == 1 and r.arguments == ids[r.index] for r in results)
+        assert 2 <= server.max_in_flight <= 4
+
+    def test_as_completed(self, server):
+        """
+        The results are returned as the calls complete, and the arguments may be keyword arguments.
+        """
+        client = _client(server.url)
+        arguments = [{'id': 'slow'}] + [{'id': 'instance-{0}'.format(i)} for i in range(7)]
+        with BatchExecutor(max_workers=4) as executor:
+            results = list(executor.map(client.get_resource_instance, arguments, ordered=False))
+        assert sorted(r.index for r in results) == list(range(8))
+        assert results[-1].index == 0
+        assert results[-1].get_result() == {'id': 'slow'}
+
+    def test_errors(self, server):
+        """
+        A failed call is returned with its exception; transient errors are retried.
+        """
+        client = _client(server.url)
+        with BatchExecutor(max_workers=4, retry_interval=0.01) as executor:
+            ok, missing, flaky = executor.map(client.get_resource_instance, ['ok', 'missing', 'flaky'])
+            assert executor.retries == 1
+        assert ok.error is None and ok.get_result() == {'id': 'ok'}
+        assert isinstance(missing.error, ApiException) and missing.error.code == 404
+        assert missing.response is None and missing.attempts == 1
+        with pytest.raises(ApiException):
+            missing.get_result()
+        assert flaky.get_result() == {'id': 'flaky'} and flaky.attempts == 2
+
+        with BatchExecutor(max_retries=0) as executor:
+            (flaky,) = executor.map(client.get_resource_instance, ['flaky-again'])
+        assert flaky.error.code == 503 and flaky.attempts == 1
+
+    def test_unsafe_operations(self, server):
+        """
+        The calls of operations that are not idempotent are only retried after a 429 response, unless asked to.
+        """
+        client = _client(server.url)
+        names = [
+            {'name': name, 'target': 'global', 'resource_group': 'group', 'resource_plan_id': 'plan'}
+            for name in ('flaky-create', 'busy')
+        ]
+        with BatchExecutor(retry_interval=0.01) as executor:
+            flaky, busy = executor.map(client.create_resource_instance, names)
+        assert flaky.error.code == 503 and flaky.attempts == 1
+        assert busy.error is None and busy.attempts == 2
+
+        names[0]['name'] = 'flaky-create-again'
+        with BatchExecutor(retry_interval=0.01) as executor:
+            (flaky,) = executor.map(client.create_resource_instance, names[:1], retry_unsafe=True)
+        assert flaky.error is None and flaky.attempts == 2
+        assert server.requests['flaky-create'] == 1 and server.requests['flaky-create-again'] == 2
+
+    def test_connection_errors(self):
+        """
+        Connection errors are retried, then returned with the call.
+        """
+        client = _client('http://127.0.0.1:1')
+        with BatchExecutor(max_retries=2, retry_interval=0.01) as executor:
+            (result,) = executor.map(client.get_resource_instance, ['instance'])
+        assert isinstance(result.error, requests.exceptions.ConnectionError)
+        assert result.attempts == 3
+        assert repr(result).startswith('BatchResult(index=0, error=')
+
+    def test_throttled(self, server):
+        """
+        A 429 response holds the calls to its host for the delay of its Retry-After header.
+        """
+        client = _client(server.url)
+        with BatchExecutor(max_workers=2) as executor:
+            results = list(
+                executor.map(client.get_resource_instance, ['busy'] + ['instance-{0}'.format(i) for i in range(4)])
+            )
+            assert executor.throttled == 1
+        assert all(r.error is None for r in results)
+        assert results[0].attempts == 2
+        # The calls sent after the 429 response wait for its delay.
+        times = sorted(server.times)
+        assert any(later - earlier >= 0.25 for earlier, later in zip(times, times[1:]))
+
+    def test_host_limits(self, server):
+        """
+        The calls in progress to a host are limited across the batches of the executor.
+        """
+        client = _client(server.url)
+        other = _client(server.url)
+        ids = ['instance-{0}'.format(i) for i in range(12)]
+        with BatchExecutor(max_workers=8, max_per_host=2) as executor:
+            first = executor.map(client.get_resource_instance, ids)
+            second = executor.map(other.get_resource_instance, ids)
+            assert len(list(first) + list(second)) == 24
+        assert server.max_in_flight == 2
+
+        server.max_in_flight = 0
+        with BatchExecutor(max_workers=8, max_per_host=2, host_limits={'127.0.0.1': 3}) as executor:
+            list(executor.map(client.get_resource_instance, ids))
+        assert server.max_in_flight == 3
+
+    def test_backpressure(self, server):
+        """
+        The arguments are taken from their iterable only as the results are consumed.
+        """
+        client = _client(server.url)
+        taken = []
+
+        def ids():
+            for i in range(1000):
+                taken.append(i)
+                yield 'instance-{0}'.format(i)
+
+        with BatchExecutor(max_workers=2, max_pending=4) as executor:
+            results = executor.map(client.get_resource_instance, ids())
+            first = next(results)
+            assert isinstance(first, BatchResult) and first.index == 0
+            time.sleep(0.1)
+            assert len(taken) == 5
+            results.close()
+        assert sum(server.requests.values()) <= 5
+
+    def test_validation(self):
+        """
+        The executor rejects invalid limits.
+        """
+        with pytest.raises(ValueError):
+            BatchExecutor(max_workers=0)
+        with pytest.raises(ValueError):
+            BatchExecutor(max_pending=0)
@@ -18,8 +18,20 @@
 Test methods in the common module
 """
 
+import datetime
 import unittest
-from ibm_platform_services import common
+
+from ibm_cloud_sdk_core import BaseService
+from ibm_cloud_sdk_core.authenticators import (
+    BasicAuthenticator,
+    BearerTokenAuthenticator,
+    CloudPakForDataAuthenticator,
+    IAMAuthenticator,
+    NoAuthAuthenticator,
+)
+from ibm_cloud_sdk_core.utils import string_to_datetime
+
+from ibm_platform_services import common, instrumentation
 
 
 class TestCommon(unittest.TestCase):
@@ -36,3 +48,161 @@ class TestCommon(unittest.TestCase):
         self.assertIsNotNone(headers.get('User-Agent'))
         print("User-Agent: {0}".format(headers.get('User-Agent')))
         self.assertTrue(headers.get('User-Agent').startswith('platform-services-python-sdk'))
+        # Building the headers does not start the operation; the operations do that themselves.
+        self.assertIsNone(instrumentation.current_operation_id())
+
+    def test_user_agent_is_lazy(self):
+        """
+        Test that USER_AGENT is computed on first use and cached
+        """
+        common.get_user_agent.cache_clear()
+        common.get_system_info.cache_clear()
+        self.assertEqual(common.get_system_info.cache_info().currsize, 0)
+        user_agent = common.USER_AGENT
+        self.assertEqual(common.get_system_info.cache_info().currsize, 1)
+        self.assertTrue(user_agent.startswith('platform-services-python-sdk/'))
+        self.assertIs(common.get_user_agent(), user_agent)
+        with self.assertRaises(AttributeError):
+            common.NOT_A_CONSTANT  # pylint: disable=pointless-statement
+
+    def test_lazy_datetime(self):
+        """
+        Test that a LazyDatetime compares equal to the datetime it denotes
+        """
+        lazy = common.LazyDatetime('2019-01-01T12:00:00Z')
+        expected = datetime.datetime(2019, 1, 1, 12, tzinfo=datetime.timezone.utc)
+        self.assertEqual(lazy, expected)
+        self.assertEqual(expected, lazy)
+        self.assertEqual(lazy, common.LazyDatetime('2019-01-01T13:00:00+01:00'))
+        self.assertNotEqual(lazy, common.LazyDatetime('2019-01-01T12:00:01Z'))
+        self.assertNotEqual(lazy, '2019-01-01T12:00:00Z')
+        self.assertEqual(hash(lazy), hash(expected))
+        self.assertIs(lazy.get(), lazy.get())
+
+    def test_lazy_datetime_attribute(self):
+        """
+        Test that a LazyDatetimeAttribute parses the strings read by from_dict() on first access
+        """
+
+        class Model:
+            created_at = common.LazyDatetimeAttribute()
+
+        model = Model()
+        with self.assertRaises(AttributeError):
+            model.created_at  # pylint: disable=pointless-statement
+        model.created_at = common.lazy_datetime('2019-01-01T12:00:00.500Z')
+        self.assertIsInstance(model.__dict__['created_at'], common.LazyDatetime)
+        self.assertEqual(model.created_at, datetime.datetime(2019, 1, 1, 12, 0, 0, 500000, datetime.timezone.utc))
+        self.assertIsInstance(model.__dict__['created_at'], datetime.datetime)
+        # Strings assigned by the caller are stored as is.
+        model.created_at = '2019-01-01T12:00:00.500Z'
+        self.assertEqual(model.created_at, '2019-01-01T12:00:00.500Z')
+        self.assertIsNone(common.lazy_datetime(None))
+        model.created_at = None
+        self.assertIsNone(model.created_at)
+        del model.created_at
+        self.assertFalse(hasattr(model, 'created_at'))
+
+    def test_parse_datetime(self):
+        """
+        Test that parse_datetime returns the same points in time as string_to_datetime
+        """
+        for string in ['2019-01-01T12:00:00.123Z', '2019-01-01T12:00:00-05:30', '2019-01-01', 'Jan 1 2019 10:00']:
+            self.assertEqual(common.parse_datetime(string), string_to_datetime(string))
+
+    def test_encode_path_var(self):
+        """
+        Test that encode_path_var encodes path variables like BaseService.encode_path_vars
+        """
+        values = ['id', 'crn:v1:bluemix:public:x:global:a/acc::inst', 'a b%c?d#e&f=g', '~_.-', 'ünïcode/ö', '']
+        self.assertEqual(
+            [common.encode_path_var(value) for value in values], list(BaseService.encode_path_vars(*values))
+        )
+
+    def test_request_template(self):
+        """
+        Test that RequestTemplate.prepare builds the same request as BaseService.prepare_request
+        """
+        service = BaseService(service_url='https://example.com/api/', authenticator=BearerTokenAuthenticator('token'))
+        service.set_default_headers({'X-Default': 'default'})
+        template = common.RequestTemplate(
+            'GET',
+            '/v1/groups/{group_id}/members/{member_id}',
+            service_name='example',
+            service_version='V1',
+            operation_id='get_member',
+            accept='application/json',
+        )
+        self.assertEqual(template.path_param_names, ('group_id', 'member_id'))
+
+        headers = {'Transaction-Id': None, 'X-Flag': True}
+        params = {'verbose': False, 'limit': 10, 'start': None}
+        custom_headers = {'X-Custom': 'custom', 'Accept': 'text/plain'}
+        request = template.prepare(
+            service, ('group/1', 'IBMid-1'), headers=headers, params=params, custom_headers=custom_headers
+        )
+
+        expected_headers = dict(headers)
+        expected_headers.update(common.get_sdk_headers('example', 'V1', 'get_member'))
+        expected_headers.update(custom_headers)
+        expected_headers['Accept'] = 'application/json'
+        expected = service.prepare_request(
+            method='GET',
+            url='/v1/groups/{0}/members/{1}'.format(*service.encode_path_vars('group/1', 'IBMid-1')),
+            headers=expected_headers,
+            params=params,
+        )
+        self.assertEqual(request, expected)
+        self.assertEqual(list(request), list(expected))
+        self.assertEqual(request['url'], 'https://example.com/api/v1/groups/group%2F1/members/IBMid-1')
+        self.assertEqual(request['headers']['Authorization'], 'Bearer token')
+
+        service.set_service_url(None)
+        with self.assertRaises(ValueError):
+            template.prepare(service, ('group', 'member'))
+
+    def test_auth_scope(self):
+        """
+        Test that auth_scope identifies the credentials of an authenticator
+        """
+        scope = common.auth_scope(IAMAuthenticator('apikey-1'))
+        self.assertEqual(scope, common.auth_scope(IAMAuthenticator('apikey-1')))
+        self.assertNotEqual(scope, common.auth_scope(IAMAuthenticator('apikey-2')))
+        self.assertNotEqual(scope, common.auth_scope(BearerTokenAuthenticator('apikey-1')))
+        self.assertNotIn('apikey-1', scope)
+        self.assertEqual(common.auth_scope(NoAuthAuthenticator()), common.auth_scope(NoAuthAuthenticator()))
+
+    def test_auth_scope_configuration(self):
+        """
+        Test that authenticators configured differently never share a scope
+        """
+        scope = common.auth_scope(IAMAuthenticator('apikey'))
+        different = [
+            IAMAuthenticator('apikey', scope='other'),
+            IAMAuthenticator('apikey', client_id='bx', client_secret='secret-1'),
+            IAMAuthenticator('apikey', headers={'X-Account': 'other'}),
+            IAMAuthenticator('apikey', proxies={'https': 'http://proxy:3128'}),
+            IAMAuthenticator('apikey', disable_ssl_verification=True),
+            IAMAuthenticator('apikey', url='https://iam.test.cloud.ibm.com'),
+        ]
+        scopes = {common.auth_scope(authenticator) for authenticator in different}
+        self.assertEqual(len(scopes), len(different))
+        self.assertNotIn(scope, scopes)
+        self.assertNotEqual(
+            common.auth_scope(IAMAuthenticator('apikey', client_id='bx', client_secret='secret-1')),
+            common.auth_scope(IAMAuthenticator('apikey', client_id='bx', client_secret='secret-2')),
+        )
+        self.assertNotEqual(
+            common.auth_scope(BasicAuthenticator('user', 'password-1')),
+            common.auth_scope(BasicAuthenticator('user', 'password-2')),
+        )
+        self.assertNotEqual(
+            common.auth_scope(CloudPakForDataAuthenticator('user', password='password-1', url='https://cp4d')),
+            common.auth_scope(CloudPakForDataAuthenticator('user', password='password-2', url='https://cp4d')),
+        )
+
+        # The state of the token is not part of the scope.
+        authenticator = IAMAuthenticator('apikey')
+        authenticator.token_manager.access_token = 'token'
+        authenticator.token_manager.expire_time = 1
+        self.assertEqual(common.auth_scope(authenticator), scope)
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the compact model classes
+"""
+
+import importlib
+import pickle
+
+import pytest
+
+from ibm_platform_services import compact, deserialization
+from ibm_platform_services.common import LazyDatetimeAttribute
+from ibm_platform_services.context_based_restrictions_v1 import Address
+from ibm_platform_services.resource_controller_v2 import Credentials, ResourceInstance, ResourceKey
+
+
+def _list_item_models():
+    for module_name, class_names in compact.LIST_ITEM_MODELS.items():
+        module = importlib.import_module('ibm_platform_services.' + module_name)
+        for class_name in class_names:
+            yield getattr(module, class_name)
+
+
+def _example_json(model_class, depth=0):
+    # Build a json representation with every property of the model set.
+    result = {}
+    for field in deserialization.get_model_spec(model_class).fields:
+        if field.kind == deserialization.CONVERTED or isinstance(
+            getattr(model_class, field.arg, None), LazyDatetimeAttribute
+        ):
+            result[field.key] = '2019-01-01T12:00:00Z'
+        elif field.kind == deserialization.VALUE:
+            result[field.key] = 'testString'
+        elif deserialization.get_model_spec(field.target) is not None and depth < 3:
+            value = _example_json(field.target, depth + 1)
+            if field.kind == deserialization.MODEL_LIST:
+                value = [value]
+            elif field.kind == deserialization.MODEL_DICT:
+                value = {'key1': value}
+            result[field.key] = value
+    return result
+
+
+class TestCompact:
+    """
+    Test Class for the compact model classes
+    """
+
+    @pytest.mark.parametrize('model_class', list(_list_item_models()), ids=lambda model_class: model_class.__name__)
+    def test_compatible_with_model_class(self, model_class):
+        """
+        Compact objects behave like the objects of the generated model class.
+        """
+        model_json = _example_json(model_class)
+        model = model_class.from_dict(model_json)
+        compact_model = compact.from_dict(model_class, model_json)
+
+        assert isinstance(compact_model, model_class)
+        assert type(compact_model).__name__ == 'Compact' + model_class.__name__
+        assert getattr(compact, 'Compact' + model_class.__name__) is type(compact_model)
+        assert vars(compact_model) == {}
+        assert compact_model == model
+        assert model == compact_model
+        assert not compact_model != model
+        assert compact_model.to_dict() == model.to_dict() == model_json
+        assert str(compact_model) == str(model)
+        assert pickle.loads(pickle.dumps(compact_model)) == model
+        assert type(compact_model).from_dict(model_json) == model
+
+        name = deserialization.get_model_spec(model_class).fields[0].arg
+        setattr(compact_model, name, 'other')
+        assert compact_model != model
+        assert getattr(compact_model, name) == 'other'
+
+    def test_nested_models(self):
+        """
+        compact.from_dict() decodes nested models as compact objects.
+        """
+        model_json = _example_json(ResourceInstance)
+        instance = compact.from_dict(ResourceInstance, model_json)
+        assert isinstance(instance.last_operation, compact.CompactModel)
+        assert isinstance(instance.plan_history[0], compact.CompactModel)
+        assert instance == ResourceInstance.from_dict(model_json)
+
+    def test_constructor(self):
+        """
+        Compact classes are constructed like the generated model classes.
+        """
+        key = compact.CompactResourceKey(id='key', name='my-key')
+        assert key == ResourceKey(id='key', name='my-key')
+        assert key.to_dict() == {'id': 'key', 'name': 'my-key'}
+        with pytest.raises(TypeError):
+            hash(key)
+
+    def test_from_dict_list(self):
+        """
+        compact.from_dict_list() decodes a list of json representations.
+        """
+        resources = [{'id': 'instance-{0}'.format(i)} for i in range(3)]
+        instances = compact.from_dict_list(ResourceInstance, resources)
+        assert [type(instance) for instance in instances] == [compact.CompactResourceInstance] * 3
+        assert instances == [ResourceInstance.from_dict(resource) for resource in resources]
+
+    def test_additional_properties(self):
+        """
+        Additional properties are kept in the object's __dict__.
+        """
+        credentials = compact.from_dict(Credentials, {'apikey': 'key', 'foo': 'bar'})
+        assert vars(credentials) == {'foo': 'bar'}
+        assert credentials.get_properties() == {'foo': 'bar'}
+        assert credentials.to_dict() == {'apikey': 'key', 'foo': 'bar'}
+        assert credentials == Credentials.from_dict({'apikey': 'key', 'foo': 'bar'})
+        credentials.set_properties({'baz': 1})
+        assert credentials.to_dict() == {'apikey': 'key', 'baz': 1}
+        assert pickle.loads(pickle.dumps(credentials)).get_properties() == {'baz': 1}
+
+    def test_unsupported_models(self):
+        """
+        Models that select a subclass through a discriminator do not have a compact variant.
+        """
+        with pytest.raises(ValueError):
+            compact.compact_class(Address)
+        with pytest.raises(AttributeError):
+            compact.CompactAddress  # pylint: disable=pointless-statement
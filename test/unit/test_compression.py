@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the gzip compression of request and response bodies, run against a local server
+"""
+
+import gzip
+import io
+import json
+
+import pytest
+
+from ibm_platform_services import compression, instrumentation, json_codec
+from ibm_platform_services.global_catalog_v1 import GlobalCatalogV1
+from ibm_platform_services.resource_controller_v2 import ResourceControllerV2
+from ibm_platform_services.usage_metering_v4 import MeasureAndQuantity, ResourceInstanceUsage, UsageMeteringV4
+
+from .conftest import LocalHandler, make_client
+
+# The result of the GET requests, large enough to be worth compressing.
+INSTANCE = {'id': 'instance', 'tags': ['env:prod', 'team:billing'] * 500}
+
+
+class _Handler(LocalHandler):
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = json.dumps(INSTANCE).encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+        self.server.requests.append({'headers': dict(self.headers)})
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self._receive()
+        self.respond(202, {'resources': [{'status': 201}]})
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        self._receive()
+        self.respond(200, {})
+
+    def _receive(self):
+        raw = self.read_body()
+        body = gzip.decompress(raw) if self.headers.get('Content-Encoding') == 'gzip' else raw
+        self.server.requests.append({'headers': dict(self.headers), 'raw': raw, 'body': body})
+
+
+@pytest.fixture
+def server(local_server):
+    return local_server(_Handler, requests=[])
+
+
+def _client(service_class, url, gzip_compression):
+    return compression.set_compression(make_client(service_class, url), gzip_compression)
+
+
+def _usage(count):
+    return [
+        ResourceInstanceUsage(
+            resource_instance_id='crn:v1:bluemix:public:database-service:us-south:a/1234:instance-{0}::'.format(i),
+            plan_id='database-lite',
+            start=1485907200000,
+            end=1485910800000,
+            measured_usage=[MeasureAndQuantity(measure='STORAGE', quantity=i)],
+        )
+        for i in range(count)
+    ]
+
+
+class TestGzipCompression:
+    """
+    Test Class for GzipCompression
+    """
+
+    def test_request_threshold(self, server):
+        """
+        Request bodies are compressed when they are at least as large as the threshold.
+        """
+        gzip_compression = compression.GzipCompression(threshold=1024)
+        client = _client(UsageMeteringV4, server.url, gzip_compression)
+        assert compression.get_compression(client) is gzip_compression
+        client.report_resource_usage('database-service', _usage(1))
+        client.report_resource_usage('database-service', _usage(100))
+        small, large = server.requests
+        assert 'Content-Encoding' not in small['headers']
+        assert large['headers']['Content-Encoding'] == 'gzip'
+        assert len(json.loads(large['body'])) == 100
+        assert len(large['raw']) < len(large['body']) / 5
+
+        op = 'report_resource_usage'
+        assert gzip_compression.requests_compressed[op] == 1
+        assert gzip_compression.request_bytes[op] == len(large['body'])
+        assert gzip_compression.request_wire_bytes[op] == len(large['raw'])
+
+    def test_stream_body(self, server):
+        """
+        A request body read from a file is compressed as it is sent.
+        """
+        gzip_compression = compression.GzipCompression()
+        client = _client(GlobalCatalogV1, server.url, gzip_compression)
+        artifact = b'artifact line\n' * 20000
+        client.upload_artifact('object', 'artifact.txt', artifact=io.BytesIO(artifact), content_type='text/plain')
+        client.upload_artifact('object', 'small.txt', artifact=io.BytesIO(b'small'), content_type='text/plain')
+        large, small = server.requests
+        assert large['headers']['Transfer-Encoding'] == 'chunked'
+        assert large['headers']['Content-Encoding'] == 'gzip'
+        assert large['body'] == artifact
+        assert small['raw'] == b'small' and 'Content-Encoding' not in small['headers']
+        assert gzip_compression.request_bytes['upload_artifact'] == len(artifact)
+        assert gzip_compression.request_wire_bytes['upload_artifact'] == len(large['raw'])
+
+    def test_response(self, server):
+        """
+        Compressed responses are negotiated, decompressed and counted.
+        """
+        gzip_compression = compression.GzipCompression()
+        client = _client(ResourceControllerV2, server.url, gzip_compression)
+        assert client.get_resource_instance('instance').get_result() == INSTANCE
+        assert server.requests[-1]['headers']['Accept-Encoding'] == 'gzip'
+        size = len(json.dumps(INSTANCE))
+        op = 'get_resource_instance'
+        assert gzip_compression.response_bytes[op] == size
+        assert 0 < gzip_compression.response_wire_bytes[op] < size / 5
+
+        # A streamed response is decompressed as it is read, and counted at its end.
+        request = client.prepare_request(method='GET', url='/v2/resource_instances/instance', headers={})
+        response = client.send(request, stream=True).get_result()
+        assert gzip_compression.response_bytes[''] == 0
+        chunks = list(response.iter_content(16))
+        assert len(chunks) > 1
+        assert json.loads(b''.join(chunks)) == INSTANCE
+        assert gzip_compression.response_bytes[''] == size
+        assert gzip_compression.response_wire_bytes[''] == gzip_compression.response_wire_bytes[op]
+
+        identity = compression.GzipCompression(decompress=False)
+        compression.set_compression(client, identity)
+        client.get_resource_instance('instance')
+        assert server.requests[-1]['headers']['Accept-Encoding'] == 'identity'
+        assert identity.response_wire_bytes[op] == identity.response_bytes[op] == size
+
+    def test_instrumentation(self, server):
+        """
+        The instrumentation measures the bytes sent and the decompressed bytes received.
+        """
+
+        class _Recording(instrumentation.Instrumentation):
+            def __init__(self):
+                self.metrics = []
+
+            def end_operation(self, metrics):
+                self.metrics.append(metrics)
+
+        recording = _Recording()
+        gzip_compression = compression.GzipCompression()
+        client = _client(UsageMeteringV4, server.url, gzip_compression)
+        instrumentation.set_instrumentation(client, recording)
+        client.report_resource_usage('database-service', _usage(100))
+        (metrics,) = recording.metrics
+        assert metrics.operation_id == 'report_resource_usage'
+        assert metrics.request_bytes == len(server.requests[0]['raw'])
+
+    def test_session_hooks(self, server):
+        """
+        The response hooks of a codec and of the instrumentation still run on compressed clients.
+        """
+
+        class _Recording(instrumentation.Instrumentation):
+            def __init__(self):
+                self.metrics = []
+
+            def end_operation(self, metrics):
+                self.metrics.append(metrics)
+
+        class _RecordingCodec(json_codec.JSONCodec):
+            def __init__(self):
+                super().__init__()
+                self.decoded = 0
+
+            def loads(self, data):
+                self.decoded += 1
+                return super().loads(data)
+
+        recording = _Recording()
+        codec = _RecordingCodec()
+        gzip_compression = compression.GzipCompression()
+        client = _client(ResourceControllerV2, server.url, gzip_compression)
+        json_codec.set_codec(client, codec)
+        instrumentation.set_instrumentation(client, recording)
+        assert client.get_resource_instance('instance').get_result() == INSTANCE
+        assert codec.decoded == 1
+        (metrics,) = recording.metrics
+        assert metrics.status_code == 200
+        assert metrics.response_bytes == len(json.dumps(INSTANCE))
+        assert gzip_compression.response_bytes['get_resource_instance'] == len(json.dumps(INSTANCE))
+
+    def test_options(self, server):
+        """
+        Only the listed operations are compressed, and bodies already encoded are left as they are.
+        """
+        gzip_compression = compression.GzipCompression(threshold=0, operations=['upload_artifact'])
+        assert gzip_compression.compresses('upload_artifact')
+        assert not gzip_compression.compresses('report_resource_usage')
+        client = _client(UsageMeteringV4, server.url, gzip_compression)
+        client.report_resource_usage('database-service', _usage(100))
+        assert 'Content-Encoding' not in server.requests[-1]['headers']
+
+        # Compressed by the core's own option.
+        client = _client(UsageMeteringV4, server.url, compression.GzipCompression(threshold=0))
+        client.set_enable_gzip_compression(True)
+        client.report_resource_usage('database-service', _usage(100))
+        assert len(json.loads(server.requests[-1]['body'])) == 100
+
+        compression.set_compression(client, None)
+        assert compression.get_compression(client) is None
+        with pytest.raises(ValueError):
+            compression.GzipCompression(level=10)
+        assert gzip.decompress(gzip_compression.compress(b'body')) == b'body'
+        assert gzip.decompress(b''.join(gzip_compression.compress(io.BytesIO(b'body')))) == b'body'
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for ConnectionPoolRegistry
+"""
+
+import threading
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+
+from ibm_platform_services.connection_pool import ConnectionPoolRegistry
+from ibm_platform_services.global_tagging_v1 import GlobalTaggingV1
+from ibm_platform_services.resource_controller_v2 import ResourceControllerV2
+from ibm_platform_services.resource_manager_v2 import ResourceManagerV2
+
+from .conftest import LocalHandler, make_client
+
+
+class _Handler(LocalHandler):
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.respond(200)
+
+
+@pytest.fixture
+def server(local_server):
+    return local_server(_Handler, connections=0, lock=threading.Lock())
+
+
+def _make_clients(url):
+    return [
+        make_client(service_class, url)
+        for service_class in [ResourceControllerV2, ResourceManagerV2, GlobalTaggingV1] * 3
+    ]
+
+
+def _call(client):
+    if isinstance(client, ResourceControllerV2):
+        return client.list_resource_instances()
+    if isinstance(client, ResourceManagerV2):
+        return client.list_resource_groups()
+    return client.list_tags()
+
+
+class TestConnectionPoolRegistry:
+    """
+    Test Class for ConnectionPoolRegistry
+    """
+
+    def test_clients_share_connections(self, server):
+        """
+        Clients attached to a registry reuse one keep-alive connection per host.
+        """
+        registry = ConnectionPoolRegistry()
+        clients = [registry.attach(client) for client in _make_clients(server.url)]
+        for _ in range(3):
+            for client in clients:
+                assert _call(client).get_status_code() == 200
+        assert server.connections == 1
+        registry.close()
+
+    def test_unshared_clients_open_one_connection_each(self, server):
+        """
+        Without a registry each client opens its own connection.
+        """
+        clients = _make_clients(server.url)
+        for client in clients:
+            _call(client)
+        assert server.connections == len(clients)
+
+    def test_host_limits(self):
+        """
+        Per-host limits override the default pool size.
+        """
+        registry = ConnectionPoolRegistry(pool_maxsize=4, host_limits={'tags.global-search-tagging.cloud.ibm.com': 2})
+        pool_manager = registry.get_pool_manager('https://tags.global-search-tagging.cloud.ibm.com/v3/tags')
+        assert pool_manager.connection_pool_kw['maxsize'] == 2
+        assert registry.get_pool_manager('https://TAGS.global-search-tagging.cloud.ibm.com') is pool_manager
+        assert registry.get_pool_manager('https://resource-controller.cloud.ibm.com').connection_pool_kw['maxsize'] == 4
+
+    def test_attach_keeps_retry_config(self):
+        """
+        The shared adapter uses the retry configuration of the client.
+        """
+        client = ResourceControllerV2(authenticator=NoAuthAuthenticator())
+        client.enable_retries(max_retries=3)
+        registry = ConnectionPoolRegistry()
+        registry.attach(client)
+        adapter = client.get_http_client().get_adapter(
+            'https://resource-controller.cloud.ibm.com/v2/resource_instances'
+        )
+        assert adapter is client.http_adapter
+        assert adapter.max_retries.total == 3
+        assert adapter.poolmanager is registry.get_pool_manager(client.service_url)
+
+    def test_new_instance(self, monkeypatch):
+        """
+        new_instance() creates an attached client from external configuration.
+        """
+        monkeypatch.setenv('TEST_SERVICE_AUTH_TYPE', 'noAuth')
+        registry = ConnectionPoolRegistry()
+        client = registry.new_instance(ResourceControllerV2, service_name='TEST_SERVICE')
+        assert isinstance(client, ResourceControllerV2)
+        assert client.http_adapter.poolmanager is registry.get_pool_manager(client.service_url)
+
+    def test_invalid_url(self):
+        """
+        A registry only accepts http and https URLs.
+        """
+        with pytest.raises(ValueError):
+            ConnectionPoolRegistry().get_pool_manager('ftp://example.com')
+        with pytest.raises(ValueError):
+            ConnectionPoolRegistry(pool_maxsize=0)
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the compiled model decoders
+"""
+
+import glob
+import importlib
+import importlib.util
+import inspect
+import os
+
+from ibm_cloud_sdk_core.utils import string_to_datetime
+import pytest
+
+from ibm_platform_services import deserialization, model_specs
+from ibm_platform_services.common import LazyDatetimeAttribute
+from ibm_platform_services.context_based_restrictions_v1 import Address, AddressIPAddress
+from ibm_platform_services.global_catalog_v1 import CatalogEntry
+from ibm_platform_services.resource_controller_v2 import Credentials, Reclamation, ResourceInstance
+
+
+def _model_classes():
+    package = os.path.dirname(deserialization.__file__)
+    for path in sorted(glob.glob(os.path.join(package, '*_v[0-9].py'))):
+        module = importlib.import_module('ibm_platform_services.' + os.path.basename(path)[:-3])
+        for value in vars(module).values():
+            if inspect.isclass(value) and value.__module__ == module.__name__ and 'from_dict' in vars(value):
+                yield value
+
+
+MODEL_CLASSES = list(_model_classes())
+
+
+def _example_json(model_class, depth=0, required_only=False):
+    # Build a json representation with every property of the model set, or None
+    # if a required nested model cannot be built this way.
+    spec = deserialization.get_model_spec(model_class)
+    if spec is None or depth > 3:
+        return None
+    result = {}
+    for field in spec.fields:
+        if required_only and field.required_message is None:
+            continue
+        if field.kind == deserialization.CONVERTED or isinstance(
+            getattr(model_class, field.arg, None), LazyDatetimeAttribute
+        ):
+            value = '2019-01-01T12:00:00Z'
+        elif field.kind == deserialization.VALUE:
+            value = 'testString'
+        else:
+            value = _example_json(field.target, depth + 1, required_only)
+            if value is not None and field.kind == deserialization.MODEL_LIST:
+                value = [value, value]
+            elif value is not None and field.kind == deserialization.MODEL_DICT:
+                value = {'key1': value, 'key2': value}
+        if value is None:
+            if field.required_message is not None:
+                return None
+            continue
+        result[field.key] = value
+    if spec.additional_properties:
+        result['foo'] = 'testString'
+    elif not required_only:
+        # Properties that are not part of the model are ignored.
+        result['unknown_property'] = 'testString'
+    return result
+
+
+class TestDeserialization:
+    """
+    Test Class for the compiled model decoders
+    """
+
+    def test_model_specs(self):
+        """
+        Only the models that select a subclass through a discriminator are not compiled.
+        """
+        assert len(MODEL_CLASSES) > 300
+        unsupported = [cls for cls in MODEL_CLASSES if deserialization.get_model_spec(cls) is None]
+        assert unsupported and all(hasattr(cls, '_get_class_by_discriminator') for cls in unsupported)
+
+        spec = deserialization.get_model_spec(CatalogEntry)
+        fields = {field.key: field for field in spec.fields}
+        assert fields['name'].required_message == 'Required property \'name\' not present in CatalogEntry JSON'
+        assert fields['overview_ui'].kind == deserialization.MODEL_DICT
+        assert fields['images'].kind == deserialization.MODEL
+        assert fields['tags'].kind == deserialization.VALUE
+        assert fields['created'].kind == deserialization.CONVERTED
+        assert fields['name'].arg == 'name'
+
+    def test_model_specs_current(self):
+        """
+        model_specs.py holds the tables generated from the current service modules.
+        """
+        path = os.path.join(os.path.dirname(__file__), '..', '..', 'scripts', 'generate_model_specs.py')
+        spec = importlib.util.spec_from_file_location('generate_model_specs', path)
+        generator = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(generator)
+        assert model_specs.MODEL_SPECS == generator.generate_model_specs()
+
+    def test_without_source(self, monkeypatch):
+        """
+        The decoders are compiled without the source of the model classes, and tables that
+        no longer match their class are not used.
+        """
+
+        def getsource(obj):
+            raise OSError('could not get source code')
+
+        monkeypatch.setattr(inspect, 'getsource', getsource)
+        monkeypatch.setattr(deserialization, '_specs', {})
+        monkeypatch.setattr(deserialization, '_decoders', {})
+        model_json = _example_json(CatalogEntry)
+        assert deserialization.from_dict(CatalogEntry, model_json) == CatalogEntry.from_dict(model_json)
+        assert deserialization.get_decoder(CatalogEntry) != CatalogEntry.from_dict
+
+        fields, attributes, additional_properties = model_specs.MODEL_SPECS['resource_controller_v2']['Reclamation']
+        stale = (fields, attributes + ('removed',), additional_properties)
+        monkeypatch.setitem(model_specs.MODEL_SPECS['resource_controller_v2'], 'Reclamation', stale)
+        assert deserialization.get_model_spec(Reclamation) is None
+        assert deserialization.get_decoder(Reclamation) == Reclamation.from_dict
+
+    @pytest.mark.parametrize('required_only', [False, True])
+    def test_equivalent_to_from_dict(self, required_only):
+        """
+        The compiled decoders return the same objects as from_dict().
+        """
+        checked = 0
+        for model_class in MODEL_CLASSES:
+            model_json = _example_json(model_class, required_only=required_only)
+            if model_json is None:
+                continue
+            expected = model_class.from_dict(model_json)
+            actual = deserialization.from_dict(model_class, model_json)
+            assert type(actual) is model_class
+            assert actual == expected, model_class.__name__
+            assert list(vars(actual)) == list(vars(expected))
+            assert actual.to_dict() == expected.to_dict()
+            checked += 1
+        assert checked > 290
+
+    def test_missing_required_property(self):
+        """
+        A missing required property raises the same ValueError as from_dict().
+        """
+        model_json = _example_json(CatalogEntry)
+        del model_json['kind']
+        with pytest.raises(ValueError) as expected:
+            CatalogEntry.from_dict(model_json)
+        with pytest.raises(ValueError) as actual:
+            deserialization.from_dict(CatalogEntry, model_json)
+        assert str(actual.value) == str(expected.value)
+
+    def test_additional_properties(self):
+        """
+        Additional properties are kept as for from_dict().
+        """
+        credentials = deserialization.from_dict(Credentials, {'apikey': 'key', 'foo': 'bar'})
+        assert credentials.apikey == 'key'
+        assert credentials.get_properties() == {'foo': 'bar'}
+        assert credentials.to_dict() == {'apikey': 'key', 'foo': 'bar'}
+
+    def test_discriminator_fallback(self):
+        """
+        Models that select a subclass through a discriminator are decoded with their from_dict() method.
+        """
+        assert deserialization.get_decoder(Address) == Address.from_dict
+        address = deserialization.from_dict(Address, {'type': 'ipAddress', 'value': '169.23.56.234'})
+        assert isinstance(address, AddressIPAddress)
+
+    def test_from_dict_list(self):
+        """
+        from_dict_list() decodes a list of json representations.
+        """
+        resources = [{'id': 'instance-{0}'.format(i), 'created_at': '2019-01-01T12:00:00Z'} for i in range(3)]
+        instances = deserialization.from_dict_list(ResourceInstance, resources)
+        assert instances == [ResourceInstance.from_dict(resource) for resource in resources]
+        assert deserialization.get_decoder(ResourceInstance) is deserialization.get_decoder(ResourceInstance)
+
+    @pytest.mark.parametrize(
+        'string',
+        [
+            '2019-01-01T12:00:00Z',
+            '2019-01-01T12:00:00.123Z',
+            '2019-01-01T12:00:00.1234567Z',
+            '2019-01-01T12:00:00',
+            '2019-01-01 12:00:00+00:00',
+            '2019-01-01T12:00:00-05:30',
+            '2019-01-01T12:00:00+0530',
+            '2019-01-01',
+            'Jan 1 2019 10:00',
+        ],
+    )
+    def test_parse_datetime(self, string):
+        """
+        parse_datetime() returns the same points in time and UTC offsets as string_to_datetime().
+        """
+        actual = deserialization.parse_datetime(string)
+        expected = string_to_datetime(string)
+        assert actual == expected
+        assert actual.utcoffset() == expected.utcoffset()
+
+    def test_parse_datetime_error(self):
+        """
+        parse_datetime() raises the same errors as string_to_datetime().
+        """
+        with pytest.raises(ValueError, match='day is out of range'):
+            deserialization.parse_datetime('2019-02-30T12:00:00Z')
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for streaming downloads, run against a local server
+"""
+
+import hashlib
+import io
+import re
+
+from ibm_cloud_sdk_core import ApiException
+import pytest
+
+from ibm_platform_services import downloads
+from ibm_platform_services.case_management_v1 import CaseManagementV1
+from ibm_platform_services.catalog_management_v1 import CatalogManagementV1
+from ibm_platform_services.global_catalog_v1 import GlobalCatalogV1
+
+from .conftest import LocalHandler, make_client
+
+# The body of every download, larger than a few chunks.
+BODY = bytes(range(256)) * 1024
+
+
+class _Handler(LocalHandler):
+    def do_GET(self):  # pylint: disable=invalid-name
+        server = self.server
+        server.requests.append({'path': self.path, 'headers': dict(self.headers)})
+        # Decided before the response starts, as the client may send its next request as soon as it has the headers.
+        drop = server.drops > 0
+        server.drops -= drop
+        body, start = server.body, 0
+        match = re.match(r'bytes=(\d+)-$', self.headers.get('Range', ''))
+        if_range = self.headers.get('If-Range')
+        if match and server.ranges and (if_range is None or if_range == server.etag):
+            start = int(match.group(1))
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header('Content-Range', 'bytes */{0}'.format(len(body)))
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes {0}-{1}/{2}'.format(start, len(body) - 1, len(body)))
+        else:
+            self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(len(body) - start))
+        self.send_header('ETag', server.etag)
+        self.end_headers()
+        if drop:
+            # The connection fails in the middle of the body.
+            self.wfile.write(body[start : start + (len(body) - start) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+
+@pytest.fixture
+def server(local_server):
+    return local_server(_Handler, body=BODY, etag='"v1"', ranges=True, drops=0, requests=[])
+
+
+class TestDownload:
+    """
+    Test Class for Download and download()
+    """
+
+    def test_chunks(self, server):
+        """
+        The body is retrieved in chunks of the chunk size, and its checksum computed.
+        """
+        client = make_client(CaseManagementV1, server.url)
+        download = downloads.Download(
+            client.download_file, 'CS1234', 'file-id', chunk_size=10000, checksum='sha256', headers={'X-Test': '1'}
+        )
+        chunks = list(download)
+        assert b''.join(chunks) == BODY
+        assert {len(chunk) for chunk in chunks[:-1]} == {10000}
+        assert download.size == download.offset == len(BODY)
+        assert download.hexdigest() == hashlib.sha256(BODY).hexdigest()
+        assert download.attempts == 1
+        (request,) = server.requests
+        assert request['path'] == '/cases/CS1234/attachments/file-id'
+        assert request['headers']['X-Test'] == '1' and 'Range' not in request['headers']
+        assert downloads.Download(client.download_file, 'CS1234', 'file-id').hexdigest() is None
+        with pytest.raises(ValueError):
+            downloads.Download(client.download_file, 'CS1234', 'file-id', chunk_size=0)
+
+    def test_destinations(self, server, tmp_path):
+        """
+        The body is written to a path or a file object.
+        """
+        client = make_client(GlobalCatalogV1, server.url)
+        path = tmp_path / 'artifact.bin'
+        download = downloads.download(
+            client.get_artifact, 'object', 'artifact.bin', destination=str(path), checksum='md5', account='acct'
+        )
+        assert path.read_bytes() == BODY
+        assert download.hexdigest() == hashlib.md5(BODY).hexdigest()
+        assert server.requests[-1]['path'] == '/object/artifacts/artifact.bin?account=acct'
+
+        client = make_client(CatalogManagementV1, server.url)
+        file = io.BytesIO(b'header')
+        file.seek(0, io.SEEK_END)
+        downloads.download(client.get_offering_source, '1.0.0', destination=file, id='offering', chunk_size=4096)
+        assert file.getvalue() == b'header' + BODY
+        assert server.requests[-1]['path'] == '/offering/source?version=1.0.0&id=offering'
+
+    def test_connection_failure(self, server, tmp_path):
+        """
+        A download is resumed from the last byte received when the connection fails.
+        """
+        server.drops = 2
+        client = make_client(CaseManagementV1, server.url)
+        path = tmp_path / 'file.bin'
+        download = downloads.download(
+            client.download_file, 'CS1234', 'file-id', destination=path, chunk_size=4096, checksum='sha256'
+        )
+        assert path.read_bytes() == BODY
+        assert download.hexdigest() == hashlib.sha256(BODY).hexdigest()
+        assert download.attempts == 3
+        first, second, third = server.requests
+        assert 'Range' not in first['headers']
+        assert second['headers']['Range'] == 'bytes={0}-'.format(len(BODY) // 2)
+        assert second['headers']['If-Range'] == '"v1"'
+        assert third['headers']['Range'] == 'bytes={0}-'.format(len(BODY) // 2 + len(BODY) // 4)
+
+        server.drops = 2
+        with pytest.raises(Exception):
+            downloads.download(client.download_file, 'CS1234', 'file-id', destination=path, max_retries=1)
+
+    def test_resume(self, server, tmp_path):
+        """
+        A download to a path is resumed from the bytes already written.
+        """
+        client = make_client(CaseManagementV1, server.url)
+        path = tmp_path / 'file.bin'
+        path.write_bytes(BODY[:1000])
+        download = downloads.download(
+            client.download_file, 'CS1234', 'file-id', destination=path, resume=True, checksum='sha256'
+        )
+        assert path.read_bytes() == BODY
+        assert download.hexdigest() == hashlib.sha256(BODY).hexdigest()
+        assert server.requests[-1]['headers']['Range'] == 'bytes=1000-'
+
+        # The file is complete already.
+        download = downloads.download(client.download_file, 'CS1234', 'file-id', destination=path, resume=True)
+        assert path.read_bytes() == BODY and download.size == len(BODY)
+
+        # The server sends the whole body, which replaces the file.
+        server.ranges = False
+        path.write_bytes(b'x' * 1000)
+        downloads.download(client.download_file, 'CS1234', 'file-id', destination=path, resume=True)
+        assert path.read_bytes() == BODY
+
+    def test_changed(self, server):
+        """
+        A download whose body changes while it is retrieved fails rather than mixing two bodies.
+        """
+        server.drops = 1
+        client = make_client(CaseManagementV1, server.url)
+        download = downloads.Download(client.download_file, 'CS1234', 'file-id', chunk_size=4096)
+        chunks = iter(download)
+        next(chunks)
+        server.etag = '"v2"'
+        with pytest.raises(ApiException) as error:
+            list(chunks)
+        assert error.value.code == 412
+
+        # Without ranges, the bytes already retrieved are skipped when the body is the same.
+        server.etag, server.ranges, server.drops = '"v1"', False, 1
+        download = downloads.Download(client.download_file, 'CS1234', 'file-id', chunk_size=4096)
+        assert b''.join(download) == BODY
+        assert download.attempts == 2
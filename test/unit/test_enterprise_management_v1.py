@@ -309,6 +309,34 @@ class TestListEnterprises:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_enterprises_with_pager_iter(self):
+        """
+        test_list_enterprises_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/enterprises')
+        mock_response1 = '{"total_count":2,"limit":1,"next_url":"https://myhost.com/somePath?next_docid=1","resources":[{"url":"url","id":"id","enterprise_account_id":"enterprise_account_id","crn":"crn","name":"name","domain":"domain","state":"state","primary_contact_iam_id":"primary_contact_iam_id","primary_contact_email":"primary_contact_email","created_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_at":"2019-01-01T12:00:00.000Z","updated_by":"updated_by"}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"resources":[{"url":"url","id":"id","enterprise_account_id":"enterprise_account_id","crn":"crn","name":"name","domain":"domain","state":"state","primary_contact_iam_id":"primary_contact_iam_id","primary_contact_email":"primary_contact_email","created_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_at":"2019-01-01T12:00:00.000Z","updated_by":"updated_by"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = EnterprisesPager(
+            client=_service,
+            enterprise_account_id='testString',
+            account_group_id='testString',
+            account_id='testString',
+            limit=10,
+        )
+        iterator = iter(pager)
+        first_result = next(iterator)
+        assert first_result is not None
+        assert len(responses.calls) == 1
+        remaining_results = list(iterator)
+        assert len(remaining_results) == 1
+        assert len(responses.calls) == 2
+
 
 class TestGetEnterprise:
     """
@@ -803,6 +831,34 @@ class TestListAccounts:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_accounts_with_pager_iter(self):
+        """
+        test_list_accounts_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/accounts')
+        mock_response1 = '{"total_count":2,"limit":1,"next_url":"https://myhost.com/somePath?next_docid=1","resources":[{"url":"url","id":"id","crn":"crn","parent":"parent","enterprise_account_id":"enterprise_account_id","enterprise_id":"enterprise_id","enterprise_path":"enterprise_path","name":"name","state":"state","owner_iam_id":"owner_iam_id","paid":true,"owner_email":"owner_email","is_enterprise_account":false,"created_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_at":"2019-01-01T12:00:00.000Z","updated_by":"updated_by"}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"resources":[{"url":"url","id":"id","crn":"crn","parent":"parent","enterprise_account_id":"enterprise_account_id","enterprise_id":"enterprise_id","enterprise_path":"enterprise_path","name":"name","state":"state","owner_iam_id":"owner_iam_id","paid":true,"owner_email":"owner_email","is_enterprise_account":false,"created_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_at":"2019-01-01T12:00:00.000Z","updated_by":"updated_by"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = AccountsPager(
+            client=_service,
+            enterprise_id='testString',
+            account_group_id='testString',
+            parent='testString',
+            limit=10,
+        )
+        iterator = iter(pager)
+        first_result = next(iterator)
+        assert first_result is not None
+        assert len(responses.calls) == 1
+        remaining_results = list(iterator)
+        assert len(remaining_results) == 1
+        assert len(responses.calls) == 2
+
 
 class TestGetAccount:
     """
@@ -1186,6 +1242,34 @@ class TestListAccountGroups:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_account_groups_with_pager_iter(self):
+        """
+        test_list_account_groups_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/account-groups')
+        mock_response1 = '{"total_count":2,"limit":1,"next_url":"https://myhost.com/somePath?next_docid=1","resources":[{"url":"url","id":"id","crn":"crn","parent":"parent","enterprise_account_id":"enterprise_account_id","enterprise_id":"enterprise_id","enterprise_path":"enterprise_path","name":"name","state":"state","primary_contact_iam_id":"primary_contact_iam_id","primary_contact_email":"primary_contact_email","created_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_at":"2019-01-01T12:00:00.000Z","updated_by":"updated_by"}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"resources":[{"url":"url","id":"id","crn":"crn","parent":"parent","enterprise_account_id":"enterprise_account_id","enterprise_id":"enterprise_id","enterprise_path":"enterprise_path","name":"name","state":"state","primary_contact_iam_id":"primary_contact_iam_id","primary_contact_email":"primary_contact_email","created_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_at":"2019-01-01T12:00:00.000Z","updated_by":"updated_by"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = AccountGroupsPager(
+            client=_service,
+            enterprise_id='testString',
+            parent_account_group_id='testString',
+            parent='testString',
+            limit=10,
+        )
+        iterator = iter(pager)
+        first_result = next(iterator)
+        assert first_result is not None
+        assert len(responses.calls) == 1
+        remaining_results = list(iterator)
+        assert len(remaining_results) == 1
+        assert len(responses.calls) == 2
+
 
 class TestGetAccountGroup:
     """
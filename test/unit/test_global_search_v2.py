@@ -130,6 +130,92 @@ class TestSearch:
         assert req_body['search_cursor'] == 'testString'
 
 
+class TestSearchIterator:
+    """
+    Test Class for SearchIterator
+    """
+
+    def preprocess_url(self, request_url: str):
+        """
+        Preprocess the request URL to ensure the mock response will be found.
+        """
+        if re.fullmatch('.*/+', request_url) is None:
+            return request_url
+        else:
+            return re.compile(request_url.rstrip('/') + '/+')
+
+    def add_batches(self):
+        """
+        Set up a mock search returning two batches followed by an empty one.
+        """
+        url = self.preprocess_url(_base_url + '/v3/resources/search')
+        mock_response1 = '{"search_cursor": "cursor1", "limit": 2, "items": [{"crn": "crn1"}, {"crn": "crn2"}]}'
+        mock_response2 = '{"search_cursor": "cursor2", "limit": 2, "items": [{"crn": "crn3"}]}'
+        mock_response3 = '{"search_cursor": "cursor3", "limit": 2, "items": []}'
+        for mock_response in [mock_response1, mock_response2, mock_response3]:
+            responses.add(responses.POST, url, body=mock_response, content_type='application/json', status=200)
+
+    @responses.activate
+    def test_search_iterator_get_next(self):
+        """
+        test_search_iterator_get_next()
+        """
+        self.add_batches()
+        iterator = SearchIterator(
+            client=_service,
+            query='type:resource-instance',
+            fields=['name'],
+            account_id='testString',
+            limit=2,
+            timeout=5,
+        )
+        all_results = []
+        while iterator.has_next():
+            all_results.extend(iterator.get_next())
+        assert [item['crn'] for item in all_results] == ['crn1', 'crn2', 'crn3']
+        assert len(responses.calls) == 3
+        # The cursor returned by each call is sent on the next one
+        req_bodies = [json.loads(str(call.request.body, 'utf-8')) for call in responses.calls]
+        assert 'search_cursor' not in req_bodies[0]
+        assert req_bodies[1]['search_cursor'] == 'cursor1'
+        assert req_bodies[2]['search_cursor'] == 'cursor2'
+        assert all(req_body['fields'] == ['name'] for req_body in req_bodies)
+        query_string = urllib.parse.unquote_plus(responses.calls[0].request.url.split('?', 1)[1])
+        assert 'timeout=5' in query_string
+        assert 'limit=2' in query_string
+
+    @responses.activate
+    def test_search_iterator_iter(self):
+        """
+        test_search_iterator_iter()
+        """
+        self.add_batches()
+        iterator = iter(SearchIterator(client=_service, limit=2))
+        assert next(iterator)['crn'] == 'crn1'
+        assert len(responses.calls) == 1
+        assert [item['crn'] for item in iterator] == ['crn2', 'crn3']
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_search_iterator_prefetch(self):
+        """
+        test_search_iterator_prefetch()
+        """
+        self.add_batches()
+        all_results = list(SearchIterator(client=_service, limit=2, prefetch=True))
+        assert [item['crn'] for item in all_results] == ['crn1', 'crn2', 'crn3']
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_search_iterator_get_all(self):
+        """
+        test_search_iterator_get_all()
+        """
+        self.add_batches()
+        all_results = SearchIterator(client=_service, limit=2).get_all()
+        assert len(all_results) == 3
+
+
 # endregion
 ##############################################################################
 # End of Service: Search
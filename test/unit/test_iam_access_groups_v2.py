@@ -405,6 +405,38 @@ class TestListAccessGroups:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_access_groups_with_pager_iter(self):
+        """
+        test_list_access_groups_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/v2/groups')
+        mock_response1 = '{"next":{"href":"https://myhost.com/somePath?offset=1"},"total_count":2,"limit":1,"groups":[{"id":"id","name":"name","description":"description","account_id":"account_id","created_at":"2019-01-01T12:00:00.000Z","created_by_id":"created_by_id","last_modified_at":"2019-01-01T12:00:00.000Z","last_modified_by_id":"last_modified_by_id","href":"href","is_federated":true}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"groups":[{"id":"id","name":"name","description":"description","account_id":"account_id","created_at":"2019-01-01T12:00:00.000Z","created_by_id":"created_by_id","last_modified_at":"2019-01-01T12:00:00.000Z","last_modified_by_id":"last_modified_by_id","href":"href","is_federated":true}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = AccessGroupsPager(
+            client=_service,
+            account_id='testString',
+            transaction_id='testString',
+            iam_id='testString',
+            membership_type='static',
+            limit=10,
+            sort='name',
+            show_federated=False,
+            hide_public_access=False,
+        )
+        iterator = iter(pager)
+        first_result = next(iterator)
+        assert first_result is not None
+        assert len(responses.calls) == 1
+        remaining_results = list(iterator)
+        assert len(remaining_results) == 1
+        assert len(responses.calls) == 2
+
 
 class TestGetAccessGroup:
     """
@@ -1162,6 +1194,37 @@ class TestListAccessGroupMembers:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_access_group_members_with_pager_iter(self):
+        """
+        test_list_access_group_members_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/v2/groups/testString/members')
+        mock_response1 = '{"next":{"href":"https://myhost.com/somePath?offset=1"},"total_count":2,"members":[{"iam_id":"iam_id","type":"type","membership_type":"membership_type","name":"name","email":"email","description":"description","href":"href","created_at":"2019-01-01T12:00:00.000Z","created_by_id":"created_by_id"}],"limit":1}'
+        mock_response2 = '{"total_count":2,"members":[{"iam_id":"iam_id","type":"type","membership_type":"membership_type","name":"name","email":"email","description":"description","href":"href","created_at":"2019-01-01T12:00:00.000Z","created_by_id":"created_by_id"}],"limit":1}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = AccessGroupMembersPager(
+            client=_service,
+            access_group_id='testString',
+            transaction_id='testString',
+            membership_type='static',
+            limit=10,
+            type='testString',
+            verbose=False,
+            sort='testString',
+        )
+        iterator = iter(pager)
+        first_result = next(iterator)
+        assert first_result is not None
+        assert len(responses.calls) == 1
+        remaining_results = list(iterator)
+        assert len(remaining_results) == 1
+        assert len(responses.calls) == 2
+
 
 class TestRemoveMemberFromAccessGroup:
     """
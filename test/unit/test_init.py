@@ -0,0 +1,65 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the lazy loading of service modules by the ibm_platform_services package
+"""
+
+import subprocess
+import sys
+import unittest
+
+import ibm_platform_services
+
+
+class TestLazyImports(unittest.TestCase):
+    """
+    Test the lazy loading of service modules by the ibm_platform_services package
+    """
+
+    def test_service_classes_resolve(self):
+        """
+        Test that every exported service class resolves to the class in its module
+        """
+        from ibm_platform_services.resource_controller_v2 import ResourceControllerV2
+
+        self.assertIs(ibm_platform_services.ResourceControllerV2, ResourceControllerV2)
+        for name in ibm_platform_services._LAZY_ATTRIBUTES:
+            self.assertIn(name, dir(ibm_platform_services))
+            self.assertEqual(getattr(ibm_platform_services, name).__name__, name)
+
+    def test_unknown_attribute(self):
+        """
+        Test that an unknown attribute raises AttributeError
+        """
+        with self.assertRaises(AttributeError):
+            ibm_platform_services.NoSuchServiceV1  # pylint: disable=pointless-statement
+
+    def test_single_service_import(self):
+        """
+        Test that importing one service class does not import the other service modules
+        """
+        script = (
+            'import sys\n'
+            'from ibm_platform_services import ResourceControllerV2\n'
+            'loaded = [m for m in sys.modules if m.startswith("ibm_platform_services.")]\n'
+            'print(",".join(sorted(loaded)))\n'
+        )
+        output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout
+        loaded = output.strip().split(',')
+        self.assertIn('ibm_platform_services.resource_controller_v2', loaded)
+        self.assertNotIn('ibm_platform_services.catalog_management_v1', loaded)
+        self.assertNotIn('ibm_platform_services.global_catalog_v1', loaded)
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the instrumentation hooks
+"""
+
+import json
+
+from ibm_cloud_sdk_core import ApiException
+import pytest
+import responses
+
+from ibm_platform_services import instrumentation, json_codec
+from ibm_platform_services.global_catalog_v1 import GlobalCatalogV1
+from ibm_platform_services.global_tagging_v1 import GlobalTaggingV1
+from ibm_platform_services.pagination import ParallelOffsetPager, PrefetchingPager
+from ibm_platform_services.resource_controller_v2 import ResourceControllerV2, ResourceInstancesPager
+
+from .conftest import LocalHandler, make_client
+
+_tagging_url = 'https://tags.global-search-tagging.cloud.ibm.com'
+_resource_controller_url = 'https://resource-controller.cloud.ibm.com'
+_catalog_url = 'https://globalcatalog.cloud.ibm.com/api/v1'
+
+
+class _RecordingInstrumentation(instrumentation.Instrumentation):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def start_operation(self, metrics, request):
+        self.started.append(metrics)
+        request['headers']['traceparent'] = 'trace-{0}'.format(len(self.started))
+
+    def end_operation(self, metrics):
+        self.ended.append(metrics)
+
+
+class _RetryHandler(LocalHandler):
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.server.requests += 1
+        if self.server.requests == 1:
+            self.respond(503, {'message': 'unavailable'})
+        else:
+            self.respond(200, {'id': '1'})
+
+
+@pytest.fixture
+def recorder():
+    recorder = _RecordingInstrumentation()
+    instrumentation.set_default_instrumentation(recorder)
+    yield recorder
+    instrumentation.set_default_instrumentation(None)
+
+
+def _add_instances_pages():
+    responses.add(
+        responses.GET,
+        _resource_controller_url + '/v2/resource_instances',
+        body=json.dumps({'rows_count': 1, 'resources': [{'id': '1'}], 'next_url': '/v2/resource_instances?start=2'}),
+        content_type='application/json',
+    )
+    responses.add(
+        responses.GET,
+        _resource_controller_url + '/v2/resource_instances',
+        body=json.dumps({'rows_count': 1, 'resources': [{'id': '2'}], 'next_url': None}),
+        content_type='application/json',
+    )
+
+
+class TestInstrumentation:
+    """
+    Test Class for the instrumentation hooks
+    """
+
+    def test_default_instrumentation(self):
+        """
+        The default instrumentation does nothing and is used by clients without one.
+        """
+        default = instrumentation.get_default_instrumentation()
+        assert type(default) is instrumentation.Instrumentation  # pylint: disable=unidiomatic-typecheck
+        client = make_client(GlobalTaggingV1, _tagging_url)
+        assert instrumentation.get_instrumentation(client) is default
+
+        recorder = _RecordingInstrumentation()
+        assert instrumentation.set_instrumentation(client, recorder) is client
+        assert instrumentation.get_instrumentation(client) is recorder
+        assert instrumentation.get_instrumentation(make_client(GlobalTaggingV1, _tagging_url)) is default
+        instrumentation.set_instrumentation(client, None)
+        assert instrumentation.get_instrumentation(client) is default
+
+    @responses.activate
+    def test_operation_metrics(self, recorder):
+        """
+        Each call is reported with its operation, sizes, status code and timings.
+        """
+        body = '{"results": [{"resource_id": "crn", "is_error": false}]}'
+        responses.add(responses.POST, _tagging_url + '/v3/tags/attach', body=body, content_type='application/json')
+        client = make_client(GlobalTaggingV1, _tagging_url)
+        client.attach_tag(resources=[{'resource_id': 'crn'}], tag_names=['env:prod'])
+
+        assert recorder.started == recorder.ended
+        (metrics,) = recorder.ended
+        assert metrics.service_name == 'global_tagging'
+        assert metrics.service_version == 'V1'
+        assert metrics.operation_id == 'attach_tag'
+        assert metrics.method == 'POST'
+        assert metrics.url == _tagging_url + '/v3/tags/attach'
+        assert metrics.page is None
+        assert metrics.status_code == 200
+        assert metrics.request_bytes == len(responses.calls[0].request.body)
+        assert metrics.response_bytes == len(body)
+        assert metrics.retries == 0
+        assert metrics.error is None
+        assert min(metrics.prepare_time, metrics.network_time, metrics.deserialization_time) >= 0
+        assert metrics.total_time >= metrics.network_time
+        assert 'attach_tag' in repr(metrics)
+        # The instrumentation may add headers to the request.
+        assert responses.calls[0].request.headers['traceparent'] == 'trace-1'
+
+    @responses.activate
+    def test_request_template(self, recorder):
+        """
+        Operations that prepare their requests from a template are reported too.
+        """
+        responses.add(
+            responses.GET,
+            _resource_controller_url + '/v2/resource_instances/1',
+            body='{"id": "1"}',
+            content_type='application/json',
+        )
+        client = make_client(ResourceControllerV2, _resource_controller_url)
+        for _ in range(2):
+            client.get_resource_instance('1')
+        assert [m.operation_id for m in recorder.ended] == ['get_resource_instance'] * 2
+        assert [m.request_bytes for m in recorder.ended] == [0, 0]
+        assert [m.response_bytes for m in recorder.ended] == [len('{"id": "1"}')] * 2
+
+    @responses.activate
+    def test_unprepared_operations(self, recorder):
+        """
+        An operation whose request cannot be prepared is not reported with the next call.
+        """
+        responses.add(
+            responses.GET,
+            _resource_controller_url + '/v2/resource_instances',
+            body='{"resources": []}',
+            content_type='application/json',
+        )
+        client = make_client(ResourceControllerV2, _resource_controller_url)
+        client.service_url = None
+        with pytest.raises(ValueError):
+            client.list_resource_instances()
+        with pytest.raises(ValueError):
+            client.get_resource_instance('1')
+        assert instrumentation.current_operation_id() is None
+
+        client.set_service_url(_resource_controller_url)
+        request = client.prepare_request(method='GET', url='/v2/resource_instances', headers={})
+        client.send(request)
+        client.list_resource_instances()
+        assert [m.operation_id for m in recorder.ended] == [None, 'list_resource_instances']
+        assert recorder.ended[0].prepare_time == 0.0
+
+    @responses.activate
+    def test_error(self, recorder):
+        """
+        A call that fails is reported with its status code and exception.
+        """
+        responses.add(
+            responses.GET,
+            _resource_controller_url + '/v2/resource_instances/missing',
+            body='{"message": "Instance not found"}',
+            content_type='application/json',
+            status=404,
+        )
+        client = make_client(ResourceControllerV2, _resource_controller_url)
+        with pytest.raises(ApiException) as error:
+            client.get_resource_instance('missing')
+        (metrics,) = recorder.ended
+        assert metrics.status_code == 404
+        assert metrics.error is error.value
+        assert metrics.response_bytes == len('{"message": "Instance not found"}')
+
+    @responses.activate
+    def test_custom_codec(self, recorder):
+        """
+        Decoding with the codec of a client is reported as deserialization time.
+        """
+
+        class _RecordingCodec(json_codec.JSONCodec):
+            def loads(self, data):
+                self.decoded = True
+                return super().loads(data)
+
+        responses.add(
+            responses.GET,
+            _resource_controller_url + '/v2/resource_instances/1',
+            body='{"id": "1"}',
+            content_type='application/json',
+        )
+        codec = _RecordingCodec()
+        client = json_codec.set_codec(make_client(ResourceControllerV2, _resource_controller_url), codec)
+        assert client.get_resource_instance('1').get_result() == {'id': '1'}
+        assert codec.decoded
+        assert recorder.ended[0].deserialization_time > 0
+
+    def test_retries(self, recorder, local_server):
+        """
+        The retries of a call are counted.
+        """
+        server = local_server(_RetryHandler, requests=0)
+        client = make_client(ResourceControllerV2, server.url)
+        client.enable_retries(max_retries=2, retry_interval=0.01)
+        assert client.get_resource_instance('1').get_result() == {'id': '1'}
+        (metrics,) = recorder.ended
+        assert metrics.retries == 1
+        assert metrics.status_code == 200
+
+    @responses.activate
+    def test_pager_pages(self, recorder):
+        """
+        The calls made by a pager are reported with their page numbers.
+        """
+        _add_instances_pages()
+        client = make_client(ResourceControllerV2, _resource_controller_url)
+        pager = ResourceInstancesPager(client=client)
+        assert [item['id'] for item in pager.get_all()] == ['1', '2']
+        assert [(m.operation_id, m.page) for m in recorder.ended] == [
+            ('list_resource_instances', 1),
+            ('list_resource_instances', 2),
+        ]
+
+    @responses.activate
+    def test_pager_page_failure(self, recorder):
+        """
+        A page that fails is retried with the same page number.
+        """
+        responses.add(
+            responses.GET,
+            _resource_controller_url + '/v2/resource_instances',
+            body='{"message": "unavailable"}',
+            content_type='application/json',
+            status=503,
+        )
+        _add_instances_pages()
+        client = make_client(ResourceControllerV2, _resource_controller_url)
+        pager = ResourceInstancesPager(client=client)
+        with pytest.raises(ApiException):
+            pager.get_next()
+        pager.get_next()
+        pager.get_next()
+        assert [m.page for m in recorder.ended] == [1, 1, 2]
+
+    @responses.activate
+    def test_prefetching_pager_pages(self, recorder):
+        """
+        The page numbers are reported for the pages retrieved ahead by a worker thread.
+        """
+        _add_instances_pages()
+        client = make_client(ResourceControllerV2, _resource_controller_url)
+        with PrefetchingPager(ResourceInstancesPager(client=client)) as pager:
+            assert len(pager.get_all()) == 2
+        assert [m.page for m in recorder.ended] == [1, 2]
+
+    @responses.activate
+    def test_parallel_offset_pager_pages(self, recorder):
+        """
+        The page numbers are reported for the pages retrieved concurrently.
+        """
+        for offset in range(0, 5, 2):
+            responses.add(
+                responses.GET,
+                _catalog_url + '/',
+                match=[responses.matchers.query_param_matcher({'_offset': str(offset), '_limit': '2'})],
+                body=json.dumps({'count': 5, 'resources': [{'id': str(i)} for i in range(offset, min(offset + 2, 5))]}),
+                content_type='application/json',
+            )
+        client = make_client(GlobalCatalogV1, _catalog_url)
+        pager = ParallelOffsetPager(client=client, operation='list_catalog_entries', limit=2, max_workers=2)
+        assert [item['id'] for item in pager.get_all()] == ['0', '1', '2', '3', '4']
+        assert sorted(m.page for m in recorder.ended) == [1, 2, 3]
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the pluggable JSON codec
+"""
+
+import json
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import requests
+import responses
+
+from ibm_platform_services import json_codec
+from ibm_platform_services.global_tagging_v1 import GlobalTaggingV1
+
+_base_url = 'https://tags.global-search-tagging.cloud.ibm.com'
+
+
+class _CountingCodec(json_codec.JSONCodec):
+    def __init__(self):
+        self.encoded = []
+        self.decoded = []
+
+    def dumps(self, obj):
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.decoded.append(data)
+        return super().loads(data)
+
+
+@pytest.fixture
+def service():
+    service = GlobalTaggingV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+@pytest.fixture
+def default_codec():
+    codec = _CountingCodec()
+    json_codec.set_default_codec(codec)
+    yield codec
+    json_codec.set_default_codec(None)
+
+
+def _count_decoders(hooks):
+    return sum(isinstance(hook, json_codec._ResponseDecoder) for hook in hooks)  # pylint: disable=protected-access
+
+
+def _add_attach_tag_response(status=200):
+    responses.add(
+        responses.POST,
+        _base_url + '/v3/tags/attach',
+        body='{"results": [{"resource_id": "crn", "is_error": false}]}',
+        content_type='application/json',
+        status=status,
+    )
+
+
+class TestJSONCodec:
+    """
+    Test Class for the pluggable JSON codec
+    """
+
+    def test_default_codec(self):
+        """
+        The default codec encodes bodies as the json module does, as UTF-8 bytes.
+        """
+        codec = json_codec.get_default_codec()
+        assert type(codec) is json_codec.JSONCodec  # pylint: disable=unidiomatic-typecheck
+        document = {'tag_names': ['env:prod', 'ünïcode'], 'count': 2}
+        assert codec.dumps(document) == json.dumps(document).encode('utf-8')
+        assert codec.loads(codec.dumps(document)) == document
+        assert json_codec.get_codec() is codec
+
+    @responses.activate
+    def test_service_codec(self, service):
+        """
+        A service client encodes request bodies and decodes responses with its codec.
+        """
+        _add_attach_tag_response()
+        codec = _CountingCodec()
+        assert json_codec.set_codec(service, codec) is service
+        response = service.attach_tag(resources=[{'resource_id': 'crn'}], tag_names=['env:prod'])
+
+        assert response.get_result() == {'results': [{'resource_id': 'crn', 'is_error': False}]}
+        assert codec.encoded == [{'resources': [{'resource_id': 'crn'}], 'tag_names': ['env:prod']}]
+        assert codec.decoded == [b'{"results": [{"resource_id": "crn", "is_error": false}]}']
+        assert json.loads(responses.calls[0].request.body) == codec.encoded[0]
+        assert responses.calls[0].request.headers['content-type'] == 'application/json'
+
+        # Other clients keep the default codec.
+        assert json_codec.get_codec(GlobalTaggingV1(authenticator=NoAuthAuthenticator())) is not codec
+
+    @responses.activate
+    def test_bytes_decoded(self, service, monkeypatch):
+        """
+        A codec decodes the bytes of the response, rather than requests decoding its text.
+        """
+        _add_attach_tag_response()
+
+        def text_json(response, **kwargs):
+            raise AssertionError('The response was decoded from its text')
+
+        monkeypatch.setattr(requests.Response, 'json', text_json)
+        codec = _CountingCodec()
+        json_codec.set_codec(service, codec)
+        response = service.attach_tag(resources=[{'resource_id': 'crn'}], tag_names=['env:prod'])
+        assert response.get_result() == {'results': [{'resource_id': 'crn', 'is_error': False}]}
+        (data,) = codec.decoded
+        assert type(data) is bytes  # pylint: disable=unidiomatic-typecheck
+
+    @responses.activate
+    def test_default_codec_of_package(self, service, default_codec):
+        """
+        Clients without a codec of their own use the default codec of the package.
+        """
+        _add_attach_tag_response()
+        service.attach_tag(resources=[{'resource_id': 'crn'}], tag_names=['env:prod'])
+        assert len(default_codec.encoded) == 1
+        assert len(default_codec.decoded) == 1
+
+        codec = _CountingCodec()
+        json_codec.set_codec(service, codec)
+        service.attach_tag(resources=[{'resource_id': 'crn'}], tag_names=['env:prod'])
+        assert len(default_codec.encoded) == 1
+        assert len(codec.encoded) == 1
+
+        json_codec.set_codec(service, None)
+        assert json_codec.get_codec(service) is default_codec
+
+    @responses.activate
+    def test_error_response(self, service):
+        """
+        Error responses are decoded with the codec too.
+        """
+        _add_attach_tag_response(status=400)
+        codec = _CountingCodec()
+        json_codec.set_codec(service, codec)
+        with pytest.raises(ApiException):
+            service.attach_tag(resources=[{'resource_id': 'crn'}], tag_names=['env:prod'])
+        assert codec.decoded
+
+    @responses.activate
+    def test_install(self, service):
+        """
+        install() adds the response hook once, and again after the http client is replaced.
+        """
+        hooks = service.get_http_client().hooks['response']
+        assert _count_decoders(hooks) == 1
+        json_codec.install(service)
+        assert _count_decoders(hooks) == 1
+
+        service.set_http_client(requests.Session())
+        codec = _CountingCodec()
+        json_codec.set_codec(service, codec)
+        assert _count_decoders(service.get_http_client().hooks['response']) == 1
+
+        _add_attach_tag_response()
+        service.attach_tag(resources=[{'resource_id': 'crn'}], tag_names=['env:prod'])
+        assert len(codec.decoded) == 1
+
+    def test_orjson_codec(self):
+        """
+        OrjsonCodec encodes to and decodes from bytes with orjson.
+        """
+        pytest.importorskip('orjson')
+        codec = json_codec.OrjsonCodec()
+        document = {'tag_names': ['env:prod', 'ünïcode'], 'count': 2, 'ratio': 0.5, 'value': None}
+        data = codec.dumps(document)
+        assert isinstance(data, bytes)
+        assert json.loads(data) == document
+        assert codec.loads(json.dumps(document).encode('utf-8')) == document
@@ -0,0 +1,471 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for MeteringBatcher, MeteringSpool and MeteringAggregator
+"""
+
+from collections import Counter
+import json
+import os
+import queue
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+import pytest
+
+from ibm_platform_services.metering import MeteringAggregator, MeteringBatcher, MeteringSpool, get_record_id
+from ibm_platform_services.usage_metering_v4 import (
+    MeasureAndQuantity,
+    ResourceInstanceUsage,
+    ResourceUsageDetails,
+    UsageMeteringV4,
+)
+
+from .conftest import LocalHandler, make_client
+
+
+class _Handler(LocalHandler):
+    def do_POST(self):  # pylint: disable=invalid-name
+        server = self.server
+        records = json.loads(self.read_body())
+        resource_id = self.path.split('/')[-2]
+        server.gate.wait()
+        with server.lock:
+            server.batches.append((resource_id, [r['resource_instance_id'] for r in records]))
+            if server.throttle:
+                server.throttle -= 1
+                self.respond(429, {'errors': [{'code': 'too_many_requests'}]}, {'Retry-After': '0.05'})
+                return
+            statuses = []
+            for record in records:
+                instance_id = record['resource_instance_id']
+                server.attempts[instance_id] += 1
+                if 'invalid' in instance_id:
+                    statuses.append({'status': 400, 'location': '', 'code': 'invalid', 'message': 'Invalid usage'})
+                elif 'flaky' in instance_id and server.attempts[instance_id] == 1:
+                    statuses.append({'status': 500, 'location': ''})
+                else:
+                    statuses.append({'status': 201, 'location': '/usage/{0}'.format(instance_id)})
+        self.respond(202, {'resources': statuses})
+
+
+@pytest.fixture
+def server(local_server):
+    gate = threading.Event()
+    gate.set()
+    server = local_server(_Handler, lock=threading.Lock(), gate=gate, batches=[], attempts=Counter(), throttle=0)
+    yield server
+    server.gate.set()
+
+
+def _client(url):
+    return make_client(UsageMeteringV4, url)
+
+
+def _usage(instance_id):
+    return ResourceInstanceUsage(
+        resource_instance_id=instance_id,
+        plan_id='plan',
+        start=1485907200000,
+        end=1485910800000,
+        measured_usage=[MeasureAndQuantity(measure='STORAGE', quantity=1)],
+    )
+
+
+class TestMeteringBatcher:
+    """
+    Test Class for MeteringBatcher
+    """
+
+    def test_batches(self, server):
+        """
+        The records of many threads are sent in batches per resource id.
+        """
+        with MeteringBatcher(_client(server.url), max_batch_size=50, max_age=60) as batcher:
+
+            def submit(resource_id):
+                for i in range(100):
+                    batcher.submit(resource_id, _usage('{0}-instance-{1}'.format(resource_id, i)))
+
+            threads = [threading.Thread(target=submit, args=(r,)) for r in ('cos', 'kms', 'db')]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert batcher.flush(timeout=10)
+            assert batcher.submitted == batcher.accepted == 300
+            assert batcher.pending == 0
+        assert len(server.batches) == batcher.batches == 6
+        for resource_id, instance_ids in server.batches:
+            assert len(instance_ids) == 50
+            assert all(i.startswith(resource_id) for i in instance_ids)
+
+    def test_age(self, server):
+        """
+        Records are sent once the oldest of them has waited the maximum age.
+        """
+        with MeteringBatcher(_client(server.url), max_batch_size=100, max_age=0.1) as batcher:
+            batcher.submit('cos', [_usage('instance-1'), {'resource_instance_id': 'instance-2'}])
+            time.sleep(0.05)
+            assert not server.batches
+            time.sleep(0.3)
+            assert server.batches == [('cos', ['instance-1', 'instance-2'])]
+            assert batcher.accepted == 2
+
+    def test_partial_acceptance(self, server):
+        """
+        The rejected records of a batch are requeued when the rejection is transient, and reported otherwise.
+        """
+        failures = []
+        with MeteringBatcher(
+            _client(server.url),
+            max_batch_size=10,
+            max_age=60,
+            retry_interval=0.01,
+            on_failure=lambda *failure: failures.append(failure),
+        ) as batcher:
+            batcher.submit('cos', [_usage('instance-1'), _usage('flaky-1'), _usage('invalid-1'), _usage('instance-2')])
+            assert batcher.flush(timeout=10)
+            assert batcher.accepted == 3 and batcher.failed == 1 and batcher.requeued == 1
+        assert server.batches == [('cos', ['instance-1', 'flaky-1', 'invalid-1', 'instance-2']), ('cos', ['flaky-1'])]
+        ((resource_id, record, reason),) = failures
+        assert resource_id == 'cos' and record.resource_instance_id == 'invalid-1'
+        assert isinstance(reason, ResourceUsageDetails) and reason.status == 400 and reason.code == 'invalid'
+
+    def test_throttled(self, server):
+        """
+        A batch that failed with a transient error is sent again after the Retry-After delay, up to max_attempts.
+        """
+        server.throttle = 1
+        failures = []
+        with MeteringBatcher(
+            _client(server.url), max_age=0, max_attempts=2, on_failure=lambda *f: failures.append(f)
+        ) as batcher:
+            start = time.monotonic()
+            batcher.submit('cos', _usage('instance-1'))
+            assert batcher.flush(timeout=10)
+            assert time.monotonic() - start >= 0.05
+            assert batcher.accepted == 1 and batcher.requeued == 1
+
+            server.throttle = 2
+            batcher.submit('cos', _usage('instance-2'))
+            assert batcher.flush(timeout=10)
+            assert batcher.failed == 1
+        ((_, record, error),) = failures
+        assert record.resource_instance_id == 'instance-2'
+        assert isinstance(error, ApiException) and error.code == 429
+
+    def test_backpressure(self, server):
+        """
+        submit() blocks while the maximum number of records are buffered or in flight.
+        """
+        server.gate.clear()
+        batcher = MeteringBatcher(_client(server.url), max_batch_size=5, max_pending=10, max_age=0)
+        batcher.submit('cos', [_usage('instance-{0}'.format(i)) for i in range(10)])
+        with pytest.raises(queue.Full):
+            batcher.submit('cos', _usage('instance-10'), timeout=0.1)
+        assert batcher.pending == 10
+        assert not batcher.flush(timeout=0.1)
+        server.gate.set()
+        batcher.submit('cos', _usage('instance-10'), timeout=10)
+        batcher.close()
+        assert batcher.accepted == 11 and batcher.pending == 0
+        with pytest.raises(ValueError):
+            batcher.submit('cos', _usage('instance-11'))
+
+    def test_callback_errors(self, server, tmp_path, caplog):
+        """
+        The errors of the on_failure callback and of the spool are logged, and the workers carry on.
+        """
+
+        class _BrokenSpool(MeteringSpool):
+            def acknowledge(self, record_ids):
+                raise OSError('No space left on device')
+
+        def on_failure(*failure):
+            raise RuntimeError('The callback failed')
+
+        with _BrokenSpool(str(tmp_path)) as spool:
+            with MeteringBatcher(
+                _client(server.url), max_age=0, max_workers=1, on_failure=on_failure, spool=spool
+            ) as batcher:
+                batcher.submit('cos', [_usage('invalid-1'), _usage('instance-1')])
+                assert batcher.flush(timeout=10)
+                batcher.submit('cos', _usage('instance-2'))
+                assert batcher.flush(timeout=10)
+                assert batcher.accepted == 2 and batcher.failed == 1
+        messages = [record.getMessage() for record in caplog.records]
+        assert 'The on_failure callback of a MeteringBatcher failed' in messages
+        assert 'A MeteringBatcher failed to acknowledge records in its spool' in messages
+
+    def test_validation(self):
+        """
+        The batcher rejects invalid limits.
+        """
+        client = _client('http://127.0.0.1:1')
+        with pytest.raises(ValueError):
+            MeteringBatcher(client, max_batch_size=0)
+        with pytest.raises(ValueError):
+            MeteringBatcher(client, max_batch_size=10, max_pending=5)
+        with pytest.raises(ValueError):
+            MeteringBatcher(client, max_workers=0)
+
+
+class TestMeteringSpool:
+    """
+    Test Class for MeteringSpool
+    """
+
+    def test_replay(self, tmp_path):
+        """
+        The records not acknowledged are replayed when the spool is opened again, once each.
+        """
+        with MeteringSpool(str(tmp_path)) as spool:
+            first = spool.append('cos', _usage('instance-1'))
+            second = spool.append('cos', {'resource_instance_id': 'instance-2'}, record_id='id-2')
+            assert first == get_record_id('cos', _usage('instance-1').to_dict())
+            assert second == 'id-2'
+            assert spool.append('cos', _usage('instance-1')) is None
+            assert spool.append('kms', {}, record_id='id-2') is None
+            assert spool.appended == 2 and spool.duplicates == 2
+            spool.acknowledge([first])
+            assert spool.pending() == []
+            # A record done with may be appended again.
+            assert spool.append('cos', _usage('instance-1')) == first
+            spool.acknowledge([first])
+        # The process stopped while writing a line.
+        with open(os.path.join(str(tmp_path), os.listdir(str(tmp_path))[0]), 'ab') as file:
+            file.write(b'{"id": "id-3", "resou')
+
+        with MeteringSpool(str(tmp_path)) as spool:
+            assert spool.pending() == [('id-2', 'cos', {'resource_instance_id': 'instance-2'})]
+            assert spool.pending() == []
+            assert spool.append('cos', {}, record_id='id-2') is None
+            assert spool.append('cos', _usage('instance-1')) == first
+            spool.acknowledge(['id-2', first])
+        with MeteringSpool(str(tmp_path)) as spool:
+            assert spool.pending() == []
+
+    def test_compaction(self, tmp_path):
+        """
+        The log is split into segments, and the oldest segments are removed once their records are acknowledged.
+        """
+        with MeteringSpool(str(tmp_path), segment_size=1000, fsync=False) as spool:
+            record_ids = [spool.append('cos', _usage('instance-{0}'.format(i))) for i in range(40)]
+            assert len(spool.segments) > 3
+            spool.acknowledge(record_ids[20:])
+            assert spool.compacted == 0
+            spool.acknowledge(record_ids[:10])
+            assert 0 < spool.compacted < len(spool.segments)
+            kept = len(spool.segments)
+        assert len(os.listdir(str(tmp_path))) == kept
+        with MeteringSpool(str(tmp_path), segment_size=1000) as spool:
+            assert [record[0] for record in spool.pending()] == record_ids[10:20]
+            spool.acknowledge(record_ids[10:20])
+            assert spool.segments == [spool._path(spool._active)]  # pylint: disable=protected-access
+        assert len(os.listdir(str(tmp_path))) == 1
+
+    def test_group_commit(self, tmp_path):
+        """
+        Concurrent appends share their fsync calls, unless group commit is off.
+        """
+        for group_commit in (True, False):
+            with MeteringSpool(str(tmp_path / str(group_commit)), group_commit=group_commit) as spool:
+                threads = [
+                    threading.Thread(
+                        target=lambda t: [
+                            spool.append('cos', {'n': i}, record_id='{0}-{1}'.format(t, i)) for i in range(50)
+                        ],
+                        args=(t,),
+                    )
+                    for t in range(8)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                assert spool.appended == 400
+                if group_commit:
+                    assert spool.syncs <= 400
+                else:
+                    assert spool.syncs == 400
+
+    def test_batcher(self, server, tmp_path):
+        """
+        The records of a batcher are acknowledged once accepted or failed, and replayed after a crash.
+        """
+        with MeteringSpool(str(tmp_path)) as spool:
+            with MeteringBatcher(_client(server.url), max_age=0, spool=spool) as batcher:
+                batcher.submit('cos', [_usage('instance-1'), _usage('invalid-1')])
+                assert batcher.flush(timeout=10)
+                assert batcher.accepted == 1 and batcher.failed == 1
+        with MeteringSpool(str(tmp_path)) as spool:
+            assert spool.pending() == []
+
+        # The process stops while the records are in flight.
+        server.gate.clear()
+        spool = MeteringSpool(str(tmp_path))
+        batcher = MeteringBatcher(_client(server.url), max_age=0, spool=spool)
+        batcher.submit('kms', [_usage('instance-2'), _usage('instance-3')])
+        batcher.submit('kms', _usage('instance-2'))
+        assert batcher.submitted == 2 and batcher.duplicates == 1
+        spool.close()
+        stopped = batcher
+
+        with MeteringSpool(str(tmp_path)) as spool:
+            with MeteringBatcher(_client(server.url), max_age=0, spool=spool) as batcher:
+                server.gate.set()
+                assert batcher.flush(timeout=10)
+                assert batcher.accepted == 2
+        stopped.close()
+        assert server.attempts['instance-2'] == server.attempts['instance-3'] == 2
+        with MeteringSpool(str(tmp_path)) as spool:
+            assert spool.pending() == []
+
+
+class TestMeteringAggregator:
+    """
+    Test Class for MeteringAggregator
+    """
+
+    def test_totals(self):
+        """
+        The additive measures of an instance, plan, region and consumer are summed per window.
+        """
+        submitted = []
+        hour = 3600 * 1000
+        aggregator = MeteringAggregator(
+            lambda *args: submitted.append(args), additive=['STORAGE', 'CALLS'], window=3600
+        )
+        for i in range(30):
+            aggregator.add(
+                'cos',
+                ResourceInstanceUsage(
+                    resource_instance_id='instance-{0}'.format(i % 2),
+                    plan_id='plan',
+                    region='us-south',
+                    start=i * 60 * 1000,
+                    end=(i + 1) * 60 * 1000,
+                    measured_usage=[
+                        MeasureAndQuantity(measure='STORAGE', quantity=1),
+                        MeasureAndQuantity(measure='CALLS', quantity=0.5),
+                    ],
+                ),
+            )
+        aggregator.add(
+            'cos',
+            [
+                {
+                    'resource_instance_id': 'instance-0',
+                    'plan_id': 'plan',
+                    'region': 'us-south',
+                    'start': hour + 1,
+                    'end': hour + 2,
+                    'measured_usage': [{'measure': 'STORAGE', 'quantity': 5}],
+                },
+                {
+                    'resource_instance_id': 'instance-0',
+                    'plan_id': 'plan',
+                    'region': 'eu-de',
+                    'start': 1,
+                    'end': 2,
+                    'measured_usage': [{'measure': 'STORAGE', 'quantity': 7}],
+                },
+            ],
+        )
+        assert not submitted and aggregator.totals == 4 and aggregator.added == 32
+
+        assert aggregator.flush(before=hour) == 3
+        ((resource_id, records),) = submitted
+        assert resource_id == 'cos'
+        totals = {(r.resource_instance_id, r.region): r for r in records}
+        first = totals[('instance-0', 'us-south')]
+        assert (first.start, first.end) == (0, 29 * 60 * 1000)
+        assert [m.to_dict() for m in first.measured_usage] == [
+            {'measure': 'STORAGE', 'quantity': 15},
+            {'measure': 'CALLS', 'quantity': 7.5},
+        ]
+        assert (totals[('instance-1', 'us-south')].start, totals[('instance-1', 'us-south')].end) == (
+            60 * 1000,
+            30 * 60 * 1000,
+        )
+        assert totals[('instance-0', 'eu-de')].measured_usage[0].quantity == 7
+
+        with aggregator:
+            pass
+        assert submitted[-1][1][0].start == hour + 1 and aggregator.totals == 0
+        assert aggregator.emitted == 4 and aggregator.passed == 0
+
+        # The totals are submitted when there are too many of them.
+        aggregator.max_totals = 1
+        aggregator.add('cos', [_usage('instance-1'), _usage('instance-1'), _usage('instance-2')])
+        assert [r.resource_instance_id for r in submitted[-1][1]] == ['instance-1'] and aggregator.totals == 1
+        assert submitted[-1][1][0].measured_usage[0].quantity == 2
+
+    def test_pass_through(self):
+        """
+        Measures that are not additive are submitted at once, unchanged.
+        """
+        submitted = []
+        aggregator = MeteringAggregator(lambda *args: submitted.append(args), additive=['STORAGE'])
+        gauge = _usage('instance-1')
+        gauge.measured_usage = [MeasureAndQuantity(measure='INSTANCES', quantity=3)]
+        mixed = {
+            'resource_instance_id': 'instance-2',
+            'plan_id': 'plan',
+            'start': 0,
+            'end': 1,
+            'consumer_id': 'consumer',
+            'measured_usage': [
+                {'measure': 'STORAGE', 'quantity': 2},
+                {'measure': 'STORAGE', 'quantity': {'previous': 1, 'current': 2}},
+                {'measure': 'INSTANCES', 'quantity': 1},
+            ],
+        }
+        aggregator.add('cos', [gauge, mixed])
+        ((_, (passed_gauge, passed_mixed)),) = submitted
+        assert passed_gauge is gauge
+        assert passed_mixed['consumer_id'] == 'consumer'
+        assert passed_mixed['measured_usage'] == mixed['measured_usage'][1:]
+        assert len(mixed['measured_usage']) == 3
+        assert aggregator.passed == 2 and aggregator.totals == 1
+        aggregator.flush()
+        (record,) = submitted[-1][1]
+        assert record.consumer_id == 'consumer' and record.region is None
+        assert record.measured_usage[0].quantity == 2
+
+    def test_batcher(self, server):
+        """
+        The totals are submitted to a batcher as fewer records.
+        """
+        with MeteringBatcher(_client(server.url), max_age=0) as batcher:
+            with MeteringAggregator(batcher.submit, additive=['STORAGE']) as aggregator:
+                for i in range(100):
+                    aggregator.add('cos', _usage('instance-{0}'.format(i % 3)))
+            assert batcher.flush(timeout=10)
+            assert batcher.accepted == 3
+        ((resource_id, instance_ids),) = server.batches
+        assert sorted(instance_ids) == ['instance-0', 'instance-1', 'instance-2']
+
+    def test_validation(self):
+        """
+        The aggregator rejects invalid limits.
+        """
+        with pytest.raises(ValueError):
+            MeteringAggregator(print, additive=[], window=0)
+        with pytest.raises(ValueError):
+            MeteringAggregator(print, additive=[], max_totals=0)
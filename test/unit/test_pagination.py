@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the pagination helpers
+"""
+
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+import pytest
+
+from ibm_platform_services.pagination import (
+    ParallelOffsetPager,
+    PrefetchingPager,
+    record_page_call,
+    replay_page_call,
+)
+from ibm_platform_services.resource_controller_v2 import ResourceInstancesPager
+
+
+class FakeResourceController:
+    """
+    Serves list_resource_instances() pages from memory, as the service would.
+    """
+
+    def __init__(self, total, calls=None, fail_at=None):
+        self.total = total
+        self.calls = calls if calls is not None else []
+        self.fail_at = fail_at
+
+    def list_resource_instances(self, *, limit=None, start=None, **kwargs):  # pylint: disable=unused-argument
+        self.calls.append(start)
+        if self.fail_at is not None and start == self.fail_at:
+            raise ApiException(500, message='Internal error')
+        limit = limit or 10
+        offset = int(start or 0)
+        resources = [{'id': 'instance-{0}'.format(i)} for i in range(offset, min(offset + limit, self.total))]
+        result = {'rows_count': len(resources), 'resources': resources, 'next_url': None}
+        if offset + limit < self.total:
+            result['next_url'] = '/v2/resource_instances?limit={0}&start={1}'.format(limit, offset + limit)
+        return DetailedResponse(response=result, status_code=200)
+
+
+class FakeGlobalCatalog:
+    """
+    Serves list_catalog_entries() pages from memory after a delay, as the service would.
+    """
+
+    def __init__(self, total, delay=0.0, fail_at=None, max_limit=None):
+        self.total = total
+        self.max_limit = max_limit
+        self.delay = delay
+        self.fail_at = fail_at
+        self.offsets = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def list_catalog_entries(self, *, offset=None, limit=None, q=None):  # pylint: disable=unused-argument
+        with self.lock:
+            self.offsets.append(offset)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if offset == self.fail_at:
+                raise ApiException(500, message='Internal error')
+            limit = limit or 50
+            size = min(limit, self.max_limit or limit)
+            resources = [{'id': 'entry-{0}'.format(i)} for i in range(offset, min(offset + size, self.total))]
+            result = {'offset': offset, 'limit': limit, 'count': self.total, 'resources': resources}
+            return DetailedResponse(response=result, status_code=200)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestRecordReplay:
+    """
+    Test Class for record_page_call() and replay_page_call()
+    """
+
+    def test_record_does_not_advance(self):
+        """
+        Recording the next call leaves the pager untouched.
+        """
+        client = FakeResourceController(25)
+        pager = ResourceInstancesPager(client=client, limit=10, resource_group_id='group')
+        call = record_page_call(pager)
+        assert call.operation == 'list_resource_instances'
+        assert call.kwargs['resource_group_id'] == 'group'
+        assert call.kwargs['limit'] == 10
+        assert call.kwargs['start'] is None
+        assert record_page_call(pager).kwargs == call.kwargs
+        assert pager._client is client
+        assert not client.calls
+
+    def test_replay_advances(self):
+        """
+        Replaying a response advances the pager as get_next() would.
+        """
+        client = FakeResourceController(25)
+        pager = ResourceInstancesPager(client=client, limit=10)
+        results = []
+        while pager.has_next():
+            call = record_page_call(pager)
+            results.extend(replay_page_call(pager, call.invoke(client)))
+        assert len(results) == 25
+        assert client.calls == [None, '10', '20']
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+class TestPrefetchingPager:
+    """
+    Test Class for PrefetchingPager
+    """
+
+    def test_results(self):
+        """
+        The prefetching pager returns the same results as the wrapped pager.
+        """
+        client = FakeResourceController(95)
+        pager = PrefetchingPager(ResourceInstancesPager(client=client, limit=10), depth=3)
+        results = list(pager)
+        assert [r['id'] for r in results] == ['instance-{0}'.format(i) for i in range(95)]
+        assert not pager.has_next()
+        with pytest.raises(StopIteration):
+            pager.get_next()
+
+    def test_get_all(self):
+        """
+        get_all() returns the results of all pages.
+        """
+        pager = PrefetchingPager(ResourceInstancesPager(client=FakeResourceController(25), limit=10))
+        assert len(pager.get_next()) == 10
+        assert len(pager.get_all()) == 15
+
+    @pytest.mark.parametrize('depth', [1, 2, 4])
+    def test_depth(self, depth):
+        """
+        Exactly `depth` pages are retrieved ahead of the caller.
+        """
+        client = FakeResourceController(100)
+        with PrefetchingPager(ResourceInstancesPager(client=client, limit=10), depth=depth) as pager:
+            pager.get_next()
+            _wait_for(lambda: len(client.calls) == 1 + depth)
+            time.sleep(0.05)
+            assert len(client.calls) == 1 + depth
+            pager.get_next()
+            _wait_for(lambda: len(client.calls) == 2 + depth)
+
+    def test_overlap(self):
+        """
+        The next page is retrieved while the caller processes the current one.
+        """
+        event = threading.Event()
+
+        class SlowClient(FakeResourceController):
+            def list_resource_instances(self, **kwargs):  # pylint: disable=arguments-differ
+                if kwargs.get('start') is not None:
+                    event.set()
+                return super().list_resource_instances(**kwargs)
+
+        pager = PrefetchingPager(ResourceInstancesPager(client=SlowClient(20), limit=10))
+        pager.get_next()
+        assert event.wait(5)
+        assert len(pager.get_next()) == 10
+
+    def test_error(self):
+        """
+        An error raised while prefetching is raised by the get_next() call for that page.
+        """
+        client = FakeResourceController(50, fail_at='20')
+        pager = PrefetchingPager(ResourceInstancesPager(client=client, limit=10), depth=3)
+        assert len(pager.get_next()) == 10
+        assert len(pager.get_next()) == 10
+        with pytest.raises(ApiException):
+            pager.get_next()
+        assert not pager.has_next()
+
+    def test_invalid_depth(self):
+        """
+        The depth must be at least 1.
+        """
+        with pytest.raises(ValueError):
+            PrefetchingPager(ResourceInstancesPager(client=FakeResourceController(1)), depth=0)
+
+
+class TestParallelOffsetPager:
+    """
+    Test Class for ParallelOffsetPager
+    """
+
+    def test_results_in_order(self):
+        """
+        All the items are returned in order.
+        """
+        client = FakeGlobalCatalog(1005)
+        pager = ParallelOffsetPager(client=client, operation='list_catalog_entries', limit=100, max_workers=4)
+        assert [r['id'] for r in pager] == ['entry-{0}'.format(i) for i in range(1005)]
+        assert sorted(client.offsets) == list(range(0, 1005, 100))
+        assert not pager.has_next()
+
+    def test_default_page_size(self):
+        """
+        Without a limit, the page size chosen by the service is used.
+        """
+        client = FakeGlobalCatalog(120)
+        pager = ParallelOffsetPager(client=client, operation='list_catalog_entries', q='kind:service')
+        assert len(pager.get_next()) == 50
+        assert len(pager.get_all()) == 70
+        assert sorted(client.offsets) == [0, 50, 100]
+
+    def test_clamped_page_size(self):
+        """
+        A service that returns fewer items than the limit requested has its pages retrieved whole.
+        """
+        client = FakeGlobalCatalog(1000, max_limit=100)
+        pager = ParallelOffsetPager(client=client, operation='list_catalog_entries', limit=200, max_workers=4)
+        assert [r['id'] for r in pager] == ['entry-{0}'.format(i) for i in range(1000)]
+        assert sorted(client.offsets) == list(range(0, 1000, 100))
+
+    def test_concurrency(self):
+        """
+        The remaining pages are retrieved concurrently, up to max_workers at a time.
+        """
+        client = FakeGlobalCatalog(1000, delay=0.05)
+        pager = ParallelOffsetPager(client=client, operation='list_catalog_entries', limit=100, max_workers=3)
+        start = time.perf_counter()
+        assert len(pager.get_all()) == 1000
+        assert client.max_in_flight == 3
+        # 1 + 9 pages of 0.05 seconds each, 3 at a time.
+        assert time.perf_counter() - start < 0.4
+
+    def test_single_page(self):
+        """
+        A result that fits in the first page needs a single request.
+        """
+        client = FakeGlobalCatalog(10)
+        pager = ParallelOffsetPager(client=client, operation='list_catalog_entries')
+        assert len(pager.get_all()) == 10
+        assert client.offsets == [0]
+
+    def test_error(self):
+        """
+        An error retrieving a page is raised when that page is reached.
+        """
+        client = FakeGlobalCatalog(500, fail_at=300)
+        pager = ParallelOffsetPager(client=client, operation='list_catalog_entries', limit=100)
+        for _ in range(3):
+            pager.get_next()
+        with pytest.raises(ApiException):
+            pager.get_next()
+
+    def test_unknown_operation(self):
+        """
+        The result properties must be given for operations that are not known.
+        """
+        client = FakeGlobalCatalog(10)
+        with pytest.raises(ValueError):
+            ParallelOffsetPager(client=client, operation='other_operation')
+        with pytest.raises(ValueError):
+            ParallelOffsetPager(client=client, operation='list_catalog_entries', max_workers=0)
+        pager = ParallelOffsetPager(
+            client=client, operation='list_catalog_entries', items_key='resources', total_key='count', max_workers=1
+        )
+        assert len(pager.get_all()) == 10
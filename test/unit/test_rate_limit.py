@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the client-side rate limiter, run against a local server that enforces a quota
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import email.utils
+import io
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+
+from ibm_platform_services import rate_limit, uploads
+from ibm_platform_services.global_catalog_v1 import GlobalCatalogV1
+from ibm_platform_services.global_tagging_v1 import GlobalTaggingV1
+
+from .conftest import LocalHandler, make_client
+
+# The quota enforced by the local server: WINDOW_REQUESTS requests per WINDOW seconds.
+WINDOW = 0.25
+WINDOW_REQUESTS = 10
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _QuotaHandler(LocalHandler):
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.read_body()
+        with self.server.lock:
+            now = time.monotonic()
+            if now - self.server.window_start >= WINDOW:
+                self.server.window_start = now
+                self.server.window_count = 0
+            self.server.window_count += 1
+            allowed = self.server.window_count <= WINDOW_REQUESTS and not self.server.closed
+            retry_after = self.server.window_start + WINDOW - now
+            if allowed:
+                self.server.accepted += 1
+            else:
+                self.server.rejected += 1
+        if allowed:
+            self.respond(200, {'results': []})
+        else:
+            self.respond(429, {'message': 'Too many requests'}, {'Retry-After': '{0:.3f}'.format(retry_after)})
+
+
+class _ThrottleOnceHandler(LocalHandler):
+    def do_PUT(self):  # pylint: disable=invalid-name
+        self.server.bodies.append(self.read_body())
+        if len(self.server.bodies) == 1:
+            self.respond(429, {'message': 'Too many requests'}, {'Retry-After': '0.01'})
+        else:
+            self.respond(200, {})
+
+
+@pytest.fixture
+def server(local_server):
+    return local_server(
+        _QuotaHandler,
+        lock=threading.Lock(),
+        window_start=time.monotonic(),
+        window_count=0,
+        accepted=0,
+        rejected=0,
+        closed=False,
+    )
+
+
+def _attach_tags(client, count, threads=4):
+    def attach(i):
+        try:
+            return client.attach_tag(resources=[{'resource_id': 'crn-{0}'.format(i)}], tag_names=['env:prod'])
+        except ApiException as error:
+            return error
+
+    with ThreadPoolExecutor(threads) as executor:
+        return list(executor.map(attach, range(count)))
+
+
+class TestTokenBucket:
+    """
+    Test Class for TokenBucket
+    """
+
+    def test_pacing(self):
+        """
+        Requests are spaced by the inverse of the rate, after a burst.
+        """
+        clock = _Clock()
+        bucket = rate_limit.TokenBucket(10, burst=2, clock=clock)
+        assert [round(bucket.reserve(), 6) for _ in range(4)] == [0, 0, 0.1, 0.2]
+        clock.now += 10
+        assert bucket.reserve() == 0
+
+        unlimited = rate_limit.TokenBucket(clock=clock)
+        assert [unlimited.reserve() for _ in range(100)] == [0] * 100
+
+        with pytest.raises(ValueError):
+            rate_limit.TokenBucket(0)
+
+    def test_throttle(self):
+        """
+        A 429 response lowers the rate once and holds the requests for its Retry-After delay.
+        """
+        clock = _Clock()
+        bucket = rate_limit.TokenBucket(10, clock=clock)
+        bucket.reserve()
+        bucket.throttle(2)
+        assert bucket.rate == pytest.approx(8)
+        # The responses of the requests already sent do not lower the rate again.
+        bucket.throttle(2)
+        assert bucket.rate == pytest.approx(8)
+        assert bucket.throttled == 2
+        assert bucket.reserve() == pytest.approx(2)
+        assert bucket.reserve() == pytest.approx(2.125)
+
+    def test_recovery(self):
+        """
+        After a 429 response the rate grows back to just under the throttled rate, then to its limit.
+        """
+        clock = _Clock()
+        bucket = rate_limit.TokenBucket(10, probe_interval=60, clock=clock)
+        bucket.throttle()
+        for _ in range(100):
+            bucket.succeeded()
+        assert bucket.rate == pytest.approx(9.5)
+        clock.now += 60
+        for _ in range(100):
+            bucket.succeeded()
+        assert bucket.rate == 10
+
+    def test_adaptive(self):
+        """
+        A bucket without a limit takes its rate from the rate the service accepted when it is throttled.
+        """
+        clock = _Clock()
+        bucket = rate_limit.TokenBucket(clock=clock)
+        # Throttled before any request succeeded, it only holds the requests.
+        bucket.throttle(0.5)
+        assert bucket.rate is None
+        assert bucket.reserve() == pytest.approx(0.5)
+        clock.now += 0.5
+        # 10 requests accepted in 0.1 seconds, then none until 0.4 seconds later: 20 requests per second.
+        for _ in range(10):
+            assert bucket.reserve() == 0
+            bucket.succeeded()
+            clock.now += 0.01
+        assert bucket.rate is None
+        bucket.throttle(0.4)
+        assert bucket.rate == pytest.approx(0.8 * 20)
+        for _ in range(1000):
+            bucket.succeeded()
+        assert bucket.rate == pytest.approx(0.95 * 20)
+
+
+class TestRateLimiter:
+    """
+    Test Class for RateLimiter
+    """
+
+    def test_get_retry_after(self):
+        """
+        Retry-After holds a number of seconds or an HTTP date.
+        """
+        assert rate_limit.get_retry_after({'Retry-After': '3'}) == 3
+        assert rate_limit.get_retry_after({'Retry-After': '0.5'}) == 0.5
+        date = email.utils.formatdate(time.time() + 30, usegmt=True)
+        assert 28 < rate_limit.get_retry_after({'Retry-After': date}) <= 30
+        assert rate_limit.get_retry_after({'Retry-After': 'soon'}) is None
+        assert rate_limit.get_retry_after({}) is None
+        assert rate_limit.get_retry_after(None) is None
+
+    def test_buckets(self):
+        """
+        Clients share the bucket of their service and host; the most specific limit applies.
+        """
+        limiter = rate_limit.RateLimiter(rate=50)
+        limiter.set_limit(5, service_name='global_tagging')
+        limiter.set_limit(7, service_name='global_tagging', host='tags.example.com')
+        assert limiter.get_bucket('global_tagging', 'tags.example.com').rate == 7
+        assert limiter.get_bucket('global_tagging', 'other.example.com').rate == 5
+        assert limiter.get_bucket('resource_controller', 'rc.example.com').rate == 50
+        assert limiter.get_bucket('global_tagging', 'tags.example.com') is limiter.get_bucket(
+            'global_tagging', 'tags.example.com'
+        )
+        assert len(limiter.buckets) == 3
+        limiter.set_limit(None, service_name='global_tagging')
+        assert len(limiter.buckets) == 1
+        assert limiter.get_bucket('global_tagging', 'other.example.com').rate is None
+
+        client = GlobalTaggingV1(authenticator=NoAuthAuthenticator())
+        assert rate_limit.get_rate_limiter(client) is None
+        rate_limit.set_rate_limiter(client)
+        assert rate_limit.get_rate_limiter(client) is rate_limit.DEFAULT_RATE_LIMITER
+        rate_limit.set_rate_limiter(client, None)
+        assert rate_limit.get_rate_limiter(client) is None
+
+    def test_quota(self, server):
+        """
+        Against a service that enforces a quota, clients sharing a limiter adapt to it and all calls succeed.
+        """
+        plain = make_client(GlobalTaggingV1, server.url)
+        results = _attach_tags(plain, 60)
+        assert any(isinstance(r, ApiException) and r.code == 429 for r in results)
+
+        server.accepted = server.rejected = 0
+        limiter = rate_limit.RateLimiter()
+        clients = []
+        for _ in range(2):
+            client = make_client(GlobalTaggingV1, server.url)
+            clients.append(rate_limit.set_rate_limiter(client, limiter))
+        start = time.monotonic()
+        results = _attach_tags(clients[0], 40) + _attach_tags(clients[1], 40)
+        elapsed = time.monotonic() - start
+
+        assert all(r.get_status_code() == 200 for r in results)
+        assert server.accepted == 80
+        # The limiter settles under the quota rather than provoking a 429 for every window.
+        assert server.rejected < 10
+        assert elapsed >= 80 / (WINDOW_REQUESTS / WINDOW) - 2 * WINDOW
+        (bucket,) = limiter.buckets.values()
+        assert bucket.throttled == server.rejected
+        assert bucket.rate < WINDOW_REQUESTS / WINDOW
+
+    def test_configured_limit(self, server):
+        """
+        A limit under the quota avoids 429 responses altogether.
+        """
+        limiter = rate_limit.RateLimiter(rate=0.9 * WINDOW_REQUESTS / WINDOW)
+        client = make_client(GlobalTaggingV1, server.url)
+        rate_limit.set_rate_limiter(client, limiter)
+        results = _attach_tags(client, 30)
+        assert all(r.get_status_code() == 200 for r in results)
+        assert server.rejected == 0
+
+    def test_max_retries(self, server):
+        """
+        A request still throttled after max_retries attempts raises the 429 error.
+        """
+        server.closed = True
+        limiter = rate_limit.RateLimiter(max_retries=2)
+        client = make_client(GlobalTaggingV1, server.url)
+        rate_limit.set_rate_limiter(client, limiter)
+        with pytest.raises(ApiException) as error:
+            client.attach_tag(resources=[{'resource_id': 'crn'}], tag_names=['env:prod'])
+        assert error.value.code == 429
+        assert server.rejected == 3
+
+    def test_retried_bodies(self, local_server):
+        """
+        A throttled request is sent again with its whole body, or not at all if its body cannot be read again.
+        """
+        artifact = b'x' * 5000
+        bodies = [
+            artifact,
+            io.BytesIO(artifact),
+            uploads.UploadStream(artifact),
+            uploads.UploadStream(io.BytesIO(artifact)),
+        ]
+        for body in bodies:
+            server = local_server(_ThrottleOnceHandler, bodies=[])
+            client = rate_limit.set_rate_limiter(make_client(GlobalCatalogV1, server.url), rate_limit.RateLimiter())
+            client.upload_artifact('object', 'artifact.txt', artifact=body, content_type='text/plain')
+            assert server.bodies == [artifact, artifact]
+
+        server = local_server(_ThrottleOnceHandler, bodies=[])
+        client = rate_limit.set_rate_limiter(make_client(GlobalCatalogV1, server.url), rate_limit.RateLimiter())
+        with pytest.raises(ApiException) as error:
+            client.upload_artifact('object', 'artifact.txt', artifact=iter([artifact]), content_type='text/plain')
+        assert error.value.code == 429
+        assert server.bodies == [artifact]
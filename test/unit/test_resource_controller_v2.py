@@ -28,6 +28,7 @@ import re
 import requests
 import responses
 import urllib
+from ibm_platform_services.common import LazyDatetime
 from ibm_platform_services.resource_controller_v2 import *
 
 
@@ -262,6 +263,41 @@ class TestListResourceInstances:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_resource_instances_with_pager_iter(self):
+        """
+        test_list_resource_instances_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/v2/resource_instances')
+        mock_response1 = '{"total_count":2,"limit":1,"next_url":"https://myhost.com/somePath?start=1","resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","scheduled_reclaim_at":"2019-01-01T12:00:00.000Z","restored_at":"2019-01-01T12:00:00.000Z","restored_by":"restored_by","scheduled_reclaim_by":"scheduled_reclaim_by","name":"name","region_id":"region_id","account_id":"account_id","reseller_channel_id":"reseller_channel_id","resource_plan_id":"resource_plan_id","resource_group_id":"resource_group_id","resource_group_crn":"resource_group_crn","target_crn":"target_crn","parameters":{"anyKey":"anyValue"},"allow_cleanup":false,"crn":"crn","state":"active","type":"type","sub_type":"sub_type","resource_id":"resource_id","dashboard_url":"dashboard_url","last_operation":{"type":"type","state":"in progress","sub_type":"sub_type","async":true,"description":"description","reason_code":"reason_code","poll_after":10,"cancelable":true,"poll":true},"resource_aliases_url":"resource_aliases_url","resource_bindings_url":"resource_bindings_url","resource_keys_url":"resource_keys_url","plan_history":[{"resource_plan_id":"resource_plan_id","start_date":"2019-01-01T12:00:00.000Z","requestor_id":"requestor_id"}],"migrated":true,"extensions":{"anyKey":"anyValue"},"controlled_by":"controlled_by","locked":true}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","scheduled_reclaim_at":"2019-01-01T12:00:00.000Z","restored_at":"2019-01-01T12:00:00.000Z","restored_by":"restored_by","scheduled_reclaim_by":"scheduled_reclaim_by","name":"name","region_id":"region_id","account_id":"account_id","reseller_channel_id":"reseller_channel_id","resource_plan_id":"resource_plan_id","resource_group_id":"resource_group_id","resource_group_crn":"resource_group_crn","target_crn":"target_crn","parameters":{"anyKey":"anyValue"},"allow_cleanup":false,"crn":"crn","state":"active","type":"type","sub_type":"sub_type","resource_id":"resource_id","dashboard_url":"dashboard_url","last_operation":{"type":"type","state":"in progress","sub_type":"sub_type","async":true,"description":"description","reason_code":"reason_code","poll_after":10,"cancelable":true,"poll":true},"resource_aliases_url":"resource_aliases_url","resource_bindings_url":"resource_bindings_url","resource_keys_url":"resource_keys_url","plan_history":[{"resource_plan_id":"resource_plan_id","start_date":"2019-01-01T12:00:00.000Z","requestor_id":"requestor_id"}],"migrated":true,"extensions":{"anyKey":"anyValue"},"controlled_by":"controlled_by","locked":true}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = ResourceInstancesPager(
+            client=_service,
+            guid='testString',
+            name='testString',
+            resource_group_id='testString',
+            resource_id='testString',
+            resource_plan_id='testString',
+            type='testString',
+            sub_type='testString',
+            limit=10,
+            state='active',
+            updated_from='2021-01-01',
+            updated_to='2021-01-01',
+        )
+        iterator = iter(pager)
+        first_result = next(iterator)
+        assert first_result is not None
+        assert len(responses.calls) == 1
+        remaining_results = list(iterator)
+        assert len(remaining_results) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreateResourceInstance:
     """
@@ -815,6 +851,32 @@ class TestListResourceAliasesForInstance:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_resource_aliases_for_instance_with_pager_iter(self):
+        """
+        test_list_resource_aliases_for_instance_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/v2/resource_instances/testString/resource_aliases')
+        mock_response1 = '{"total_count":2,"limit":1,"next_url":"https://myhost.com/somePath?start=1","resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","name":"name","resource_instance_id":"resource_instance_id","target_crn":"target_crn","account_id":"account_id","resource_id":"resource_id","resource_group_id":"resource_group_id","crn":"crn","region_instance_id":"region_instance_id","region_instance_crn":"region_instance_crn","state":"state","migrated":true,"resource_instance_url":"resource_instance_url","resource_bindings_url":"resource_bindings_url","resource_keys_url":"resource_keys_url"}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","name":"name","resource_instance_id":"resource_instance_id","target_crn":"target_crn","account_id":"account_id","resource_id":"resource_id","resource_group_id":"resource_group_id","crn":"crn","region_instance_id":"region_instance_id","region_instance_crn":"region_instance_crn","state":"state","migrated":true,"resource_instance_url":"resource_instance_url","resource_bindings_url":"resource_bindings_url","resource_keys_url":"resource_keys_url"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = ResourceAliasesForInstancePager(
+            client=_service,
+            id='testString',
+            limit=10,
+        )
+        iterator = iter(pager)
+        first_result = next(iterator)
+        assert first_result is not None
+        assert len(responses.calls) == 1
+        remaining_results = list(iterator)
+        assert len(remaining_results) == 1
+        assert len(responses.calls) == 2
+
 
 class TestListResourceKeysForInstance:
     """
@@ -964,6 +1026,32 @@ class TestListResourceKeysForInstance:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_resource_keys_for_instance_with_pager_iter(self):
+        """
+        test_list_resource_keys_for_instance_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/v2/resource_instances/testString/resource_keys')
+        mock_response1 = '{"total_count":2,"limit":1,"next_url":"https://myhost.com/somePath?start=1","resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","source_crn":"source_crn","name":"name","crn":"crn","state":"state","account_id":"account_id","resource_group_id":"resource_group_id","resource_id":"resource_id","credentials":{"REDACTED":"REDACTED","apikey":"apikey","iam_apikey_description":"iam_apikey_description","iam_apikey_name":"iam_apikey_name","iam_role_crn":"iam_role_crn","iam_serviceid_crn":"iam_serviceid_crn"},"iam_compatible":true,"migrated":true,"resource_instance_url":"resource_instance_url","resource_alias_url":"resource_alias_url"}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","source_crn":"source_crn","name":"name","crn":"crn","state":"state","account_id":"account_id","resource_group_id":"resource_group_id","resource_id":"resource_id","credentials":{"REDACTED":"REDACTED","apikey":"apikey","iam_apikey_description":"iam_apikey_description","iam_apikey_name":"iam_apikey_name","iam_role_crn":"iam_role_crn","iam_serviceid_crn":"iam_serviceid_crn"},"iam_compatible":true,"migrated":true,"resource_instance_url":"resource_instance_url","resource_alias_url":"resource_alias_url"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = ResourceKeysForInstancePager(
+            client=_service,
+            id='testString',
+            limit=10,
+        )
+        iterator = iter(pager)
+        first_result = next(iterator)
+        assert first_result is not None
+        assert len(responses.calls) == 1
+        remaining_results = list(iterator)
+        assert len(remaining_results) == 1
+        assert len(responses.calls) == 2
+
 
 class TestLockResourceInstance:
     """
@@ -1347,6 +1435,37 @@ class TestListResourceKeys:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_resource_keys_with_pager_iter(self):
+        """
+        test_list_resource_keys_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/v2/resource_keys')
+        mock_response1 = '{"total_count":2,"limit":1,"next_url":"https://myhost.com/somePath?start=1","resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","source_crn":"source_crn","name":"name","crn":"crn","state":"state","account_id":"account_id","resource_group_id":"resource_group_id","resource_id":"resource_id","credentials":{"REDACTED":"REDACTED","apikey":"apikey","iam_apikey_description":"iam_apikey_description","iam_apikey_name":"iam_apikey_name","iam_role_crn":"iam_role_crn","iam_serviceid_crn":"iam_serviceid_crn"},"iam_compatible":true,"migrated":true,"resource_instance_url":"resource_instance_url","resource_alias_url":"resource_alias_url"}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","source_crn":"source_crn","name":"name","crn":"crn","state":"state","account_id":"account_id","resource_group_id":"resource_group_id","resource_id":"resource_id","credentials":{"REDACTED":"REDACTED","apikey":"apikey","iam_apikey_description":"iam_apikey_description","iam_apikey_name":"iam_apikey_name","iam_role_crn":"iam_role_crn","iam_serviceid_crn":"iam_serviceid_crn"},"iam_compatible":true,"migrated":true,"resource_instance_url":"resource_instance_url","resource_alias_url":"resource_alias_url"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = ResourceKeysPager(
+            client=_service,
+            guid='testString',
+            name='testString',
+            resource_group_id='testString',
+            resource_id='testString',
+            limit=10,
+            updated_from='2021-01-01',
+            updated_to='2021-01-01',
+        )
+        iterator = iter(pager)
+        first_result = next(iterator)
+        assert first_result is not None
+        assert len(responses.calls) == 1
+        remaining_results = list(iterator)
+        assert len(remaining_results) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreateResourceKey:
     """
@@ -1832,6 +1951,38 @@ class TestListResourceBindings:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_resource_bindings_with_pager_iter(self):
+        """
+        test_list_resource_bindings_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/v2/resource_bindings')
+        mock_response1 = '{"total_count":2,"limit":1,"next_url":"https://myhost.com/somePath?start=1","resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","source_crn":"source_crn","target_crn":"target_crn","crn":"crn","region_binding_id":"region_binding_id","region_binding_crn":"region_binding_crn","name":"name","account_id":"account_id","resource_group_id":"resource_group_id","state":"state","credentials":{"REDACTED":"REDACTED","apikey":"apikey","iam_apikey_description":"iam_apikey_description","iam_apikey_name":"iam_apikey_name","iam_role_crn":"iam_role_crn","iam_serviceid_crn":"iam_serviceid_crn"},"iam_compatible":true,"resource_id":"resource_id","migrated":true,"resource_alias_url":"resource_alias_url"}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","source_crn":"source_crn","target_crn":"target_crn","crn":"crn","region_binding_id":"region_binding_id","region_binding_crn":"region_binding_crn","name":"name","account_id":"account_id","resource_group_id":"resource_group_id","state":"state","credentials":{"REDACTED":"REDACTED","apikey":"apikey","iam_apikey_description":"iam_apikey_description","iam_apikey_name":"iam_apikey_name","iam_role_crn":"iam_role_crn","iam_serviceid_crn":"iam_serviceid_crn"},"iam_compatible":true,"resource_id":"resource_id","migrated":true,"resource_alias_url":"resource_alias_url"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = ResourceBindingsPager(
+            client=_service,
+            guid='testString',
+            name='testString',
+            resource_group_id='testString',
+            resource_id='testString',
+            region_binding_id='testString',
+            limit=10,
+            updated_from='2021-01-01',
+            updated_to='2021-01-01',
+        )
+        iterator = iter(pager)
+        first_result = next(iterator)
+        assert first_result is not None
+        assert len(responses.calls) == 1
+        remaining_results = list(iterator)
+        assert len(remaining_results) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreateResourceBinding:
     """
@@ -2330,6 +2481,39 @@ class TestListResourceAliases:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_resource_aliases_with_pager_iter(self):
+        """
+        test_list_resource_aliases_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/v2/resource_aliases')
+        mock_response1 = '{"total_count":2,"limit":1,"next_url":"https://myhost.com/somePath?start=1","resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","name":"name","resource_instance_id":"resource_instance_id","target_crn":"target_crn","account_id":"account_id","resource_id":"resource_id","resource_group_id":"resource_group_id","crn":"crn","region_instance_id":"region_instance_id","region_instance_crn":"region_instance_crn","state":"state","migrated":true,"resource_instance_url":"resource_instance_url","resource_bindings_url":"resource_bindings_url","resource_keys_url":"resource_keys_url"}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","name":"name","resource_instance_id":"resource_instance_id","target_crn":"target_crn","account_id":"account_id","resource_id":"resource_id","resource_group_id":"resource_group_id","crn":"crn","region_instance_id":"region_instance_id","region_instance_crn":"region_instance_crn","state":"state","migrated":true,"resource_instance_url":"resource_instance_url","resource_bindings_url":"resource_bindings_url","resource_keys_url":"resource_keys_url"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = ResourceAliasesPager(
+            client=_service,
+            guid='testString',
+            name='testString',
+            resource_instance_id='testString',
+            region_instance_id='testString',
+            resource_id='testString',
+            resource_group_id='testString',
+            limit=10,
+            updated_from='2021-01-01',
+            updated_to='2021-01-01',
+        )
+        iterator = iter(pager)
+        first_result = next(iterator)
+        assert first_result is not None
+        assert len(responses.calls) == 1
+        remaining_results = list(iterator)
+        assert len(remaining_results) == 1
+        assert len(responses.calls) == 2
+
 
 class TestCreateResourceAlias:
     """
@@ -2794,6 +2978,32 @@ class TestListResourceBindingsForAlias:
         assert all_results is not None
         assert len(all_results) == 2
 
+    @responses.activate
+    def test_list_resource_bindings_for_alias_with_pager_iter(self):
+        """
+        test_list_resource_bindings_for_alias_with_pager_iter()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/v2/resource_aliases/testString/resource_bindings')
+        mock_response1 = '{"total_count":2,"limit":1,"next_url":"https://myhost.com/somePath?start=1","resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","source_crn":"source_crn","target_crn":"target_crn","crn":"crn","region_binding_id":"region_binding_id","region_binding_crn":"region_binding_crn","name":"name","account_id":"account_id","resource_group_id":"resource_group_id","state":"state","credentials":{"REDACTED":"REDACTED","apikey":"apikey","iam_apikey_description":"iam_apikey_description","iam_apikey_name":"iam_apikey_name","iam_role_crn":"iam_role_crn","iam_serviceid_crn":"iam_serviceid_crn"},"iam_compatible":true,"resource_id":"resource_id","migrated":true,"resource_alias_url":"resource_alias_url"}]}'
+        mock_response2 = '{"total_count":2,"limit":1,"resources":[{"id":"id","guid":"guid","url":"url","created_at":"2019-01-01T12:00:00.000Z","updated_at":"2019-01-01T12:00:00.000Z","deleted_at":"2019-01-01T12:00:00.000Z","created_by":"created_by","updated_by":"updated_by","deleted_by":"deleted_by","source_crn":"source_crn","target_crn":"target_crn","crn":"crn","region_binding_id":"region_binding_id","region_binding_crn":"region_binding_crn","name":"name","account_id":"account_id","resource_group_id":"resource_group_id","state":"state","credentials":{"REDACTED":"REDACTED","apikey":"apikey","iam_apikey_description":"iam_apikey_description","iam_apikey_name":"iam_apikey_name","iam_role_crn":"iam_role_crn","iam_serviceid_crn":"iam_serviceid_crn"},"iam_compatible":true,"resource_id":"resource_id","migrated":true,"resource_alias_url":"resource_alias_url"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = ResourceBindingsForAliasPager(
+            client=_service,
+            id='testString',
+            limit=10,
+        )
+        iterator = iter(pager)
+        first_result = next(iterator)
+        assert first_result is not None
+        assert len(responses.calls) == 1
+        remaining_results = list(iterator)
+        assert len(remaining_results) == 1
+        assert len(responses.calls) == 2
+
 
 # endregion
 ##############################################################################
@@ -3565,6 +3775,42 @@ class TestModel_ResourceInstance:
         resource_instance_model_json2 = resource_instance_model.to_dict()
         assert resource_instance_model_json2 == resource_instance_model_json
 
+    def test_resource_instance_lazy_datetimes(self):
+        """
+        Test that the date-time properties of ResourceInstance are parsed on first access
+        """
+
+        resource_instance_model_json = {'id': 'testString', 'created_at': '2019-01-01T12:00:00.000Z'}
+        resource_instance_model = ResourceInstance.from_dict(resource_instance_model_json)
+        assert isinstance(resource_instance_model.__dict__['created_at'], LazyDatetime)
+
+        # An unparsed date-time compares equal to the parsed one
+        resource_instance_model2 = ResourceInstance(
+            id='testString', created_at=datetime(2019, 1, 1, 12, tzinfo=timezone.utc)
+        )
+        assert resource_instance_model == resource_instance_model2
+
+        assert resource_instance_model.created_at == datetime(2019, 1, 1, 12, tzinfo=timezone.utc)
+        assert isinstance(resource_instance_model.__dict__['created_at'], datetime)
+        assert resource_instance_model.updated_at is None
+        assert resource_instance_model.to_dict() == {'id': 'testString', 'created_at': '2019-01-01T12:00:00Z'}
+
+    def test_resource_instance_invalid_datetimes(self):
+        """
+        Test where an invalid date-time property of ResourceInstance raises its error
+        """
+
+        # from_dict() defers the parsing, so the error is raised when the property is first read
+        resource_instance_model = ResourceInstance.from_dict({'id': 'testString', 'created_at': 'not a date-time'})
+        with pytest.raises(ValueError):
+            resource_instance_model.created_at  # pylint: disable=pointless-statement
+
+        # A string assigned by the caller is stored and returned as is, as before
+        resource_instance_model = ResourceInstance(id='testString', created_at='not a date-time')
+        assert resource_instance_model.created_at == 'not a date-time'
+        resource_instance_model.updated_at = 'not a date-time either'
+        assert resource_instance_model.updated_at == 'not a date-time either'
+
 
 class TestModel_ResourceInstanceLastOperation:
     """
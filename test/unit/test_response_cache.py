@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the read-through response cache
+"""
+
+import json
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_platform_services import instrumentation, response_cache
+from ibm_platform_services.global_catalog_v1 import GlobalCatalogV1
+from ibm_platform_services.iam_policy_management_v1 import IamPolicyManagementV1
+
+_iam_url = 'https://iam.cloud.ibm.com'
+_catalog_url = 'https://globalcatalog.cloud.ibm.com/api/v1'
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def cache(clock):
+    return response_cache.ResponseCache(clock=clock)
+
+
+def _client(cache, service_class=IamPolicyManagementV1, url=_iam_url, authenticator=None):
+    client = service_class(authenticator=authenticator or NoAuthAuthenticator())
+    client.set_service_url(url)
+    return response_cache.set_cache(client, cache)
+
+
+def _add_role(role_id, etag=None, status=200):
+    responses.add(
+        responses.GET,
+        '{0}/v2/roles/{1}'.format(_iam_url, role_id),
+        body=json.dumps({'id': role_id, 'display_name': 'Role ' + role_id}),
+        content_type='application/json',
+        headers={'ETag': etag} if etag else None,
+        status=status,
+    )
+
+
+class TestResponseCache:
+    """
+    Test Class for the read-through response cache
+    """
+
+    @responses.activate
+    def test_hit(self, cache):
+        """
+        A cached result is returned as a new copy without sending a request.
+        """
+        _add_role('role-1')
+        client = _client(cache)
+        assert response_cache.get_cache(client) is cache
+        first = client.get_role('role-1')
+        second = client.get_role('role-1')
+
+        assert len(responses.calls) == 1
+        assert second.get_result() == first.get_result() == {'id': 'role-1', 'display_name': 'Role role-1'}
+        assert second.get_result() is not first.get_result()
+        assert second.get_status_code() == 200
+        assert second.get_headers()['Content-Type'] == 'application/json'
+        assert cache.hits['get_role'] == 1
+        assert cache.misses['get_role'] == 1
+        assert len(cache) == 1
+        assert cache.size > 0
+
+    @responses.activate
+    def test_uncached_operations(self, cache):
+        """
+        Operations without a time to live are not cached.
+        """
+        responses.add(
+            responses.GET, _iam_url + '/v1/policies', body='{"policies": []}', content_type='application/json'
+        )
+        client = _client(cache)
+        client.list_policies('account')
+        client.list_policies('account')
+        assert len(responses.calls) == 2
+        assert not cache.hits and not cache.misses
+
+        # Clients without a cache are not affected.
+        _add_role('role-1')
+        other = IamPolicyManagementV1(authenticator=NoAuthAuthenticator())
+        other.set_service_url(_iam_url)
+        assert response_cache.get_cache(other) is None
+        other.get_role('role-1')
+        other.get_role('role-1')
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_expiry(self, cache, clock):
+        """
+        An expired result without an ETag is fetched again.
+        """
+        _add_role('role-1')
+        client = _client(cache)
+        client.get_role('role-1')
+        clock.now += response_cache.DEFAULT_TTLS['get_role'] - 1
+        client.get_role('role-1')
+        assert len(responses.calls) == 1
+        clock.now += 1
+        client.get_role('role-1')
+        assert len(responses.calls) == 2
+        assert 'If-None-Match' not in responses.calls[1].request.headers
+        assert (cache.hits['get_role'], cache.misses['get_role']) == (1, 2)
+
+    @responses.activate
+    def test_etag_revalidation(self, cache, clock):
+        """
+        An expired result with an ETag is revalidated and reused if it has not changed.
+        """
+        _add_role('role-1', etag='"v1"')
+        client = _client(cache)
+        first = client.get_role('role-1')
+        clock.now += 301
+
+        responses.replace(responses.GET, _iam_url + '/v2/roles/role-1', body='', status=304)
+        second = client.get_role('role-1')
+        assert responses.calls[1].request.headers['If-None-Match'] == '"v1"'
+        assert second.get_result() == first.get_result()
+        assert cache.revalidations['get_role'] == 1
+        assert cache.hits['get_role'] == 1
+
+        # The revalidated result is fresh again.
+        client.get_role('role-1')
+        assert len(responses.calls) == 2
+
+        # A changed result replaces the cached one.
+        clock.now += 301
+        responses.replace(
+            responses.GET,
+            _iam_url + '/v2/roles/role-1',
+            body='{"id": "role-1", "display_name": "Renamed"}',
+            content_type='application/json',
+            headers={'ETag': '"v2"'},
+        )
+        assert client.get_role('role-1').get_result()['display_name'] == 'Renamed'
+        assert client.get_role('role-1').get_result()['display_name'] == 'Renamed'
+        assert len(responses.calls) == 3
+        assert cache.misses['get_role'] == 2
+
+    @responses.activate
+    def test_lru_bounds(self, clock):
+        """
+        The least recently used results are evicted beyond the size bounds.
+        """
+        cache = response_cache.ResponseCache(max_entries=2, clock=clock)
+        for role_id in ('role-1', 'role-2', 'role-3'):
+            _add_role(role_id)
+        client = _client(cache)
+        client.get_role('role-1')
+        client.get_role('role-2')
+        client.get_role('role-1')
+        client.get_role('role-3')
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        client.get_role('role-1')
+        assert len(responses.calls) == 3
+        client.get_role('role-2')
+        assert len(responses.calls) == 4
+
+        small = response_cache.ResponseCache(max_bytes=10, clock=clock)
+        client = _client(small)
+        client.get_role('role-1')
+        assert len(small) == 0 and small.size == 0
+
+        with pytest.raises(ValueError):
+            response_cache.ResponseCache(max_entries=0)
+
+    @responses.activate
+    def test_cache_key(self, cache):
+        """
+        Results are cached per query parameters and per credentials.
+        """
+        responses.add(responses.GET, _catalog_url + '/entry', body='{"id": "entry"}', content_type='application/json')
+        client = _client(cache, GlobalCatalogV1, _catalog_url, BearerTokenAuthenticator('token-1'))
+        client.get_catalog_entry('entry')
+        client.get_catalog_entry('entry', include='*')
+        client.get_catalog_entry('entry', include='*')
+        assert len(responses.calls) == 2
+
+        other = _client(cache, GlobalCatalogV1, _catalog_url, BearerTokenAuthenticator('token-2'))
+        other.get_catalog_entry('entry')
+        assert len(responses.calls) == 3
+        same = _client(cache, GlobalCatalogV1, _catalog_url, BearerTokenAuthenticator('token-1'))
+        same.get_catalog_entry('entry')
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_errors(self, cache):
+        """
+        Error responses are not cached.
+        """
+        _add_role('role-1', status=404)
+        client = _client(cache)
+        for _ in range(2):
+            with pytest.raises(ApiException):
+                client.get_role('role-1')
+        assert len(responses.calls) == 2
+        assert len(cache) == 0
+
+    @responses.activate
+    def test_invalidate(self, cache):
+        """
+        invalidate() and clear() remove cached results.
+        """
+        _add_role('role-1')
+        client = _client(cache)
+        client.get_role('role-1')
+        cache.invalidate('list_roles')
+        assert len(cache) == 1
+        cache.invalidate('get_role')
+        assert len(cache) == 0
+        client.get_role('role-1')
+        cache.clear()
+        assert len(cache) == 0 and not cache.misses
+
+    @responses.activate
+    def test_instrumentation(self, cache):
+        """
+        The cache and the instrumentation can be set in any order; hits are not sent.
+        """
+
+        class Recorder(instrumentation.Instrumentation):
+            def __init__(self):
+                self.ended = []
+
+            def end_operation(self, metrics):
+                self.ended.append(metrics)
+
+        _add_role('role-1')
+        recorder = Recorder()
+        client = _client(cache)
+        instrumentation.set_instrumentation(client, recorder)
+        response_cache.set_cache(client, cache)
+        client.get_role('role-1')
+        client.get_role('role-1')
+        assert [m.operation_id for m in recorder.ended] == ['get_role']
+        assert cache.hits['get_role'] == 1
+
+        response_cache.set_cache(client, None)
+        client.get_role('role-1')
+        assert len(responses.calls) == 2
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the coalescing of identical concurrent GET requests, run against a local server
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+import pytest
+import requests
+
+from ibm_platform_services import single_flight
+from ibm_platform_services.global_catalog_v1 import GlobalCatalogV1
+from ibm_platform_services.resource_manager_v2 import ResourceManagerV2
+
+from .conftest import LocalHandler, make_client
+
+THREADS = 32
+
+
+class _Handler(LocalHandler):
+    def do_GET(self):  # pylint: disable=invalid-name
+        with self.server.lock:
+            self.server.requests.append(self.path)
+        # Slow enough for the concurrent calls to overlap.
+        time.sleep(0.2)
+        entry_id = self.path.split('?')[0].rsplit('/', 1)[-1]
+        status = 404 if entry_id == 'missing' else 200
+        self.respond(status, {'id': entry_id, 'auth': self.headers.get('Authorization')})
+
+
+@pytest.fixture
+def server(local_server):
+    return local_server(_Handler, requests=[], lock=threading.Lock())
+
+
+def _client(url, group=None, service_class=GlobalCatalogV1, token='token'):
+    client = make_client(service_class, url, BearerTokenAuthenticator(token))
+    client.get_http_client().mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=THREADS))
+    if group is not None:
+        single_flight.set_single_flight(client, group)
+    return client
+
+
+def _run_together(calls):
+    # Starts the calls on as many threads at the same moment; returns their results or exceptions.
+    barrier = threading.Barrier(len(calls))
+
+    def run(call):
+        barrier.wait()
+        try:
+            return call()
+        except ApiException as error:
+            return error
+
+    with ThreadPoolExecutor(len(calls)) as executor:
+        return list(executor.map(run, calls))
+
+
+class TestSingleFlight:
+    """
+    Test Class for the coalescing of identical concurrent GET requests
+    """
+
+    def test_stress(self, server):
+        """
+        Identical concurrent calls send far fewer requests than calls, and all get the result.
+        """
+        client = _client(server.url)
+        results = _run_together([lambda: client.get_catalog_entry('entry')] * THREADS)
+        assert len(server.requests) == THREADS
+        assert all(r.get_result()['id'] == 'entry' for r in results)
+
+        del server.requests[:]
+        group = single_flight.SingleFlight()
+        client = _client(server.url, group)
+        assert single_flight.get_single_flight(client) is group
+        results = _run_together([lambda: client.get_catalog_entry('entry')] * THREADS)
+        assert len(server.requests) <= THREADS // 8
+        assert group.sent['get_catalog_entry'] == len(server.requests)
+        assert group.sent['get_catalog_entry'] + group.coalesced['get_catalog_entry'] == THREADS
+        assert all(r.get_result() == {'id': 'entry', 'auth': 'Bearer token'} for r in results)
+        # Every caller has its own copy of the result.
+        assert len({id(r.get_result()) for r in results}) == THREADS
+
+    def test_distinct_calls(self, server):
+        """
+        Calls that differ in arguments, credentials or operation are not coalesced.
+        """
+        group = single_flight.SingleFlight()
+        client = _client(server.url, group)
+        other = _client(server.url, group, token='other')
+        groups = _client(server.url, group, ResourceManagerV2)
+        results = _run_together(
+            [
+                lambda: client.get_catalog_entry('entry'),
+                lambda: client.get_catalog_entry('entry', include='*'),
+                lambda: client.get_catalog_entry('other'),
+                lambda: other.get_catalog_entry('entry'),
+                lambda: groups.get_resource_group('entry'),
+            ]
+        )
+        assert len(server.requests) == 5
+        assert not group.coalesced
+        assert results[3].get_result()['auth'] == 'Bearer other'
+
+        # Sequential calls are not coalesced either.
+        client.get_catalog_entry('entry')
+        assert len(server.requests) == 6
+
+    def test_shared_clients(self, server):
+        """
+        The identical calls of clients that share a group and credentials are coalesced.
+        """
+        group = single_flight.SingleFlight()
+        clients = [_client(server.url, group) for _ in range(4)]
+        _run_together([lambda c=c: c.get_catalog_entry('entry') for c in clients])
+        assert len(server.requests) < len(clients)
+
+    def test_error(self, server):
+        """
+        The calls that share a failed request raise its exception.
+        """
+        group = single_flight.SingleFlight()
+        client = _client(server.url, group)
+        results = _run_together([lambda: client.get_catalog_entry('missing')] * 8)
+        assert len(server.requests) < 8
+        assert group.coalesced['get_catalog_entry'] == 8 - len(server.requests)
+        assert all(isinstance(r, ApiException) and r.code == 404 for r in results)
+
+    def test_operations(self, server):
+        """
+        Only the listed operations are coalesced.
+        """
+        group = single_flight.SingleFlight(operations=['get_resource_group'])
+        assert group.coalesces('get_resource_group')
+        assert not group.coalesces('get_catalog_entry')
+        client = _client(server.url, group)
+        _run_together([lambda: client.get_catalog_entry('entry')] * 4)
+        assert len(server.requests) == 4
+
+        single_flight.set_single_flight(client, None)
+        assert single_flight.get_single_flight(client) is None
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the background refreshing of IAM tokens, run against a local token service
+"""
+
+from collections import Counter
+import threading
+import time
+from urllib.parse import parse_qs
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import jwt
+import pytest
+
+from ibm_platform_services import token_refresh
+from ibm_platform_services.resource_controller_v2 import ResourceControllerV2
+
+from .conftest import LocalHandler, make_client
+
+# The time the token service takes to answer; a request that takes as long waited for it.
+TOKEN_LATENCY = 0.3
+
+
+class _Handler(LocalHandler):
+    def do_POST(self):  # pylint: disable=invalid-name
+        form = parse_qs(self.read_body().decode('utf-8'))
+        apikey = form['apikey'][0]
+        with self.server.lock:
+            self.server.token_requests[apikey] += 1
+        time.sleep(TOKEN_LATENCY)
+        if apikey == 'broken':
+            self.respond(500, {'errorMessage': 'Internal error'})
+            return
+        now = int(time.time())
+        access_token = jwt.encode(
+            {'iat': now, 'exp': now + self.server.ttl, 'sub': apikey}, 'x' * 32, algorithm='HS256'
+        )
+        self.respond(
+            200,
+            {
+                'access_token': access_token,
+                'refresh_token': 'refresh',
+                'token_type': 'Bearer',
+                'expires_in': self.server.ttl,
+            },
+        )
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.respond(200, {'id': self.path.rsplit('/', 1)[-1]})
+
+
+@pytest.fixture
+def server(local_server):
+    return local_server(_Handler, lock=threading.Lock(), token_requests=Counter(), ttl=3600)
+
+
+@pytest.fixture
+def refresher():
+    refresher = token_refresh.TokenRefresher()
+    yield refresher
+    refresher.close()
+
+
+def _client(url, apikey):
+    return make_client(ResourceControllerV2, url, IAMAuthenticator(apikey, url=url))
+
+
+def _wait_for_token(client, timeout=5):
+    token_manager = client.get_authenticator().token_manager
+    deadline = time.monotonic() + timeout
+    while token_manager.access_token is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert token_manager.access_token is not None
+
+
+def _count_blocked(client, duration):
+    # Calls the client for the duration; returns the number of calls that waited for the token service.
+    blocked = 0
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        start = time.monotonic()
+        client.get_resource_instance('instance')
+        if time.monotonic() - start >= TOKEN_LATENCY * 0.8:
+            blocked += 1
+        time.sleep(0.01)
+    return blocked
+
+
+class TestTokenRefresher:
+    """
+    Test Class for TokenRefresher
+    """
+
+    def test_blocked_requests(self, server, refresher):
+        """
+        With the refresher, no request waits for the token service when its token expires.
+        """
+        # Tokens live for 3 seconds; they are refreshed after 2.4 seconds.
+        server.ttl = 3
+        plain = _client(server.url, 'plain')
+        refreshed = token_refresh.set_token_refresher(_client(server.url, 'refreshed'), refresher)
+        assert token_refresh.get_token_refresher(refreshed) is refresher
+        assert token_refresh.get_token_refresher(plain) is None
+        plain.get_resource_instance('instance')
+        _wait_for_token(refreshed)
+
+        blocked = {}
+        threads = [
+            threading.Thread(target=lambda c=c: blocked.__setitem__(c, _count_blocked(c, 4.5)))
+            for c in (plain, refreshed)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert blocked[plain] >= 1
+        assert blocked[refreshed] == 0
+        assert refresher.refreshes >= 3
+        assert refresher.failures == 0
+
+    def test_shared_credentials(self, server, refresher):
+        """
+        The clients with the same credentials share one token manager and one token.
+        """
+        clients = [token_refresh.set_token_refresher(_client(server.url, 'shared'), refresher) for _ in range(3)]
+        other = token_refresh.set_token_refresher(_client(server.url, 'other'), refresher)
+        token_managers = {id(c.get_authenticator().token_manager) for c in clients}
+        assert len(token_managers) == 1
+        assert id(other.get_authenticator().token_manager) not in token_managers
+        assert len(refresher.token_managers) == 2
+        for client in clients + [other]:
+            _wait_for_token(client)
+            client.get_resource_instance('instance')
+        assert server.token_requests == {'shared': 1, 'other': 1}
+
+    def test_configuration(self, server, refresher, monkeypatch):
+        """
+        Token managers are shared only if they are configured alike, even when their scopes collide.
+        """
+        authenticators = [
+            IAMAuthenticator('shared', url=server.url),
+            IAMAuthenticator('shared', url=server.url, scope='other'),
+            IAMAuthenticator('shared', url=server.url, client_id='bx', client_secret='secret'),
+            IAMAuthenticator('shared', url=server.url, headers={'X-Account': 'other'}),
+            IAMAuthenticator('shared', url=server.url, proxies={'https': 'http://proxy:3128'}),
+            IAMAuthenticator('shared', url=server.url, disable_ssl_verification=True),
+        ]
+        token_managers = {id(refresher.register(authenticator)) for authenticator in authenticators}
+        assert len(token_managers) == len(authenticators)
+
+        monkeypatch.setattr(token_refresh, 'auth_scope', lambda authenticator: 'collision')
+        refresher = token_refresh.TokenRefresher()
+        try:
+            first = refresher.register(IAMAuthenticator('shared', url=server.url))
+            assert refresher.register(IAMAuthenticator('shared', url=server.url)) is first
+            assert refresher.register(IAMAuthenticator('shared', url=server.url, scope='other')) is not first
+            assert len(refresher.token_managers) == 2
+        finally:
+            refresher.close()
+
+    def test_failure(self, server):
+        """
+        When the refresher fails to fetch a token, the requests fetch it themselves.
+        """
+        refresher = token_refresh.TokenRefresher(retry_interval=0.1)
+        client = token_refresh.set_token_refresher(_client(server.url, 'broken'), refresher)
+        deadline = time.monotonic() + 5
+        while refresher.failures < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert refresher.failures >= 2
+        assert refresher.refreshes == 0
+        with pytest.raises(ApiException) as error:
+            client.get_resource_instance('instance')
+        assert error.value.code == 500
+        refresher.close()
+        with pytest.raises(ValueError):
+            refresher.register(IAMAuthenticator('apikey', url=server.url))
+
+    def test_new_instance(self, server, refresher, monkeypatch):
+        """
+        Clients constructed by the refresher are registered with it.
+        """
+        monkeypatch.setenv('RESOURCE_CONTROLLER_AUTH_TYPE', 'iam')
+        monkeypatch.setenv('RESOURCE_CONTROLLER_APIKEY', 'configured')
+        monkeypatch.setenv('RESOURCE_CONTROLLER_AUTH_URL', server.url)
+        client = refresher.new_instance(ResourceControllerV2)
+        assert token_refresh.get_token_refresher(client) is refresher
+        _wait_for_token(client)
+        assert server.token_requests == {'configured': 1}
+
+        with pytest.raises(ValueError):
+            refresher.register(NoAuthAuthenticator())
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for streaming uploads, run against a local server
+"""
+
+import email
+import io
+import mmap
+
+import pytest
+import requests
+
+from ibm_platform_services import uploads
+from ibm_platform_services.case_management_v1 import CaseManagementV1, FileWithMetadata
+from ibm_platform_services.global_catalog_v1 import GlobalCatalogV1
+
+from .conftest import LocalHandler, make_client
+
+# The content of the uploaded files, larger than a few chunks.
+CONTENT = bytes(range(256)) * 1024
+
+
+class _Handler(LocalHandler):
+    def do_PUT(self):  # pylint: disable=invalid-name
+        body = self.read_body()
+        self.server.requests.append({'path': self.path, 'headers': dict(self.headers), 'body': body})
+        self.respond(200, {'id': 'attachment'})
+
+
+@pytest.fixture
+def server(local_server):
+    return local_server(_Handler, requests=[])
+
+
+def _parts(request):
+    message = email.message_from_bytes(
+        'Content-Type: {0}\r\n\r\n'.format(request['headers']['Content-Type']).encode('ascii') + request['body']
+    )
+    return [(part.get_filename(), part.get_content_type(), part.get_payload(decode=True)) for part in message.walk()][
+        1:
+    ]
+
+
+class _Pipe(io.RawIOBase):
+    """
+    A file object whose length is not known until it is read.
+    """
+
+    def __init__(self, content):
+        super().__init__()
+        self._content = io.BytesIO(content)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        chunk = self._content.read(min(len(b), 1000))
+        b[: len(chunk)] = chunk
+        return len(chunk)
+
+
+class TestUploadStream:
+    """
+    Test Class for UploadStream
+    """
+
+    def test_sources(self, tmp_path):
+        """
+        Paths, file objects and buffers are read in chunks, and their length is known without reading them.
+        """
+        path = tmp_path / 'bundle.zip'
+        path.write_bytes(CONTENT)
+        file = open(path, 'rb')
+        file.seek(1000)
+        with open(path, 'r+b') as mapped:
+            buffer = mmap.mmap(mapped.fileno(), 0)
+            for source, content in [
+                (str(path), CONTENT),
+                (file, CONTENT[1000:]),
+                (CONTENT, CONTENT),
+                (buffer, CONTENT),
+                (_Pipe(CONTENT), CONTENT),
+            ]:
+                progress = []
+                stream = uploads.UploadStream(source, chunk_size=4096, progress=lambda *p: progress.append(p))
+                assert stream.len == (None if isinstance(source, _Pipe) else len(content))
+                chunks = list(stream)
+                assert b''.join(chunks) == content
+                assert max(len(chunk) for chunk in chunks) <= 4096
+                assert progress[-1] == (len(content), stream.len)
+                if stream.seekable():
+                    assert stream.seek(10) == 10 and stream.read(5) == content[10:15]
+                    assert stream.seek(-5, io.SEEK_END) == len(content) - 5
+                else:
+                    with pytest.raises(io.UnsupportedOperation):
+                        stream.seek(0)
+                stream.close()
+            buffer.close()
+        assert uploads.UploadStream(str(path)).name == str(path)
+        file.close()
+        with pytest.raises(ValueError):
+            uploads.UploadStream(CONTENT, chunk_size=0)
+
+    def test_upload_artifact(self, server, tmp_path):
+        """
+        An artifact is sent in chunks with its Content-Length, reporting its progress.
+        """
+        path = tmp_path / 'artifact.tgz'
+        path.write_bytes(CONTENT)
+        client = make_client(GlobalCatalogV1, server.url)
+        progress = []
+        with uploads.UploadStream(path, progress=lambda sent, total: progress.append(sent)) as artifact:
+            client.upload_artifact('object', 'artifact.tgz', artifact=artifact, content_type='application/gzip')
+        (request,) = server.requests
+        assert request['headers']['Content-Length'] == str(len(CONTENT))
+        assert request['body'] == CONTENT
+        assert len(progress) > 1 and progress[-1] == len(CONTENT)
+
+        # A body whose length is not known is sent with chunked transfer encoding.
+        client.upload_artifact('object', 'artifact.tgz', artifact=uploads.UploadStream(_Pipe(CONTENT)))
+        assert server.requests[-1]['headers']['Transfer-Encoding'] == 'chunked'
+        assert server.requests[-1]['body'] == CONTENT
+
+
+class TestMultipartBody:
+    """
+    Test Class for MultipartBody and the streaming uploads of service clients
+    """
+
+    def test_encoding(self):
+        """
+        The body is the one the HTTP client would encode in memory.
+        """
+
+        def files():
+            return [('file', ('a.txt', b'hello', 'text/plain')), ('file', (None, io.BytesIO(b'xyz'), None))]
+
+        body = uploads.MultipartBody(files(), fields={'key': 'value'}, boundary='boundary', chunk_size=7)
+        content = b''.join(body)
+        assert len(content) == body.len and body.tell() == body.len
+        prepared = requests.Request('PUT', 'http://localhost', files=files(), data={'key': 'value'}).prepare()
+        boundary = prepared.headers['Content-Type'].split('boundary=')[1]
+        assert prepared.body.replace(boundary.encode('ascii'), b'boundary') == content
+        assert body.content_type == 'multipart/form-data; boundary=boundary'
+
+        body = uploads.MultipartBody([('file', ('a.txt', uploads.UploadStream(CONTENT), 'text/plain'))])
+        first = body.read(1000)
+        assert len(first) == 1000
+        assert body.seek(0) == 0
+        assert body.read(1000) == first
+        with pytest.raises(io.UnsupportedOperation):
+            body.seek(10)
+
+    def test_upload_file(self, server, tmp_path):
+        """
+        The attachments of a case are sent in chunks, with their Content-Length or chunked.
+        """
+        path = tmp_path / 'bundle.zip'
+        path.write_bytes(CONTENT)
+        client = uploads.set_streaming_uploads(make_client(CaseManagementV1, server.url), chunk_size=4096)
+        assert uploads.get_streaming_uploads(client) == 4096
+        progress = []
+        files = [
+            FileWithMetadata(uploads.UploadStream(path, progress=lambda *p: progress.append(p))),
+            FileWithMetadata(b'notes', filename='notes.txt', content_type='text/plain'),
+        ]
+        assert client.upload_file('CS1234', files).get_result() == {'id': 'attachment'}
+        request = server.requests[-1]
+        assert request['path'] == '/cases/CS1234/attachments'
+        assert int(request['headers']['Content-Length']) == len(request['body'])
+        assert _parts(request) == [
+            ('bundle.zip', 'application/octet-stream', CONTENT),
+            ('notes.txt', 'text/plain', b'notes'),
+        ]
+        assert progress[-1] == (len(CONTENT), len(CONTENT))
+
+        client.upload_file('CS1234', [FileWithMetadata(uploads.UploadStream(_Pipe(CONTENT)), filename='pipe')])
+        request = server.requests[-1]
+        assert request['headers']['Transfer-Encoding'] == 'chunked'
+        assert _parts(request) == [('pipe', 'application/octet-stream', CONTENT)]
+
+        uploads.set_streaming_uploads(client, None)
+        assert uploads.get_streaming_uploads(client) is None
+        client.upload_file('CS1234', [FileWithMetadata(io.BytesIO(b'notes'), filename='notes.txt')])
+        assert _parts(server.requests[-1]) == [('notes.txt', 'application/octet-stream', b'notes')]
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the columnar export of instance usage reports
+"""
+
+import csv
+import io
+import json
+import math
+import urllib
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_platform_services import usage_export
+from ibm_platform_services.usage_reports_v4 import UsageReportsV4
+
+_service = UsageReportsV4(authenticator=NoAuthAuthenticator())
+_service.set_service_url('https://usage.test.cloud.ibm.com')
+
+
+def _resource(i, metrics):
+    return {
+        'account_id': 'account',
+        'resource_instance_id': 'instance-{0}'.format(i),
+        'resource_id': 'cloud-object-storage',
+        'pricing_country': 'USA',
+        'currency_code': 'USD',
+        'billable': True,
+        'plan_id': 'plan-{0}'.format(i % 2),
+        'month': '2022-06',
+        'usage': [
+            {'metric': metric, 'quantity': i, 'cost': i * 0.5, 'rated_cost': i * 0.75, 'discounts': []}
+            for metric in metrics
+        ],
+    }
+
+
+# The pages of the report, by offset.
+PAGES = {
+    None: {'resources': [_resource(0, ['STORAGE', 'CLASS_A']), _resource(1, [])], 'next': {'offset': 'page-2'}},
+    'page-2': {'resources': [_resource(2, ['STORAGE'])], 'next': {'offset': 'page-3'}},
+    'page-3': {'resources': [_resource(3, ['STORAGE', 'CLASS_A', 'CLASS_B'])]},
+}
+
+
+def _add_pages(url):
+    def callback(request):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+        start = query.get('_start', [None])[0]
+        return (200, {}, json.dumps(PAGES[start]))
+
+    responses.add_callback(responses.GET, url, callback=callback, content_type='application/json')
+
+
+class TestUsageExport:
+    """
+    Test Class for the columnar export of instance usage reports
+    """
+
+    @responses.activate
+    def test_export_usage(self):
+        """
+        The metrics of every page are exported as columns, one row per metric.
+        """
+        _add_pages('https://usage.test.cloud.ibm.com/v4/accounts/account/resource_instances/usage/2022-06')
+        columns = usage_export.export_usage(_service.get_resource_usage_account, 'account', '2022-06', limit=20)
+        assert len(responses.calls) == 3
+        assert '_limit=20' in responses.calls[-1].request.url
+        assert len(columns) == 6
+        assert columns.resource_instance_id == ['instance-0'] * 2 + ['instance-2'] + ['instance-3'] * 3
+        assert columns.metric == ['STORAGE', 'CLASS_A', 'STORAGE', 'STORAGE', 'CLASS_A', 'CLASS_B']
+        assert columns.plan_id[2:4] == ['plan-0', 'plan-1']
+        assert list(columns.cost) == [0.0, 0.0, 1.0, 1.5, 1.5, 1.5]
+        assert columns.rated_cost.typecode == 'd'
+        assert list(columns.columns()) == list(usage_export.COLUMNS)
+        assert next(iter(columns.rows())) == ('instance-0', 'plan-0', 'STORAGE', 0.0, 0.0, 0.0, 'USD')
+
+        # The export starts at an offset.
+        columns = usage_export.export_usage(_service.get_resource_usage_account, 'account', '2022-06', start='page-3')
+        assert len(columns) == 3 and len(responses.calls) == 4
+
+    @responses.activate
+    def test_export_usage_csv(self, tmp_path):
+        """
+        The rows are written as CSV, page by page, to a path or a file object.
+        """
+        _add_pages(
+            'https://usage.test.cloud.ibm.com/v4/accounts/account/resource_groups/group/resource_instances/usage/2022-06'
+        )
+        path = tmp_path / 'usage.csv'
+        count = usage_export.export_usage_csv(
+            _service.get_resource_usage_resource_group, 'account', 'group', '2022-06', destination=str(path)
+        )
+        assert count == 6
+        with open(str(path), newline='', encoding='utf-8') as file:
+            rows = list(csv.reader(file))
+        assert rows[0] == list(usage_export.COLUMNS)
+        assert rows[-1] == ['instance-3', 'plan-1', 'CLASS_B', '3.0', '1.5', '2.25', 'USD']
+        assert len(rows) == 7
+
+        _add_pages(
+            'https://usage.test.cloud.ibm.com/v4/accounts/account/organizations/org/resource_instances/usage/2022-06'
+        )
+        file = io.StringIO(newline='')
+        usage_export.export_usage_csv(_service.get_resource_usage_org, 'account', 'org', '2022-06', destination=file)
+        assert file.getvalue() == path.read_bytes().decode('utf-8')
+
+    def test_missing_values(self):
+        """
+        A metric without a quantity or cost has NaN in its columns, and a resource without metrics has no row.
+        """
+        columns = usage_export.UsageColumns()
+        assert columns.add_page({}) == 0
+        assert columns.add_page({'resources': [{'resource_instance_id': 'instance', 'usage': [{'metric': 'M'}]}]}) == 1
+        assert math.isnan(columns.quantity[0]) and math.isnan(columns.cost[0])
+        assert columns.plan_id == [None] and columns.currency_code == [None]
+
+    @responses.activate
+    def test_export_usage_npz(self, tmp_path):
+        """
+        The columns are written to an .npz file with one array for each column.
+        """
+        numpy = pytest.importorskip('numpy')
+        _add_pages('https://usage.test.cloud.ibm.com/v4/accounts/account/resource_instances/usage/2022-06')
+        path = tmp_path / 'usage.npz'
+        count = usage_export.export_usage_npz(
+            _service.get_resource_usage_account, 'account', '2022-06', destination=str(path)
+        )
+        assert count == 6
+        with numpy.load(str(path)) as arrays:
+            assert sorted(arrays.files) == sorted(usage_export.COLUMNS)
+            assert arrays['cost'].dtype == numpy.float64 and arrays['cost'].sum() == 5.5
+            assert list(arrays['metric'][:2]) == ['STORAGE', 'CLASS_A']